@@ -69,6 +69,7 @@ AUTH_SKIP_ROUTE_PATTERNS: list[str] = [
     "/billing/portal",
     # SEO / crawler routes — must be accessible without session
     "/sitemap.xml",
+    r"/sitemap-\d+\.xml",
     "/robots.txt",
 ]
 
@@ -21,7 +21,7 @@ from db import (
     record_dashboard_event,
     get_dashboard_event_counts,
 )
-from utils import load_df_from_json
+from utils import load_playlist_frame
 from views.dashboard import render_dashboard
 
 logger = logging.getLogger(__name__)
@@ -93,8 +93,11 @@ def view_dashboard_controller(
         return ErrorAlert("Database Error", "Failed to load dashboard. Please try again later.")
 
     # Validate required fields
-    required_fields = ["df_json", "playlist_url"]
+    required_fields = ["playlist_url"]
     missing_fields = [f for f in required_fields if f not in playlist_row]
+    # Columnar df_arrow (migration 058), or df_json on rows written before it
+    if not playlist_row.get("df_arrow") and not playlist_row.get("df_json"):
+        missing_fields.append("df_arrow")
 
     if missing_fields:
         logger.error(f"Missing required fields: {missing_fields}")
@@ -113,11 +116,8 @@ def view_dashboard_controller(
 
     # Load and deserialize DataFrame
     try:
-        df = load_df_from_json(playlist_row["df_json"])
+        df = load_playlist_frame(playlist_row)
         logger.debug(f"Loaded DataFrame: {len(df)} rows")
-    except KeyError as e:
-        logger.error(f"Missing JSON field in playlist_row: {e}")
-        return ErrorAlert("Invalid Data", "Playlist data is corrupted. Please contact support.")
     except Exception as e:
         logger.exception(f"Failed to deserialize DataFrame for {dashboard_id}: {e}")
         return ErrorAlert("Data Error", "Failed to parse playlist data. Please try again later.")
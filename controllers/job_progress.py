@@ -1,17 +1,14 @@
 # controllers/job_progress.py
 
+import asyncio
 import json
 import logging
-from dataclasses import dataclass
+import time
 from urllib.parse import quote_plus
 
 from fasthtml.common import *
 from monsterui.all import *
 
-# How often the in-progress UI polls /job-progress for an update.
-# Tune here without touching view code.
-_PROGRESS_POLL_INTERVAL = "every 3s"
-
 from components.errors import get_user_friendly_error
 from components.processing_tips import get_tip_for_progress
 from constants import JobStatus, MAX_RETRY_ATTEMPTS
@@ -29,11 +26,20 @@ from utils import (
     format_number,
     format_seconds,
 )
+from services.progress_bus import ProgressBus, is_terminal, progress_bus
 from views.job_progress import render_job_progress_view
 from views.job_progress_state import JobProgressViewState
 
 logger = logging.getLogger(__name__)
 
+# How often the in-progress UI polls /job-progress for an update.
+# Tune here without touching view code.
+_PROGRESS_POLL_INTERVAL = "every 3s"
+# SSE stream: comment ping interval (keeps proxies from idling the connection
+# out) and a hard cap after which the browser falls back to polling.
+_PROGRESS_STREAM_KEEPALIVE_SECONDS = 15
+_PROGRESS_STREAM_MAX_SECONDS = 30 * 60
+
 
 def is_retryable_network_error(error: str) -> bool:
     """
@@ -85,7 +91,22 @@ def job_progress_controller(playlist_url: str):
 
     # Get job progress data
     job_data = get_job_progress(playlist_url)
+    return render_job_progress(playlist_url, job_data)
+
 
+def render_job_progress(
+    playlist_url: str,
+    job_data: dict,
+    preview_info: dict | None = None,
+    live: bool = False,
+):
+    """
+    Render the progress fragment for one ``get_job_progress`` snapshot.
+
+    Shared by the polling endpoint and the SSE stream. ``live`` fragments are
+    pushed by the stream, so they carry no polling trigger of their own.
+    ``preview_info`` is looked up when not supplied.
+    """
     if not job_data:
         logger.warning(f"No job found for {playlist_url}")
         return Div(
@@ -225,7 +246,8 @@ def job_progress_controller(playlist_url: str):
     # ========================================================
     # SHOW PROGRESS UI (processing/pending/queued)
     # ========================================================
-    preview_info = get_playlist_preview_info(playlist_url) or {}
+    if preview_info is None:
+        preview_info = get_playlist_preview_info(playlist_url) or {}
     retry_count = job_data.get("retry_count", 0)
 
     return render_job_progress_ui(
@@ -236,9 +258,42 @@ def job_progress_controller(playlist_url: str):
         retry_count=retry_count,
         max_retries=MAX_RETRY_ATTEMPTS,
         started_at=job_data.get("started_at"),
+        live=live,
     )
 
 
+async def job_progress_stream(playlist_url: str, bus: ProgressBus = progress_bus):
+    """
+    Server-sent events for one playlist's job progress.
+
+    Each progress snapshot from the bus is rendered as a ``#preview-box``
+    fragment. Watchers share the bus's single DB poller, so an open stream
+    costs no queries of its own beyond the one-off preview lookup. A
+    ``close`` event follows the terminal fragment so the browser does not
+    reconnect.
+    """
+    preview_info = None
+    started = time.monotonic()
+    with bus.subscribe(playlist_url) as updates:
+        while time.monotonic() - started < _PROGRESS_STREAM_MAX_SECONDS:
+            job_data = await updates.get(timeout=_PROGRESS_STREAM_KEEPALIVE_SECONDS)
+            if job_data is None:
+                yield ": keepalive\n\n"
+                continue
+
+            terminal = is_terminal(job_data)
+            if preview_info is None and not terminal:
+                preview_info = await asyncio.to_thread(get_playlist_preview_info, playlist_url)
+                preview_info = preview_info or {}
+            yield sse_message(
+                render_job_progress(playlist_url, job_data, preview_info=preview_info, live=True)
+            )
+            if terminal:
+                yield sse_message(Div(), event="close")
+                return
+    # Cap reached: ending without ``close`` lets EventSource reconnect afresh
+
+
 def _elapsed_timer_widgets(started_at: str | None) -> list:
     """Return a live elapsed-time Span + a self-contained client-side timer Script.
 
@@ -290,6 +345,7 @@ def render_job_progress_ui(
     retry_count: int = 0,
     max_retries: int = 3,
     started_at: str | None = None,
+    live: bool = False,
 ):
     """
     Render the progress UI with preview data.
@@ -308,6 +364,7 @@ def render_job_progress_ui(
         preview_info: Playlist metadata (title, thumbnail, etc)
         retry_count: Current retry attempt count
         max_retries: Maximum retry attempts allowed
+        live: Fragment pushed over SSE — omit the polling trigger
     """
     # Extract preview fields
     title = preview_info.get("title", "YouTube Playlist")
@@ -419,10 +476,49 @@ def render_job_progress_ui(
         ),
         # Live elapsed timer — ticks every second client-side between polls
         *(_elapsed_timer_widgets(started_at)),
+        # Upgrade to the SSE stream; polling stays as the fallback
+        *([] if live else [_progress_stream_widget(playlist_url)]),
         cls="p-6 bg-white rounded-xl shadow-lg border max-w-3xl mx-auto",
         id="preview-box",
         # 🔄 Continue polling (interval tunable via _PROGRESS_POLL_INTERVAL)
-        hx_get=f"/job-progress?playlist_url={quote_plus(playlist_url)}",
-        hx_trigger=_PROGRESS_POLL_INTERVAL,
-        hx_swap="outerHTML",
+        **(
+            {}
+            if live
+            else {
+                "hx_get": f"/job-progress?playlist_url={quote_plus(playlist_url)}",
+                "hx_trigger": _PROGRESS_POLL_INTERVAL,
+                "hx_swap": "outerHTML",
+            }
+        ),
+    )
+
+
+def _progress_stream_widget(playlist_url: str) -> Script:
+    """Client that swaps ``#preview-box`` with fragments pushed over SSE.
+
+    The first streamed fragment (which has no polling trigger) replaces the
+    polling one. If the stream errors, it is closed for the rest of the page
+    and polling resumes via /job-progress.
+    """
+    query = quote_plus(playlist_url)
+    return Script(
+        f"""
+(function() {{
+    if (!window.EventSource || window._vvProgressStream || window._vvProgressStreamFailed) return;
+    var es = new EventSource('/job-progress/stream?playlist_url={query}');
+    window._vvProgressStream = es;
+    function stop() {{ es.close(); window._vvProgressStream = null; }}
+    es.onmessage = function(e) {{
+        if (!document.getElementById('preview-box')) {{ stop(); return; }}
+        htmx.swap('#preview-box', e.data, {{swapStyle: 'outerHTML'}});
+    }};
+    es.addEventListener('close', stop);
+    es.onerror = function() {{
+        stop();
+        window._vvProgressStreamFailed = true;
+        htmx.ajax('GET', '/job-progress?playlist_url={query}',
+                  {{target: '#preview-box', swap: 'outerHTML'}});
+    }};
+}})();
+"""
     )
@@ -11,9 +11,12 @@ import logging
 import os
 import random
 import re
+import threading
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Protocol, NamedTuple, Tuple
+from typing import Any, Callable, Dict, List, Optional, Protocol, NamedTuple, Tuple
 
 from supabase import Client, create_client
 from tenacity import (
@@ -43,7 +46,8 @@ from constants import (
 )
 from utils import (
     compute_dashboard_id,
-    deserialize_dataframe,
+    encode_frame,
+    load_playlist_frame,
     normalize_category_name,
     safe_get_value,
 )
@@ -355,9 +359,8 @@ def get_cached_playlist_stats(
             row = response.data[0]
 
             # --- Validate the integrity of the cached data ---
-            df_json = row.get("df_json")
-            # Check if df_json is missing, empty, or represents an empty list/object.
-            if _is_empty_json(df_json):
+            # Columnar df_arrow is preferred; legacy rows only carry df_json.
+            if not row.get("df_arrow") and _is_empty_json(row.get("df_json")):
                 logger.warning(
                     f"[Cache] Found invalid/empty cache entry for {playlist_url}"
                     f"(user={user_id}). Treating as miss."
@@ -366,9 +369,9 @@ def get_cached_playlist_stats(
 
             logger.info(f"[Cache] Hit for playlist: {playlist_url} (user={user_id})")
 
-            # Deserialize JSON fields
+            # Deserialize the cached frame (df_arrow, else legacy df_json)
             try:
-                row["df"] = deserialize_dataframe(df_json)
+                row["df"] = load_playlist_frame(row)
             except Exception as e:
                 logger.error(f"[Cache] Failed to deserialize DataFrame for {playlist_url}: {e}")
                 return None
@@ -396,6 +399,7 @@ class UpsertResult:
 
     source: str  # 'cache', 'fresh', 'error'
     df_json: Optional[str] = None
+    df_arrow: Optional[str] = None  # base64 Arrow IPC (zstd), see utils.frame_codec
     summary_stats_json: Optional[str] = None
     error: Optional[str] = None
     raw_row: Optional[Dict[str, Any]] = None
@@ -439,14 +443,15 @@ def upsert_playlist_stats(stats: Dict[str, Any]) -> UpsertResult:
 
     if cached:
         logger.info(f"[Cache] Returning cached stats for {playlist_url} (user={user_id})")
-        # Prefer any stored df_json present in the raw row, otherwise reserialize the in-memory df
+        # Return the stored payloads as-is; only legacy rows carry df_json
         cached_df_json = cached.get("df_json")
-        if not cached_df_json and cached.get("df") is not None:
+        cached_df_arrow = cached.get("df_arrow")
+        if not cached_df_json and not cached_df_arrow and cached.get("df") is not None:
             try:
-                cached_df_json = cached["df"].write_json()
+                cached_df_arrow = encode_frame(cached["df"])
             except Exception as e:
                 logger.exception(f"[Cache] Failed to re-serialize df for {playlist_url}: {e}")
-                cached_df_json = None
+                cached_df_arrow = None
 
         # Ensure summary_stats is returned as JSON string when possible
         summary_stats_json = cached.get("summary_stats")
@@ -462,16 +467,23 @@ def upsert_playlist_stats(stats: Dict[str, Any]) -> UpsertResult:
         return UpsertResult(
             source="cache",
             df_json=cached_df_json,
+            df_arrow=cached_df_arrow,
             summary_stats_json=summary_stats_json,
             raw_row=cached,
         )
 
     # --- Prepare for fresh insert ---
+    # Store the frame columnar (df_arrow); df_json is only written if that fails.
+    df_arrow = None
+    df_json = None
     try:
-        df_json = df.write_json() if df is not None else None
+        df_arrow = encode_frame(df)
     except Exception as e:
-        logger.exception(f"Error serializing df for {playlist_url}: {e}")
-        df_json = None
+        logger.exception(f"Error encoding df as Arrow IPC for {playlist_url}: {e}")
+        try:
+            df_json = df.write_json()
+        except Exception as e:
+            logger.exception(f"Error serializing df for {playlist_url}: {e}")
 
     try:
         summary_stats_json = json.dumps(stats.get("summary_stats", {}))
@@ -480,9 +492,10 @@ def upsert_playlist_stats(stats: Dict[str, Any]) -> UpsertResult:
         summary_stats_json = None
 
     # If serialization failed, do not insert an incomplete row; return error result
-    if not df_json or not summary_stats_json:
+    if not (df_arrow or df_json) or not summary_stats_json:
         err_msg = (
             f"[DB] Serialization failed for {playlist_url}. "
+            f"df_arrow present: {bool(df_arrow)}, "
             f"df_json present: {bool(df_json)}, "
             f"summary_stats_json present: {bool(summary_stats_json)}"
         )
@@ -490,11 +503,16 @@ def upsert_playlist_stats(stats: Dict[str, Any]) -> UpsertResult:
         return UpsertResult(source="error", error=err_msg)
 
     user_id = stats.get("user_id")
+    now_utc = datetime.now(timezone.utc)
 
     stats_to_insert = {
         **stats,
         "user_id": user_id,
-        "processed_date": datetime.now(timezone.utc).date().isoformat(),
+        # processed_on is the dashboard data version (get_dashboard_version →
+        # render cache key and ETag), so every write must move it.
+        "processed_on": now_utc.isoformat(),
+        "processed_date": now_utc.date().isoformat(),
+        "df_arrow": df_arrow,
         "df_json": df_json,
         "summary_stats": summary_stats_json,
         "dashboard_id": compute_dashboard_id(playlist_url),
@@ -520,6 +538,7 @@ def upsert_playlist_stats(stats: Dict[str, Any]) -> UpsertResult:
         return UpsertResult(
             source="fresh",
             df_json=df_json,
+            df_arrow=df_arrow,
             summary_stats_json=summary_stats_json,
         )
     else:
@@ -1348,13 +1367,35 @@ def upsert_subscription(
         return False
 
 
-def get_user_plan(user_id: str) -> Dict[str, Any]:
+# Plan lookups run on every gated request; a paying user's plan only changes
+# when a Stripe webhook lands, and that handler calls clear_user_plan_cache().
+# The TTL bounds staleness for webhooks handled by another process; the LRU
+# cap bounds memory however many distinct users hit gated routes.
+_USER_PLAN_TTL_SECONDS = 60
+_USER_PLAN_CACHE_MAX_ENTRIES = 4096
+_user_plan_cache: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+_user_plan_cache_lock = threading.Lock()
+
+
+def clear_user_plan_cache(user_id: Optional[str] = None) -> None:
+    """Invalidate the in-process plan cache for ``user_id`` (every user when None)."""
+    with _user_plan_cache_lock:
+        if user_id is None:
+            _user_plan_cache.clear()
+        else:
+            _user_plan_cache.pop(user_id, None)
+
+
+def get_user_plan(user_id: str, *, fresh: bool = False) -> Dict[str, Any]:
     """
     Return the active subscription info for a user.
 
     Returns a dict with keys: plan, interval, status, current_period_end.
     Defaults to {'plan': 'free', 'interval': None, 'status': 'inactive',
     'current_period_end': None} when no active subscription exists.
+
+    Cached in-process for ``_USER_PLAN_TTL_SECONDS``; ``fresh=True`` skips the
+    cache (e.g. the checkout success page waiting for its webhook).
     """
     default: Dict[str, Any] = {
         "plan": "free",
@@ -1366,6 +1407,14 @@ def get_user_plan(user_id: str) -> Dict[str, Any]:
     if not supabase_client or not user_id:
         return default
 
+    now = time.monotonic()
+    if not fresh:
+        with _user_plan_cache_lock:
+            cached_entry = _user_plan_cache.get(user_id)
+            if cached_entry is not None and now - cached_entry[0] < _USER_PLAN_TTL_SECONDS:
+                _user_plan_cache.move_to_end(user_id)
+                return dict(cached_entry[1])
+
     try:
         resp = (
             supabase_client.table(SUBSCRIPTIONS_TABLE)
@@ -1377,11 +1426,18 @@ def get_user_plan(user_id: str) -> Dict[str, Any]:
             .execute()
         )
         rows = resp.data or []
-        return rows[0] if rows else default
+        plan_info = rows[0] if rows else default
     except Exception as exc:
         logger.exception("[DB] get_user_plan failed: %s", exc)
         return default
 
+    with _user_plan_cache_lock:
+        _user_plan_cache[user_id] = (now, dict(plan_info))
+        _user_plan_cache.move_to_end(user_id)
+        while len(_user_plan_cache) > _USER_PLAN_CACHE_MAX_ENTRIES:
+            _user_plan_cache.popitem(last=False)
+    return plan_info
+
 
 def get_pending_creator_syncs(batch_size: int = 1) -> List[Dict[str, Any]]:
     """
@@ -1527,6 +1583,30 @@ def mark_creator_sync_failed(job_id: int, error: str) -> bool:
         return False
 
 
+def mark_creator_syncs_completed(job_ids: List[int]) -> bool:
+    """Mark many creator sync jobs as completed in one round trip."""
+    if not supabase_client or not job_ids:
+        return False
+
+    try:
+        response = _db_execute(
+            lambda: supabase_client.table(CREATOR_SYNC_JOBS_TABLE)
+            .update(
+                {
+                    "status": "completed",
+                    "completed_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            .in_("id", job_ids)
+            .execute()
+        )
+        return bool(response.data)
+
+    except Exception as e:
+        logger.exception(f"Error marking {len(job_ids)} creator syncs as completed: {e}")
+        return False
+
+
 def archive_permanently_failed_creators(max_retries: int = 3) -> int:
     """
     Archive creators that failed to sync after max retries.
@@ -1655,6 +1735,33 @@ def update_creator_stats(
         return False
 
 
+def bulk_update_creators(rows: List[Dict[str, Any]]) -> bool:
+    """
+    Write many partial creators-row updates in one round trip.
+
+    Each row carries ``id`` plus the columns to change.  The
+    ``bulk_update_creators`` RPC (migration 065) runs them as
+    ``UPDATE ... FROM`` grouped by key set, so a key missing from a row is
+    left untouched rather than written as NULL, and — unlike an upsert — no
+    INSERT privilege or NOT NULL column values are needed.  The call is one
+    statement per shape in one transaction: all rows land or none do.
+
+    Returns:
+        True if every row was written (False leaves the table unchanged).
+    """
+    if not supabase_client or not rows:
+        return False
+
+    try:
+        _db_execute(lambda: supabase_client.rpc("bulk_update_creators", {"p_rows": rows}).execute())
+        logger.info("bulk_update_creators: %d row(s) written in one request", len(rows))
+        return True
+
+    except Exception as e:
+        logger.exception(f"Error bulk-updating {len(rows)} creators: {e}")
+        return False
+
+
 def get_creator_stats(creator_id: str) -> Optional[Dict[str, Any]]:
     """Get the current stats from the creators table."""
     if not supabase_client:
@@ -1691,24 +1798,83 @@ def get_creator_stats(creator_id: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+# Process-level cache for per-category peer benchmarks.  The source view is
+# refreshed once per bootstrap cycle (Pass 4), so a 10 min TTL costs nothing
+# in freshness; clear_peer_benchmarks_cache() runs after each refresh.  On a
+# DB error the stale entry is served instead of all-zero benchmarks.
+CATEGORY_PEER_BENCHMARKS_VIEW = "mv_category_peer_benchmarks"
+_PEER_BENCHMARKS_TTL_SECONDS = 600
+_peer_benchmarks_cache: dict[str, tuple[float, dict[str, float]]] = {}
+
+
+def clear_peer_benchmarks_cache() -> None:
+    """Invalidate the in-process peer benchmarks cache (called after the MV refresh)."""
+    _peer_benchmarks_cache.clear()
+
+
 def get_category_peer_benchmarks(category: str) -> dict[str, float]:
     """
-    Return p75 views-per-video and viral-coeff for all synced creators
-    in ``category``.  Used by the Growth Blueprint scorer to contextualise
-    a single creator against its cohort.
+    Return p75 views-per-video, viral-coeff and engagement for all synced
+    creators in ``category``.  Used by the Growth Blueprint scorer and the
+    creator profile to contextualise a single creator against its cohort.
 
-    Fetches only the four numeric columns needed; typically <200 rows per
-    category so the PostgREST default limit (1 000) is not a concern.
+    Reads the single pre-aggregated row from ``mv_category_peer_benchmarks``
+    (migration 060), cached in-process for ``_PEER_BENCHMARKS_TTL_SECONDS``.
+    Falls back to the live per-category row scan when the view is unavailable
+    (migration not applied yet).
 
     Returns:
-        {"peer_vpv_p75": float, "peer_vc_p75": float}
-        Both values are 0.0 when the category has no synced peers.
+        {"peer_vpv_p75": float, "peer_vc_p75": float, "peer_engagement_p75": float}
+        All values are 0.0 when the category has no synced peers.
     """
     _default = {"peer_vpv_p75": 0.0, "peer_vc_p75": 0.0, "peer_engagement_p75": 0.0}
 
-    if not supabase_client or not category:
+    if not category:
         return _default
 
+    now = time.monotonic()
+    cached_entry = _peer_benchmarks_cache.get(category)
+    if cached_entry is not None and now - cached_entry[0] < _PEER_BENCHMARKS_TTL_SECONDS:
+        return cached_entry[1]
+
+    if not supabase_client:
+        return cached_entry[1] if cached_entry else _default
+
+    try:
+        resp = _db_execute(
+            lambda: supabase_client.table(CATEGORY_PEER_BENCHMARKS_VIEW)
+            .select("peer_vpv_p75, peer_vc_p75, peer_engagement_p75")
+            .eq("primary_category", category)
+            .limit(1)
+            .execute()
+        )
+    except Exception:
+        logger.debug(
+            "get_category_peer_benchmarks: %s lookup failed for %r, falling back to row scan",
+            CATEGORY_PEER_BENCHMARKS_VIEW,
+            category,
+            exc_info=True,
+        )
+        result = _scan_category_peer_benchmarks(category)
+        if result is None:
+            return cached_entry[1] if cached_entry else _default
+    else:
+        row = resp.data[0] if resp.data else {}
+        result = {key: float(row.get(key) or 0.0) for key in _default}
+
+    _peer_benchmarks_cache[category] = (now, result)
+    return result
+
+
+def _scan_category_peer_benchmarks(category: str) -> dict[str, float] | None:
+    """
+    Compute the peer benchmarks by fetching every synced creator row in
+    ``category`` — the pre-migration-060 path, kept as a fallback.
+
+    Returns None on a swallowed DB error (the caller serves stale or default).
+    """
+    _default = {"peer_vpv_p75": 0.0, "peer_vc_p75": 0.0, "peer_engagement_p75": 0.0}
+
     try:
         resp = _db_execute(
             lambda: supabase_client.table(CREATOR_TABLE)
@@ -1728,7 +1894,6 @@ def get_category_peer_benchmarks(category: str) -> dict[str, float]:
         rows = resp.data or []
         if not rows:
             return _default
-
         vpvs: list[float] = [
             r["current_view_count"] / r["current_video_count"]
             for r in rows
@@ -1774,7 +1939,7 @@ def get_category_peer_benchmarks(category: str) -> dict[str, float]:
                 category,
                 exc,
             )
-            return _default
+            return None
         # postgrest.exceptions.APIError carries a .code attribute (e.g. 400,
         # 500).  Match by type name — consistent with the _is_transient_disconnect
         # pattern — so only PostgREST errors are swallowed, not any exception
@@ -1785,7 +1950,7 @@ def get_category_peer_benchmarks(category: str) -> dict[str, float]:
                 category,
                 exc,
             )
-            return _default
+            return None
         # Unexpected programming error — re-raise so it's caught in tests.
         logger.exception("get_category_peer_benchmarks: unexpected error for '%s'", category)
         raise
@@ -1929,6 +2094,65 @@ def get_creator_rank(
         return None
 
 
+RPC_CREATOR_CONTEXT_RANKS = "get_creator_context_ranks"
+
+# rank key → (creators column, get_creator_context_ranks parameter)
+_CONTEXT_RANK_SEGMENTS = {
+    "country_rank": ("country_code", "p_country"),
+    "language_rank": ("default_language", "p_language"),
+    "category_rank": ("primary_category", "p_category"),
+}
+
+
+def get_creator_context_ranks(
+    current_subscribers: int,
+    *,
+    country: str = "",
+    language: str = "",
+    category: str = "",
+) -> dict[str, int | None]:
+    """
+    Return this creator's subscriber rank in its country, language and
+    primary category in a single RPC call (migrations 061, 064).
+
+    The RPC reads per-segment cumulative subscriber counts precomputed in
+    ``mv_creator_segment_subscribers`` (refreshed in bootstrap Pass 5) with
+    one index probe per segment, so no COUNT runs over the creators table.  Falls back to one
+    ``get_creator_rank`` COUNT per segment if the RPC is unavailable.
+
+    Returns:
+        dict with keys country_rank, language_rank, category_rank; each value
+        is an int (1-based position) or None when unavailable.
+    """
+    values = {"country_rank": country, "language_rank": language, "category_rank": category}
+    result: dict[str, int | None] = dict.fromkeys(_CONTEXT_RANK_SEGMENTS)
+    if not supabase_client or not current_subscribers or not any(values.values()):
+        return result
+
+    params: dict[str, Any] = {"p_subscribers": int(current_subscribers)}
+    for name, (_, param) in _CONTEXT_RANK_SEGMENTS.items():
+        params[param] = values[name] or None
+
+    try:
+        resp = _db_execute(lambda: supabase_client.rpc(RPC_CREATOR_CONTEXT_RANKS, params).execute())
+    except Exception as exc:
+        logger.warning(
+            "[DB] %s RPC failed (%s) — falling back to per-segment COUNT queries",
+            RPC_CREATOR_CONTEXT_RANKS,
+            exc,
+        )
+        for name, (column, _) in _CONTEXT_RANK_SEGMENTS.items():
+            if values[name]:
+                result[name] = get_creator_rank(current_subscribers, column, values[name])
+        return result
+
+    row = resp.data[0] if isinstance(resp.data, list) and resp.data else resp.data or {}
+    for name in result:
+        rank = row.get(name)
+        result[name] = int(rank) if rank is not None and values[name] else None
+    return result
+
+
 def get_top_creators_by_growth(limit: int = 20) -> List[Dict[str, Any]]:
     """
     Get top creators by subscriber count.
@@ -2200,7 +2424,7 @@ def get_dashboard_stats_by_id(
         user_id: Optional user_id for ownership filtering
 
     Returns:
-        Complete stats dict with df_json, summary_stats, etc., or None if not found
+        Complete stats dict with df_arrow/df_json, summary_stats, etc., or None if not found
     """
     if not supabase_client:
         logger.warning("Supabase client not available")
@@ -2220,9 +2444,8 @@ def get_dashboard_stats_by_id(
         if response.data and len(response.data) > 0:
             row = response.data[0]
 
-            # Validate df_json
-            df_json = row.get("df_json")
-            if _is_empty_json(df_json):
+            # Validate the stored frame (df_arrow, else legacy df_json)
+            if not row.get("df_arrow") and _is_empty_json(row.get("df_json")):
                 logger.warning(
                     f"[Dashboard] Found invalid/empty data for dashboard_id={dashboard_id}"
                 )
@@ -2248,6 +2471,43 @@ def get_dashboard_stats_by_id(
         return None
 
 
+def get_dashboard_version(
+    dashboard_id: str,
+    user_id: Optional[str] = None,
+) -> Optional[str]:
+    """
+    Return the ``processed_on`` stamp of the newest row for a dashboard.
+
+    Narrow single-column lookup used as the data version for the rendered
+    dashboard cache and its ETag. Returns None if the dashboard is missing
+    or the query fails (callers then fall back to a full load).
+    """
+    if not supabase_client:
+        return None
+
+    try:
+        query = (
+            supabase_client.table(PLAYLIST_STATS_TABLE)
+            .select("processed_on")
+            .eq("dashboard_id", dashboard_id)
+        )
+
+        # Filter by user if provided
+        if user_id is not None:
+            query = query.eq("user_id", user_id)
+
+        response = query.order("processed_on", desc=True).limit(1).execute()
+
+        if not response.data:
+            return None
+        version = response.data[0].get("processed_on")
+        return str(version) if version else None
+
+    except Exception as e:
+        logger.exception(f"Failed to fetch dashboard version {dashboard_id} (user={user_id}): {e}")
+        return None
+
+
 def resolve_playlist_url_from_dashboard_id(
     dashboard_id: str,
     user_id: Optional[str] = None,
@@ -3346,6 +3606,200 @@ def _get_ranked_creator_search(
     return True, creators
 
 
+# ==============================================================
+# 🗃️ get_creators result cache
+# ==============================================================
+# /creators, the similar-creator rails and most list pages call get_creators
+# with a small set of recurring filter/sort combinations.  Results are cached
+# per normalised argument tuple:
+#   - single-flight: concurrent misses on one key share a single query
+#   - refresh-ahead: a key read again in the last _REFRESH_AHEAD seconds of
+#     its TTL is re-fetched in a background thread, so hot pages never wait
+#   - stale-on-timeout: a statement timeout (57014) or pool exhaustion
+#     (PGRST003) serves the previous result for up to _STALE_SECONDS
+# Degraded (empty-on-error) results are returned but never cached.
+_CREATORS_CACHE_TTL_SECONDS = 120
+_CREATORS_CACHE_REFRESH_AHEAD_SECONDS = 30
+_CREATORS_CACHE_STALE_SECONDS = 1800
+_CREATORS_CACHE_MAX_ENTRIES = 512
+
+
+class _DegradedCreators(Exception):
+    """Internal: the creators query failed and fell back to ``value``."""
+
+    def __init__(self, value: list[dict] | CreatorsResult, cause: Exception | None = None):
+        super().__init__(str(cause) if cause else "creators query degraded")
+        self.value = value
+        self.timeout = cause is not None and (
+            _is_statement_timeout_error(cause) or _is_connection_pool_timeout(cause)
+        )
+
+
+def _normalise_creators_args(
+    *,
+    search: str,
+    sort: str,
+    grade_filter: str,
+    language_filter: str,
+    activity_filter: str,
+    age_filter: str,
+    country_filter: str,
+    category_filter: str,
+    limit: int,
+    offset: int,
+    return_count: bool,
+    cursor_value: Any,
+) -> dict[str, Any]:
+    """
+    Normalise get_creators arguments so equivalent calls share a cache entry.
+
+    The result is both the cache key (its values, in order) and the keyword
+    arguments for ``_query_creators``, so the query always runs with exactly
+    what the key describes — e.g. ``"   "`` is no search at all.  Search is
+    lowercased rather than casefolded to keep ILIKE's matching unchanged.
+    """
+
+    def _opt(value: Any) -> str:
+        value = (value or "").strip() if isinstance(value, str) else value
+        return value or "all"
+
+    country = _opt(country_filter)
+    category = _opt(category_filter)
+    return {
+        "search": (search or "").strip().lower(),
+        "sort": sort,
+        "grade_filter": _opt(grade_filter),
+        "language_filter": _opt(language_filter),
+        "activity_filter": _opt(activity_filter),
+        "age_filter": _opt(age_filter),
+        "country_filter": country.upper() if country != "all" else country,
+        "category_filter": (
+            (normalize_category_name(category) or "all") if category != "all" else category
+        ),
+        "limit": int(limit),
+        "offset": int(offset or 0),
+        "return_count": bool(return_count),
+        "cursor_value": cursor_value,
+    }
+
+
+def _copy_creators(value: list[dict] | CreatorsResult) -> list[dict] | CreatorsResult:
+    """Per-caller copy: routes annotate rows in place (e.g. ``_rank``)."""
+    if isinstance(value, CreatorsResult):
+        return CreatorsResult([dict(row) for row in value.creators], value.total_count)
+    return [dict(row) for row in value]
+
+
+class _CreatorsResultCache:
+    """Bounded LRU of get_creators results with single-flight and refresh-ahead."""
+
+    def __init__(
+        self,
+        ttl: float = _CREATORS_CACHE_TTL_SECONDS,
+        refresh_ahead: float = _CREATORS_CACHE_REFRESH_AHEAD_SECONDS,
+        stale_for: float = _CREATORS_CACHE_STALE_SECONDS,
+        max_entries: int = _CREATORS_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.stale_for = stale_for
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # key → (stored_at, value)
+        self._entries: OrderedDict[tuple, tuple[float, Any]] = OrderedDict()
+        # key → [done event, value, exception] for the in-flight fetch
+        self._inflight: dict[tuple, list] = {}
+        self._refreshing: set[tuple] = set()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key: tuple, load: Callable[[], Any]) -> Any:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                if now - entry[0] >= self.ttl - self.refresh_ahead:
+                    self._refresh_in_background(key, load)
+                return _copy_creators(entry[1])
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._inflight[key] = [threading.Event(), None, None]
+
+        if leader:
+            self._fetch(key, load, flight)
+        else:
+            flight[0].wait()
+        if flight[2] is not None:
+            raise flight[2]
+        return _copy_creators(flight[1])
+
+    def _fetch(self, key: tuple, load: Callable[[], Any], flight: list) -> None:
+        """Run ``load`` for ``key`` and publish the outcome to waiting callers."""
+        try:
+            value = load()
+        except _DegradedCreators as degraded:
+            with self._lock:
+                entry = self._entries.get(key)
+            if degraded.timeout and entry and time.monotonic() - entry[0] < self.stale_for:
+                logger.warning(
+                    "get_creators: query timed out — serving cached result (age %.0fs)",
+                    time.monotonic() - entry[0],
+                )
+                flight[1] = entry[1]
+            else:
+                flight[1] = degraded.value
+        except BaseException as exc:
+            flight[2] = exc
+        else:
+            flight[1] = value
+            self._store(key, value)
+        finally:
+            with self._lock:
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            flight[0].set()
+
+    def _store(self, key: tuple, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _refresh_in_background(self, key: tuple, load: Callable[[], Any]) -> None:
+        """Start one background re-fetch of ``key`` (lock held by the caller)."""
+        if key in self._refreshing or key in self._inflight:
+            return
+        self._refreshing.add(key)
+
+        def _run():
+            try:
+                value = load()
+            except _DegradedCreators:
+                pass  # keep serving the current entry until it expires
+            except Exception:
+                logger.warning("get_creators: background refresh failed", exc_info=True)
+            else:
+                self._store(key, value)
+            finally:
+                with self._lock:
+                    self._refreshing.discard(key)
+
+        threading.Thread(target=_run, name="creators-cache-refresh", daemon=True).start()
+
+
+_creators_cache = _CreatorsResultCache()
+
+
+def clear_creators_cache() -> None:
+    """Drop every cached get_creators result (called after the MV refreshes)."""
+    _creators_cache.clear()
+
+
 def get_creators(
     search: str = "",
     sort: str = "subscribers",
@@ -3396,6 +3850,12 @@ def get_creators(
         offset: Number of results to skip (for pagination)
         return_count: If True, returns CreatorsResult with total_count
 
+    Results are served from a shared in-process cache keyed by the normalised
+    arguments (see ``_CreatorsResultCache``): concurrent identical calls share
+    one query, hot keys are refreshed in the background shortly before they
+    expire, and a statement timeout serves the last good result when there
+    is one.  Callers receive copies and may mutate them freely.
+
     Returns:
         List of creator dicts with _rank position added (1-based index)
         OR CreatorsResult(creators, total_count) if return_count=True
@@ -3410,9 +3870,47 @@ def get_creators(
         # Find new creators with good engagement
         creators = get_creators(age_filter="new", sort="engagement")
     """
+    args = _normalise_creators_args(
+        search=search,
+        sort=sort,
+        grade_filter=grade_filter,
+        language_filter=language_filter,
+        activity_filter=activity_filter,
+        age_filter=age_filter,
+        country_filter=country_filter,
+        category_filter=category_filter,
+        limit=limit,
+        offset=offset,
+        return_count=return_count,
+        cursor_value=cursor_value,
+    )
+    return _creators_cache.get(tuple(args.values()), lambda: _query_creators(**args))
+
+
+def _query_creators(
+    search: str = "",
+    sort: str = "subscribers",
+    grade_filter: str = "all",
+    language_filter: str = "all",
+    activity_filter: str = "all",
+    age_filter: str = "all",
+    country_filter: str = "all",
+    category_filter: str = "all",
+    limit: int = 50,
+    offset: int = 0,
+    return_count: bool = False,
+    cursor_value: any = None,  # New: for keyset/cursor pagination
+) -> list[dict] | CreatorsResult:
+    """
+    Run the ``get_creators`` query against PostgREST (uncached).
+
+    Raises ``_DegradedCreators`` carrying the empty fallback result whenever
+    the query could not produce real data (timeout, pool exhaustion, any
+    other error), so the cache never stores a degraded result.
+    """
     if not supabase_client:
         logger.warning("Supabase client not available")
-        return CreatorsResult([], 0) if return_count else []
+        raise _DegradedCreators(CreatorsResult([], 0) if return_count else [])
 
     try:
         # Build sort mapping (DB does the sorting based on this)
@@ -3704,9 +4202,7 @@ def get_creators(
                         country_filter,
                         category_filter,
                     )
-                if return_count:
-                    return CreatorsResult([], 0)
-                return []
+                raise _DegradedCreators(CreatorsResult([], 0) if return_count else [], e)
 
             logger.error(
                 f"Query execution failed: {type(e).__name__}: {str(e)}\n"
@@ -3755,9 +4251,11 @@ def get_creators(
             return CreatorsResult(creators, total_count)
         return creators
 
+    except _DegradedCreators:
+        raise
     except Exception as e:
         logger.exception(f"Error fetching creators: {e}")
-        return CreatorsResult([], 0) if return_count else []
+        raise _DegradedCreators(CreatorsResult([], 0) if return_count else [], e) from e
 
 
 def calculate_creator_stats(creators: list[dict]) -> dict:
@@ -4159,6 +4657,7 @@ def refresh_category_stats_cache() -> int:
                 failed,
             )
 
+        refresh_category_peer_benchmarks()
         return len(rows_to_upsert)
 
     except Exception:
@@ -4166,6 +4665,35 @@ def refresh_category_stats_cache() -> int:
         return 0
 
 
+def refresh_category_peer_benchmarks() -> bool:
+    """
+    Refresh mv_category_peer_benchmarks (migration 060) and drop the in-process
+    benchmark cache.  Runs at the end of ``refresh_category_stats_cache()`` so
+    both per-category aggregates advance together in bootstrap Pass 4.
+
+    Returns:
+        True if the view was refreshed.
+    """
+    if not supabase_client:
+        return False
+    try:
+        resp = supabase_client.rpc("refresh_mv_category_peer_benchmarks").execute()
+    except Exception:
+        logger.warning(
+            "refresh_category_peer_benchmarks: RPC failed — profiles keep the previous view",
+            exc_info=True,
+        )
+        return False
+    row = (resp.data or [{}])[0]
+    logger.info(
+        "refresh_category_peer_benchmarks: %s rows in %sms",
+        row.get("rows_refreshed", 0),
+        row.get("refresh_duration_ms", 0),
+    )
+    clear_peer_benchmarks_cache()
+    return True
+
+
 # ==============================================================
 # 📊 Total Categories — app_stats cache
 # ==============================================================
@@ -4255,6 +4783,8 @@ def refresh_hero_stats_cache() -> dict[str, Any]:
         ("refresh_mv_hero_stats", "mv_hero_stats"),
         ("refresh_mv_lists_meta", "mv_lists_meta"),
         ("refresh_mv_category_counts", "mv_category_counts"),
+        ("refresh_mv_creator_segment_subscribers", "mv_creator_segment_subscribers"),
+        ("refresh_mv_niche_heatmap", "mv_niche_heatmap"),
     ]:
         try:
             resp = supabase_client.rpc(rpc_name).execute()
@@ -4306,6 +4836,8 @@ def refresh_hero_stats_cache() -> dict[str, Any]:
                         exc_info=True,
                     )
             if view_label == "mv_category_counts":
+                # get_creators totals for category pages come from this MV
+                clear_creators_cache()
                 try:
                     from db_lists import (
                         clear_top_categories_cache,
@@ -4319,6 +4851,15 @@ def refresh_hero_stats_cache() -> dict[str, Any]:
                         "[Hero Stats Cache] failed to clear category caches (top_categories and/or category_creators)",
                         exc_info=True,
                     )
+            if view_label == "mv_niche_heatmap":
+                try:
+                    from db_lists import clear_niche_heatmap_cache
+
+                    clear_niche_heatmap_cache()
+                except Exception:
+                    logger.debug(
+                        "[Hero Stats Cache] failed to clear niche heatmap cache", exc_info=True
+                    )
         except Exception as e:
             logger.error("[Hero Stats Cache] ❌ %s failed: %s", view_label, e)
             errors.append({"view": view_label, "error": str(e)})
@@ -0,0 +1,31 @@
+-- Migration 058: Columnar DataFrame storage for playlist_stats.
+--
+-- Problem: upsert_playlist_stats() stored the whole playlist DataFrame as
+-- row-oriented JSON (df.write_json()) in playlist_stats.df_json. Large
+-- playlists produce multi-MB blobs that dominate DB egress on every
+-- dashboard load, and each reader parses the JSON back into Python objects.
+--
+-- Fix: new rows store the frame in df_arrow — Arrow IPC with zstd
+-- compression, base64-encoded (utils/frame_codec.py). Readers decode it
+-- straight into Polars. df_json is left NULL for new rows and is only read
+-- as a fallback for rows written before this migration.
+--
+-- df_json must therefore be nullable.
+
+ALTER TABLE public.playlist_stats
+    ADD COLUMN IF NOT EXISTS df_arrow TEXT;
+
+ALTER TABLE public.playlist_stats
+    ALTER COLUMN df_json DROP NOT NULL;
+
+COMMENT ON COLUMN public.playlist_stats.df_arrow IS
+    'Playlist DataFrame as base64 Arrow IPC (zstd). Preferred over df_json.';
+COMMENT ON COLUMN public.playlist_stats.df_json IS
+    'Legacy row-oriented JSON DataFrame. NULL for rows that carry df_arrow.';
+
+-- Verification (run after applying):
+-- SELECT count(*) FILTER (WHERE df_arrow IS NOT NULL) AS arrow_rows,
+--        count(*) FILTER (WHERE df_arrow IS NULL AND df_json IS NOT NULL) AS legacy_rows,
+--        pg_size_pretty(avg(octet_length(df_arrow))::bigint) AS avg_arrow,
+--        pg_size_pretty(avg(octet_length(df_json))::bigint)  AS avg_json
+-- FROM public.playlist_stats;
@@ -0,0 +1,149 @@
+-- Migration 059: Atomic multi-job claim RPCs for the playlist and creator queues.
+--
+-- Problem: both workers poll with a plain SELECT and then claim each row with
+-- its own conditional UPDATE. Concurrent workers read the same head of the
+-- queue, race on the same ids and lose most of their claims — one round trip
+-- per lost race, and the losers re-poll the same rows again.
+--
+-- Fix: claim_playlist_jobs() / claim_creator_sync_jobs() select the next N
+-- claimable rows with FOR UPDATE SKIP LOCKED and mark them 'processing' in the
+-- same statement. Each worker gets a disjoint batch in one round trip; rows
+-- locked by another claimer are skipped instead of waited on.
+--
+-- Called from the workers:
+--   sb.rpc("claim_playlist_jobs", {
+--       "p_limit": 3, "p_max_retries": 3,
+--       "p_retry_cutoff": "2026-01-01T00:00:00+00:00", "p_retry_limit": 1,
+--   }).execute()
+--   sb.rpc("claim_creator_sync_jobs", {"p_limit": 10}).execute()
+--
+-- Workers fall back to the poll-then-claim path when the RPCs are missing.
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- INDEXES
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE INDEX IF NOT EXISTS idx_playlist_jobs_pending_created
+    ON public.playlist_jobs(created_at)
+    WHERE status = 'pending';
+
+CREATE INDEX IF NOT EXISTS idx_playlist_jobs_failed_finished
+    ON public.playlist_jobs(finished_at)
+    WHERE status = 'failed';
+
+CREATE INDEX IF NOT EXISTS idx_creator_sync_jobs_pending_created
+    ON public.creator_sync_jobs(created_at)
+    WHERE status = 'pending';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- claim_playlist_jobs()
+--
+-- Claims up to p_limit jobs: pending jobs first (FIFO by created_at), then
+-- failed jobs eligible for retry (retry_count < p_max_retries and last attempt
+-- before p_retry_cutoff, oldest first) to fill the remainder, capped at
+-- p_retry_limit. Returns each claimed row as JSONB plus whether it was a retry.
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE OR REPLACE FUNCTION public.claim_playlist_jobs(
+    p_limit        INT,
+    p_max_retries  INT,
+    p_retry_cutoff TIMESTAMPTZ,
+    p_retry_limit  INT DEFAULT NULL
+)
+RETURNS TABLE (job JSONB, is_retry BOOLEAN)
+LANGUAGE plpgsql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+DECLARE
+    v_claimed INT := 0;
+BEGIN
+    IF COALESCE(p_limit, 0) <= 0 THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    WITH picked AS (
+        SELECT j.id
+        FROM public.playlist_jobs j
+        WHERE j.status = 'pending'
+        ORDER BY j.created_at
+        LIMIT p_limit
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.playlist_jobs j
+    SET status = 'processing', started_at = now()
+    FROM picked
+    WHERE j.id = picked.id
+    RETURNING to_jsonb(j), false;
+
+    GET DIAGNOSTICS v_claimed = ROW_COUNT;
+
+    IF v_claimed < p_limit THEN
+        RETURN QUERY
+        WITH picked AS (
+            SELECT j.id
+            FROM public.playlist_jobs j
+            WHERE j.status = 'failed'
+              AND j.retry_count < p_max_retries
+              AND j.finished_at < p_retry_cutoff
+            ORDER BY j.finished_at
+            LIMIT GREATEST(0, LEAST(p_limit - v_claimed, COALESCE(p_retry_limit, p_limit)))
+            FOR UPDATE SKIP LOCKED
+        )
+        UPDATE public.playlist_jobs j
+        SET status = 'processing', started_at = now()
+        FROM picked
+        WHERE j.id = picked.id
+        RETURNING to_jsonb(j), true;
+    END IF;
+END;
+$$;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- claim_creator_sync_jobs()
+--
+-- Claims up to p_limit pending creator sync jobs whose backoff window has
+-- passed (next_retry_at IS NULL or due), FIFO by created_at.
+-- ─────────────────────────────────────────────────────────────────────────────
+
+CREATE OR REPLACE FUNCTION public.claim_creator_sync_jobs(p_limit INT)
+RETURNS SETOF public.creator_sync_jobs
+LANGUAGE sql
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH picked AS (
+        SELECT j.id
+        FROM public.creator_sync_jobs j
+        WHERE j.status = 'pending'
+          AND (j.next_retry_at IS NULL OR j.next_retry_at <= now())
+        ORDER BY j.created_at
+        LIMIT GREATEST(0, COALESCE(p_limit, 0))
+        FOR UPDATE SKIP LOCKED
+    )
+    UPDATE public.creator_sync_jobs j
+    SET status = 'processing', started_at = now()
+    FROM picked
+    WHERE j.id = picked.id
+    RETURNING j.*;
+$$;
+
+-- Workers run with the service role key; nothing else should claim jobs.
+REVOKE ALL ON FUNCTION public.claim_playlist_jobs(INT, INT, TIMESTAMPTZ, INT) FROM PUBLIC;
+REVOKE ALL ON FUNCTION public.claim_creator_sync_jobs(INT) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.claim_playlist_jobs(INT, INT, TIMESTAMPTZ, INT) TO service_role;
+GRANT EXECUTE ON FUNCTION public.claim_creator_sync_jobs(INT) TO service_role;
+
+COMMENT ON FUNCTION public.claim_playlist_jobs IS
+    'Atomically claims up to p_limit playlist jobs (pending first, then retryable failed) '
+    'with FOR UPDATE SKIP LOCKED and marks them processing.';
+COMMENT ON FUNCTION public.claim_creator_sync_jobs IS
+    'Atomically claims up to p_limit due pending creator sync jobs with '
+    'FOR UPDATE SKIP LOCKED and marks them processing.';
+
+-- Verification (run after applying):
+-- BEGIN;
+-- SELECT * FROM public.claim_playlist_jobs(2, 3, now() - interval '10 minutes', 1);
+-- SELECT id, status, started_at FROM public.claim_creator_sync_jobs(2);
+-- ROLLBACK;
@@ -0,0 +1,112 @@
+-- Migration 060: mv_category_peer_benchmarks — pre-aggregated p75 peer benchmarks
+--
+-- Root cause
+-- ----------
+-- db.get_category_peer_benchmarks() fetched every synced creator row in a
+-- category (five numeric columns) on every creator profile and Growth
+-- Blueprint view, then computed three p75 values in Python with sorted().
+-- Large categories moved thousands of rows per page view for three floats.
+--
+-- Fix
+-- ---
+-- 1. mv_category_peer_benchmarks: one row per primary_category with the same
+--    three p75 values, computed once at refresh time.  The per-request read
+--    becomes a PK-style lookup on ~60 rows.
+-- 2. refresh_mv_category_peer_benchmarks() RPC (same signature as the other
+--    refresh_mv_* RPCs), called by db.refresh_category_stats_cache() in
+--    bootstrap Pass 4 right after the category box-plot stats are refreshed.
+--
+-- The p75 definition matches the Python implementation exactly: sort the
+-- values ascending and take element floor(n * 0.75) (0-based), clamped to
+-- the last element.  percentile_disc(0.75) picks ceil(n * 0.75) - 1 instead,
+-- so arrays are indexed explicitly.
+--
+-- db.py falls back to the live per-category scan while this view is missing.
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Materialized view
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.mv_category_peer_benchmarks AS
+WITH peers AS (
+    SELECT
+        c.primary_category,
+        array_agg(c.current_view_count::float8 / c.current_video_count
+                  ORDER BY c.current_view_count::float8 / c.current_video_count)
+            FILTER (WHERE COALESCE(c.current_view_count, 0) > 0)          AS vpvs,
+        array_agg(COALESCE(c.views_change_30d, 0)::float8 / c.current_subscribers
+                  ORDER BY COALESCE(c.views_change_30d, 0)::float8 / c.current_subscribers)
+            FILTER (WHERE COALESCE(c.views_change_30d, 0) >= 0)           AS vcs,
+        array_agg(c.engagement_score::float8 ORDER BY c.engagement_score::float8)
+            FILTER (WHERE c.engagement_score > 0)                         AS engagements,
+        COUNT(*)::bigint                                                  AS peer_count
+    FROM public.creators c
+    WHERE c.sync_status = 'synced'
+      AND c.primary_category IS NOT NULL
+      AND c.current_video_count > 0
+      AND c.current_subscribers > 0
+    GROUP BY c.primary_category
+)
+SELECT
+    primary_category,
+    peer_count,
+    COALESCE(vpvs[LEAST(FLOOR(cardinality(vpvs) * 0.75)::int + 1, cardinality(vpvs))], 0)
+        AS peer_vpv_p75,
+    COALESCE(vcs[LEAST(FLOOR(cardinality(vcs) * 0.75)::int + 1, cardinality(vcs))], 0)
+        AS peer_vc_p75,
+    COALESCE(
+        engagements[LEAST(FLOOR(cardinality(engagements) * 0.75)::int + 1,
+                          cardinality(engagements))],
+        0
+    ) AS peer_engagement_p75
+FROM peers
+WITH DATA;
+
+-- One row per category; also allows REFRESH ... CONCURRENTLY later if needed.
+CREATE UNIQUE INDEX IF NOT EXISTS mv_category_peer_benchmarks_category_idx
+    ON public.mv_category_peer_benchmarks (primary_category);
+
+COMMENT ON MATERIALIZED VIEW public.mv_category_peer_benchmarks IS
+    'p75 views-per-video, viral coefficient and engagement of synced creators per '
+    'primary_category. Refreshed via refresh_mv_category_peer_benchmarks() in '
+    'bootstrap Pass 4. Replaces the per-view row scan in '
+    'db.get_category_peer_benchmarks() (migration 060).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Refresh RPC  (mirrors refresh_mv_category_counts)
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.refresh_mv_category_peer_benchmarks()
+RETURNS TABLE (
+    materialized_view   text,
+    rows_refreshed      bigint,
+    refresh_duration_ms bigint
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    _start TIMESTAMPTZ;
+    _end   TIMESTAMPTZ;
+    _rows  BIGINT;
+BEGIN
+    -- The aggregate scans every synced creator; keep it clear of the
+    -- role-level PostgREST timeout (see migration 025).
+    SET LOCAL statement_timeout = 0;
+
+    _start := clock_timestamp();
+    REFRESH MATERIALIZED VIEW public.mv_category_peer_benchmarks;
+    _end := clock_timestamp();
+    SELECT COUNT(*) INTO _rows FROM public.mv_category_peer_benchmarks;
+    RETURN QUERY SELECT
+        'mv_category_peer_benchmarks'::TEXT,
+        _rows,
+        EXTRACT(MILLISECONDS FROM (_end - _start))::BIGINT;
+END;
+$$;
+
+COMMENT ON FUNCTION public.refresh_mv_category_peer_benchmarks() IS
+    'Refresh mv_category_peer_benchmarks. Called by db.py '
+    'refresh_category_stats_cache() in bootstrap Pass 4 (migration 060).';
+
+-- Verification (run after applying):
+-- SELECT * FROM public.refresh_mv_category_peer_benchmarks();
+-- SELECT * FROM public.mv_category_peer_benchmarks ORDER BY peer_count DESC LIMIT 10;
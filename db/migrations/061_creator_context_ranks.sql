@@ -0,0 +1,156 @@
+-- Migration 061: get_creator_context_ranks() — all three profile ranks in one call
+--
+-- Root cause
+-- ----------
+-- Every creator profile (and each side of /compare) computed the creator's
+-- subscriber rank in its country, language and primary category with up to
+-- three separate COUNT queries over creators, each fanned out to its own
+-- thread and wrapped in its own retry loop (db.get_creator_rank).
+--
+-- Fix
+-- ---
+-- 1. mv_creator_segment_subscribers: per (segment, value) the subscriber
+--    counts of all synced creators as one array sorted descending.  Rebuilt
+--    by refresh_mv_creator_segment_subscribers(), which bootstrap Pass 5
+--    calls alongside the other refresh_mv_* RPCs.
+-- 2. rank_in_desc_array(): binary search over such an array, returning
+--    1 + the number of entries strictly greater than the value — the same
+--    definition db.get_creator_rank used.
+-- 3. get_creator_context_ranks(): three unique-index lookups on the MV and
+--    three binary searches; one round trip per profile.
+--
+-- db.get_creator_context_ranks() falls back to the per-segment COUNT
+-- queries while this migration is not applied.
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Materialized view
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.mv_creator_segment_subscribers AS
+SELECT 'country_code'::text AS segment, country_code AS value,
+       array_agg(current_subscribers::bigint ORDER BY current_subscribers DESC) AS subscribers_desc
+FROM public.creators
+WHERE sync_status = 'synced' AND current_subscribers IS NOT NULL
+  AND country_code IS NOT NULL AND country_code <> ''
+GROUP BY country_code
+UNION ALL
+SELECT 'default_language'::text, default_language,
+       array_agg(current_subscribers::bigint ORDER BY current_subscribers DESC)
+FROM public.creators
+WHERE sync_status = 'synced' AND current_subscribers IS NOT NULL
+  AND default_language IS NOT NULL AND default_language <> ''
+GROUP BY default_language
+UNION ALL
+SELECT 'primary_category'::text, primary_category,
+       array_agg(current_subscribers::bigint ORDER BY current_subscribers DESC)
+FROM public.creators
+WHERE sync_status = 'synced' AND current_subscribers IS NOT NULL
+  AND primary_category IS NOT NULL AND primary_category <> ''
+GROUP BY primary_category
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_creator_segment_subscribers_key_idx
+    ON public.mv_creator_segment_subscribers (segment, value);
+
+COMMENT ON MATERIALIZED VIEW public.mv_creator_segment_subscribers IS
+    'Descending subscriber-count arrays of synced creators per country, language '
+    'and primary category. Read by get_creator_context_ranks(); refreshed via '
+    'refresh_mv_creator_segment_subscribers() in bootstrap Pass 5 (migration 061).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Binary search helper
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.rank_in_desc_array(p_desc bigint[], p_value bigint)
+RETURNS integer
+LANGUAGE plpgsql
+IMMUTABLE
+AS $$
+DECLARE
+    lo  integer := 1;
+    hi  integer := COALESCE(cardinality(p_desc), 0) + 1;
+    mid integer;
+BEGIN
+    -- First position whose value is <= p_value; everything before it is larger.
+    WHILE lo < hi LOOP
+        mid := (lo + hi) / 2;
+        IF p_desc[mid] > p_value THEN
+            lo := mid + 1;
+        ELSE
+            hi := mid;
+        END IF;
+    END LOOP;
+    RETURN lo;
+END;
+$$;
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 3. Ranks RPC
+-- ─────────────────────────────────────────────────────────────────────────────
+-- A NULL/empty segment value, or a value with no synced creators in the MV,
+-- yields a NULL rank for that segment.
+CREATE OR REPLACE FUNCTION public.get_creator_context_ranks(
+    p_subscribers bigint,
+    p_country     text DEFAULT NULL,
+    p_language    text DEFAULT NULL,
+    p_category    text DEFAULT NULL
+)
+RETURNS TABLE (country_rank integer, language_rank integer, category_rank integer)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT
+        (SELECT public.rank_in_desc_array(m.subscribers_desc, p_subscribers)
+           FROM public.mv_creator_segment_subscribers m
+          WHERE m.segment = 'country_code' AND m.value = p_country),
+        (SELECT public.rank_in_desc_array(m.subscribers_desc, p_subscribers)
+           FROM public.mv_creator_segment_subscribers m
+          WHERE m.segment = 'default_language' AND m.value = p_language),
+        (SELECT public.rank_in_desc_array(m.subscribers_desc, p_subscribers)
+           FROM public.mv_creator_segment_subscribers m
+          WHERE m.segment = 'primary_category' AND m.value = p_category);
+$$;
+
+COMMENT ON FUNCTION public.get_creator_context_ranks(bigint, text, text, text) IS
+    'Subscriber rank of a creator within its country, language and primary category '
+    '(1 + synced creators with more subscribers), via binary search over '
+    'mv_creator_segment_subscribers. One call per profile (migration 061).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 4. Refresh RPC  (mirrors refresh_mv_category_counts)
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.refresh_mv_creator_segment_subscribers()
+RETURNS TABLE (
+    materialized_view   text,
+    rows_refreshed      bigint,
+    refresh_duration_ms bigint
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    _start TIMESTAMPTZ;
+    _end   TIMESTAMPTZ;
+    _rows  BIGINT;
+BEGIN
+    -- Aggregates every synced creator three times; see migration 025.
+    SET LOCAL statement_timeout = 0;
+
+    _start := clock_timestamp();
+    REFRESH MATERIALIZED VIEW public.mv_creator_segment_subscribers;
+    _end := clock_timestamp();
+    SELECT COUNT(*) INTO _rows FROM public.mv_creator_segment_subscribers;
+    RETURN QUERY SELECT
+        'mv_creator_segment_subscribers'::TEXT,
+        _rows,
+        EXTRACT(MILLISECONDS FROM (_end - _start))::BIGINT;
+END;
+$$;
+
+COMMENT ON FUNCTION public.refresh_mv_creator_segment_subscribers() IS
+    'Refresh mv_creator_segment_subscribers. Called by db.py refresh_hero_stats_cache() '
+    'alongside the other materialized view refreshes (migration 061).';
+
+-- Verification (run after applying):
+-- SELECT * FROM public.refresh_mv_creator_segment_subscribers();
+-- SELECT * FROM public.get_creator_context_ranks(1000000, 'US', 'en', 'Gaming');
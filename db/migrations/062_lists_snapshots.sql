@@ -0,0 +1,33 @@
+-- Migration 062: lists_snapshots — prebuilt /lists tab payloads
+--
+-- Root cause
+-- ----------
+-- routes/lists.lists_route ran eleven independent queries (meta, six creator
+-- lists, three group pages, heat map, language count) on every request.  The
+-- CDN only shields logged-out traffic, so each logged-in /lists view cost
+-- eleven round trips for data that changes once per bootstrap cycle.
+--
+-- Fix
+-- ---
+-- The bootstrap worker (Pass 7) builds every tab payload once and upserts it
+-- here as a single JSONB blob.  The route reads the row with one PK lookup and
+-- only falls back to the live queries when the row is missing, too old, or
+-- was written by a different payload version (services/lists_snapshot.py).
+
+CREATE TABLE IF NOT EXISTS public.lists_snapshots (
+    key        text        PRIMARY KEY,
+    version    integer     NOT NULL,
+    payload    jsonb       NOT NULL,
+    built_at   timestamptz NOT NULL DEFAULT now()
+);
+
+COMMENT ON TABLE public.lists_snapshots IS
+    'Prebuilt page payloads (key=lists_page: all /lists tabs). Written by '
+    'worker/bootstrap_creators.py Pass 7; read by routes/lists.lists_route '
+    '(migration 062).';
+
+-- Written and read with the service role key only.
+ALTER TABLE public.lists_snapshots ENABLE ROW LEVEL SECURITY;
+
+-- Verification (run after the next bootstrap):
+-- SELECT key, version, built_at, pg_column_size(payload) FROM public.lists_snapshots;
@@ -0,0 +1,149 @@
+-- Migration 063: mv_niche_heatmap — per-category Niche Heat Map aggregates
+--
+-- Root cause
+-- ----------
+-- db_lists.get_niche_heatmap_data() fetched up to _MAX_FALLBACK_FETCH synced
+-- creator rows (topic_categories, engagement, growth, grade) on every /lists
+-- render and bucketed them in a Python loop.  Megabytes of transfer and
+-- seconds of CPU per call — and once the table outgrew the cap the tiles were
+-- computed from an arbitrary subset of creators.
+--
+-- Fix
+-- ---
+-- 1. mv_niche_heatmap: one row per normalised topic category with the same
+--    four aggregates the Python loop produced (creator_count, avg_engagement,
+--    avg_growth_pct, premium_ratio), over every synced creator.
+-- 2. get_niche_heatmap(p_min_creators) RPC: a seq scan over ~60 rows.
+-- 3. refresh_mv_niche_heatmap() RPC (same signature as the other refresh_mv_*
+--    RPCs), called by db.refresh_hero_stats_cache() in bootstrap Pass 5.
+--
+-- Category normalisation mirrors utils.normalize_category_name (Wikipedia URL
+-- prefix, query string and fragment stripped; underscores to spaces;
+-- whitespace collapsed).  Rows whose topic_categories is not a JSON array are
+-- skipped via safe_jsonb() (migration 053), as in mv_category_counts.
+--
+-- db_lists.get_niche_heatmap_data() falls back to the client-side scan while
+-- this migration is not applied.
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Materialized view
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE MATERIALIZED VIEW IF NOT EXISTS public.mv_niche_heatmap AS
+WITH unnested AS (
+    SELECT
+        TRIM(
+            REGEXP_REPLACE(
+                REPLACE(
+                    CASE
+                        WHEN cat_raw.value ~ '^https?://([^/]+\.)?wikipedia\.org/wiki/'
+                        THEN SPLIT_PART(
+                                 SPLIT_PART(SPLIT_PART(cat_raw.value, '/wiki/', 2), '?', 1),
+                                 '#', 1
+                             )
+                        ELSE cat_raw.value
+                    END,
+                    '_', ' '
+                ),
+                '\s+', ' ', 'g'
+            )
+        ) AS cat,
+        c.engagement_score::float8 AS engagement,
+        c.subscribers_change_30d::float8 / c.current_subscribers * 100 AS growth_pct,
+        c.quality_grade IN ('A+', 'A') AS is_premium
+    FROM public.creators c
+    CROSS JOIN LATERAL (SELECT public.safe_jsonb(c.topic_categories) AS j) AS parsed
+    CROSS JOIN LATERAL jsonb_array_elements_text(
+        CASE
+            WHEN jsonb_typeof(parsed.j) = 'array' THEN parsed.j
+            ELSE '[]'::jsonb
+        END
+    ) AS cat_raw(value)
+    WHERE c.sync_status         = 'synced'
+      AND c.channel_name        IS NOT NULL
+      AND c.topic_categories    IS NOT NULL
+      AND c.current_subscribers  > 0
+)
+SELECT
+    cat                                                   AS category,
+    COUNT(*)::bigint                                      AS creator_count,
+    AVG(engagement)                                       AS avg_engagement,
+    AVG(growth_pct)                                       AS avg_growth_pct,
+    COUNT(*) FILTER (WHERE is_premium)::float8 / COUNT(*) AS premium_ratio
+FROM unnested
+WHERE cat <> ''
+GROUP BY cat
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_niche_heatmap_category_idx
+    ON public.mv_niche_heatmap (category);
+
+COMMENT ON MATERIALIZED VIEW public.mv_niche_heatmap IS
+    'Per-topic-category creator count, mean engagement, mean 30-day subscriber '
+    'growth % and share of A/A+ creators (synced only). Read by get_niche_heatmap(); '
+    'refreshed via refresh_mv_niche_heatmap() in bootstrap Pass 5 (migration 063).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Read RPC
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.get_niche_heatmap(p_min_creators integer DEFAULT 3)
+RETURNS TABLE (
+    category       text,
+    creator_count  bigint,
+    avg_engagement double precision,
+    avg_growth_pct double precision,
+    premium_ratio  double precision
+)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    SELECT category, creator_count, avg_engagement, avg_growth_pct, premium_ratio
+    FROM public.mv_niche_heatmap
+    WHERE creator_count >= p_min_creators
+    ORDER BY creator_count DESC, category;
+$$;
+
+COMMENT ON FUNCTION public.get_niche_heatmap(integer) IS
+    'Niche Heat Map tiles from mv_niche_heatmap, largest categories first. '
+    'Replaces the client-side creator scan in db_lists.get_niche_heatmap_data() '
+    '(migration 063).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 3. Refresh RPC  (mirrors refresh_mv_category_counts)
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.refresh_mv_niche_heatmap()
+RETURNS TABLE (
+    materialized_view   text,
+    rows_refreshed      bigint,
+    refresh_duration_ms bigint
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    _start TIMESTAMPTZ;
+    _end   TIMESTAMPTZ;
+    _rows  BIGINT;
+BEGIN
+    -- Unnests topic_categories of every synced creator; see migration 025.
+    SET LOCAL statement_timeout = 0;
+
+    _start := clock_timestamp();
+    REFRESH MATERIALIZED VIEW public.mv_niche_heatmap;
+    _end := clock_timestamp();
+    SELECT COUNT(*) INTO _rows FROM public.mv_niche_heatmap;
+    RETURN QUERY SELECT
+        'mv_niche_heatmap'::TEXT,
+        _rows,
+        EXTRACT(MILLISECONDS FROM (_end - _start))::BIGINT;
+END;
+$$;
+
+COMMENT ON FUNCTION public.refresh_mv_niche_heatmap() IS
+    'Refresh mv_niche_heatmap. Called by db.py refresh_hero_stats_cache() '
+    'alongside the other materialized view refreshes (migration 063).';
+
+-- Verification (run after applying):
+-- SELECT * FROM public.refresh_mv_niche_heatmap();
+-- SELECT * FROM public.get_niche_heatmap(3) LIMIT 10;
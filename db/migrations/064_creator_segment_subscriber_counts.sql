@@ -0,0 +1,171 @@
+-- Migration 064: mv_creator_segment_subscribers as indexed cumulative counts
+--
+-- Root cause
+-- ----------
+-- Migration 061 stored, per (segment, value), every synced creator's
+-- subscriber count as one array.  The largest segments (country US, language
+-- en) hold hundreds of thousands of bigints: each array is a multi-megabyte
+-- TOASTed value that get_creator_context_ranks() had to fetch and
+-- decompress in full on every profile view before the binary search, and
+-- the whole view was rewritten on every refresh.
+--
+-- Fix
+-- ---
+-- 1. mv_creator_segment_subscribers is rebuilt as one row per
+--    (segment, value, subscribers) with creators_at_least = number of synced
+--    creators in that segment with at least that many subscribers.  Public
+--    subscriber counts are rounded to three significant figures, so a
+--    segment has at most a few thousand distinct values — the view is small
+--    and no row is large.
+-- 2. The unique index (segment, value, subscribers) answers
+--    "creators with more than N subscribers" as a single index probe: the
+--    creators_at_least of the smallest subscriber value above N.  Rank keeps
+--    061's definition: 1 + synced creators with strictly more subscribers.
+-- 3. get_creator_context_ranks() keeps its signature (db.py is unchanged);
+--    rank_in_desc_array() is dropped.  The unique index also lets the
+--    refresh run CONCURRENTLY so profile reads are not blocked.
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 1. Materialized view
+-- ─────────────────────────────────────────────────────────────────────────────
+DROP MATERIALIZED VIEW IF EXISTS public.mv_creator_segment_subscribers CASCADE;
+DROP FUNCTION IF EXISTS public.rank_in_desc_array(bigint[], bigint);
+
+CREATE MATERIALIZED VIEW public.mv_creator_segment_subscribers AS
+WITH segment_creators AS (
+    SELECT 'country_code'::text AS segment, country_code AS value,
+           current_subscribers::bigint AS subscribers
+    FROM public.creators
+    WHERE sync_status = 'synced' AND current_subscribers IS NOT NULL
+      AND country_code IS NOT NULL AND country_code <> ''
+    UNION ALL
+    SELECT 'default_language'::text, default_language, current_subscribers::bigint
+    FROM public.creators
+    WHERE sync_status = 'synced' AND current_subscribers IS NOT NULL
+      AND default_language IS NOT NULL AND default_language <> ''
+    UNION ALL
+    SELECT 'primary_category'::text, primary_category, current_subscribers::bigint
+    FROM public.creators
+    WHERE sync_status = 'synced' AND current_subscribers IS NOT NULL
+      AND primary_category IS NOT NULL AND primary_category <> ''
+),
+value_counts AS (
+    SELECT segment, value, subscribers, COUNT(*) AS creators
+    FROM segment_creators
+    GROUP BY segment, value, subscribers
+)
+SELECT
+    segment,
+    value,
+    subscribers,
+    SUM(creators) OVER (
+        PARTITION BY segment, value
+        ORDER BY subscribers DESC
+        ROWS BETWEEN UNBOUNDED PRECEDING AND CURRENT ROW
+    )::bigint AS creators_at_least
+FROM value_counts
+WITH DATA;
+
+CREATE UNIQUE INDEX IF NOT EXISTS mv_creator_segment_subscribers_key_idx
+    ON public.mv_creator_segment_subscribers (segment, value, subscribers);
+
+COMMENT ON MATERIALIZED VIEW public.mv_creator_segment_subscribers IS
+    'Per country / language / primary category and distinct subscriber count: '
+    'synced creators with at least that many subscribers. Read by '
+    'get_creator_context_ranks(); refreshed via '
+    'refresh_mv_creator_segment_subscribers() in bootstrap Pass 5 (migration 064).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 2. Ranks RPC
+-- ─────────────────────────────────────────────────────────────────────────────
+-- A NULL/empty segment value, or a value with no synced creators in the MV,
+-- yields a NULL rank for that segment.
+CREATE OR REPLACE FUNCTION public.get_creator_context_ranks(
+    p_subscribers bigint,
+    p_country     text DEFAULT NULL,
+    p_language    text DEFAULT NULL,
+    p_category    text DEFAULT NULL
+)
+RETURNS TABLE (country_rank integer, language_rank integer, category_rank integer)
+LANGUAGE sql
+STABLE
+SECURITY DEFINER
+SET search_path = public
+AS $$
+    WITH wanted(segment, value) AS (
+        VALUES ('country_code', p_country),
+               ('default_language', p_language),
+               ('primary_category', p_category)
+    ),
+    ranks AS (
+        SELECT w.segment,
+               CASE WHEN EXISTS (
+                        SELECT 1 FROM public.mv_creator_segment_subscribers m
+                        WHERE m.segment = w.segment AND m.value = w.value
+                    )
+                    THEN 1 + COALESCE((
+                        SELECT m.creators_at_least
+                        FROM public.mv_creator_segment_subscribers m
+                        WHERE m.segment = w.segment AND m.value = w.value
+                          AND m.subscribers > p_subscribers
+                        ORDER BY m.subscribers
+                        LIMIT 1
+                    ), 0)
+               END::integer AS rank
+        FROM wanted w
+    )
+    SELECT
+        (SELECT rank FROM ranks WHERE segment = 'country_code'),
+        (SELECT rank FROM ranks WHERE segment = 'default_language'),
+        (SELECT rank FROM ranks WHERE segment = 'primary_category');
+$$;
+
+COMMENT ON FUNCTION public.get_creator_context_ranks(bigint, text, text, text) IS
+    'Subscriber rank of a creator within its country, language and primary category '
+    '(1 + synced creators with more subscribers), via index probes on '
+    'mv_creator_segment_subscribers. One call per profile (migrations 061, 064).';
+
+-- ─────────────────────────────────────────────────────────────────────────────
+-- 3. Refresh RPC  (same signature as 061)
+-- ─────────────────────────────────────────────────────────────────────────────
+CREATE OR REPLACE FUNCTION public.refresh_mv_creator_segment_subscribers()
+RETURNS TABLE (
+    materialized_view   text,
+    rows_refreshed      bigint,
+    refresh_duration_ms bigint
+)
+LANGUAGE plpgsql
+SECURITY DEFINER
+AS $$
+DECLARE
+    _start TIMESTAMPTZ;
+    _end   TIMESTAMPTZ;
+    _rows  BIGINT;
+BEGIN
+    -- Aggregates every synced creator three times; see migration 025.
+    SET LOCAL statement_timeout = 0;
+
+    _start := clock_timestamp();
+    REFRESH MATERIALIZED VIEW CONCURRENTLY public.mv_creator_segment_subscribers;
+    _end := clock_timestamp();
+    SELECT COUNT(*) INTO _rows FROM public.mv_creator_segment_subscribers;
+    RETURN QUERY SELECT
+        'mv_creator_segment_subscribers'::TEXT,
+        _rows,
+        EXTRACT(MILLISECONDS FROM (_end - _start))::BIGINT;
+END;
+$$;
+
+COMMENT ON FUNCTION public.refresh_mv_creator_segment_subscribers() IS
+    'Refresh mv_creator_segment_subscribers (concurrently). Called by db.py '
+    'refresh_hero_stats_cache() alongside the other materialized view refreshes '
+    '(migrations 061, 064).';
+
+-- Verification (run after applying):
+-- SELECT * FROM public.refresh_mv_creator_segment_subscribers();
+-- SELECT segment, COUNT(*) AS rows, MAX(creators_at_least) AS creators
+--   FROM public.mv_creator_segment_subscribers GROUP BY segment;
+-- SELECT * FROM public.get_creator_context_ranks(1000000, 'US', 'en', 'Gaming');
+-- -- must match the live definition:
+-- SELECT 1 + COUNT(*) FROM public.creators
+--  WHERE sync_status = 'synced' AND country_code = 'US' AND current_subscribers > 1000000;
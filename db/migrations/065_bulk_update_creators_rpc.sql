@@ -0,0 +1,75 @@
+-- Migration 065: bulk_update_creators() — partial creators updates in one call
+--
+-- Problem: db.bulk_update_creators() wrote batches of partial rows with a
+-- PostgREST upsert (on_conflict=id).  An upsert is an INSERT ... ON CONFLICT:
+-- it needs INSERT privilege and a value for every NOT NULL column, so partial
+-- rows could fail constraints or RLS even though the row always exists, and
+-- every such batch fell back to one UPDATE per creator.
+--
+-- Fix: bulk_update_creators(p_rows) is a plain UPDATE ... FROM over the rows.
+-- Each row carries "id" plus the columns to change; rows are grouped by their
+-- key set so a column missing from a row is left untouched (never written as
+-- NULL).  One statement per shape, all in the caller's transaction: the call
+-- writes every row or none.  Runs as the caller (no SECURITY DEFINER), so it
+-- needs exactly the UPDATE privilege the per-row path needed.
+--
+-- Called from db.py:
+--   sb.rpc("bulk_update_creators", {"p_rows": [
+--       {"id": "...", "current_subscribers": 1200, "sync_status": "synced"},
+--       {"id": "...", "current_subscribers": 900, "prev_snapshot_at": "..."},
+--   ]}).execute()
+
+CREATE OR REPLACE FUNCTION public.bulk_update_creators(p_rows JSONB)
+RETURNS INTEGER
+LANGUAGE plpgsql
+SET search_path = public
+AS $$
+DECLARE
+    v_keys    TEXT[];
+    v_rows    JSONB;
+    v_updated INTEGER;
+    v_total   INTEGER := 0;
+BEGIN
+    FOR v_keys, v_rows IN
+        SELECT keys, jsonb_agg(r)
+        FROM (
+            SELECT r, ARRAY(SELECT jsonb_object_keys(r) ORDER BY 1) AS keys
+            FROM jsonb_array_elements(COALESCE(p_rows, '[]'::jsonb)) AS r
+        ) shaped
+        GROUP BY keys
+    LOOP
+        IF NOT 'id' = ANY (v_keys) THEN
+            RAISE EXCEPTION 'bulk_update_creators: every row needs an "id"';
+        END IF;
+        v_keys := array_remove(v_keys, 'id');
+        CONTINUE WHEN cardinality(v_keys) = 0;
+
+        -- jsonb_populate_recordset types each value by its creators column.
+        EXECUTE format(
+            'UPDATE public.creators AS c SET (%s) = ROW(%s) '
+            'FROM jsonb_populate_recordset(NULL::public.creators, $1) AS v '
+            'WHERE c.id = v.id',
+            (SELECT string_agg(format('%I', k), ', ') FROM unnest(v_keys) AS k),
+            (SELECT string_agg(format('v.%I', k), ', ') FROM unnest(v_keys) AS k)
+        ) USING v_rows;
+        GET DIAGNOSTICS v_updated = ROW_COUNT;
+        v_total := v_total + v_updated;
+    END LOOP;
+    RETURN v_total;
+END;
+$$;
+
+-- Workers and backfills run with the service role key.
+REVOKE ALL ON FUNCTION public.bulk_update_creators(JSONB) FROM PUBLIC;
+GRANT EXECUTE ON FUNCTION public.bulk_update_creators(JSONB) TO service_role;
+
+COMMENT ON FUNCTION public.bulk_update_creators IS
+    'Partial UPDATE of many creators rows (matched on id; only the keys present '
+    'in each row are written). Returns the number of rows updated.';
+
+-- Verification (run after applying):
+-- BEGIN;
+-- SELECT public.bulk_update_creators(
+--     jsonb_build_array(jsonb_build_object('id', (SELECT id FROM public.creators LIMIT 1),
+--                                          'sync_status', 'synced')));
+-- ROLLBACK;
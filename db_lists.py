@@ -7,6 +7,7 @@ import json
 import logging
 import random
 import time
+from datetime import datetime, timezone
 from typing import Callable, NamedTuple
 from urllib.parse import unquote, urlparse
 
@@ -667,6 +668,9 @@ _top_countries_cache: tuple[float, list[tuple[str, int]]] | None = None
 _TOP_LANGUAGES_TTL_SECONDS = 600  # 10 min — same change cadence as categories
 _top_languages_cache: tuple[float, list[tuple[str, int]]] | None = None
 
+_NICHE_HEATMAP_TTL_SECONDS = 600  # 10 min — mv_niche_heatmap changes only on worker runs
+_niche_heatmap_cache: tuple[float, list[dict]] | None = None
+
 
 def clear_lists_meta_cache() -> None:
     """Clear this process's short-lived lists metadata cache."""
@@ -693,6 +697,12 @@ def clear_top_languages_cache() -> None:
     _top_languages_cache = None
 
 
+def clear_niche_heatmap_cache() -> None:
+    """Clear this process's short-lived Niche Heat Map cache."""
+    global _niche_heatmap_cache
+    _niche_heatmap_cache = None
+
+
 def _get_supabase_client():
     """Access the Supabase client (initialized at app startup via db.init_supabase())."""
     from db import supabase_client
@@ -1957,19 +1967,75 @@ def get_niche_heatmap_data(min_creators: int = 3) -> list[dict]:
     Aggregate per-category momentum for the Niche Heat Map.
 
     For each normalized category with at least *min_creators* synced creators,
-    computes:
+    returns:
       - creator_count
       - avg_engagement  (mean engagement_score, null rows excluded)
       - avg_growth_pct  (mean subscribers_change_30d / current_subscribers * 100)
       - premium_ratio   (fraction of creators with quality_grade A+ or A)
 
     Returns list of dicts sorted by creator_count descending (largest tiles first).
-    No new DB columns required — all derived from existing creators fields.
+
+    Reads the ``get_niche_heatmap`` RPC over ``mv_niche_heatmap``
+    (db/migrations/063_mv_niche_heatmap.sql), falling back to a capped
+    client-side scan if the RPC is unavailable.  All categories are cached
+    in-process for ``_NICHE_HEATMAP_TTL_SECONDS`` so any ``min_creators`` is
+    served from one fetch.
     """
+    global _niche_heatmap_cache
+    now = time.monotonic()
+    if _niche_heatmap_cache is not None:
+        ts, full = _niche_heatmap_cache
+        if now - ts < _NICHE_HEATMAP_TTL_SECONDS:
+            return [dict(row) for row in full if row["creator_count"] >= min_creators]
+
     supabase_client = _get_supabase_client()
     if not supabase_client:
         return []
 
+    full = _fetch_niche_heatmap_rpc(supabase_client)
+    if full is None:
+        full = _scan_niche_heatmap_data(supabase_client)
+    if full:
+        _niche_heatmap_cache = (now, full)
+    return [dict(row) for row in full if row["creator_count"] >= min_creators]
+
+
+def _heatmap_row(category: str, creator_count: int, avg_engagement, avg_growth_pct, premium_ratio):
+    return {
+        "category": category,
+        "creator_count": creator_count,
+        "avg_engagement": round(avg_engagement, 1) if avg_engagement is not None else None,
+        "avg_growth_pct": round(avg_growth_pct, 1) if avg_growth_pct is not None else None,
+        "premium_ratio": round(premium_ratio, 2),
+    }
+
+
+def _fetch_niche_heatmap_rpc(supabase_client) -> list[dict] | None:
+    """All Niche Heat Map rows from the RPC, or None when it is unavailable."""
+    try:
+        resp = supabase_client.rpc("get_niche_heatmap", {"p_min_creators": 1}).execute()
+    except Exception as e:
+        logger.warning("[Lists] get_niche_heatmap RPC failed, scanning creators: %s", e)
+        return None
+    return [
+        _heatmap_row(
+            row["category"],
+            int(row.get("creator_count") or 0),
+            row.get("avg_engagement"),
+            row.get("avg_growth_pct"),
+            float(row.get("premium_ratio") or 0),
+        )
+        for row in resp.data or []
+        if row.get("category")
+    ]
+
+
+def _scan_niche_heatmap_data(supabase_client) -> list[dict]:
+    """
+    Client-side Niche Heat Map over at most ``_MAX_FALLBACK_FETCH`` creators.
+
+    Pre-063 fallback; returns every category (no ``min_creators`` cut).
+    """
     try:
         response = (
             supabase_client.table("creators")
@@ -1986,7 +2052,7 @@ def get_niche_heatmap_data(min_creators: int = 3) -> list[dict]:
         )
         rows = response.data or []
     except Exception as e:
-        logger.exception("get_niche_heatmap_data: DB error: %s", e)
+        logger.exception("_scan_niche_heatmap_data: DB error: %s", e)
         return []
 
     # Accumulate per-category stats
@@ -2029,24 +2095,70 @@ def get_niche_heatmap_data(min_creators: int = 3) -> list[dict]:
             if is_premium:
                 b["_premium_count"] += 1
 
-    results = []
-    for b in buckets.values():
-        if b["creator_count"] < min_creators:
-            continue
-        avg_engagement = (
-            round(b["_engagement_sum"] / b["_engagement_n"], 1) if b["_engagement_n"] else None
-        )
-        avg_growth_pct = round(b["_growth_sum"] / b["_growth_n"], 1) if b["_growth_n"] else None
-        premium_ratio = round(b["_premium_count"] / b["creator_count"], 2)
-        results.append(
-            {
-                "category": b["category"],
-                "creator_count": b["creator_count"],
-                "avg_engagement": avg_engagement,
-                "avg_growth_pct": avg_growth_pct,
-                "premium_ratio": premium_ratio,
-            }
+    results = [
+        _heatmap_row(
+            b["category"],
+            b["creator_count"],
+            b["_engagement_sum"] / b["_engagement_n"] if b["_engagement_n"] else None,
+            b["_growth_sum"] / b["_growth_n"] if b["_growth_n"] else None,
+            b["_premium_count"] / b["creator_count"],
         )
+        for b in buckets.values()
+    ]
 
     results.sort(key=lambda x: x["creator_count"], reverse=True)
     return results
+
+
+# ─── /lists page snapshot (migration 062) ────────────────────────────────────
+# Write path: services.lists_snapshot.refresh_lists_snapshot() — bootstrap Pass 7
+# Read path:  services.lists_snapshot.load_lists_tab_data() — routes/lists.lists_route
+
+LISTS_SNAPSHOTS_TABLE = "lists_snapshots"
+
+
+def get_lists_snapshot(key: str) -> dict | None:
+    """
+    Return the ``{version, payload, built_at}`` row stored under ``key``.
+
+    One PK lookup. Returns None when the row is missing, the table does not
+    exist yet, or on any error — callers rebuild the payload live.
+    """
+    supabase_client = _get_supabase_client()
+    if not supabase_client:
+        return None
+    try:
+        resp = (
+            supabase_client.table(LISTS_SNAPSHOTS_TABLE)
+            .select("version, payload, built_at")
+            .eq("key", key)
+            .limit(1)
+            .execute()
+        )
+        return resp.data[0] if resp.data else None
+    except Exception:
+        logger.warning("[Lists] reading snapshot %r failed", key, exc_info=True)
+        return None
+
+
+def save_lists_snapshot(key: str, version: int, payload: dict) -> bool:
+    """Upsert ``payload`` under ``key``; returns True on success."""
+    supabase_client = _get_supabase_client()
+    if not supabase_client:
+        return False
+    try:
+        supabase_client.table(LISTS_SNAPSHOTS_TABLE).upsert(
+            {
+                "key": key,
+                "version": version,
+                # Round-trip through json so non-JSON scalars (dates, Decimals)
+                # are stringified here rather than failing inside the client.
+                "payload": json.loads(json.dumps(payload, default=str)),
+                "built_at": datetime.now(timezone.utc).isoformat(),
+            },
+            on_conflict="key",
+        ).execute()
+        return True
+    except Exception:
+        logger.exception("[Lists] saving snapshot %r failed", key)
+        return False
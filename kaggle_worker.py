@@ -194,6 +194,7 @@ from worker.creator_worker import (  # noqa: E402
 )
 from services.youtube_config import get_creator_worker_api_key  # noqa: E402
 from services.channel_utils import YouTubeResolver  # noqa: E402
+from services.youtube_http import YouTubeHttpClient  # noqa: E402
 
 
 # =============================================================================
@@ -278,6 +279,9 @@ class KeyPool:
     def current_resolver(self) -> "YouTubeResolver":
         return YouTubeResolver(api_key=self.current_slot.api_key)
 
+    def current_http_client(self) -> YouTubeHttpClient:
+        return YouTubeHttpClient(api_key=self.current_slot.api_key)
+
     def record_job(self) -> None:
         self.current_slot.jobs_processed += 1
 
@@ -362,6 +366,8 @@ async def run(
     # ── Initialise Supabase + resolver ────────────────────────────────────────
     await init()
     _cw.youtube_resolver = key_pool.current_resolver()
+    if _cw.youtube_http is not None:
+        _cw.youtube_http = key_pool.current_http_client()
 
     jobs_processed = 0
     empty_polls = 0
@@ -441,10 +447,13 @@ async def run(
                 )
                 rotated = key_pool.mark_exhausted_and_rotate()
                 if rotated:
-                    # Swap resolver to new key
+                    # Swap resolver (and httpx client, if in use) to new key
                     _cw.youtube_resolver = None
                     gc.collect()
                     _cw.youtube_resolver = key_pool.current_resolver()
+                    if _cw.youtube_http is not None:
+                        await _cw.youtube_http.aclose()
+                        _cw.youtube_http = key_pool.current_http_client()
                     logger.info(
                         "  ↩️  Re-queuing job %s for retry on new key",
                         job["id"],
@@ -11,12 +11,12 @@ import logging
 import mimetypes
 import os
 import re
-import time as _time_module
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 from urllib.parse import quote_plus
 
+import polars as pl
 from dotenv import load_dotenv
 from fasthtml.common import *
 from fasthtml.common import RedirectResponse, Response
@@ -74,10 +74,11 @@ from controllers.auth_routes import (
     safe_local_return_url,
 )
 
-from controllers.job_progress import job_progress_controller
+from controllers.job_progress import job_progress_controller, job_progress_stream
 from controllers.preview import preview_playlist_controller
 from db import (
     get_cached_playlist_stats,
+    get_dashboard_version,
     get_creator_stats,
     get_estimated_stats,
     get_favourite_creators_with_stats,
@@ -100,13 +101,20 @@ from db import (
     add_creator_by_handle,
     find_creator_by_handle,
 )
+from services.dashboard_render_cache import (
+    dashboard_etag,
+    etag_matches,
+    get_rendered_dashboard,
+    render_cache_key,
+    store_rendered_dashboard,
+)
+from services.dashboard_table import build_table_view, load_dashboard_data
+from services.exports import export_response, iter_frame_csv, iter_json_document
 from services.playlist_loader import load_cached_or_stub, load_dashboard_by_id
 from utils import (
     compute_dashboard_id,
-    get_columns,
     get_country_name,
     get_language_name,
-    sort_dataframe,
 )
 from validators import YoutubePlaylist, YoutubePlaylistValidator
 from views.dashboard import render_full_dashboard
@@ -116,7 +124,7 @@ from views.my_dashboards import (
     render_dashboard_page_partial,
 )
 from views.lists import _list_heart_btn
-from views.table import DISPLAY_HEADERS, get_sort_col, render_playlist_table
+from views.table import DISPLAY_HEADERS, render_playlist_table
 from routes.analysis import analysis_page_content
 from routes.creators import (
     CreatorProfileResult,
@@ -163,7 +171,7 @@ from routes.stripe_checkout import (
     billing_portal,
 )
 from services.plan_gate import gate_plan
-from services.sitemap import build_sitemap_xml, fetch_aplus_creators, fetch_synced_creators
+from services.sitemap import LiveSitemap, fetch_aplus_creators, fetch_synced_creators
 from services.rankings import ranking_path, resolve_country_slug, resolve_ranking_category_slug
 from routes.lists import (
     categories_explorer_route,
@@ -295,6 +303,24 @@ def _public_cached_response(sess, page, cache_control: str):
     return page
 
 
+def _with_server_timing(response, timings_ms: dict):
+    """Attach a ``Server-Timing`` header (one metric per sub-query) to private responses.
+
+    A ``public`` CDN-cacheable response is returned unchanged: the edge would
+    replay one render's timings to every visitor it serves.  The raw
+    ``Titled`` page returned to logged-in users gets the header through
+    FastHTML's ``HttpHeader``.
+    """
+    if not timings_ms:
+        return response
+    value = ", ".join(f"{name};dur={ms:.1f}" for name, ms in timings_ms.items())
+    if isinstance(response, Response):
+        if "public" not in response.headers.get("cache-control", ""):
+            response.headers["Server-Timing"] = value
+        return response
+    return (response, HttpHeader("Server-Timing", value))
+
+
 def _creator_not_found_response(req, sess, message: str) -> HTMLResponse:
     """Return a 404 HTMLResponse for the creator profile route.
 
@@ -848,6 +874,19 @@ def dashboard_page(dashboard_id: str, req, sess, sort_by: str = "Views", order:
         sess["intended_url"] = str(req.url.path)
         return RedirectResponse("/login", status_code=303)
 
+    # 0. Cheap version lookup → rendered-fragment cache + ETag revalidation
+    version = get_dashboard_version(dashboard_id, user_id=user_id)
+    cache_key = etag = None
+    if version:
+        cache_key = render_cache_key(dashboard_id, user_id, sort_by, order, version)
+        etag = dashboard_etag(cache_key)
+        if etag_matches(req.headers.get("if-none-match"), etag):
+            return Response(status_code=304, headers={"ETag": etag, **_DASHBOARD_CACHE_HEADERS})
+
+        rendered = get_rendered_dashboard(cache_key)
+        if rendered:
+            return _dashboard_page_response(rendered.title, rendered.html, oauth, req, sess, etag)
+
     # 1. Load dashboard via service layer (handles all data deserialization)
     #    Resolve dashboard_id → playlist data
     data = load_dashboard_by_id(dashboard_id, user_id=user_id)
@@ -859,7 +898,6 @@ def dashboard_page(dashboard_id: str, req, sess, sort_by: str = "Views", order:
         )
 
     # 2. Extract clean data from service response
-    df = data["df"]
     playlist_url = data["playlist_url"]
     playlist_name = data["playlist_name"]
     channel_name = data["channel_name"]
@@ -867,46 +905,47 @@ def dashboard_page(dashboard_id: str, req, sess, sort_by: str = "Views", order:
     summary_stats = data["summary_stats"]
     cached_stats = data["cached_stats"]
 
-    # 3. Sorting (identical to validate/full)
-    df_columns = get_columns(df)
-    sortable_map = {h: get_sort_col(h) for h in DISPLAY_HEADERS if get_sort_col(h) in df_columns}
-
-    # Validate sort parameter
-    if sort_by not in sortable_map:
+    # 3. Sorting (identical to validate/full) — Polars-backed table engine
+    table = build_table_view(data, sort_by, order)
+    if table.valid_sort != sort_by:
         logger.warning(f"Invalid sort column '{sort_by}', defaulting to 'Views'")
-        sort_by = "Views"
 
-    valid_sort = sort_by
-    valid_order = order if order in ("asc", "desc") else "desc"
+    # 4. Render dashboard (persistent mode)
+    title = f"{playlist_name} - ViralVibes"
+    html = to_xml(
+        render_full_dashboard(
+            df=table.rows,
+            summary_stats=summary_stats,
+            playlist_name=playlist_name,
+            channel_name=channel_name,
+            channel_thumbnail=channel_thumbnail,
+            playlist_url=playlist_url,
+            valid_sort=table.valid_sort,
+            valid_order=table.valid_order,
+            next_order=table.next_order,
+            cached_stats=cached_stats,
+            mode="persistent",
+            dashboard_id=dashboard_id,
+        )
+    )
+    if cache_key:
+        store_rendered_dashboard(cache_key, title, html)
+
+    return _dashboard_page_response(title, html, oauth, req, sess, etag)
 
-    if valid_sort in sortable_map:
-        sort_col = sortable_map[valid_sort]
-        df = sort_dataframe(df, sort_col, descending=(valid_order == "desc"))
 
-    def next_order(col):
-        return "asc" if (col == valid_sort and valid_order == "desc") else "desc"
+# Saved dashboards are per-user pages: let browsers keep a copy but always
+# revalidate against the data-version ETag.
+_DASHBOARD_CACHE_HEADERS = {"Cache-Control": "private, no-cache"}
 
-    # 4. Render dashboard (persistent mode)
-    return Titled(
-        f"{playlist_name} - ViralVibes",
-        Container(
-            NavComponent(oauth, req, sess),
-            render_full_dashboard(
-                df=df,
-                summary_stats=summary_stats,
-                playlist_name=playlist_name,
-                channel_name=channel_name,
-                channel_thumbnail=channel_thumbnail,
-                playlist_url=playlist_url,
-                valid_sort=valid_sort,
-                valid_order=valid_order,
-                next_order=next_order,
-                cached_stats=cached_stats,
-                mode="persistent",
-                dashboard_id=dashboard_id,
-            ),
-        ),
-    )
+
+def _dashboard_page_response(title: str, html: str, oauth, req, sess, etag: Optional[str]):
+    """Wrap a (possibly cached) dashboard fragment in the session-specific page shell."""
+    page = Titled(title, Container(NavComponent(oauth, req, sess), NotStr(html)))
+    if not etag:
+        return page
+    headers = {"ETag": etag, **_DASHBOARD_CACHE_HEADERS}
+    return (page, *(HttpHeader(k, v) for k, v in headers.items()))
 
 
 @rt("/validate/full", methods=["POST", "GET"])
@@ -938,36 +977,18 @@ def validate_full(
 
     # --- Check if this is an HTMX sort request BEFORE streaming ---
     if htmx.target == "playlist-table-container":
-        # For sort requests, just load data and return the table
-        data = load_cached_or_stub(playlist_url, meter_max or 1)
-        df = data["df"]
-        summary_stats = data["summary_stats"]
-
-        # --- Normalize sort_by ---
-        df_columns = get_columns(df)
-        sortable_map = {
-            h: get_sort_col(h) for h in DISPLAY_HEADERS if get_sort_col(h) in df_columns
-        }
-        valid_sort = sort_by if sort_by in sortable_map else "Views"
-        valid_order = order.lower() if order.lower() in ("asc", "desc") else "desc"
-
-        # --- Apply sorting ---
-        if valid_sort in sortable_map:
-            sort_col = sortable_map[valid_sort]
-            df = sort_dataframe(df, sort_col, descending=(valid_order == "desc"))
-
-        # --- Build next_order function ---
-        def next_order(col):
-            return "asc" if (col == valid_sort and valid_order == "desc") else "desc"
+        # For sort requests, reuse the cached per-dashboard frame and re-sort in Polars
+        data = load_dashboard_data(playlist_url, meter_max or 1)
+        table = build_table_view(data, sort_by, order)
 
         # Return only the table, no streaming
         table_html = render_playlist_table(
-            df=df,
-            summary_stats=summary_stats,
+            df=table.rows,
+            summary_stats=data["summary_stats"],
             playlist_url=playlist_url,
-            valid_sort=valid_sort,
-            valid_order=valid_order,
-            next_order=next_order,
+            valid_sort=table.valid_sort,
+            valid_order=table.valid_order,
+            next_order=table.next_order,
         )
         return table_html
 
@@ -1009,24 +1030,14 @@ def validate_full(
             )
             # Map display header → actual column in DF (raw for sorting, formatted for display)
 
-            # Build sortable_map: header → raw numeric column
-            df_columns = get_columns(df)
-            sortable_map = {
-                h: get_sort_col(h) for h in DISPLAY_HEADERS if get_sort_col(h) in df_columns
-            }
-
-            # --- 6) Normalize sort_by ---
-            valid_sort = sort_by if sort_by in sortable_map else "Views"
-            valid_order = order.lower() if order.lower() in ("asc", "desc") else "desc"
-
-            # --- 7) Apply sorting ---
-            if valid_sort in sortable_map:
-                sort_col = sortable_map[valid_sort]
-                df = sort_dataframe(df, sort_col, descending=(valid_order == "desc"))
+            # --- 6-7) Normalize sort_by and apply sorting (Polars table engine) ---
+            table = build_table_view(data, sort_by, order)
+            df = table.rows
+            valid_sort = table.valid_sort
+            valid_order = table.valid_order
 
             # --- 8) Build THEAD with working arrows ---
-            def next_order(col):
-                return "asc" if (col == valid_sort and valid_order == "desc") else "desc"
+            next_order = table.next_order
 
             # --- 9) Final render: steps + header side-by-side, then table, then plots ---
             # --- inside a target container for HTMX swaps ---
@@ -1272,6 +1283,19 @@ def get_job_progress_data(playlist_url: str, req, sess):
     return job_progress_controller(playlist_url)
 
 
+@rt("/job-progress/stream", methods=["GET"])
+def stream_job_progress(playlist_url: str, req, sess):
+    """Protected route - pushes job progress fragments over SSE"""
+    auth = sess.get("auth") if sess else None
+
+    # EventSource cannot render an auth alert; a 401 makes the client fall
+    # back to polling /job-progress, which does.
+    if require_auth(auth):
+        return StarletteResponse(status_code=401)
+
+    return EventStream(job_progress_stream(playlist_url))
+
+
 @rt("/modal/share/{dashboard_id}")
 def get_share_modal(dashboard_id: str, req, sess):
     """Show share modal for dashboard."""
@@ -1315,6 +1339,12 @@ def get_export_modal(dashboard_id: str, req, sess):
     )
 
 
+def _export_frame(data: dict) -> pl.DataFrame:
+    """Loader payload → Polars frame (stub payloads carry only the empty row list)."""
+    frame = data.get("frame")
+    return frame if frame is not None else pl.DataFrame(data.get("df") or [])
+
+
 @rt("/export/{dashboard_id}/csv")
 def export_csv(dashboard_id: str, req, sess):
     """Export dashboard data as CSV — requires Pro plan."""
@@ -1326,7 +1356,9 @@ def export_csv(dashboard_id: str, req, sess):
         return RedirectResponse("/login", status_code=303)
 
     # Plan gate: CSV export is a Pro+ feature
-    blocked = gate_plan(user_id, required="pro", redirect_url=f"/export/{dashboard_id}/csv")
+    blocked = gate_plan(
+        user_id, required="pro", redirect_url=f"/export/{dashboard_id}/csv", request=req
+    )
     if blocked:
         return blocked
 
@@ -1337,16 +1369,13 @@ def export_csv(dashboard_id: str, req, sess):
 
     # Pass user_id
     data = load_cached_or_stub(playlist_url, 1, user_id=user_id)
-    df = data["df"]
 
-    # Convert to CSV
-    csv_content = df.write_csv()
-
-    # Return as download
-    return Response(
-        content=csv_content,
+    # Stream the frame in batches instead of one write_csv() of the whole thing
+    return export_response(
+        iter_frame_csv(_export_frame(data)),
+        filename=f"viralvibes-{dashboard_id}.csv",
         media_type="text/csv",
-        headers={"Content-Disposition": f"attachment; filename=viralvibes-{dashboard_id}.csv"},
+        request=req,
     )
 
 
@@ -1362,7 +1391,9 @@ def export_json(dashboard_id: str, req, sess):
         return RedirectResponse("/login", status_code=303)
 
     # Plan gate: JSON export is a Pro+ feature
-    blocked = gate_plan(user_id, required="pro", redirect_url=f"/export/{dashboard_id}/json")
+    blocked = gate_plan(
+        user_id, required="pro", redirect_url=f"/export/{dashboard_id}/json", request=req
+    )
     if blocked:
         return blocked
 
@@ -1373,25 +1404,19 @@ def export_json(dashboard_id: str, req, sess):
 
     # Pass user_id
     data = load_cached_or_stub(playlist_url, 1, user_id=user_id)
-    df = data["df"]
-    summary_stats = data["summary_stats"]
 
-    # Convert to JSON
-    export_data = {
+    # Same document as before, but "videos" is streamed in batches
+    head = {
         "dashboard_id": dashboard_id,
         "playlist_name": data["playlist_name"],
         "channel_name": data["channel_name"],
-        "summary_stats": summary_stats,
-        "videos": df.to_dicts(),
+        "summary_stats": data["summary_stats"],
     }
-
-    json_content = json.dumps(export_data, indent=2)
-
-    # Return as download
-    return Response(
-        content=json_content,
+    return export_response(
+        iter_json_document(head, "videos", _export_frame(data)),
+        filename=f"viralvibes-{dashboard_id}.json",
         media_type="application/json",
-        headers={"Content-Disposition": f"attachment; filename=viralvibes-{dashboard_id}.json"},
+        request=req,
     )
 
 
@@ -1886,7 +1911,7 @@ def creator_profile_by_handle(req, sess, handle: str):
             ),
             *head_tags,
         )
-        return _public_cached_response(sess, page, _CC_STD)
+        return _with_server_timing(_public_cached_response(sess, page, _CC_STD), result.timings_ms)
 
     return Titled(
         "Creator Profile - ViralVibes",
@@ -1969,7 +1994,7 @@ def creator_profile(req, sess, creator_id: str):
             ),
             *head_tags,
         )
-        return _public_cached_response(sess, page, _CC_STD)
+        return _with_server_timing(_public_cached_response(sess, page, _CC_STD), result.timings_ms)
 
     return Titled(
         "Creator Profile - ViralVibes",
@@ -2620,17 +2645,16 @@ def admin_outreach_export(req, sess):
 
 
 # ============================================================================
-# Sitemap — live route with 24-hour in-process cache
+# Sitemap — live route, refreshed in the background every 6 hours
 # Static routes are imported from services.sitemap (single source of truth shared
 # with scripts/generate_sitemap.py and verified by scripts/verify_sitemap.py).
 # ============================================================================
 
-_SITEMAP_CACHE: dict = {"xml": None, "generated_at": None}
 _SITEMAP_CACHE_TTL = 21_600  # 6 hours — aligns with worker cycle
 
 
-def _build_sitemap_xml() -> str:
-    """Fetch sitemap cohorts from Supabase and delegate to services.sitemap.
+def _load_sitemap_cohorts() -> tuple[list, list]:
+    """Fetch sitemap cohorts from Supabase for services.sitemap.
 
     Query logic lives in ``services.sitemap.fetch_synced_creators`` /
     ``fetch_aplus_creators`` — same definitions used by the deploy-time script
@@ -2646,29 +2670,39 @@ def _build_sitemap_xml() -> str:
 
         aplus_creators = fetch_aplus_creators(supabase_client)
 
-    return build_sitemap_xml(creators, aplus_creators=aplus_creators)
+    return creators, aplus_creators
 
 
-@rt("/sitemap.xml")
-def sitemap_xml(req):
-    """GET /sitemap.xml — dynamic sitemap, cached in-process for 24 h."""
-    now = _time_module.monotonic()
-    generated_at = _SITEMAP_CACHE.get("generated_at")
-    if (
-        _SITEMAP_CACHE["xml"] is None
-        or generated_at is None
-        or (now - generated_at) > _SITEMAP_CACHE_TTL
-    ):
-        _SITEMAP_CACHE["xml"] = _build_sitemap_xml()
-        _SITEMAP_CACHE["generated_at"] = now
+_LIVE_SITEMAP = LiveSitemap(_load_sitemap_cohorts, ttl=_SITEMAP_CACHE_TTL)
 
+
+def _sitemap_response(xml: str) -> Response:
     return Response(
-        content=_SITEMAP_CACHE["xml"],
+        content=xml,
         media_type="application/xml",
         headers={"Cache-Control": "public, max-age=3600"},
     )
 
 
+@rt("/sitemap.xml")
+def sitemap_xml(req):
+    """GET /sitemap.xml — the urlset, or a sitemapindex once past 50k URLs.
+
+    Only the first request after boot builds inline; expired builds are
+    refreshed in the background while the previous XML keeps being served.
+    """
+    return _sitemap_response(_LIVE_SITEMAP.root_xml())
+
+
+@rt("/sitemap-{number}.xml")
+def sitemap_shard_xml(req, number: int):
+    """GET /sitemap-{n}.xml — one shard of a sharded sitemap."""
+    xml = _LIVE_SITEMAP.shard_xml(number)
+    if xml is None:
+        return Response(status_code=404)
+    return _sitemap_response(xml)
+
+
 # ============================================================================
 # Run the app
 # ============================================================================
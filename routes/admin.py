@@ -11,8 +11,7 @@ DB helpers (is_admin) live in db.py.
 
 from __future__ import annotations
 
-import csv
-import io
+import itertools
 import logging
 import os
 from datetime import datetime, timedelta, timezone
@@ -23,6 +22,7 @@ from starlette.responses import Response as StarletteResponse
 import db as _db
 from constants import BROWSEABLE_SYNC_STATUSES
 from services.contact_extractor import ContactExtractorService
+from services.exports import export_response, iter_dict_rows_csv
 from utils.dates import parse_iso_utc
 from views.admin import AdminPage, _JobsSection
 
@@ -605,6 +605,72 @@ def admin_rescue_quota_jobs(req, sess) -> Response | FT:
 # -- Admin Outreach Export ---------------------------------------------------
 
 
+# Rows per creators page read by the outreach export (PostgREST's max-rows cap).
+_OUTREACH_EXPORT_PAGE_SIZE = 1000
+
+
+def _outreach_keyset_filter(last: dict) -> str:
+    """PostgREST ``or`` filter for rows after ``last`` in (subscribers DESC NULLS LAST, id)."""
+    subs, creator_id = last.get("current_subscribers"), last["id"]
+    if subs is None:
+        return f"and(current_subscribers.is.null,id.gt.{creator_id})"
+    return (
+        f"current_subscribers.lt.{subs},"
+        f"and(current_subscribers.eq.{subs},id.gt.{creator_id}),"
+        "current_subscribers.is.null"
+    )
+
+
+def _iter_admin_outreach_rows(sc):
+    """
+    Email-ready contact rows for every synced creator with contact info.
+
+    Pages through ``creators`` with keyset pagination on
+    (``current_subscribers`` DESC NULLS LAST, ``id``) so only one page is held
+    at a time while the export streams, and subscriber counts changing
+    mid-export cannot skip or repeat rows the way OFFSET paging could.
+
+    Each page read goes through ``_db._db_execute`` (transient-disconnect
+    retry).  A page that still fails raises: the first page fails before
+    any header is sent (a plain 500), later ones abort the chunked response
+    so the client sees a failed download instead of a short, valid CSV.
+    """
+    last = None
+    exported = 0
+    scanned = 0
+    while True:
+        query = (
+            sc.table("creators")
+            .select("*")
+            .eq("has_contact_info", True)
+            .eq("sync_status", "synced")
+        )
+        if last is not None:
+            query = query.or_(_outreach_keyset_filter(last))
+        query = (
+            query.order("current_subscribers", desc=True, nullsfirst=False)
+            .order("id")
+            .limit(_OUTREACH_EXPORT_PAGE_SIZE)
+        )
+        try:
+            page = _db._db_execute(query.execute).data or []
+        except Exception:
+            logger.exception(
+                "[Admin] Outreach export aborted after %d rows (%d scanned)", exported, scanned
+            )
+            raise
+        scanned += len(page)
+        rows = ContactExtractorService.filter_email_ready_rows(
+            [ContactExtractorService.build_creator_contact_row(creator) for creator in page]
+        )
+        exported += len(rows)
+        yield from rows
+        if len(page) < _OUTREACH_EXPORT_PAGE_SIZE:
+            break
+        last = page[-1]
+    logger.info(f"[Admin] Exported {exported} email-ready creators ({scanned} scanned)")
+
+
 def admin_outreach_export_route(req, sess) -> Response:
     """
     GET /admin/outreach/export — bulk export of all creators with contact info.
@@ -632,58 +698,24 @@ def admin_outreach_export_route(req, sess) -> Response:
         return StarletteResponse("DB unavailable", status_code=503, media_type="text/plain")
 
     try:
-        # Query creators with contact info, synced status only
-        creators = (
-            sc.table("creators")
-            .select("*")
-            .eq("has_contact_info", True)
-            .eq("sync_status", "synced")
-            .order("current_subscribers", desc=True)
-            .execute()
-            .data
-            or []
-        )
-
-        if not creators:
-            return StarletteResponse(
-                "No creators with contact information found.",
-                status_code=200,
-                media_type="text/plain",
-            )
-
-        logger.info(f"[Admin] Generating outreach export for {len(creators)} creators")
-
-        # Build rows using unified service
-        rows = [ContactExtractorService.build_creator_contact_row(c) for c in creators]
-
-        # Filter email-ready (keep file size down)
-        rows = ContactExtractorService.filter_email_ready_rows(rows)
-
-        if not rows:
+        rows = _iter_admin_outreach_rows(sc)
+        # Pull the first row up front so "nothing to export" stays a plain reply;
+        # later pages are fetched as the CSV streams.
+        first = next(rows, None)
+        if first is None:
             return StarletteResponse(
                 "No creators with email addresses found.",
                 status_code=200,
                 media_type="text/plain",
             )
 
-        logger.info(f"[Admin] Exporting {len(rows)} email-ready creators")
-
-        # Render CSV
-        buf = io.StringIO()
-        writer = csv.DictWriter(
-            buf,
-            fieldnames=ContactExtractorService.EMAIL_EXPORT_HEADERS,
-            extrasaction="ignore",
-        )
-        writer.writeheader()
-        writer.writerows(rows)
-
-        return StarletteResponse(
-            content=buf.getvalue(),
+        return export_response(
+            iter_dict_rows_csv(
+                itertools.chain([first], rows), ContactExtractorService.EMAIL_EXPORT_HEADERS
+            ),
+            filename=f"viralvibes-creators-{datetime.now().strftime('%Y%m%d')}.csv",
             media_type="text/csv; charset=utf-8",
-            headers={
-                "Content-Disposition": f'attachment; filename="viralvibes-creators-{datetime.now().strftime("%Y%m%d")}.csv"'
-            },
+            request=req,
         )
 
     except Exception as e:
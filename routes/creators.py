@@ -6,8 +6,10 @@ import logging
 import os
 import re
 import threading
+import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed
+from concurrent.futures import wait as wait_futures
 from dataclasses import dataclass, field
 from typing import Any
 from urllib.parse import urlencode
@@ -27,8 +29,8 @@ from db import (
     get_category_leaderboard,
     get_category_peer_benchmarks,
     get_creator_add_request_status,
+    get_creator_context_ranks,
     get_creator_hero_stats,
-    get_creator_rank,
     get_creator_stats,
     get_creators,
     get_embedding_peers,
@@ -93,6 +95,8 @@ class CreatorProfileResult:
 
     body: Any  # FT element tree from render_creator_profile_page()
     creator: dict
+    # Per-fetch wall time from _load_profile_data (ms), for Server-Timing.
+    timings_ms: dict = field(default_factory=dict)
 
 
 # ---------------------------------------------------------------------------
@@ -526,47 +530,19 @@ def creators_route(request, is_authenticated: bool = False, user_id: str | None
 def _get_context_ranks(creator: dict) -> dict:
     """
     Compute this creator's subscriber rank in their country, language, and
-    primary category — each is a single server-side COUNT (no row transfer).
-    All three queries run in parallel via a thread pool.
+    primary category — one RPC that binary-searches precomputed per-segment
+    subscriber arrays (no row transfer, no live COUNT).
 
     Returns:
         dict with keys country_rank, language_rank, category_rank.
         Each value is an int (1-based position) or None when unavailable.
     """
-    subs = int(creator.get("current_subscribers") or 0)
-    country = creator.get("country_code", "")
-    language = creator.get("default_language", "")
-    category = creator.get("primary_category", "")
-
-    tasks: dict[str, tuple[str, str]] = {}
-    if subs and country:
-        tasks["country_rank"] = ("country_code", country)
-    if subs and language:
-        tasks["language_rank"] = ("default_language", language)
-    if subs and category:
-        tasks["category_rank"] = ("primary_category", category)
-
-    result: dict[str, int | None] = {
-        "country_rank": None,
-        "language_rank": None,
-        "category_rank": None,
-    }
-    if not tasks:
-        return result
-
-    with ThreadPoolExecutor(max_workers=len(tasks)) as pool:
-        futures = {
-            pool.submit(get_creator_rank, subs, key, val): name
-            for name, (key, val) in tasks.items()
-        }
-        for future in as_completed(futures):
-            name = futures[future]
-            try:
-                result[name] = future.result()
-            except Exception:
-                logger.exception("[CreatorProfile] Rank query failed for %s", name)
-
-    return result
+    return get_creator_context_ranks(
+        int(creator.get("current_subscribers") or 0),
+        country=creator.get("country_code") or "",
+        language=creator.get("default_language") or "",
+        category=creator.get("primary_category") or "",
+    )
 
 
 _SIMILAR_MIN = 3  # minimum tiles before we consider the rail worth showing
@@ -612,6 +588,162 @@ def _get_similar_creators(creator: dict) -> list[dict]:
     return []
 
 
+# ---------------------------------------------------------------------------
+# Profile data loader
+# ---------------------------------------------------------------------------
+# Every profile section below the header depends only on the creator row (or
+# just its id), so the fetches are independent and run concurrently.  The
+# pool is module-level so a burst of profile views shares one bounded set of
+# threads instead of each request spawning its own.  It is sized for
+# PROFILE_LOADER_CONCURRENCY simultaneous profile renders (7 fetches each) so
+# fetches normally start immediately instead of queueing behind other pages.
+_PROFILE_FETCHES_PER_PAGE = 7
+_PROFILE_LOADER_CONCURRENCY = int(os.getenv("PROFILE_LOADER_CONCURRENCY", "8"))
+_PROFILE_LOADER_WORKERS = int(
+    os.getenv(
+        "PROFILE_LOADER_WORKERS", str(_PROFILE_FETCHES_PER_PAGE * _PROFILE_LOADER_CONCURRENCY)
+    )
+)
+# Per-fetch budget, counted from when the fetch starts running.  Under a
+# burst that outgrows the pool, a fetch still queued after
+# _PROFILE_QUEUE_WAIT_S is dropped so the page never waits on the backlog.
+_PROFILE_FETCH_TIMEOUT_S = float(os.getenv("PROFILE_FETCH_TIMEOUT_S", "4"))
+_PROFILE_QUEUE_WAIT_S = float(os.getenv("PROFILE_QUEUE_WAIT_S", "1"))
+# How often the loader re-checks fetches that are still queued.
+_PROFILE_QUEUE_POLL_S = 0.05
+_profile_pool = ThreadPoolExecutor(
+    max_workers=_PROFILE_LOADER_WORKERS, thread_name_prefix="profile-loader"
+)
+
+
+@dataclass
+class ProfileData:
+    """Section payloads for one profile render plus per-fetch timings.
+
+    Every field defaults to the "section unavailable" value the view already
+    handles, so a timed-out or failed fetch degrades to a missing section
+    rather than a failed page.
+    """
+
+    context_ranks: dict = field(
+        default_factory=lambda: {"country_rank": None, "language_rank": None, "category_rank": None}
+    )
+    category_stats: dict | None = None
+    peer_benchmarks: dict = field(default_factory=dict)
+    niche_leaderboard: list = field(default_factory=list)
+    is_favourited: bool = False
+    similar_creators: list = field(default_factory=list)
+    embedding_peers: tuple | None = None
+    timings_ms: dict = field(default_factory=dict)
+    missing: list = field(default_factory=list)
+
+
+def _load_profile_data(creator: dict, creator_id: str, user_id: str | None) -> ProfileData:
+    """
+    Run all dependency-free profile fetches concurrently on ``_profile_pool``.
+
+    Each fetch gets ``_PROFILE_FETCH_TIMEOUT_S`` from the moment it starts
+    running; one still queued after ``_PROFILE_QUEUE_WAIT_S`` is dropped.
+    Fetches that time out or raise keep their ``ProfileData`` default and are
+    listed in ``missing``.  A dropped fetch that is already running cannot be
+    interrupted — it finishes in the background and its result is ignored.
+    The timing breakdown is logged per request so the dominant sub-query is
+    visible.
+    """
+    category = creator.get("primary_category", "")
+    fetches: dict[str, Any] = {
+        "context_ranks": lambda: _get_context_ranks(creator),
+        "category_stats": lambda: get_cached_category_box_stats(category),
+        "peer_benchmarks": lambda: get_category_peer_benchmarks(category),
+        "niche_leaderboard": lambda: get_category_leaderboard(category, limit=5),
+        "similar_creators": lambda: _get_similar_creators(creator),
+        # Fetch peer list once (cheap: one JSONB read + batched IN-list hydration).
+        # hydrate_limit caps step-2 to the rail size so each IN() URL stays well
+        # under Cloudflare's WAF length limit; total comes from step-1's raw count.
+        "embedding_peers": lambda: get_embedding_peers(
+            creator_id, limit=LOOKALIKE_LIMIT, hydrate_limit=_PROFILE_PEER_RAIL_LIMIT
+        ),
+    }
+    if user_id:
+        fetches["is_favourited"] = lambda: is_creator_favourited(user_id, creator_id)
+
+    data = ProfileData()
+
+    # name → perf_counter() when the fetch left the queue (written by the
+    # pool thread, one key each).
+    fetch_started: dict[str, float] = {}
+
+    def _timed(name: str, fn) -> tuple[Any, Exception | None, float]:
+        # Timings travel back with the result so only this thread writes
+        # data.timings_ms — an abandoned (timed-out) fetch never touches it.
+        started = fetch_started[name] = time.perf_counter()
+        try:
+            return fn(), None, (time.perf_counter() - started) * 1000
+        except Exception as exc:
+            return None, exc, (time.perf_counter() - started) * 1000
+
+    started = time.perf_counter()
+    futures = {_profile_pool.submit(_timed, name, fn): name for name, fn in fetches.items()}
+    done: set = set()
+    pending = set(futures)
+    expired: dict[Any, float] = {}
+    while pending:
+        now = time.perf_counter()
+        deadlines = {}
+        for future in pending:
+            fetch_start = fetch_started.get(futures[future])
+            if fetch_start is None:
+                deadlines[future] = started + _PROFILE_QUEUE_WAIT_S
+            else:
+                deadlines[future] = fetch_start + _PROFILE_FETCH_TIMEOUT_S
+        for future, deadline in deadlines.items():
+            if deadline <= now and not future.done():
+                expired[future] = now - started
+                pending.discard(future)
+        if not pending:
+            break
+        wait_s = min(deadlines[f] for f in pending) - now
+        if any(futures[f] not in fetch_started for f in pending):
+            # A queued fetch may start at any moment and move its deadline.
+            wait_s = min(wait_s, _PROFILE_QUEUE_POLL_S)
+        finished, pending = wait_futures(
+            pending, timeout=max(wait_s, 0), return_when=FIRST_COMPLETED
+        )
+        done |= finished
+
+    for future in done:
+        name = futures[future]
+        value, exc, elapsed_ms = future.result()
+        data.timings_ms[name] = elapsed_ms
+        if exc is not None:
+            logger.error(
+                "[CreatorProfile] %s fetch failed for %s: %s", name, creator_id, exc, exc_info=exc
+            )
+            data.missing.append(name)
+        elif value is not None:
+            setattr(data, name, value)
+
+    for future, waited_s in expired.items():
+        name = futures[future]
+        future.cancel()  # only stops a fetch that never left the queue
+        data.missing.append(name)
+        data.timings_ms[name] = waited_s * 1000
+
+    total_ms = (time.perf_counter() - started) * 1000
+    breakdown = " ".join(
+        f"{name}={ms:.0f}ms"
+        for name, ms in sorted(data.timings_ms.items(), key=lambda kv: kv[1], reverse=True)
+    )
+    logger.info(
+        "[CreatorProfile] loaded %s in %.0fms | %s%s",
+        creator_id,
+        total_ms,
+        breakdown,
+        f" | missing: {', '.join(sorted(data.missing))}" if data.missing else "",
+    )
+    return data
+
+
 def creator_profile_route(request, creator_id: str, user_id: str | None = None):
     """
     GET /creator/{creator_id} — Full profile page for a single creator.
@@ -650,18 +782,8 @@ def creator_profile_route(request, creator_id: str, user_id: str | None = None):
     # /creator/{id}?a={compare_a_id}), thread the first creator's ID through
     # to the view so the Compare button can complete the pair directly.
     compare_a_id = request.query_params.get("a", "")
-    context_ranks = _get_context_ranks(creator)
-    category_stats = get_cached_category_box_stats(creator.get("primary_category", ""))
-    peer_benchmarks = get_category_peer_benchmarks(creator.get("primary_category", ""))
-    niche_leaderboard = get_category_leaderboard(creator.get("primary_category", ""), limit=5)
-    is_fav = is_creator_favourited(user_id, creator_id) if user_id else False
-    similar_creators = _get_similar_creators(creator)
-    # Fetch peer list once (cheap: one JSONB read + batched IN-list hydration).
-    # hydrate_limit caps step-2 to the rail size so each IN() URL stays well
-    # under Cloudflare's WAF length limit; total comes from step-1's raw count.
-    peers_result = get_embedding_peers(
-        creator_id, limit=LOOKALIKE_LIMIT, hydrate_limit=_PROFILE_PEER_RAIL_LIMIT
-    )
+    data = _load_profile_data(creator, creator_id, user_id)
+    peers_result = data.embedding_peers
     embedding_peers = peers_result[0] if peers_result else None
     embedding_peer_total = peers_result[1] if peers_result else 0
 
@@ -669,18 +791,18 @@ def creator_profile_route(request, creator_id: str, user_id: str | None = None):
     body = render_creator_profile_page(
         creator,
         back_url=back_url,
-        context_ranks=context_ranks,
-        category_stats=category_stats,
-        peer_engagement_p75=peer_benchmarks.get("peer_engagement_p75", 0.0),
-        niche_leaderboard=niche_leaderboard,
-        is_favourited=is_fav,
-        similar_creators=similar_creators,
+        context_ranks=data.context_ranks,
+        category_stats=data.category_stats,
+        peer_engagement_p75=data.peer_benchmarks.get("peer_engagement_p75", 0.0),
+        niche_leaderboard=data.niche_leaderboard,
+        is_favourited=data.is_favourited,
+        similar_creators=data.similar_creators,
         embedding_peers=embedding_peers,
         embedding_peer_total=embedding_peer_total,
         is_authenticated=is_authenticated,
         compare_a_id=compare_a_id,
     )
-    return CreatorProfileResult(body=body, creator=creator)
+    return CreatorProfileResult(body=body, creator=creator, timings_ms=data.timings_ms)
 
 
 def toggle_favourite_route(request, sess, creator_id: str):
@@ -1275,12 +1397,10 @@ def creators_like_export_route(request, *, handle: str):
     separate from the page display route which uses a lighter field set.
     This prevents the page render from fetching unnecessary contact columns.
     """
-    import csv
-    import io
-
     from starlette.responses import Response
 
     from services.contact_extractor import ContactExtractorService
+    from services.exports import export_response, iter_dict_rows_csv
 
     seed = _resolve_seed_creator(handle)
     if not seed or not seed.get("id"):
@@ -1304,23 +1424,15 @@ def creators_like_export_route(request, *, handle: str):
     rows = [ContactExtractorService.build_creator_contact_row(p, base_url=base_url) for p in peers]
     rows = ContactExtractorService.filter_email_ready_rows(rows)
 
-    buf = io.StringIO()
-    writer = csv.DictWriter(
-        buf,
-        fieldnames=ContactExtractorService.EMAIL_EXPORT_HEADERS,
-        extrasaction="ignore",
-    )
-    writer.writeheader()
-    writer.writerows(rows)
-
     # Filename is sanitised lower-case handle so downloads don't collide
     # when a user exports several lookalike lists in one session.
     safe_handle = (seed.get("custom_url") or handle or "creator").lstrip("@").lower()
     safe_handle = re.sub(r"[^a-z0-9_-]", "", safe_handle) or "creator"
     filename = f"lookalikes-{safe_handle}.csv"
 
-    return Response(
-        content=buf.getvalue(),
+    return export_response(
+        iter_dict_rows_csv(rows, ContactExtractorService.EMAIL_EXPORT_HEADERS),
+        filename=filename,
         media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        request=request,
     )
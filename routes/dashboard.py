@@ -7,12 +7,12 @@ Dependencies:
     - db.get_supabase(): Returns initialized Supabase client
     - db.record_dashboard_event(): Logs view/click events
     - db.get_dashboard_event_counts(): Retrieves analytics
-    - utils.load_df_from_json(): Deserializes cached DataFrame
+    - utils.load_playlist_frame(): Deserializes cached DataFrame
     - views.dashboard.render_dashboard(): Renders HTML dashboard
 
 Data Flow:
     1. dashboard_id (URL param) → indexed lookup in playlist_stats
-    2. Load cached DataFrame from df_json column
+    2. Load cached DataFrame from df_arrow (legacy rows: df_json)
     3. Record analytics event (view)
     4. Fetch event counts (interest metrics)
     5. Render persistent dashboard view
@@ -31,7 +31,7 @@ from db import (
     get_supabase,
     record_dashboard_event,
 )
-from utils import load_df_from_json
+from utils import load_playlist_frame
 from views.dashboard import render_dashboard
 
 logger = logging.getLogger(__name__)
@@ -147,8 +147,11 @@ def dashboard_view(request: Request, dashboard_id: str) -> Union[Div, Response]:
     # --- 3️⃣ Validate data integrity ---
     try:
         # Check required fields
-        required_fields = ["df_json", "playlist_url"]
+        required_fields = ["playlist_url"]
         missing_fields = [f for f in required_fields if f not in playlist_row]
+        # Columnar df_arrow (migration 058), or df_json on rows written before it
+        if not playlist_row.get("df_arrow") and not playlist_row.get("df_json"):
+            missing_fields.append("df_arrow")
 
         if missing_fields:
             logger.error(f"Missing required fields in playlist_row: {missing_fields}")
@@ -178,14 +181,8 @@ def dashboard_view(request: Request, dashboard_id: str) -> Union[Div, Response]:
 
     # --- 5️⃣ Load and deserialize DataFrame ---
     try:
-        df = load_df_from_json(playlist_row["df_json"])
+        df = load_playlist_frame(playlist_row)
         logger.debug(f"Loaded DataFrame: {len(df)} rows")
-    except KeyError as e:
-        logger.error(f"Missing JSON field in playlist_row: {e}")
-        return ErrorAlert(
-            "Invalid Data",
-            "Playlist data is corrupted. Please contact support.",
-        )
     except Exception as e:
         logger.exception(f"Failed to deserialize DataFrame for {dashboard_id}: {e}")
         return ErrorAlert(
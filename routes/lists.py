@@ -3,7 +3,6 @@ Lists route — curated creator list pages.
 """
 
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import unquote
 
 from fasthtml.common import Div
@@ -16,17 +15,11 @@ from db_lists import (
     get_country_groups,
     get_language_groups,
     get_lists_meta,
-    get_most_active_creators,
-    get_new_channels,
-    get_niche_heatmap_data,
-    get_rising_creators,
     get_top_categories_with_counts,
     get_top_countries_with_counts,
     get_top_languages_with_counts,
     get_topic_category_country_creators,
-    get_top_rated_creators,
     get_topic_category_creators,
-    get_veteran_creators,
     merge_language_variants,
     resolve_category_slug,
 )
@@ -48,6 +41,7 @@ from views.lists import (
     render_ranking_creators_rows,
     _unslugify,
 )
+from services.lists_snapshot import CREATORS_PER_GROUP, INITIAL_GROUPS, load_lists_tab_data
 from services.rankings import resolve_country_slug, resolve_ranking_category_slug
 
 logger = logging.getLogger(__name__)
@@ -62,87 +56,29 @@ def _auth_context(request) -> tuple[str | None, bool, frozenset]:
 # ─────────────────────────────────────────────────────────────────────────────
 # Tuning constants — how many groups/creators to show initially vs on load-more
 # ─────────────────────────────────────────────────────────────────────────────
-INITIAL_GROUPS = 8  # country / category cards visible on first load
+# INITIAL_GROUPS and CREATORS_PER_GROUP live in services.lists_snapshot, which
+# builds the first page of groups.
 LOAD_MORE_STEP = 8  # how many more to load per "Show more" click
-CREATORS_PER_GROUP = 5  # top creators shown inside each group card
 
 
 def lists_route(request):
     """
     GET /lists — Curated creator lists page.
 
-    Loads all tab data upfront to support UIkit's client-side tab switcher.
-    Also fetches live meta (country + category counts) to drive dynamic
-    tab badges and load-more controls.
+    Loads all tab data upfront to support UIkit's client-side tab switcher,
+    from the precomputed snapshot when one is current.  The payload includes
+    the country / category / language totals that drive dynamic tab badges
+    and load-more controls.
     """
     active_tab = request.query_params.get("tab", "top-rated")
 
     # Auth context for heart buttons
     user_id, authenticated, fav_keys = _auth_context(request)
 
-    # ── Fire all independent DB calls in parallel ────────────────────────────
-    # All tab data is loaded upfront to support UIkit's client-side tab switcher.
-    # Live meta (country + category counts) drives dynamic tab badges and
-    # load-more controls. All calls are independent — total latency = max(each).
-    with ThreadPoolExecutor(max_workers=11) as pool:
-        # Live DB meta: one combined aggregation scan
-        f_meta = pool.submit(get_lists_meta)
-        # Top Rated: quality-sorted creators
-        f_top_rated = pool.submit(get_top_rated_creators, 20)
-        # Most Active: upload-frequency leaders
-        f_most_active = pool.submit(get_most_active_creators, 20)
-        # By Country: first page of groups (offset=0)
-        f_country_rankings = pool.submit(get_country_groups, 0, INITIAL_GROUPS, CREATORS_PER_GROUP)
-        # By Category: first page of groups (offset=0)
-        f_category_rankings = pool.submit(
-            get_category_groups, 0, INITIAL_GROUPS, CREATORS_PER_GROUP
-        )
-        # Rising Stars: fastest growth rate
-        f_rising = pool.submit(get_rising_creators, 20)
-        # Veterans: 10+ year channels
-        f_veterans = pool.submit(get_veteran_creators, 20)
-        # New Channels: created within the last year, sorted by engagement
-        f_new_channels = pool.submit(get_new_channels, 20)
-        # Niche Heat Map: category-level aggregated momentum
-        f_heatmap = pool.submit(get_niche_heatmap_data)
-        # By Language: first page of groups (offset=0)
-        f_language_rankings = pool.submit(
-            get_language_groups, 0, INITIAL_GROUPS, CREATORS_PER_GROUP
-        )
-        # Language count fallback: zero-row-transfer COUNT(DISTINCT) — cheap to
-        # pre-fetch; used only when meta["total_languages"] is absent (pre-003 DB)
-        f_total_languages = pool.submit(_count_distinct_languages)
-
-        meta = f_meta.result()
-        top_rated = f_top_rated.result()
-        most_active = f_most_active.result()
-        country_rankings = f_country_rankings.result()
-        category_rankings = f_category_rankings.result()
-        rising = f_rising.result()
-        veterans = f_veterans.result()
-        new_channels = f_new_channels.result()
-        heatmap = f_heatmap.result()
-        language_rankings = f_language_rankings.result()
-        total_languages_fallback = f_total_languages.result()
-
-    # ── Assemble tab_data from parallel results ──────────────────────────────
-    tab_data = {
-        "top_rated": top_rated,
-        "most_active": most_active,
-        "country_rankings": country_rankings,
-        "total_countries": meta["total_countries"],
-        "category_rankings": category_rankings,
-        "total_categories": meta["total_categories"],
-        "rising": rising,
-        "veterans": veterans,
-        "new_channels": new_channels,
-        "heatmap": heatmap,
-        "language_rankings": language_rankings,
-        # meta["total_languages"] comes from migration 003.  On older DB schemas
-        # that predate the RPC column, fall back to _count_distinct_languages() —
-        # pre-fetched above in parallel so there is no extra round-trip.
-        "total_languages": meta.get("total_languages") or total_languages_fallback,
-    }
+    # ── All tab data in one read ─────────────────────────────────────────────
+    # Built by bootstrap Pass 7 (services/lists_snapshot.py); live queries run
+    # only when the stored snapshot is missing, stale or from another version.
+    tab_data = load_lists_tab_data()
 
     return render_lists_page(
         active_tab=active_tab,
@@ -4,7 +4,8 @@ routes/mentions.py
 Single endpoint: GET /creator/{creator_id}/mentions
 
 Called by the HTMX placeholder in the profile page after it renders.
-Fetches both feeds, renders the card, and returns the HTML fragment.
+Fetches both feeds (concurrently, cached), renders the card, and returns
+the HTML fragment.
 
 Wire into main.py:
     from routes.mentions import mentions_route
@@ -13,19 +14,20 @@ Wire into main.py:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 
 from db import get_creator_stats
-from services.mentions import get_mentions
+from services.mentions import get_mentions_async
 from views.mentions import render_mentions_card, render_mentions_error
 
 logger = logging.getLogger(__name__)
 
 
-def mentions_route(req, sess, creator_id: str):
+async def mentions_route(req, sess, creator_id: str):
     """GET /creator/{creator_id}/mentions — HTMX lazy-load fragment."""
     try:
-        creator = get_creator_stats(creator_id)
+        creator = await asyncio.to_thread(get_creator_stats, creator_id)
         if not creator:
             return render_mentions_error()
 
@@ -35,7 +37,7 @@ def mentions_route(req, sess, creator_id: str):
         if not channel_id or not channel_name:
             return render_mentions_error()
 
-        bundle = get_mentions(channel_id, channel_name)
+        bundle = await get_mentions_async(channel_id, channel_name)
         return render_mentions_card(bundle)
 
     except Exception as exc:
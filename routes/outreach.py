@@ -5,14 +5,12 @@ Saved creator outreach routes.
 from __future__ import annotations
 
 import os
-import csv
-import io
 
 from fasthtml.common import A, Div, P, RedirectResponse, Span
-from starlette.responses import Response as StarletteResponse
 
 from db import add_favourite_creators_bulk, get_user_favourite_creators, get_user_favourite_lists
 from services.contact_extractor import ContactExtractorService
+from services.exports import export_response, iter_dict_rows_csv
 from services.outreach_lists import clamp_import_limit, get_creators_for_outreach_list
 from views.outreach import render_outreach_page
 
@@ -80,18 +78,11 @@ def outreach_export_route(req, sess):
     # Filter email-ready to keep file size down
     rows = ContactExtractorService.filter_email_ready_rows(rows)
 
-    # Render CSV
-    buf = io.StringIO()
-    writer = csv.DictWriter(
-        buf, fieldnames=ContactExtractorService.EMAIL_EXPORT_HEADERS, extrasaction="ignore"
-    )
-    writer.writeheader()
-    writer.writerows(rows)
-
-    return StarletteResponse(
-        content=buf.getvalue(),
+    return export_response(
+        iter_dict_rows_csv(rows, ContactExtractorService.EMAIL_EXPORT_HEADERS),
+        filename="saved-creators-outreach.csv",
         media_type="text/csv; charset=utf-8",
-        headers={"Content-Disposition": 'attachment; filename="saved-creators-outreach.csv"'},
+        request=req,
     )
 
 
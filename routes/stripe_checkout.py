@@ -132,7 +132,8 @@ def billing_success_content(req, sess, session_id: str = "") -> Union[Div, Respo
     if not session_id:
         return RedirectResponse("/pricing", status_code=303)
 
-    plan_info = get_user_plan(user_id) or {}
+    # Bypass the plan cache: this page polls until the webhook has landed
+    plan_info = get_user_plan(user_id, fresh=True) or {}
     is_active = plan_info.get("status", "inactive") in ("active", "trialing")
 
     if not is_active:
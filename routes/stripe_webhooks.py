@@ -26,7 +26,7 @@ import stripe
 from fasthtml.common import Request
 from starlette.responses import JSONResponse
 
-from db import get_user_id_by_stripe_customer, upsert_subscription
+from db import clear_user_plan_cache, get_user_id_by_stripe_customer, upsert_subscription
 from services.stripe_service import WEBHOOK_SECRET, get_plan_for_price
 
 logger = logging.getLogger(__name__)
@@ -150,6 +150,8 @@ def _handle_subscription_upsert(subscription: dict) -> None:
         status=status,
         current_period_end_ts=period_end_ts,
     )
+    # Drop the cached plan so the next gated request sees the change
+    clear_user_plan_cache(user_id)
     logger.info(
         "[Webhook] Upserted subscription %s: user=%s plan=%s/%s status=%s",
         subscription["id"],
@@ -183,6 +185,7 @@ def _handle_subscription_deleted(subscription: dict) -> None:
         status="canceled",
         current_period_end_ts=(subscription.get("current_period_end") or 0),
     )
+    clear_user_plan_cache(user_id)
     logger.info(
         "[Webhook] Marked subscription %s canceled for user %s",
         subscription["id"],
@@ -11,7 +11,12 @@ This CLI runs the *pure-Python* extractor (no YouTube API calls) over already-
 stored ``channel_description`` / ``description`` / ``bio`` / ``keywords`` and
 persists the nine columns. It is safe to run in production and resumable: rows
 with a non-null ``contact_signals_extracted_at`` are skipped on subsequent
-runs.
+runs. ``--force`` revisits every row, so its keyset position (the last fully
+written page) is saved to ``--checkpoint`` for a restarted run to pick up;
+the file is deleted once a run reaches the end of the table.
+
+Pages are extracted in a process pool (``--workers``) while the next pages
+are fetched, and each page is written back with one bulk update.
 
 Usage
 -----
@@ -26,14 +31,21 @@ Usage
 
     # Force re-extraction of rows already processed
     python scripts/backfill_contact_signals.py --limit 1000 --force
+
+    # Start over, ignoring a saved checkpoint
+    python scripts/backfill_contact_signals.py --force --reset-checkpoint
 """
 
 from __future__ import annotations
 
 import argparse
+import json
 import logging
+import os
 import sys
 import time
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from pathlib import Path
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -50,7 +62,7 @@ from services.contact_extractor import ContactExtractorService  # noqa: E402
 logger = logging.getLogger("backfill_contact_signals")
 
 # Columns required by ContactExtractorService.extract_from_creator() — fetched
-# in a single SELECT to avoid per-row round-trips. ``id`` is the PK for UPDATE.
+# in a single SELECT to avoid per-row round-trips. ``id`` keys the bulk update.
 # Note: ``bio`` column does not exist in creators table, use only:
 # channel_description, description, keywords
 _SELECT_COLUMNS = "id,channel_description,description,keywords"
@@ -59,6 +71,8 @@ _SELECT_COLUMNS = "id,channel_description,description,keywords"
 # accepts at most ~1000 per request anyway. Keep at 1000 for fewer round-trips.
 _PAGE_SIZE = 1000
 
+_DEFAULT_CHECKPOINT = ".backfill_contact_signals.checkpoint.json"
+
 
 def _parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(
@@ -86,6 +100,25 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Re-process rows that already have contact_signals_extracted_at set.",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Extraction processes (1 = extract in-process). Default: CPU count.",
+    )
+    parser.add_argument(
+        "--checkpoint",
+        default=_DEFAULT_CHECKPOINT,
+        help=(
+            "File recording the last fully written id of a --force run. "
+            f"Default: {_DEFAULT_CHECKPOINT}."
+        ),
+    )
+    parser.add_argument(
+        "--reset-checkpoint",
+        action="store_true",
+        help="Ignore (and overwrite) any saved checkpoint.",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -121,6 +154,62 @@ def _apply_payload(sc, creator_id: str, payload: dict) -> None:
     sc.table(CREATOR_TABLE).update(payload).eq("id", creator_id).execute()
 
 
+def _extract_page(rows: list[dict]) -> list[dict]:
+    """Build update payloads for one page (runs in a pool worker)."""
+    return ContactExtractorService.build_db_update_payloads(rows)
+
+
+def _write_page(sc, payloads: list[dict]) -> int:
+    """Bulk-update one page; fall back to per-row updates. Returns failed rows."""
+    if db.bulk_update_creators(payloads):
+        return 0
+    logger.warning("[backfill] bulk write of %d rows failed — retrying row by row", len(payloads))
+    errors = 0
+    for payload in payloads:
+        row = {k: v for k, v in payload.items() if k != "id"}
+        try:
+            _apply_payload(sc, payload["id"], row)
+        except Exception as exc:
+            # Don't abort the run on a single bad row — log and continue.
+            errors += 1
+            logger.warning("[backfill] update failed id=%s: %s", payload["id"], exc)
+    return errors
+
+
+def _load_checkpoint(path: Path, force: bool) -> str | None:
+    """Last fully written id from a previous run with the same ``force`` mode."""
+    try:
+        state = json.loads(path.read_text())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError):
+        logger.warning("[backfill] unreadable checkpoint %s — starting from the top", path)
+        return None
+    if state.get("force") != force:
+        logger.info("[backfill] checkpoint %s is for force=%s — ignoring", path, state.get("force"))
+        return None
+    return state.get("last_id")
+
+
+def _save_checkpoint(path: Path, last_id: str, force: bool, processed: int) -> None:
+    """Atomically record ``last_id`` (all rows up to it are written)."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"last_id": last_id, "force": force, "processed": processed}))
+    os.replace(tmp, path)
+
+
+class _InlineExecutor(Executor):
+    """``--workers 1``: run extraction in-process, same interface as the pool."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except BaseException as exc:
+            future.set_exception(exc)
+        return future
+
+
 def main() -> int:
     args = _parse_args()
     setup_logging()
@@ -142,16 +231,75 @@ def main() -> int:
         args.limit or "ALL",
     )
 
-    started_at = time.monotonic()
+    # Without --force the IS NULL filter already skips written rows, so only a
+    # --force run needs its keyset position persisted to resume.
+    checkpoint = Path(args.checkpoint)
+    use_checkpoint = args.force and not args.dry_run
     last_id: str | None = None
+    if use_checkpoint and not args.reset_checkpoint:
+        last_id = _load_checkpoint(checkpoint, args.force)
+        if last_id:
+            logger.info("[backfill] resuming after id=%s (checkpoint %s)", last_id, checkpoint)
+
+    started_at = time.monotonic()
+    fetched = 0
     processed = 0
     with_contact = 0
     with_email = 0
     db_errors = 0
+    completed = False
+
+    # Pages whose extraction is running: (future, page's last id). Finished
+    # pages are written strictly in order, so the checkpoint never skips one.
+    in_flight: deque[tuple[Future, str]] = deque()
+    max_in_flight = max(2, args.workers * 2)
+    pool: Executor = (
+        ProcessPoolExecutor(max_workers=args.workers) if args.workers > 1 else _InlineExecutor()
+    )
+
+    def _finish_oldest() -> None:
+        nonlocal processed, with_contact, with_email, db_errors
+        future, page_last_id = in_flight.popleft()
+        payloads = future.result()
+        processed += len(payloads)
+        with_contact += sum(1 for p in payloads if p.get("has_contact_info"))
+        with_email += sum(1 for p in payloads if p.get("extracted_email"))
+
+        if args.verbose:
+            for p in payloads:
+                logger.debug(
+                    "[backfill] id=%s has_contact=%s email=%s",
+                    p["id"],
+                    p.get("has_contact_info"),
+                    bool(p.get("extracted_email")),
+                )
+
+        if not args.dry_run:
+            if payloads:
+                db_errors += _write_page(sc, payloads)
+            if use_checkpoint:
+                _save_checkpoint(checkpoint, page_last_id, args.force, processed)
+
+        elapsed = time.monotonic() - started_at
+        rate = processed / elapsed if elapsed > 0 else 0
+        yield_pct = (100 * with_contact / processed) if processed else 0
+        email_pct = (100 * with_email / processed) if processed else 0
+        logger.info(
+            "[backfill] processed=%d with_contact=%d (%.1f%%) with_email=%d (%.1f%%) "
+            "errors=%d rate=%.0f rows/s elapsed=%.0fs",
+            processed,
+            with_contact,
+            yield_pct,
+            with_email,
+            email_pct,
+            db_errors,
+            rate,
+            elapsed,
+        )
 
     try:
         while True:
-            remaining = (args.limit - processed) if args.limit else args.page_size
+            remaining = (args.limit - fetched) if args.limit else args.page_size
             if remaining <= 0:
                 break
             page_size = min(args.page_size, remaining) if args.limit else args.page_size
@@ -165,60 +313,32 @@ def main() -> int:
                 )
             except Exception:
                 logger.exception("[backfill] fetch failed at last_id=%s — aborting", last_id)
+                while in_flight:
+                    _finish_oldest()
                 return 2
 
             if not rows:
                 logger.info("[backfill] no more rows to process")
+                completed = True
                 break
 
-            for row in rows:
-                creator_id = row.get("id")
-                if not creator_id:
-                    continue
-
-                payload = ContactExtractorService.build_db_update_payload(row)
-                processed += 1
-                if payload.get("has_contact_info"):
-                    with_contact += 1
-                if payload.get("extracted_email"):
-                    with_email += 1
-
-                if args.verbose:
-                    logger.debug(
-                        "[backfill] id=%s has_contact=%s email=%s",
-                        creator_id,
-                        payload.get("has_contact_info"),
-                        bool(payload.get("extracted_email")),
-                    )
-
-                if not args.dry_run:
-                    try:
-                        _apply_payload(sc, creator_id, payload)
-                    except Exception as exc:
-                        # Don't abort the run on a single bad row — log and continue.
-                        db_errors += 1
-                        logger.warning("[backfill] update failed id=%s: %s", creator_id, exc)
-
-                last_id = creator_id
-
-            elapsed = time.monotonic() - started_at
-            rate = processed / elapsed if elapsed > 0 else 0
-            yield_pct = (100 * with_contact / processed) if processed else 0
-            email_pct = (100 * with_email / processed) if processed else 0
-            logger.info(
-                "[backfill] processed=%d with_contact=%d (%.1f%%) with_email=%d (%.1f%%) "
-                "errors=%d rate=%.0f rows/s elapsed=%.0fs",
-                processed,
-                with_contact,
-                yield_pct,
-                with_email,
-                email_pct,
-                db_errors,
-                rate,
-                elapsed,
-            )
+            # Keyset pagination only needs the page's last id, so the next
+            # fetch overlaps with this page's extraction.
+            fetched += len(rows)
+            last_id = rows[-1]["id"]
+            in_flight.append((pool.submit(_extract_page, rows), last_id))
+            if len(in_flight) >= max_in_flight:
+                _finish_oldest()
+
+        while in_flight:
+            _finish_oldest()
+        if completed and use_checkpoint:
+            # A finished run must not make the next --force run resume at the end.
+            checkpoint.unlink(missing_ok=True)
     except KeyboardInterrupt:
         logger.warning("[backfill] interrupted — progress is saved (resumable)")
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
 
     logger.info(
         "[backfill] DONE mode=%s processed=%d with_contact=%d with_email=%d errors=%d",
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""Benchmark playlist normalisation + enrichment on a synthetic playlist.
+
+Compares services.youtube_transforms (native Polars expressions) against the
+previous per-cell ``map_elements`` implementation, checks both produce the
+same UI columns, and prints the timings.
+
+    python scripts/benchmark_playlist_enrichment.py
+    python scripts/benchmark_playlist_enrichment.py --rows 50000 --repeat 5
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+import isodate
+import polars as pl
+
+_PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(_PROJECT_ROOT))
+
+from services.youtube_transforms import _enrich_dataframe, normalize_columns  # noqa: E402
+from services.youtube_utils import CATEGORY_EMOJI_MAP, get_category_emoji  # noqa: E402
+from utils import format_number  # noqa: E402
+from utils.dates import format_duration  # noqa: E402
+
+_UI_COLUMNS = [
+    "Duration",
+    "Category Emoji",
+    "Views Formatted",
+    "Likes Formatted",
+    "Dislikes Formatted",
+    "Comments Formatted",
+    "Duration Formatted",
+    "Engagement Rate (%)",
+]
+
+
+def _playlist(rows: int, seed: int = 7) -> pl.DataFrame:
+    """API-backend shaped rows: camelCase counts, ISO 8601 durations."""
+    rng = random.Random(seed)
+    category_ids = list(CATEGORY_EMOJI_MAP) + ["0", "99"]
+    names = ["Music", "Gaming", "People & Blogs", "News & Politics", "Howto & Style"]
+    data = []
+    for i in range(rows):
+        views = rng.randint(0, 10 ** rng.randint(2, 10))
+        seconds = rng.randint(5, 4 * 3600)
+        hours, rest = divmod(seconds, 3600)
+        minutes, secs = divmod(rest, 60)
+        data.append(
+            {
+                "videoId": f"v{i}",
+                "title": f"Video {i}",
+                "viewCount": views,
+                "likeCount": views // rng.randint(10, 200),
+                "dislikeCount": 0,
+                "commentCount": views // rng.randint(100, 2000),
+                "duration": f"PT{hours}H{minutes}M{secs}S" if hours else f"PT{minutes}M{secs}S",
+                "publishedAt": "2024-05-01T12:00:00Z",
+                "CategoryId": rng.choice(category_ids),
+                "CategoryName": rng.choice(names),
+            }
+        )
+    return pl.DataFrame(data)
+
+
+def _legacy(df: pl.DataFrame) -> pl.DataFrame:
+    """The map_elements implementation this benchmark compares against."""
+    df = df.rename({"viewCount": "Views", "likeCount": "Likes", "dislikeCount": "Dislikes"})
+    df = df.rename({"commentCount": "Comments", "duration": "Duration"})
+    df = df.with_columns(
+        pl.col("Duration").map_elements(
+            lambda d: int(isodate.parse_duration(d).total_seconds()), return_dtype=pl.Int64
+        )
+    )
+    df = df.with_columns(
+        ((pl.col("Likes") + pl.col("Comments")) / (pl.col("Views") + 1))
+        .fill_null(0.0)
+        .alias("Engagement Rate Raw"),
+        pl.struct(["CategoryId", "CategoryName"])
+        .map_elements(
+            lambda s: get_category_emoji(s["CategoryId"], s["CategoryName"]),
+            return_dtype=pl.Utf8,
+        )
+        .alias("Category Emoji"),
+    )
+    return df.with_columns(
+        *(
+            pl.col(c).map_elements(format_number, return_dtype=pl.Utf8).alias(f"{c} Formatted")
+            for c in ("Views", "Likes", "Dislikes", "Comments")
+        ),
+        pl.col("Duration")
+        .map_elements(format_duration, return_dtype=pl.Utf8)
+        .alias("Duration Formatted"),
+        pl.col("Engagement Rate Raw")
+        .map_elements(lambda x: f"{x:.2%}", return_dtype=pl.Utf8)
+        .alias("Engagement Rate (%)"),
+    )
+
+
+def _current(df: pl.DataFrame) -> pl.DataFrame:
+    enriched, _ = _enrich_dataframe(normalize_columns(df))
+    return enriched
+
+
+def _best_of(fn, df: pl.DataFrame, repeat: int) -> tuple[float, pl.DataFrame]:
+    best, out = float("inf"), None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        out = fn(df)
+        best = min(best, time.perf_counter() - started)
+    return best, out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    df = _playlist(args.rows)
+    legacy_s, legacy_df = _best_of(_legacy, df, args.repeat)
+    current_s, current_df = _best_of(_current, df, args.repeat)
+
+    if not legacy_df.select(_UI_COLUMNS).equals(current_df.select(_UI_COLUMNS)):
+        print("ERROR: native and map_elements outputs differ", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"rows:          {args.rows:,}")
+    print(f"map_elements:  {legacy_s * 1000:8.1f} ms")
+    print(f"native Polars: {current_s * 1000:8.1f} ms")
+    print(f"speedup:       {legacy_s / current_s:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
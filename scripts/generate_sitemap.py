@@ -3,7 +3,8 @@
 Generate sitemap.xml for ViralVibes application.
 
 Queries Supabase for all synced creator profiles and writes public/sitemap.xml.
-Run at deploy time (or manually) to keep the static sitemap up to date.
+Past 50k URLs, sitemap.xml becomes a sitemapindex over public/sitemap-{n}.xml
+shards. Run at deploy time (or manually) to keep the static sitemap up to date.
 
 Usage:
     python scripts/generate_sitemap.py
@@ -24,7 +25,7 @@ load_secrets()
 from db import init_supabase  # noqa: E402
 from services.sitemap import (
     STATIC_ROUTES,
-    build_sitemap_xml,
+    ShardedSitemap,
     fetch_aplus_creators,
     fetch_synced_creators,
 )  # noqa: E402
@@ -51,7 +52,8 @@ def generate_sitemap() -> bool:
         aplus_creators = fetch_aplus_creators(client)
         print(f"Found {len(aplus_creators)} A+ creators for lookalike pages.")
 
-    xml_content = build_sitemap_xml(creators, aplus_creators=aplus_creators)
+    sitemap = ShardedSitemap()
+    sitemap.update(creators, aplus_creators=aplus_creators)
 
     public_dir = os.path.join(_PROJECT_ROOT, "public")
     sitemap_path = os.path.join(public_dir, "sitemap.xml")
@@ -59,7 +61,13 @@ def generate_sitemap() -> bool:
     try:
         os.makedirs(public_dir, exist_ok=True)
         with open(sitemap_path, "w", encoding="utf-8") as f:
-            f.write(xml_content)
+            f.write(sitemap.root_xml())
+        if sitemap.shard_count > 1:
+            for number in range(1, sitemap.shard_count + 1):
+                shard_file = os.path.join(public_dir, f"sitemap-{number}.xml")
+                with open(shard_file, "w", encoding="utf-8") as f:
+                    f.write(sitemap.shard_xml(number))
+            print(f"Sitemap index covers {sitemap.shard_count} shard files.")
         print(
             f"Sitemap written to {sitemap_path} "
             f"({len(STATIC_ROUTES)} static + {len(creators)} creator "
@@ -1,5 +1,9 @@
 #!/usr/bin/env python3
-"""Verify that public/sitemap.xml is well-formed and contains the expected static routes."""
+"""Verify that public/sitemap.xml is well-formed and contains the expected static routes.
+
+When sitemap.xml is a sitemapindex, every public/sitemap-{n}.xml shard it
+lists is parsed and the URLs are counted across all of them.
+"""
 
 import sys
 import xml.etree.ElementTree as ET
@@ -16,6 +20,14 @@ NAMESPACE = "http://www.sitemaps.org/schemas/sitemap/0.9"
 MIN_URLS = len(STATIC_ROUTES)
 
 
+def _parse(path: Path) -> ET.Element:
+    try:
+        return ET.parse(path).getroot()
+    except ET.ParseError as exc:
+        print(f"ERROR: {path.name} is not valid XML: {exc}", file=sys.stderr)
+        sys.exit(1)
+
+
 def main() -> None:
     if not SITEMAP_PATH.exists():
         print(f"ERROR: {SITEMAP_PATH} not found", file=sys.stderr)
@@ -24,14 +36,17 @@ def main() -> None:
     # xml.etree is safe here: the file is generated by our own code moments
     # earlier in the same CI step — it is not untrusted external input, so
     # defusedxml provides no practical security benefit.
-    try:
-        tree = ET.parse(SITEMAP_PATH)
-    except ET.ParseError as exc:
-        print(f"ERROR: sitemap is not valid XML: {exc}", file=sys.stderr)
-        sys.exit(1)
-
-    root = tree.getroot()
-    urls = root.findall(f"{{{NAMESPACE}}}url")
+    root = _parse(SITEMAP_PATH)
+    if root.tag == f"{{{NAMESPACE}}}sitemapindex":
+        urls = []
+        for loc in root.findall(f"{{{NAMESPACE}}}sitemap/{{{NAMESPACE}}}loc"):
+            shard_path = SITEMAP_PATH.parent / loc.text.rsplit("/", 1)[-1]
+            if not shard_path.exists():
+                print(f"ERROR: {shard_path} listed in index but not found", file=sys.stderr)
+                sys.exit(1)
+            urls.extend(_parse(shard_path).findall(f"{{{NAMESPACE}}}url"))
+    else:
+        urls = root.findall(f"{{{NAMESPACE}}}url")
 
     if len(urls) < MIN_URLS:
         print(
@@ -338,6 +338,60 @@ class YouTubeResolver:
             logger.error(f"[YouTubeResolver] Failed to fetch {channel_id}: {e}")
             return None
 
+    async def get_channels_data(self, channel_ids: list[str]) -> dict[str, dict]:
+        """
+        Fetch and normalize channel data for many channels at once.
+
+        channels.list accepts up to 50 comma-separated IDs per request and
+        bills 1 quota unit per request regardless of how many IDs it carries,
+        so this issues ceil(len(channel_ids) / 50) calls in total.
+
+        Unlike ``get_channel_data``, non-quota HttpErrors are re-raised: an
+        empty dict from a failed batch call would otherwise be indistinguishable
+        from "none of these channels exist".
+
+        Args:
+            channel_ids: YouTube channel IDs (UCxxxxxx); invalid formats are skipped
+
+        Returns:
+            Mapping of channel_id → normalized channel data for channels
+            YouTube returned.  IDs absent from the mapping were not found.
+        """
+        valid_ids = [cid for cid in dict.fromkeys(channel_ids) if self._validator.is_valid(cid)]
+        if not valid_ids:
+            return {}
+
+        youtube = self._get_youtube_client()
+        channels: dict[str, dict] = {}
+
+        for start in range(0, len(valid_ids), 50):
+            chunk = valid_ids[start : start + 50]
+            try:
+                request = youtube.channels().list(
+                    part="id,snippet,statistics,brandingSettings,topicDetails,status,contentDetails",
+                    id=",".join(chunk),
+                    maxResults=50,
+                )
+                response = await self._execute_async(request)
+            except HttpError as e:
+                if is_quota_exhausted_error(e):
+                    logger.error(
+                        f"[YouTubeResolver] YouTube quota exceeded fetching "
+                        f"{len(chunk)} channels — re-raising"
+                    )
+                else:
+                    logger.error(f"[YouTubeResolver] Batch fetch of {len(chunk)} failed: {e}")
+                raise
+
+            for item in response.get("items", []):
+                if item.get("id"):
+                    channels[item["id"]] = self.normalize_channel(item)
+
+        missing = len(valid_ids) - len(channels)
+        if missing:
+            logger.warning(f"[YouTubeResolver] {missing}/{len(valid_ids)} channels not found")
+        return channels
+
     async def get_channel_category_distribution(
         self,
         channel_id: str,
@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
-from typing import Any
+from datetime import datetime, timezone
+from typing import Any, Iterable
 
 
 @dataclass(frozen=True)
@@ -94,6 +95,30 @@ _SOCIAL_PATTERNS = [
     ),
 ]
 
+# Literals each pattern above cannot match without (lower-case), by pattern
+# index. A text is checked once for these with plain substring search, and
+# only the patterns that can possibly match are run — most bios contain none
+# or a few, instead of all fourteen regexes scanning every text.
+_PATTERN_TRIGGERS: tuple[tuple[str, ...], ...] = (
+    ("instagram",),
+    ("instagram", "ig"),
+    ("twitter", "x.com"),
+    ("twitter",),
+    ("facebook",),
+    ("linkedin",),
+    ("github",),
+    ("tiktok",),
+    ("tiktok", "tt"),
+    ("twitch",),
+    ("discord",),
+    ("patreon",),
+    ("linktr",),
+    ("http",),
+)
+_TRIGGERS = tuple(sorted({t for triggers in _PATTERN_TRIGGERS for t in triggers}))
+# Non-ASCII characters re.IGNORECASE treats as equal to ASCII letters
+_RE_CASE_EXTRAS = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
 _SKIP_WEBSITE_DOMAINS = frozenset(
     {
         "youtube.com",
@@ -146,16 +171,25 @@ def extract_social_links(bio: str = "", keywords: str = "") -> list[tuple[str, s
     if not text:
         return []
 
+    lowered = text.translate(_RE_CASE_EXTRAS).lower()
+    present = {t for t in _TRIGGERS if t in lowered}
+    has_at = "@" in text
+    if not present and not has_at:
+        return []
+
     found: list[tuple[str, str, str]] = []
     seen: set[str] = set()
 
-    for email in _EMAIL_RE.findall(text):
-        href = f"mailto:{email}"
-        if href not in seen:
-            found.append(("mail", email, href))
-            seen.add(href)
+    if has_at:
+        for email in _EMAIL_RE.findall(text):
+            href = f"mailto:{email}"
+            if href not in seen:
+                found.append(("mail", email, href))
+                seen.add(href)
 
-    for pattern, icon, label, url_tpl in _SOCIAL_PATTERNS:
+    for (pattern, icon, label, url_tpl), triggers in zip(_SOCIAL_PATTERNS, _PATTERN_TRIGGERS):
+        if present.isdisjoint(triggers):
+            continue
         for match in pattern.finditer(text):
             if icon == "globe":
                 full_url = match.group(1).rstrip(".,;")
@@ -300,10 +334,44 @@ class ContactExtractorService:
             extracted_x, extracted_tiktok, extracted_linkedin, extracted_whatsapp,
             contact_signals_extracted_at, has_contact_info
         """
-        from datetime import datetime, timezone
+        return ContactExtractorService._payload_from_signals(
+            ContactExtractorService.extract_from_creator(creator),
+            datetime.now(timezone.utc).isoformat(),
+        )
 
-        signals = ContactExtractorService.extract_from_creator(creator)
+    @staticmethod
+    def build_db_update_payloads(
+        creators: Iterable[dict[str, Any]], *, extracted_at: str | None = None
+    ) -> list[dict[str, Any]]:
+        """Batch ``build_db_update_payload`` for backfills.
 
+        Each payload also carries the creator's ``id`` so the list can go
+        straight to ``db.bulk_update_creators``; rows without an ``id`` are
+        skipped. One ``extracted_at`` stamp is shared by the batch.
+
+        Args:
+            creators: Creator dicts with id and the text fields
+            extracted_at: ISO timestamp to stamp (defaults to now, UTC)
+
+        Returns:
+            One payload per creator with an id, in input order
+        """
+        stamp = extracted_at or datetime.now(timezone.utc).isoformat()
+        payloads: list[dict[str, Any]] = []
+        for creator in creators:
+            if not creator.get("id"):
+                continue
+            signals = extract_contact_signals_from_creator(creator)
+            payloads.append(
+                {
+                    "id": creator["id"],
+                    **ContactExtractorService._payload_from_signals(signals, stamp),
+                }
+            )
+        return payloads
+
+    @staticmethod
+    def _payload_from_signals(signals: ContactSignals, extracted_at: str) -> dict[str, Any]:
         # Determine if any contact field is non-null
         has_contact = any(
             (
@@ -324,7 +392,7 @@ class ContactExtractorService:
             "extracted_tiktok": signals.tiktok_url or None,
             "extracted_linkedin": signals.linkedin_url or None,
             "extracted_whatsapp": None,  # Reserved for future use
-            "contact_signals_extracted_at": datetime.now(timezone.utc).isoformat(),
+            "contact_signals_extracted_at": extracted_at,
             "has_contact_info": has_contact,
         }
 
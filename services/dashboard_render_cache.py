@@ -0,0 +1,104 @@
+"""
+services/dashboard_render_cache.py
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+In-process cache of rendered dashboard fragments.
+
+Rendering a saved dashboard means fetching the playlist_stats row, decoding
+the frame and running every chart builder. The result only changes when the
+playlist is re-analysed, so fragments are cached per
+(dashboard_id, user_id, sort, order, version) where ``version`` is the row's
+``processed_on`` stamp. A view then costs one narrow version lookup; a
+re-analysis bumps the version and naturally misses the cache.
+
+The same key drives a strong ETag so browsers revalidating with
+``If-None-Match`` get a 304 without any rendering at all.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from services.dashboard_table import DEFAULT_ORDER, DEFAULT_SORT
+from views.table import DISPLAY_HEADERS
+
+_RENDER_CACHE_TTL_SECONDS = 10 * 60
+_RENDER_CACHE_MAX_ENTRIES = 128
+
+
+@dataclass(frozen=True)
+class RenderedDashboard:
+    title: str
+    html: str
+    rendered_at: float
+
+
+_render_cache: "OrderedDict[tuple, RenderedDashboard]" = OrderedDict()
+_render_cache_lock = threading.Lock()
+
+
+def render_cache_key(
+    dashboard_id: str,
+    user_id: Optional[str],
+    sort_by: str,
+    order: str,
+    version: str,
+) -> tuple:
+    """
+    Cache key for one rendered view. Sort arguments the table would ignore
+    (unknown header, bad order) fold into the defaults it renders instead,
+    mirroring ``dashboard_table.build_table_view``.
+    """
+    order = (order or "").lower()
+    return (
+        dashboard_id,
+        user_id,
+        sort_by if sort_by in DISPLAY_HEADERS else DEFAULT_SORT,
+        order if order in ("asc", "desc") else DEFAULT_ORDER,
+        version,
+    )
+
+
+def dashboard_etag(key: tuple) -> str:
+    """Strong ETag for a render cache key (opaque; changes with the data version)."""
+    digest = hashlib.sha256(repr(key).encode("utf-8")).hexdigest()[:20]
+    return f'"{key[0]}-{digest}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 9110 weak comparison of an ``If-None-Match`` header against ``etag``."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
+
+
+def get_rendered_dashboard(key: tuple) -> Optional[RenderedDashboard]:
+    with _render_cache_lock:
+        entry = _render_cache.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry.rendered_at >= _RENDER_CACHE_TTL_SECONDS:
+            _render_cache.pop(key, None)
+            return None
+        _render_cache.move_to_end(key)
+        return entry
+
+
+def store_rendered_dashboard(key: tuple, title: str, html: str) -> None:
+    with _render_cache_lock:
+        _render_cache[key] = RenderedDashboard(title, html, time.monotonic())
+        _render_cache.move_to_end(key)
+        while len(_render_cache) > _RENDER_CACHE_MAX_ENTRIES:
+            _render_cache.popitem(last=False)
+
+
+def clear_dashboard_render_cache() -> None:
+    with _render_cache_lock:
+        _render_cache.clear()
@@ -0,0 +1,205 @@
+"""
+Prebuilt /lists page payload.
+
+``lists_route`` used to fan out eleven queries per request to fill every tab
+of the page.  The data only changes when creators are re-synced, so the
+bootstrap worker builds it once per run (``refresh_lists_snapshot``) and
+stores it as one versioned JSON blob in ``lists_snapshots`` (migration 062).
+The route reads that blob with a single lookup (``load_lists_tab_data``) and
+only runs the live queries when the snapshot is missing, too old, or was
+written by a different ``LISTS_SNAPSHOT_VERSION``.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from db_lists import (
+    _count_distinct_languages,
+    get_category_groups,
+    get_country_groups,
+    get_language_groups,
+    get_lists_meta,
+    get_lists_snapshot,
+    get_most_active_creators,
+    get_new_channels,
+    get_niche_heatmap_data,
+    get_rising_creators,
+    get_top_rated_creators,
+    get_veteran_creators,
+    save_lists_snapshot,
+)
+
+logger = logging.getLogger(__name__)
+
+INITIAL_GROUPS = 8  # country / category cards visible on first load
+CREATORS_PER_GROUP = 5  # top creators shown inside each group card
+
+LISTS_SNAPSHOT_KEY = "lists_page"
+# Bump whenever the shape of build_lists_tab_data() changes so that web
+# workers ignore snapshots written by an older (or newer) deploy.
+LISTS_SNAPSHOT_VERSION = 1
+# Bootstrap runs every 6 h; tolerate one missed run before going live again.
+LISTS_SNAPSHOT_MAX_AGE = timedelta(hours=12)
+
+# Process-local copy so a burst of page views costs one lookup, not one each.
+_LOCAL_TTL_SECONDS = 60
+_local_cache: tuple[float, dict] | None = None
+
+
+def clear_lists_snapshot_cache() -> None:
+    """Drop the process-local copy of the /lists payload."""
+    global _local_cache
+    _local_cache = None
+
+
+def build_lists_tab_data() -> dict:
+    """
+    Run the live queries behind every /lists tab and return the ``tab_data``
+    dict consumed by ``views.lists.render_lists_page``.
+
+    All calls are independent, so they run in parallel — total latency is
+    the slowest single call.
+    """
+    with ThreadPoolExecutor(max_workers=11) as pool:
+        # Live DB meta: one combined aggregation scan
+        f_meta = pool.submit(get_lists_meta)
+        # Top Rated: quality-sorted creators
+        f_top_rated = pool.submit(get_top_rated_creators, 20)
+        # Most Active: upload-frequency leaders
+        f_most_active = pool.submit(get_most_active_creators, 20)
+        # By Country: first page of groups (offset=0)
+        f_country_rankings = pool.submit(get_country_groups, 0, INITIAL_GROUPS, CREATORS_PER_GROUP)
+        # By Category: first page of groups (offset=0)
+        f_category_rankings = pool.submit(
+            get_category_groups, 0, INITIAL_GROUPS, CREATORS_PER_GROUP
+        )
+        # Rising Stars: fastest growth rate
+        f_rising = pool.submit(get_rising_creators, 20)
+        # Veterans: 10+ year channels
+        f_veterans = pool.submit(get_veteran_creators, 20)
+        # New Channels: created within the last year, sorted by engagement
+        f_new_channels = pool.submit(get_new_channels, 20)
+        # Niche Heat Map: category-level aggregated momentum
+        f_heatmap = pool.submit(get_niche_heatmap_data)
+        # By Language: first page of groups (offset=0)
+        f_language_rankings = pool.submit(
+            get_language_groups, 0, INITIAL_GROUPS, CREATORS_PER_GROUP
+        )
+        # Language count fallback: zero-row-transfer COUNT(DISTINCT) — cheap to
+        # pre-fetch; used only when meta["total_languages"] is absent (pre-003 DB)
+        f_total_languages = pool.submit(_count_distinct_languages)
+
+        meta = f_meta.result()
+        total_languages_fallback = f_total_languages.result()
+
+        return {
+            "top_rated": f_top_rated.result(),
+            "most_active": f_most_active.result(),
+            "country_rankings": f_country_rankings.result(),
+            "total_countries": meta["total_countries"],
+            "category_rankings": f_category_rankings.result(),
+            "total_categories": meta["total_categories"],
+            "rising": f_rising.result(),
+            "veterans": f_veterans.result(),
+            "new_channels": f_new_channels.result(),
+            "heatmap": f_heatmap.result(),
+            "language_rankings": f_language_rankings.result(),
+            # meta["total_languages"] comes from migration 003.  On older DB
+            # schemas that predate the RPC column, fall back to
+            # _count_distinct_languages() — pre-fetched above in parallel.
+            "total_languages": meta.get("total_languages") or total_languages_fallback,
+        }
+
+
+def _emptied_sections(previous: dict, current: dict) -> list[str]:
+    """Sections that held data in ``previous`` but came back empty in ``current``."""
+    return sorted(
+        name
+        for name, value in previous.items()
+        if isinstance(value, (list, dict)) and value and not current.get(name)
+    )
+
+
+def refresh_lists_snapshot() -> bool:
+    """
+    Build the /lists payload and store it. Called by bootstrap Pass 7.
+
+    The db_lists helpers return ``[]`` on a timeout or error, so a section
+    that held data in the stored snapshot and is now empty is treated as a
+    failed query: the refresh is skipped and the previous snapshot keeps
+    serving (until LISTS_SNAPSHOT_MAX_AGE, after which the route goes live).
+    """
+    started = time.monotonic()
+    tab_data = build_lists_tab_data()
+
+    previous = get_lists_snapshot(LISTS_SNAPSHOT_KEY) or {}
+    if previous.get("version") == LISTS_SNAPSHOT_VERSION and isinstance(
+        previous.get("payload"), dict
+    ):
+        emptied = _emptied_sections(previous["payload"], tab_data)
+        if emptied:
+            logger.warning(
+                "[ListsSnapshot] not storing %r: %s came back empty (kept previous snapshot)",
+                LISTS_SNAPSHOT_KEY,
+                ", ".join(emptied),
+            )
+            return False
+
+    saved = save_lists_snapshot(LISTS_SNAPSHOT_KEY, LISTS_SNAPSHOT_VERSION, tab_data)
+    if saved:
+        logger.info(
+            "[ListsSnapshot] stored %r v%d in %.1fs",
+            LISTS_SNAPSHOT_KEY,
+            LISTS_SNAPSHOT_VERSION,
+            time.monotonic() - started,
+        )
+    return saved
+
+
+def _usable_payload(row: dict | None) -> dict | None:
+    """The snapshot payload if it is current, else None (with the reason logged)."""
+    if not row:
+        logger.info("[ListsSnapshot] no snapshot stored — building live")
+        return None
+    if row.get("version") != LISTS_SNAPSHOT_VERSION:
+        logger.info(
+            "[ListsSnapshot] snapshot version %r != %d — building live",
+            row.get("version"),
+            LISTS_SNAPSHOT_VERSION,
+        )
+        return None
+    try:
+        built_at = datetime.fromisoformat(str(row["built_at"]).replace("Z", "+00:00"))
+    except (KeyError, ValueError):
+        logger.warning(
+            "[ListsSnapshot] unreadable built_at %r — building live", row.get("built_at")
+        )
+        return None
+    if built_at.tzinfo is None:
+        built_at = built_at.replace(tzinfo=timezone.utc)
+    if datetime.now(timezone.utc) - built_at > LISTS_SNAPSHOT_MAX_AGE:
+        logger.warning("[ListsSnapshot] snapshot built at %s is stale — building live", built_at)
+        return None
+    payload = row.get("payload")
+    return payload if isinstance(payload, dict) else None
+
+
+def load_lists_tab_data() -> dict:
+    """
+    Return the /lists ``tab_data``: the stored snapshot when it is current,
+    otherwise a live ``build_lists_tab_data()``.
+    """
+    global _local_cache
+    if _local_cache and _local_cache[0] > time.monotonic():
+        return _local_cache[1]
+
+    tab_data = _usable_payload(get_lists_snapshot(LISTS_SNAPSHOT_KEY))
+    if tab_data is None:
+        tab_data = build_lists_tab_data()
+
+    _local_cache = (time.monotonic() + _LOCAL_TTL_SECONDS, tab_data)
+    return tab_data
@@ -11,16 +11,26 @@ Two sources:
 No API keys. No DB writes. Called lazily from the profile route.
 Cached in-process for 30 minutes so repeated profile visits don't hammer
 the upstream feeds.
+
+The profile route uses ``get_mentions_async``: both feeds are fetched
+concurrently over one pooled keep-alive client and parsed incrementally
+(reading stops once ``limit`` entries are in). Bundles older than the TTL
+are still served for up to ``_STALE_TTL`` while a single background fetch
+refreshes them, and concurrent misses for the same creator share one
+upstream fetch. ``get_mentions`` is the blocking equivalent.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import threading
 import time
 import xml.etree.ElementTree as ET
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import AsyncIterator, Callable, Iterable, Optional, TypeVar
 from urllib.parse import quote_plus
 
 import httpx
@@ -63,53 +73,156 @@ class MentionBundle:
 
 # ── In-process cache (TTL: 30 minutes) ────────────────────────────────────
 #
-# TTL keeps entries fresh, and a max size cap prevents unbounded growth
-# across many channel_id/channel_name pairs.
+# LRU ordered: hits move an entry to the end, writes evict from the front,
+# so every operation is O(1). Entries past _CACHE_TTL are stale; the async
+# path keeps serving them (while refreshing) until _STALE_TTL.
 
 _CACHE_TTL = 30 * 60  # seconds
-_MAX_CACHE_ENTRIES = 128  # hard cap to avoid unbounded growth
-_cache: dict[str, MentionBundle] = {}
+_STALE_TTL = 6 * 60 * 60  # serve-stale window for get_mentions_async
+_MAX_CACHE_ENTRIES = 512  # hard cap to avoid unbounded growth
+_cache: "OrderedDict[str, MentionBundle]" = OrderedDict()
+_cache_lock = threading.Lock()
 
 
 def _cache_key(channel_id: str, channel_name: str) -> str:
     return f"{channel_id}:{channel_name.lower()}"
 
 
-def _cached(channel_id: str, channel_name: str) -> Optional[MentionBundle]:
-    key = _cache_key(channel_id, channel_name)
-    bundle = _cache.get(key)
-    if bundle and (time.monotonic() - bundle.fetched_at) < _CACHE_TTL:
+def _lookup(key: str, max_age: float) -> Optional[MentionBundle]:
+    """The cached bundle if younger than ``max_age``; expired entries are dropped."""
+    with _cache_lock:
+        bundle = _cache.get(key)
+        if bundle is None:
+            return None
+        age = time.monotonic() - bundle.fetched_at
+        if age >= _STALE_TTL:
+            _cache.pop(key, None)
+            return None
+        if age >= max_age:
+            return None
+        _cache.move_to_end(key)
         return bundle
-    return None
 
 
-def _prune_cache_now() -> None:
-    """Evict expired entries and trim cache down to _MAX_CACHE_ENTRIES.
+def _cached(channel_id: str, channel_name: str) -> Optional[MentionBundle]:
+    return _lookup(_cache_key(channel_id, channel_name), _CACHE_TTL)
 
-    Called opportunistically on cache writes so the cache can't grow
-    without bound in higher-tenant scenarios.
-    """
-    if not _cache:
-        return
 
-    now = time.monotonic()
+def _store(bundle: MentionBundle) -> None:
+    key = _cache_key(bundle.channel_id, bundle.channel_name)
+    with _cache_lock:
+        _cache[key] = bundle
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_CACHE_ENTRIES:
+            _cache.popitem(last=False)
 
-    # Drop anything older than TTL.
-    expired_keys = [key for key, bundle in _cache.items() if now - bundle.fetched_at > _CACHE_TTL]
-    for key in expired_keys:
-        _cache.pop(key, None)
 
-    # Enforce max size, evicting oldest first by fetched_at.
-    excess = len(_cache) - _MAX_CACHE_ENTRIES
-    if excess > 0:
-        # Sort by fetched_at so we remove the stalest entries first.
-        for key, _bundle in sorted(_cache.items(), key=lambda item: item[1].fetched_at)[:excess]:
-            _cache.pop(key, None)
+def clear_mentions_cache() -> None:
+    with _cache_lock:
+        _cache.clear()
 
 
-def _store(bundle: MentionBundle) -> None:
-    _prune_cache_now()
-    _cache[_cache_key(bundle.channel_id, bundle.channel_name)] = bundle
+# ── Pooled async client ────────────────────────────────────────────────────
+#
+# One keep-alive client per event loop, shared by every feed fetch.
+
+_HEADERS = {"User-Agent": "ViralVibesBot/1.0"}
+_async_client: Optional[httpx.AsyncClient] = None
+_async_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_async_client() -> httpx.AsyncClient:
+    global _async_client, _async_client_loop
+    loop = asyncio.get_running_loop()
+    if _async_client is None or _async_client.is_closed or _async_client_loop is not loop:
+        _async_client = httpx.AsyncClient(
+            timeout=8.0,
+            follow_redirects=True,
+            headers=_HEADERS,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _async_client_loop = loop
+    return _async_client
+
+
+async def close_async_client() -> None:
+    global _async_client
+    if _async_client is not None and not _async_client.is_closed:
+        await _async_client.aclose()
+    _async_client = None
+
+
+# ── Incremental XML parsing ────────────────────────────────────────────────
+
+_T = TypeVar("_T")
+
+
+def _drain(parser: ET.XMLPullParser, stack: list[str], path: tuple[str, ...]):
+    """
+    Yield newly closed elements at ``path`` (root first, ``*`` matches any
+    tag), clearing each once the consumer moves on.
+    """
+    for event, elem in parser.read_events():
+        if event == "start":
+            stack.append(elem.tag)
+            continue
+        if len(stack) == len(path) and all(p in ("*", tag) for p, tag in zip(path, stack)):
+            yield elem
+            elem.clear()
+        stack.pop()
+
+
+def _iter_elements(chunks: Iterable[bytes], path: tuple[str, ...]):
+    """
+    Yield each element at ``path`` as soon as it has been parsed.
+
+    The consumer can stop early without the rest of the document being
+    parsed. Raises ``ET.ParseError`` on malformed XML.
+    """
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[str] = []
+    for chunk in chunks:
+        parser.feed(chunk)
+        yield from _drain(parser, stack, path)
+
+
+async def _aiter_elements(chunks: AsyncIterator[bytes], path: tuple[str, ...]):
+    """Async ``_iter_elements`` over a streamed response body."""
+    parser = ET.XMLPullParser(events=("start", "end"))
+    stack: list[str] = []
+    async for chunk in chunks:
+        parser.feed(chunk)
+        for elem in _drain(parser, stack, path):
+            yield elem
+
+
+def _take(elements, limit: int, build: Callable[[ET.Element], Optional[_T]]) -> list[_T]:
+    """Build items from the first ``limit`` elements (invalid ones are skipped)."""
+    items: list[_T] = []
+    if limit <= 0:
+        return items
+    for count, elem in enumerate(elements, start=1):
+        item = build(elem)
+        if item is not None:
+            items.append(item)
+        if count >= limit:
+            break
+    return items
+
+
+async def _atake(elements, limit: int, build: Callable[[ET.Element], Optional[_T]]) -> list[_T]:
+    items: list[_T] = []
+    if limit <= 0:
+        return items
+    count = 0
+    async for elem in elements:
+        count += 1
+        item = build(elem)
+        if item is not None:
+            items.append(item)
+        if count >= limit:
+            break
+    return items
 
 
 # ── YouTube RSS ────────────────────────────────────────────────────────────
@@ -134,13 +247,11 @@ def _parse_yt_date(raw: str) -> str:
         return raw[:10]
 
 
-def fetch_recent_videos(channel_id: str, limit: int = 6) -> list[VideoItem]:
-    url = _YT_RSS.format(channel_id=channel_id)
-    try:
-        with httpx.Client(timeout=8.0) as client:
-            resp = client.get(url, headers={"User-Agent": "ViralVibesBot/1.0"})
-            resp.raise_for_status()
-    except httpx.HTTPStatusError as exc:
+_YT_ENTRY_PATH = ("*", f"{{{_YT_NS['atom']}}}entry")
+
+
+def _log_yt_fetch_error(channel_id: str, exc: httpx.HTTPError) -> None:
+    if isinstance(exc, httpx.HTTPStatusError):
         status = exc.response.status_code
         if status == 404:
             # Channel deleted, private, or terminated — expected for churned channels.
@@ -160,62 +271,88 @@ def fetch_recent_videos(channel_id: str, limit: int = 6) -> list[VideoItem]:
                 status,
                 channel_id,
             )
-        return []
-    except httpx.TimeoutException:
+    elif isinstance(exc, httpx.TimeoutException):
         logger.warning("YouTube RSS request timed out for channel %s", channel_id)
-        return []
-    except httpx.RequestError as exc:
+    else:
         logger.error(
             "Failed to fetch YouTube RSS feed for channel %s: %r",
             channel_id,
             exc,
         )
+
+
+def _log_yt_parse_error(channel_id: str, exc: ET.ParseError) -> None:
+    logger.error(
+        "Failed to parse YouTube RSS XML",
+        extra={"channel_id": channel_id, "exception": repr(exc)},
+    )
+
+
+def _build_video(entry: ET.Element) -> Optional[VideoItem]:
+    title_el = entry.find("atom:title", _YT_NS)
+    link_el = entry.find("atom:link", _YT_NS)
+    pub_el = entry.find("atom:published", _YT_NS)
+    stats_el = entry.find("yt:statistics", _YT_NS)
+    thumb_el = entry.find("media:group/media:thumbnail", _YT_NS)
+
+    title = title_el.text if title_el is not None else ""
+    url = (link_el.get("href") if link_el is not None else "") or ""
+    pub = _parse_yt_date(pub_el.text or "") if pub_el is not None else ""
+
+    view_count: Optional[int] = None
+    if stats_el is not None:
+        try:
+            view_count = int(stats_el.get("viewCount", 0))
+        except (ValueError, TypeError):
+            pass
+
+    thumb = ""
+    if thumb_el is not None:
+        thumb = thumb_el.get("url", "")
+
+    if not (title and url):
+        return None
+    return VideoItem(
+        title=title,
+        url=url,
+        published=pub,
+        view_count=view_count,
+        thumbnail_url=thumb,
+    )
+
+
+def fetch_recent_videos(channel_id: str, limit: int = 6) -> list[VideoItem]:
+    url = _YT_RSS.format(channel_id=channel_id)
+    try:
+        with httpx.Client(timeout=8.0) as client:
+            resp = client.get(url, headers=_HEADERS)
+            resp.raise_for_status()
+    except httpx.HTTPError as exc:
+        _log_yt_fetch_error(channel_id, exc)
         return []
 
     try:
-        root = ET.fromstring(resp.text)
+        return _take(_iter_elements([resp.text], _YT_ENTRY_PATH), limit, _build_video)
     except ET.ParseError as exc:
-        logger.error(
-            "Failed to parse YouTube RSS XML",
-            extra={"channel_id": channel_id, "exception": repr(exc)},
-        )
+        _log_yt_parse_error(channel_id, exc)
         return []
 
-    videos: list[VideoItem] = []
-    for entry in root.findall("atom:entry", _YT_NS)[:limit]:
-        title_el = entry.find("atom:title", _YT_NS)
-        link_el = entry.find("atom:link", _YT_NS)
-        pub_el = entry.find("atom:published", _YT_NS)
-        stats_el = entry.find("yt:statistics", _YT_NS)
-        thumb_el = entry.find("media:group/media:thumbnail", _YT_NS)
-
-        title = title_el.text if title_el is not None else ""
-        url = (link_el.get("href") if link_el is not None else "") or ""
-        pub = _parse_yt_date(pub_el.text or "") if pub_el is not None else ""
-
-        view_count: Optional[int] = None
-        if stats_el is not None:
-            try:
-                view_count = int(stats_el.get("viewCount", 0))
-            except (ValueError, TypeError):
-                pass
-
-        thumb = ""
-        if thumb_el is not None:
-            thumb = thumb_el.get("url", "")
-
-        if title and url:
-            videos.append(
-                VideoItem(
-                    title=title,
-                    url=url,
-                    published=pub,
-                    view_count=view_count,
-                    thumbnail_url=thumb,
-                )
-            )
 
-    return videos
+async def afetch_recent_videos(channel_id: str, limit: int = 6) -> list[VideoItem]:
+    """``fetch_recent_videos`` over the pooled client; stops reading after ``limit`` entries."""
+    url = _YT_RSS.format(channel_id=channel_id)
+    try:
+        async with _get_async_client().stream("GET", url) as resp:
+            resp.raise_for_status()
+            return await _atake(
+                _aiter_elements(resp.aiter_bytes(), _YT_ENTRY_PATH), limit, _build_video
+            )
+    except httpx.HTTPError as exc:
+        _log_yt_fetch_error(channel_id, exc)
+        return []
+    except ET.ParseError as exc:
+        _log_yt_parse_error(channel_id, exc)
+        return []
 
 
 # ── Google News RSS ────────────────────────────────────────────────────────
@@ -224,6 +361,7 @@ def fetch_recent_videos(channel_id: str, limit: int = 6) -> list[VideoItem]:
 # Google exposes this as their official RSS product; it's not scraping.
 
 _GNEWS_RSS = "https://news.google.com/rss/search?q={query}&hl=en&gl=US&ceid=US:en"
+_GNEWS_ITEM_PATH = ("*", "channel", "item")
 
 
 def _strip_source(title: str) -> tuple[str, str]:
@@ -250,17 +388,45 @@ def _parse_gnews_date(raw: str) -> str:
         return raw[:16] if raw else ""
 
 
+def _gnews_url(channel_name: str) -> str:
+    # Narrow to YouTube mentions to reduce noise
+    query = f'"{channel_name}" youtube'
+    return _GNEWS_RSS.format(query=quote_plus(query))
+
+
+def _log_gnews_parse_error(exc: ET.ParseError) -> None:
+    logger.error(
+        "Failed to parse Google News RSS XML",
+        extra={"exception": repr(exc)},
+    )
+
+
+def _build_mention(item: ET.Element) -> Optional[MentionItem]:
+    raw_title = (item.findtext("title") or "").strip()
+    link = (item.findtext("link") or "").strip()
+    pub_raw = (item.findtext("pubDate") or "").strip()
+    desc = (item.findtext("description") or "").strip()
+
+    headline, source = _strip_source(raw_title)
+    if not headline or not link:
+        return None
+
+    return MentionItem(
+        title=headline,
+        url=link,
+        source=source,
+        published=_parse_gnews_date(pub_raw),
+        snippet=desc[:200],
+    )
+
+
 def fetch_news_mentions(
     channel_name: str,
     limit: int = 6,
 ) -> list[MentionItem]:
-    # Narrow to YouTube mentions to reduce noise
-    query = f'"{channel_name}" youtube'
-    url = _GNEWS_RSS.format(query=quote_plus(query))
-
     try:
         with httpx.Client(timeout=8.0, follow_redirects=True) as client:
-            resp = client.get(url, headers={"User-Agent": "ViralVibesBot/1.0"})
+            resp = client.get(_gnews_url(channel_name), headers=_HEADERS)
             resp.raise_for_status()
     except Exception as exc:
         logger.error(
@@ -270,40 +436,29 @@ def fetch_news_mentions(
         return []
 
     try:
-        root = ET.fromstring(resp.text)
+        return _take(_iter_elements([resp.text], _GNEWS_ITEM_PATH), limit, _build_mention)
     except ET.ParseError as exc:
-        logger.error(
-            "Failed to parse Google News RSS XML",
-            extra={"exception": repr(exc)},
-        )
-        return []
-
-    channel_el = root.find("channel")
-    if channel_el is None:
+        _log_gnews_parse_error(exc)
         return []
 
-    mentions: list[MentionItem] = []
-    for item in channel_el.findall("item")[:limit]:
-        raw_title = (item.findtext("title") or "").strip()
-        link = (item.findtext("link") or "").strip()
-        pub_raw = (item.findtext("pubDate") or "").strip()
-        desc = (item.findtext("description") or "").strip()
-
-        headline, source = _strip_source(raw_title)
-        if not headline or not link:
-            continue
 
-        mentions.append(
-            MentionItem(
-                title=headline,
-                url=link,
-                source=source,
-                published=_parse_gnews_date(pub_raw),
-                snippet=desc[:200],
+async def afetch_news_mentions(channel_name: str, limit: int = 6) -> list[MentionItem]:
+    """``fetch_news_mentions`` over the pooled client; stops reading after ``limit`` items."""
+    try:
+        async with _get_async_client().stream("GET", _gnews_url(channel_name)) as resp:
+            resp.raise_for_status()
+            return await _atake(
+                _aiter_elements(resp.aiter_bytes(), _GNEWS_ITEM_PATH), limit, _build_mention
             )
+    except ET.ParseError as exc:
+        _log_gnews_parse_error(exc)
+        return []
+    except Exception as exc:
+        logger.error(
+            "Failed to fetch Google News RSS feed",
+            extra={"channel_name": channel_name, "exception": repr(exc)},
         )
-
-    return mentions
+        return []
 
 
 # ── Public API ─────────────────────────────────────────────────────────────
@@ -339,3 +494,66 @@ def get_mentions(
     )
     _store(bundle)
     return bundle
+
+
+# In-flight refreshes by cache key: concurrent misses await the same fetch
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def _refresh(
+    channel_id: str, channel_name: str, video_limit: int, news_limit: int
+) -> MentionBundle:
+    recent_videos, news_mentions = await asyncio.gather(
+        afetch_recent_videos(channel_id, limit=video_limit),
+        afetch_news_mentions(channel_name, limit=news_limit),
+    )
+    bundle = MentionBundle(
+        channel_id=channel_id,
+        channel_name=channel_name,
+        recent_videos=recent_videos,
+        news_mentions=news_mentions,
+    )
+    _store(bundle)
+    return bundle
+
+
+def _refresh_coalesced(
+    channel_id: str, channel_name: str, video_limit: int, news_limit: int
+) -> asyncio.Task:
+    """The running refresh for this creator, or a new one."""
+    key = _cache_key(channel_id, channel_name)
+    task = _inflight.get(key)
+    if task is None or task.done() or task.get_loop() is not asyncio.get_running_loop():
+        task = asyncio.create_task(_refresh(channel_id, channel_name, video_limit, news_limit))
+        _inflight[key] = task
+
+        def _forget(done: asyncio.Task) -> None:
+            if _inflight.get(key) is done:
+                del _inflight[key]
+
+        task.add_done_callback(_forget)
+    return task
+
+
+async def get_mentions_async(
+    channel_id: str,
+    channel_name: str,
+    video_limit: int = 6,
+    news_limit: int = 6,
+) -> MentionBundle:
+    """
+    Async ``get_mentions``: feeds fetched concurrently, one fetch per creator at a time.
+
+    A bundle past the TTL but inside the stale window is returned at once
+    while a background refresh replaces it.
+    """
+    key = _cache_key(channel_id, channel_name)
+    bundle = _lookup(key, _STALE_TTL)
+    if bundle is not None:
+        if time.monotonic() - bundle.fetched_at >= _CACHE_TTL:
+            _refresh_coalesced(channel_id, channel_name, video_limit, news_limit)
+        return bundle
+    # shield: a client disconnecting must not cancel the fetch other callers share
+    return await asyncio.shield(
+        _refresh_coalesced(channel_id, channel_name, video_limit, news_limit)
+    )
@@ -8,11 +8,10 @@ email column comes first and core contact fields have plain names.
 
 from __future__ import annotations
 
-import csv
-import io
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 from services.contact_extractor import extract_contact_signals_from_creator
+from services.exports import iter_dict_rows_csv
 
 
 EMAIL_EXPORT_HEADERS = [
@@ -122,9 +121,10 @@ def filter_email_ready_rows(rows: list[dict[str, str]]) -> list[dict[str, str]]:
     return [row for row in rows if row.get("Email")]
 
 
+def iter_outreach_csv(rows: Iterable[dict[str, str]]) -> Iterator[str]:
+    """CSV chunks (header first) for ``rows``; feed to ``services.exports.export_response``."""
+    return iter_dict_rows_csv(rows, EMAIL_EXPORT_HEADERS)
+
+
 def render_outreach_csv(rows: list[dict[str, str]]) -> str:
-    buf = io.StringIO()
-    writer = csv.DictWriter(buf, fieldnames=EMAIL_EXPORT_HEADERS, extrasaction="ignore")
-    writer.writeheader()
-    writer.writerows(rows)
-    return buf.getvalue()
+    return "".join(iter_outreach_csv(rows))
@@ -6,12 +6,16 @@ Usage in a route handler:
 
     from services.plan_gate import gate_plan
 
-    blocked = gate_plan(user_id, required="pro", redirect_url=str(req.url))
+    blocked = gate_plan(user_id, required="pro", redirect_url=str(req.url), request=req)
     if blocked:
         return blocked
 
 `gate_plan` returns None when the user has sufficient access, or a
 RedirectResponse to the pricing page when they don't.
+
+Plan lookups go through `db.get_user_plan` (short in-process TTL cache) and,
+when the request is passed, are memoised on `request.state` so several gates
+in one request share a single lookup.
 """
 
 from urllib.parse import quote_plus
@@ -22,10 +26,24 @@ from db import get_user_plan
 from services.stripe_service import PLAN_RANK
 
 
+def get_request_plan(user_id: str, request=None) -> dict:
+    """``db.get_user_plan(user_id)``, memoised on ``request.state`` when given."""
+    state = getattr(request, "state", None)
+    memo = getattr(state, "plan_info", None) if state is not None else None
+    if memo is not None and memo[0] == user_id:
+        return memo[1]
+
+    plan_info = get_user_plan(user_id) or {}
+    if state is not None:
+        state.plan_info = (user_id, plan_info)
+    return plan_info
+
+
 def gate_plan(
     user_id: str | None,
     required: str,
     redirect_url: str = "/pricing",
+    request=None,
 ) -> RedirectResponse | None:
     """
     Return a redirect to /pricing if the user's plan is below `required`,
@@ -36,6 +54,8 @@ def gate_plan(
         required:     Minimum plan name — "pro" or "agency".
         redirect_url: The URL to bounce back to after upgrading (passed as
                       ?from= query param so the pricing page can show context).
+        request:      The current request, to share one plan lookup across
+                      every gate it passes through.
 
     Returns:
         RedirectResponse to pricing if insufficient, None if allowed.
@@ -43,7 +63,7 @@ def gate_plan(
     if not user_id:
         return RedirectResponse("/login", status_code=303)
 
-    plan_info = get_user_plan(user_id) or {}
+    plan_info = get_request_plan(user_id, request)
     user_rank = PLAN_RANK.get(plan_info.get("plan", "free"), 0)
 
     if required not in PLAN_RANK:
@@ -9,7 +9,7 @@ from db import (
     get_dashboard_stats_by_id,
     upsert_playlist_stats,
 )
-from utils import create_empty_dataframe, deserialize_dataframe
+from utils import create_empty_dataframe, load_playlist_frame
 
 logger = logging.getLogger(__name__)
 
@@ -32,8 +32,9 @@ def load_dashboard_by_id(
         user_id: Optional user_id for ownership filtering
 
     Returns:
-        Dict with keys: df, playlist_url, playlist_name, channel_name,
-        channel_thumbnail, summary_stats, cached_stats
+        Dict with keys: df (list of row dicts), frame (the Polars DataFrame),
+        playlist_url, playlist_name, channel_name, channel_thumbnail,
+        summary_stats, cached_stats
         Returns None if dashboard not found or data is invalid
     """
     # 1. Fetch raw stats from database (no date filtering)
@@ -43,14 +44,14 @@ def load_dashboard_by_id(
         logger.warning(f"Dashboard {dashboard_id} not found (user={user_id})")
         return None
 
-    # 2. Deserialize DataFrame from JSON
+    # 2. Deserialize DataFrame (columnar df_arrow, else legacy df_json)
     try:
-        df_json = cached_stats.get("df_json")
-        if not df_json:
-            logger.error(f"Dashboard {dashboard_id} has no df_json")
+        if not cached_stats.get("df_arrow") and not cached_stats.get("df_json"):
+            logger.error(f"Dashboard {dashboard_id} has no stored DataFrame")
             return None
 
-        df = deserialize_dataframe(df_json)
+        frame = load_playlist_frame(cached_stats)
+        df = frame.to_dicts()
     except Exception as e:
         logger.error(f"Failed to deserialize DataFrame for dashboard {dashboard_id}: {e}")
         return None
@@ -68,6 +69,7 @@ def load_dashboard_by_id(
 
     return {
         "df": df,
+        "frame": frame,
         "playlist_url": playlist_url,
         "playlist_name": playlist_name,
         "channel_name": channel_name,
@@ -97,8 +99,11 @@ def load_cached_or_stub(
     if cached:
         logger.info(f"Using cached stats for playlist {playlist_url}")
 
-        # reconstruct df other fields from cache row
-        df = deserialize_dataframe(cached["df_json"])
+        # reconstruct df other fields from cache row (already decoded by the cache lookup)
+        frame = cached.get("df")
+        if frame is None:
+            frame = load_playlist_frame(cached)
+        df = frame.to_dicts()
         # TODO: Move this code to worker
         # if logger.isEnabledFor(logging.DEBUG):
         # logger.info("=" * 60)
@@ -120,6 +125,7 @@ def load_cached_or_stub(
         return {
             "cached": True,
             "df": df,
+            "frame": frame,
             "playlist_name": playlist_name,
             "channel_name": channel_name,
             "channel_thumbnail": channel_thumbnail,
@@ -173,6 +179,7 @@ def load_cached_or_stub(
     return {
         "cached": False,
         "df": df,
+        "frame": None,
         "playlist_name": playlist_name,
         "channel_name": channel_name,
         "channel_thumbnail": channel_thumbnail,
@@ -0,0 +1,213 @@
+"""
+services/progress_bus.py
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+In-process pub/sub for playlist job progress, feeding the SSE progress stream.
+
+Every open progress page used to poll /job-progress, and every poll ran its
+own playlist_jobs query. Watchers now subscribe to the bus instead:
+
+  - Updates published in-process (a worker running inside the web process)
+    reach subscribers immediately, without touching the DB.
+  - For cross-process deployments, one poller per watched playlist reads
+    ``db.get_job_progress`` every ``poll_interval`` seconds, skipped while
+    in-process updates are fresh, and publishes any change. N watchers of
+    the same job cost one query per interval, not N.
+
+Delivery is coalesced: each subscriber holds at most one pending snapshot,
+so a slow client only ever sees the latest state.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+from constants import JobStatus
+from db import get_job_progress
+
+logger = logging.getLogger(__name__)
+
+PROGRESS_POLL_INTERVAL_SECONDS = 2.0
+# Upper bound on remembered snapshots for jobs nobody is currently watching
+_MAX_TRACKED_JOBS = 256
+
+
+def is_terminal(snapshot: Dict[str, Any]) -> bool:
+    """True once a job can no longer change (finished, or no job at all)."""
+    status = snapshot.get("status")
+    if status is None:
+        # get_job_progress reports a missing job as job_id=None
+        return "job_id" in snapshot and snapshot["job_id"] is None
+    return status in JobStatus.FINISHED
+
+
+class ProgressSubscription:
+    """Async iterator over coalesced progress snapshots for one playlist."""
+
+    def __init__(self, bus: "ProgressBus", key: str):
+        self._bus = bus
+        self.key = key
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+    def offer(self, snapshot: Dict[str, Any]) -> None:
+        """Replace any undelivered snapshot with ``snapshot`` (loop thread only)."""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(snapshot)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Next snapshot, or None after ``timeout`` seconds without one."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+
+    def close(self) -> None:
+        self._bus._unsubscribe(self)
+
+    def __enter__(self) -> "ProgressSubscription":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> Dict[str, Any]:
+        return await self.queue.get()
+
+
+class ProgressBus:
+    """Latest-value progress channel keyed by playlist URL."""
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Dict[str, Any]] = get_job_progress,
+        poll_interval: float = PROGRESS_POLL_INTERVAL_SECONDS,
+    ):
+        self._fetch = fetch
+        self.poll_interval = poll_interval
+        self._lock = threading.Lock()
+        self._subscribers: Dict[str, set[ProgressSubscription]] = {}
+        # key → (monotonic_ts, snapshot) of the last published state
+        self._latest: Dict[str, tuple[float, Dict[str, Any]]] = {}
+        self._pollers: Dict[str, asyncio.Task] = {}
+
+    # ── Publishing ─────────────────────────────────────────────────────────
+
+    def publish(self, key: str, update: Dict[str, Any]) -> None:
+        """
+        Merge ``update`` into the latest snapshot for ``key`` and fan it out.
+
+        Safe to call from any thread; partial updates (e.g. just ``progress``)
+        are merged over the previous snapshot.
+        """
+        with self._lock:
+            previous = self._latest.get(key, (0.0, {}))[1]
+            snapshot = {**previous, **update}
+            if snapshot == previous:
+                return
+            subscribers = list(self._subscribers.get(key, ()))
+            if subscribers or not is_terminal(snapshot):
+                self._latest[key] = (time.monotonic(), snapshot)
+                self._prune()
+            else:
+                # Nobody is watching a finished job; a later run must not see it
+                self._latest.pop(key, None)
+        for sub in subscribers:
+            self._deliver(sub, snapshot)
+
+    def _prune(self) -> None:
+        """Drop the oldest unwatched snapshots beyond ``_MAX_TRACKED_JOBS`` (lock held)."""
+        excess = len(self._latest) - _MAX_TRACKED_JOBS
+        if excess <= 0:
+            return
+        unwatched = [k for k in self._latest if k not in self._subscribers]
+        for key in sorted(unwatched, key=lambda k: self._latest[k][0])[:excess]:
+            self._latest.pop(key, None)
+
+    @staticmethod
+    def _deliver(sub: ProgressSubscription, snapshot: Dict[str, Any]) -> None:
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is sub.loop:
+            sub.offer(snapshot)
+        elif not sub.loop.is_closed():
+            sub.loop.call_soon_threadsafe(sub.offer, snapshot)
+
+    def latest(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._latest.get(key)
+        return entry[1] if entry else None
+
+    # ── Subscribing ────────────────────────────────────────────────────────
+
+    def subscribe(self, key: str) -> ProgressSubscription:
+        """
+        Watch ``key``. The latest known snapshot (if any) is delivered at once;
+        the first subscriber on this loop starts the DB fallback poller.
+        """
+        sub = ProgressSubscription(self, key)
+        with self._lock:
+            self._subscribers.setdefault(key, set()).add(sub)
+            entry = self._latest.get(key)
+            poller = self._pollers.get(key)
+            if poller is None or poller.done():
+                self._pollers[key] = sub.loop.create_task(
+                    self._poll(key), name=f"progress-poll:{key}"
+                )
+        if entry:
+            # Terminal snapshots are only kept while watched, so this is current
+            sub.offer(entry[1])
+        return sub
+
+    def _unsubscribe(self, sub: ProgressSubscription) -> None:
+        with self._lock:
+            subs = self._subscribers.get(sub.key)
+            if subs is None:
+                return
+            subs.discard(sub)
+            if subs:
+                return
+            del self._subscribers[sub.key]
+            poller = self._pollers.pop(sub.key, None)
+            # Keep the last snapshot only while a job is still running
+            entry = self._latest.get(sub.key)
+            if entry and is_terminal(entry[1]):
+                self._latest.pop(sub.key, None)
+        if poller is not None:
+            poller.cancel()
+
+    def subscriber_count(self, key: str) -> int:
+        with self._lock:
+            return len(self._subscribers.get(key, ()))
+
+    # ── DB fallback ────────────────────────────────────────────────────────
+
+    async def _poll(self, key: str) -> None:
+        """Single shared DB reader for ``key`` while anyone is watching."""
+        while self.subscriber_count(key):
+            with self._lock:
+                entry = self._latest.get(key)
+            fresh = entry is not None and time.monotonic() - entry[0] < self.poll_interval
+            if not fresh:
+                try:
+                    snapshot = await asyncio.to_thread(self._fetch, key)
+                except Exception:
+                    logger.warning("Progress poll failed for %s", key, exc_info=True)
+                else:
+                    if snapshot:
+                        self.publish(key, snapshot)
+                        if is_terminal(snapshot):
+                            return
+            await asyncio.sleep(self.poll_interval)
+
+
+progress_bus = ProgressBus()
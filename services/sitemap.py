@@ -4,18 +4,47 @@ Single source of truth for which routes appear in the sitemap and how
 they are serialised to XML. Consumed by:
 
   - scripts/generate_sitemap.py  — deploy-time static file generation
-  - main.py @rt("/sitemap.xml")  — live route with 24 h in-process cache
+  - main.py @rt("/sitemap.xml")  — live route, refreshed in the background
+
+XML is streamed straight into a text buffer, one ``<url>`` at a time — no
+ElementTree/minidom document is ever built. Past ``MAX_URLS_PER_SITEMAP``
+entries the output is split into ``/sitemap-{n}.xml`` shards listed by a
+``<sitemapindex>``; ``ShardedSitemap`` re-serialises only the shards whose
+entries (loc + lastmod) changed since the previous build.
 """
 
-import xml.etree.ElementTree as ET
+import hashlib
+import io
+import itertools
+import logging
+import math
+import threading
+import time
+import zlib
 from datetime import datetime, timezone
+from typing import Callable, Iterable, Iterator, Optional, TextIO
 from urllib.parse import urljoin
-from xml.dom import minidom
+from xml.sax.saxutils import escape
 
 from constants import SITE_BASE_URL
 from services.rankings import iter_ranking_sitemap_paths
 
+logger = logging.getLogger(__name__)
+
 BASE_URL = SITE_BASE_URL
+# urljoin(BASE_URL, "/path") for root-relative paths, without urljoin's
+# per-call parsing (it dominated builds with 100k+ creators)
+_ORIGIN = urljoin(BASE_URL, "/").rstrip("/")
+SITEMAP_NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
+
+# Google's per-file limit; larger sitemaps are split behind a sitemapindex
+MAX_URLS_PER_SITEMAP = 50_000
+# Target fill of each hashed creator shard, leaving headroom for growth so
+# the shard count (and with it every bucket assignment) rarely changes
+_SHARD_FILL = 0.8
+
+# (loc, lastmod, changefreq, priority)
+SitemapEntry = tuple[str, str, str, str]
 
 # (path, changefreq, priority)
 STATIC_ROUTES: list[tuple[str, str, str]] = [
@@ -79,23 +108,107 @@ def fetch_aplus_creators(client) -> list:
         return []
 
 
-def _prettify(elem: ET.Element) -> str:
-    rough = ET.tostring(elem, "utf-8")
-    return minidom.parseString(rough).toprettyxml(indent="  ")
-
-
 def _lastmod_or_today(row: dict, today: str) -> str:
     """Pull a 10-char (YYYY-MM-DD) lastmod off a row, falling back to today."""
     raw = row.get("last_updated_at") or ""
     return raw[:10] if len(raw) >= 10 else today
 
 
+def _today() -> str:
+    return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+
+# ---------------------------------------------------------------------------
+# Entries
+# ---------------------------------------------------------------------------
+
+
+def iter_page_entries(today: str) -> Iterator[SitemapEntry]:
+    """Static routes followed by the programmatic ranking pages."""
+    for path, changefreq, priority in STATIC_ROUTES:
+        yield _ORIGIN + path, today, changefreq, priority
+    for path in iter_ranking_sitemap_paths():
+        yield _ORIGIN + path, today, "weekly", "0.7"
+
+
+def iter_creator_entries(
+    creators: Iterable[dict],
+    aplus_creators: Iterable[dict] | None,
+    today: str,
+) -> Iterator[tuple[str, SitemapEntry]]:
+    """Yield ``(shard_key, entry)`` for creator profiles and A+ lookalike pages.
+
+    ``shard_key`` is stable for a given page (creator id / handle), so a
+    creator always hashes into the same shard of a sharded sitemap.
+    """
+    for creator in creators:
+        creator_id = creator.get("id")
+        if not creator_id:
+            continue
+        handle = (creator.get("custom_url") or "").lstrip("@").lower()
+        path = f"/creators/@{handle}" if handle else f"/creator/{creator_id}"
+        entry = (_ORIGIN + path, _lastmod_or_today(creator, today), "weekly", "0.7")
+        yield str(creator_id), entry
+
+    for creator in aplus_creators or []:
+        handle = (creator.get("custom_url") or "").lstrip("@").lower()
+        if not handle:
+            continue
+        loc = f"{_ORIGIN}/creators/like/{handle}"
+        yield f"like:{handle}", (loc, _lastmod_or_today(creator, today), "weekly", "0.6")
+
+
+# ---------------------------------------------------------------------------
+# Streaming writers
+# ---------------------------------------------------------------------------
+
+
+_URLSET_OPEN = f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n'
+_URLSET_CLOSE = "</urlset>\n"
+
+
+def _write_url(out: TextIO, entry: SitemapEntry) -> None:
+    loc, lastmod, changefreq, priority = entry
+    out.write(
+        f"  <url>\n"
+        f"    <loc>{escape(loc)}</loc>\n"
+        f"    <lastmod>{lastmod}</lastmod>\n"
+        f"    <changefreq>{changefreq}</changefreq>\n"
+        f"    <priority>{priority}</priority>\n"
+        f"  </url>\n"
+    )
+
+
+def write_urlset(entries: Iterable[SitemapEntry], out: TextIO) -> int:
+    """Stream a ``<urlset>`` document for ``entries`` into ``out``; returns the URL count."""
+    count = 0
+    out.write(_URLSET_OPEN)
+    for entry in entries:
+        _write_url(out, entry)
+        count += 1
+    out.write(_URLSET_CLOSE)
+    return count
+
+
+def write_sitemap_index(sitemaps: Iterable[tuple[str, str]], out: TextIO) -> None:
+    """Stream a ``<sitemapindex>`` of ``(loc, lastmod)`` pairs into ``out``."""
+    out.write(f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n')
+    for loc, lastmod in sitemaps:
+        out.write(
+            f"  <sitemap>\n"
+            f"    <loc>{escape(loc)}</loc>\n"
+            f"    <lastmod>{lastmod}</lastmod>\n"
+            f"  </sitemap>\n"
+        )
+    out.write("</sitemapindex>\n")
+
+
 def build_sitemap_xml(
     creators: list,
     *,
     aplus_creators: list | None = None,
 ) -> str:
-    """Build and return the complete sitemap XML string.
+    """Build and return the complete sitemap XML string as one ``<urlset>``.
 
     Args:
         creators: List of ``{id, custom_url, last_updated_at}`` dicts for synced
@@ -109,44 +222,252 @@ def build_sitemap_xml(
                   A+ by the caller so the sitemap stays well under Google's
                   50k-URL ceiling and crawl budget focuses on the most
                   rankable creators.
+
+    Not sharded — use ``ShardedSitemap`` when the output may exceed
+    ``MAX_URLS_PER_SITEMAP`` URLs.
     """
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    urlset = ET.Element("urlset", xmlns="http://www.sitemaps.org/schemas/sitemap/0.9")
+    today = _today()
+    buf = io.StringIO()
+    write_urlset(_all_entries(creators, aplus_creators, today), buf)
+    return buf.getvalue()
 
-    for path, changefreq, priority in STATIC_ROUTES:
-        url_el = ET.SubElement(urlset, "url")
-        ET.SubElement(url_el, "loc").text = urljoin(BASE_URL, path)
-        ET.SubElement(url_el, "lastmod").text = today
-        ET.SubElement(url_el, "changefreq").text = changefreq
-        ET.SubElement(url_el, "priority").text = priority
 
-    for path in iter_ranking_sitemap_paths():
-        url_el = ET.SubElement(urlset, "url")
-        ET.SubElement(url_el, "loc").text = urljoin(BASE_URL, path)
-        ET.SubElement(url_el, "lastmod").text = today
-        ET.SubElement(url_el, "changefreq").text = "weekly"
-        ET.SubElement(url_el, "priority").text = "0.7"
+def _all_entries(creators, aplus_creators, today) -> Iterator[SitemapEntry]:
+    yield from iter_page_entries(today)
+    for _, entry in iter_creator_entries(creators, aplus_creators, today):
+        yield entry
 
-    for creator in creators:
-        creator_id = creator.get("id")
-        if not creator_id:
-            continue
-        handle = (creator.get("custom_url") or "").lstrip("@").lower()
-        path = f"/creators/@{handle}" if handle else f"/creator/{creator_id}"
-        url_el = ET.SubElement(urlset, "url")
-        ET.SubElement(url_el, "loc").text = urljoin(BASE_URL, path)
-        ET.SubElement(url_el, "lastmod").text = _lastmod_or_today(creator, today)
-        ET.SubElement(url_el, "changefreq").text = "weekly"
-        ET.SubElement(url_el, "priority").text = "0.7"
 
-    for creator in aplus_creators or []:
-        handle = (creator.get("custom_url") or "").lstrip("@").lower()
-        if not handle:
-            continue
-        url_el = ET.SubElement(urlset, "url")
-        ET.SubElement(url_el, "loc").text = urljoin(BASE_URL, f"/creators/like/{handle}")
-        ET.SubElement(url_el, "lastmod").text = _lastmod_or_today(creator, today)
-        ET.SubElement(url_el, "changefreq").text = "weekly"
-        ET.SubElement(url_el, "priority").text = "0.6"
+def shard_path(number: int) -> str:
+    """URL path of shard ``number`` (1-based)."""
+    return f"/sitemap-{number}.xml"
+
+
+# ---------------------------------------------------------------------------
+# Sharded, incremental sitemap
+# ---------------------------------------------------------------------------
+
+
+class _Shard:
+    """Fingerprint accumulator (and, once rebuilt, the XML) for one shard."""
+
+    __slots__ = ("digest", "count", "lastmod", "xml")
+
+    def __init__(self):
+        self.digest = 0
+        self.count = 0
+        self.lastmod = ""
+        self.xml: Optional[str] = None
+
+    def add(self, entry: SitemapEntry) -> None:
+        loc, lastmod = entry[0], entry[1]
+        h = hashlib.blake2b(f"{loc}\0{lastmod}".encode(), digest_size=8).digest()
+        # Order-independent sum, so a different row order from the DB is not a change
+        self.digest = (self.digest + int.from_bytes(h, "big")) & 0xFFFFFFFFFFFFFFFF
+        self.count += 1
+        if lastmod > self.lastmod:
+            self.lastmod = lastmod
+
+    @property
+    def fingerprint(self) -> tuple[int, int]:
+        return self.digest, self.count
+
+
+class ShardedSitemap:
+    """Sitemap split into ≤ ``max_urls`` shards, rebuilt incrementally.
+
+    While everything fits in one file, ``root_xml()`` is a plain ``<urlset>``
+    in the same order ``build_sitemap_xml`` produces. Beyond that, shard 1
+    holds the static and ranking pages and the remaining shards hold creator
+    pages bucketed by a stable hash of the creator id (or lookalike handle):
+    a creator whose ``last_updated_at`` changed only dirties its own bucket,
+    and ``update()`` re-serialises just the shards whose fingerprint moved.
+    ``root_xml()`` is then a ``<sitemapindex>`` pointing at each shard.
+    """
+
+    def __init__(self, max_urls: int = MAX_URLS_PER_SITEMAP):
+        self.max_urls = max_urls
+        self._lock = threading.Lock()
+        self._shards: list[_Shard] = []
+        self._index_xml: Optional[str] = None
+
+    @property
+    def shard_count(self) -> int:
+        with self._lock:
+            return len(self._shards)
+
+    def update(self, creators: list, *, aplus_creators: list | None = None) -> list[int]:
+        """Rebuild from fresh cohorts; returns the 1-based numbers of re-rendered shards.
+
+        Readers keep seeing the previous build until the new one is swapped in.
+        """
+        today = _today()
+        keyed = list(iter_creator_entries(creators, aplus_creators, today))
+        pages = list(iter_page_entries(today))
+        total = len(pages) + len(keyed)
+
+        if total <= self.max_urls:
+            layout = [_Shard()]
+            for entry in pages:
+                layout[0].add(entry)
+            for _, entry in keyed:
+                layout[0].add(entry)
+            buckets = None
+        else:
+            buckets = self._bucket_count(keyed)
+            layout = [_Shard() for _ in range(buckets + 1)]
+            for entry in pages:
+                layout[0].add(entry)
+            for key, entry in keyed:
+                layout[1 + _bucket(key, buckets)].add(entry)
+
+        with self._lock:
+            previous = self._shards
+        dirty = []
+        for i, shard in enumerate(layout):
+            old = previous[i] if i < len(previous) else None
+            if old is not None and old.xml is not None and old.fingerprint == shard.fingerprint:
+                shard.xml = old.xml
+            else:
+                dirty.append(i)
+
+        if dirty:
+            self._render(layout, dirty, pages, keyed, buckets)
+
+        index_xml = None
+        if len(layout) > 1:
+            buf = io.StringIO()
+            write_sitemap_index(
+                ((_ORIGIN + shard_path(i + 1), s.lastmod) for i, s in enumerate(layout)),
+                buf,
+            )
+            index_xml = buf.getvalue()
+
+        with self._lock:
+            self._shards = layout
+            self._index_xml = index_xml
+        return [i + 1 for i in dirty]
+
+    def _bucket_count(self, keyed: list) -> int:
+        """Smallest hashed-bucket count (at the target fill) where no bucket overflows."""
+        buckets = max(1, math.ceil(len(keyed) / (self.max_urls * _SHARD_FILL)))
+        while True:
+            sizes = [0] * buckets
+            for key, _ in keyed:
+                sizes[_bucket(key, buckets)] += 1
+            if max(sizes) <= self.max_urls:
+                return buckets
+            buckets += 1
+
+    @staticmethod
+    def _render(layout, dirty, pages, keyed, buckets) -> None:
+        """Stream the entries of every dirty shard into fresh buffers in one pass."""
+        if buckets is None:
+            buf = io.StringIO()
+            write_urlset(itertools.chain(pages, (entry for _, entry in keyed)), buf)
+            layout[0].xml = buf.getvalue()
+            return
+        buffers = {i: io.StringIO() for i in dirty}
+        for buf in buffers.values():
+            buf.write(_URLSET_OPEN)
+        if 0 in buffers:
+            for entry in pages:
+                _write_url(buffers[0], entry)
+        if len(buffers) > (0 in buffers):
+            for key, entry in keyed:
+                buf = buffers.get(1 + _bucket(key, buckets))
+                if buf is not None:
+                    _write_url(buf, entry)
+        for i, buf in buffers.items():
+            buf.write(_URLSET_CLOSE)
+            layout[i].xml = buf.getvalue()
+
+    def root_xml(self) -> Optional[str]:
+        """``/sitemap.xml`` body: the sitemapindex when sharded, else the single urlset."""
+        with self._lock:
+            if self._index_xml is not None:
+                return self._index_xml
+            return self._shards[0].xml if self._shards else None
+
+    def shard_xml(self, number: int) -> Optional[str]:
+        """Body of ``/sitemap-{number}.xml``, or None if there is no such shard."""
+        with self._lock:
+            if len(self._shards) < 2 or not 1 <= number <= len(self._shards):
+                return None
+            return self._shards[number - 1].xml
+
+
+def _bucket(key: str, buckets: int) -> int:
+    # crc32 rather than hash(): stable across processes and restarts
+    return zlib.crc32(key.encode()) % buckets
+
+
+class LiveSitemap:
+    """``ShardedSitemap`` kept fresh by a background refresh.
+
+    Only the very first request builds inline; after that an expired TTL
+    triggers one background rebuild while requests keep getting the previous
+    XML, so no crawler request waits on the full creator fetch.
+    """
+
+    def __init__(
+        self,
+        load: Callable[[], tuple[list, list]],
+        ttl: float,
+        sitemap: Optional[ShardedSitemap] = None,
+    ):
+        self._load = load
+        self.ttl = ttl
+        self.sitemap = sitemap or ShardedSitemap()
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._refreshed_at: Optional[float] = None
+        self._refreshing = False
+
+    def refresh(self) -> list[int]:
+        """Fetch the cohorts and rebuild; returns the re-rendered shard numbers."""
+        with self._build_lock:
+            return self._rebuild()
+
+    def _rebuild(self) -> list[int]:
+        creators, aplus_creators = self._load()
+        rebuilt = self.sitemap.update(creators, aplus_creators=aplus_creators)
+        with self._lock:
+            self._refreshed_at = time.monotonic()
+        if rebuilt:
+            logger.info("sitemap: re-rendered shard(s) %s", rebuilt)
+        return rebuilt
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.warning("sitemap: background refresh failed", exc_info=True)
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _ensure_fresh(self) -> None:
+        with self._lock:
+            refreshed_at = self._refreshed_at
+            stale = refreshed_at is not None and time.monotonic() - refreshed_at > self.ttl
+            start = stale and not self._refreshing
+            if start:
+                self._refreshing = True
+        if refreshed_at is None:
+            # Cold start: nothing to serve yet, so build inline (once)
+            with self._build_lock:
+                if self._refreshed_at is None:
+                    self._rebuild()
+        elif start:
+            threading.Thread(
+                target=self._refresh_in_background, name="sitemap-refresh", daemon=True
+            ).start()
+
+    def root_xml(self) -> Optional[str]:
+        self._ensure_fresh()
+        return self.sitemap.root_xml()
 
-    return _prettify(urlset)
+    def shard_xml(self, number: int) -> Optional[str]:
+        self._ensure_fresh()
+        return self.sitemap.shard_xml(number)
@@ -1,8 +1,10 @@
+import asyncio
 import logging
 import os
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+import httpx
 import isodate
 import polars as pl
 from googleapiclient.discovery import build
@@ -33,6 +35,9 @@ class YouTubeBackendAPI(YouTubeBackendBase):
     """
 
     YOUTUBE_API_MAX_RESULTS = 50
+    YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+    # Max videos.list batches in flight at once for a single playlist
+    VIDEO_DETAIL_CONCURRENCY = int(os.getenv("YOUTUBE_API_DETAIL_CONCURRENCY", "4"))
 
     def __init__(self, cfg: YouTubeConfig = None):
         super().__init__(cfg)
@@ -45,6 +50,42 @@ class YouTubeBackendAPI(YouTubeBackendBase):
             raise ValueError("YOUTUBE_API_KEY environment variable not set.")
 
         self.youtube = build("youtube", "v3", developerKey=YOUTUBE_API_KEY)
+        self._api_key = YOUTUBE_API_KEY
+        self._http_client: Optional[httpx.AsyncClient] = None
+
+    async def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the persistent keep-alive client for Data API calls."""
+        if self._http_client is None or self._http_client.is_closed:
+            self._http_client = httpx.AsyncClient(
+                base_url=self.YOUTUBE_API_BASE_URL,
+                timeout=httpx.Timeout(15.0, connect=5.0),
+                limits=httpx.Limits(
+                    max_connections=self.VIDEO_DETAIL_CONCURRENCY * 2,
+                    max_keepalive_connections=self.VIDEO_DETAIL_CONCURRENCY,
+                ),
+                transport=httpx.AsyncHTTPTransport(retries=self.cfg.max_retries),
+            )
+        return self._http_client
+
+    async def _api_get(self, endpoint: str, **params) -> Dict[str, Any]:
+        """GET a Data API v3 endpoint and return the decoded JSON body.
+
+        ``None`` params are dropped so optional values such as ``pageToken``
+        can be passed straight through. Raises ``httpx.HTTPStatusError`` on
+        non-2xx responses (quota, not found, bad key).
+        """
+        query = {k: v for k, v in params.items() if v is not None}
+        query["key"] = self._api_key
+        client = await self._get_http_client()
+        resp = await client.get(f"/{endpoint}", params=query)
+        resp.raise_for_status()
+        return resp.json()
+
+    async def close(self):
+        """Close the persistent HTTP client."""
+        if self._http_client and not self._http_client.is_closed:
+            await self._http_client.aclose()
+            self._http_client = None
 
     def _create_empty_dataframe(self) -> pl.DataFrame:
         """
@@ -160,12 +201,10 @@ class YouTubeBackendAPI(YouTubeBackendBase):
             playlist_id = self._extract_playlist_id(playlist_url)
 
             # Fetch with status and localized fields
-            resp = (
-                self.youtube.playlists()
-                .list(part="snippet,contentDetails,status", id=playlist_id, maxResults=1)
-                .execute()
+            resp = await self._api_get(
+                "playlists", part="snippet,contentDetails,status", id=playlist_id, maxResults=1
             )
-            if not resp["items"]:
+            if not resp.get("items"):
                 logger.warning(f"Playlist not found: {playlist_id}")
                 return "Preview unavailable", "", "", 0, "", "Unknown", ""
 
@@ -234,8 +273,10 @@ class YouTubeBackendAPI(YouTubeBackendBase):
                 f"Channel: {channel_name} | Videos: {total_count}"
             )
 
-            # ==================== Step 3: Fetch Video IDs ====================
-            video_ids = await self._fetch_video_ids(playlist_id, max_expanded, progress_callback)
+            # ============ Step 3+4: Page Video IDs and Fetch Details (pipelined) ============
+            video_ids, videos, df = await self._fetch_videos_pipelined(
+                playlist_id, max_expanded, total_count, progress_callback
+            )
 
             if not video_ids:
                 logger.warning(
@@ -258,9 +299,6 @@ class YouTubeBackendAPI(YouTubeBackendBase):
 
             logger.info(f"[YouTubeAPI] Found {len(video_ids)} accessible videos")
 
-            # ==================== Step 4: Fetch Video Details ====================
-            videos = await self._fetch_video_details(video_ids, progress_callback)
-
             if not videos:
                 logger.warning(
                     f"[YouTubeAPI] Failed to fetch details for any videos in {playlist_id}"
@@ -278,9 +316,7 @@ class YouTubeBackendAPI(YouTubeBackendBase):
 
             logger.info(f"[YouTubeAPI] Successfully fetched {len(videos)} video details")
 
-            # ==================== Step 5: Create and Enrich DataFrame ====================
-            df = self._create_dataframe_from_videos(videos)
-
+            # ==================== Step 5: Enrich DataFrame ====================
             # Validate DataFrame creation
             if df is None or not isinstance(df, pl.DataFrame):
                 logger.error(f"[YouTubeAPI] DataFrame creation failed for {playlist_id}")
@@ -337,75 +373,169 @@ class YouTubeBackendAPI(YouTubeBackendBase):
                 self._create_empty_stats(),
             )
 
-    async def _fetch_video_details(
+    async def _fetch_videos_pipelined(
         self,
-        video_ids: List[str],
+        playlist_id: str,
+        max_expanded: Optional[int],
+        expected_total: int,
         progress_callback: Optional[callable],
-    ) -> List[Dict[str, Any]]:
-        """Fetch detailed video information in batches (robust; returns partial results)."""
-        videos = []
+    ) -> Tuple[List[str], List[Dict[str, Any]], pl.DataFrame]:
+        """Page playlistItems and fetch video details as a producer/consumer pipeline.
 
-        try:
-            # iterate in batches (max 50 per YouTube API)
-            for i in range(0, len(video_ids), self.YOUTUBE_API_MAX_RESULTS):
-                batch = video_ids[i : i + self.YOUTUBE_API_MAX_RESULTS]
-                batch_num = i // self.YOUTUBE_API_MAX_RESULTS + 1
+        Each page of up to 50 ids is queued for a pool of ``videos.list``
+        consumers as soon as it arrives, so detail fetches overlap with
+        paging. Each consumer turns its batch into a small DataFrame; the
+        frames are concatenated in playlist order at the end.
 
-                logger.debug(f"[YouTubeAPI] Fetching batch {batch_num} ({len(batch)} videos)")
+        Progress is reported per batch as ``(fetched, total, {"batch": n})``.
+        ``total`` is the playlist's itemCount (capped by ``max_expanded``)
+        while paging is in flight, and the exact id count once paging ends.
 
-                try:
-                    resp = (
-                        self.youtube.videos()
-                        .list(
-                            part="snippet,statistics,contentDetails",
-                            id=",".join(batch),
-                        )
-                        .execute()
-                    )
-                except Exception as e:
-                    # Log and continue with next batch (quota/temporary errors may happen)
-                    logger.error(
-                        f"[YouTubeAPI] Exception while fetching videos for batch {batch_num}: {e}"
+        Returns ``(video_ids, videos, df)``; partial results on failure.
+        """
+        step = self.YOUTUBE_API_MAX_RESULTS
+        workers = max(1, self.VIDEO_DETAIL_CONCURRENCY)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=workers * 2)
+
+        video_ids: List[str] = []
+        page_videos: Dict[int, List[Dict[str, Any]]] = {}
+        page_frames: Dict[int, pl.DataFrame] = {}
+        expected = expected_total if max_expanded is None else min(expected_total, max_expanded)
+        fetched = 0
+        paging_done = False
+
+        async def produce() -> None:
+            next_page_token = None
+            page = 0
+            try:
+                while max_expanded is None or len(video_ids) < max_expanded:
+                    remaining = max_expanded - len(video_ids) if max_expanded is not None else step
+                    items_resp = await self._api_get(
+                        "playlistItems",
+                        part="contentDetails",
+                        playlistId=playlist_id,
+                        maxResults=min(step, remaining),
+                        pageToken=next_page_token,
                     )
-                    continue
 
-                items = resp.get("items", [])
-                if not items:
-                    logger.warning(
-                        f"[YouTubeAPI] Batch {batch_num} returned no items for ids: {batch}"
+                    items = items_resp.get("items", [])
+                    if not items:
+                        logger.warning(
+                            f"[YouTubeAPI] No items returned on page {page + 1} for {playlist_id}"
+                        )
+                        break
+
+                    ids = [
+                        it.get("contentDetails", {}).get("videoId")
+                        for it in items
+                        if it.get("contentDetails", {}).get("videoId")
+                    ][:remaining]
+                    if ids:
+                        await queue.put((page, len(video_ids), ids))
+                        video_ids.extend(ids)
+                        page += 1
+
+                    logger.debug(
+                        f"[YouTubeAPI] Page {page}: queued {len(ids)} video IDs "
+                        f"(total: {len(video_ids)})"
                     )
-                    # continue to next batch instead of failing — allow partial results
-                    if progress_callback:
-                        await progress_callback(len(videos), len(video_ids), {"batch": batch_num})
-                    continue
 
-                # parse returned items
-                for idx, it in enumerate(items, start=i + 1):
-                    video_data = self._parse_video_item(it, idx)
-                    if video_data:
-                        videos.append(video_data)
+                    next_page_token = items_resp.get("nextPageToken")
+                    if not next_page_token:
+                        break
+            except Exception as e:
+                logger.error(f"Failed to fetch video IDs for {playlist_id}: {e}")
+
+        async def consume_batch(page: int, offset: int, ids: List[str]) -> None:
+            nonlocal fetched
+            batch_num = page + 1
+            try:
+                resp = await self._api_get(
+                    "videos",
+                    part="snippet,statistics,contentDetails",
+                    id=",".join(ids),
+                )
+            except Exception as e:
+                logger.error(
+                    f"[YouTubeAPI] Exception while fetching videos for batch {batch_num}: {e}"
+                )
+                return
+
+            items = resp.get("items", [])
+            if not items:
+                logger.warning(f"[YouTubeAPI] Batch {batch_num} returned no items for ids: {ids}")
+
+            rows = []
+            for idx, it in enumerate(items, start=offset + 1):
+                video_data = self._parse_video_item(it, idx)
+                if video_data:
+                    rows.append(video_data)
+            if rows:
+                page_videos[page] = rows
+                page_frames[page] = self._create_dataframe_from_videos(rows)
+            fetched += len(rows)
+
+            if progress_callback:
+                total = len(video_ids) if paging_done else max(expected, len(video_ids))
+                try:
+                    await progress_callback(fetched, total, {"batch": batch_num})
+                except Exception as e:
+                    logger.warning(f"[YouTubeAPI] Progress callback failed: {e}")
 
-                # progress callback
-                if progress_callback:
-                    await progress_callback(len(videos), len(video_ids), {"batch": batch_num})
+        async def consume() -> None:
+            # A bad batch must not kill the consumer: with every consumer gone
+            # the producer would block on a full queue forever.
+            while True:
+                page, offset, ids = await queue.get()
+                try:
+                    await consume_batch(page, offset, ids)
+                except Exception as e:
+                    logger.exception(f"[YouTubeAPI] Failed to process batch {page + 1}: {e}")
+                finally:
+                    queue.task_done()
+
+        consumers = [asyncio.create_task(consume()) for _ in range(workers)]
+        producer = asyncio.create_task(produce())
+        try:
+            # Consumers only return on an unexpected error; stop paging then
+            # rather than queue pages nobody will take.
+            done, _ = await asyncio.wait(
+                [producer, *consumers], return_when=asyncio.FIRST_COMPLETED
+            )
+            if producer in done:
+                paging_done = True
+                drained = asyncio.create_task(queue.join())
+                await asyncio.wait([drained, *consumers], return_when=asyncio.FIRST_COMPLETED)
+                drained.cancel()
+            for task in consumers:
+                if task.done() and not task.cancelled() and task.exception():
+                    logger.error(
+                        f"[YouTubeAPI] Video detail consumer died for {playlist_id}: "
+                        f"{task.exception()} — returning partial results"
+                    )
+        finally:
+            producer.cancel()
+            for task in consumers:
+                task.cancel()
+            await asyncio.gather(producer, *consumers, return_exceptions=True)
 
-            return videos
+        pages = sorted(page_frames)
+        videos = [video for page in pages for video in page_videos[page]]
+        if not pages:
+            return video_ids, videos, self._create_empty_dataframe()
 
-        except Exception as e:
-            logger.exception(f"[YouTubeAPI] Failed to fetch video details: {e}")
-            return videos  # return whatever partial results we have
+        # Per-batch frames can infer List(Null)/Null for all-empty columns; relax to supertypes
+        df = pl.concat([page_frames[page] for page in pages], how="vertical_relaxed")
+        return video_ids, videos, df
 
     async def _fetch_playlist_metadata(self, playlist_id: str) -> Optional[Dict[str, Any]]:
         """Fetch and parse playlist metadata."""
         try:
-            resp = (
-                self.youtube.playlists()
-                .list(
-                    part="snippet,contentDetails,status",
-                    id=playlist_id,
-                    maxResults=1,
-                )
-                .execute()
+            resp = await self._api_get(
+                "playlists",
+                part="snippet,contentDetails,status",
+                id=playlist_id,
+                maxResults=1,
             )
 
             if not resp.get("items"):
@@ -437,66 +567,6 @@ class YouTubeBackendAPI(YouTubeBackendBase):
             logger.error(f"Failed to fetch metadata for {playlist_id}: {e}")
             return None
 
-    async def _fetch_video_ids(
-        self,
-        playlist_id: str,
-        max_expanded: Optional[int],
-        progress_callback: Optional[callable],
-    ) -> List[str]:
-        """Fetch all video IDs from playlist with pagination."""
-        video_ids = []
-        nextPageToken = None
-        page_count = 0
-
-        try:
-            while max_expanded is None or len(video_ids) < max_expanded:
-                page_count += 1
-
-                items_resp = (
-                    self.youtube.playlistItems()
-                    .list(
-                        part="contentDetails",
-                        playlistId=playlist_id,
-                        maxResults=min(
-                            self.YOUTUBE_API_MAX_RESULTS,
-                            (
-                                max_expanded - len(video_ids)
-                                if max_expanded is not None
-                                else self.YOUTUBE_API_MAX_RESULTS
-                            ),
-                        ),
-                        pageToken=nextPageToken,
-                    )
-                    .execute()
-                )
-
-                items = items_resp.get("items", [])
-                if not items:
-                    logger.warning(
-                        f"[YouTubeAPI] No items returned on page {page_count} for {playlist_id}"
-                    )
-                    break
-
-                for it in items:
-                    video_id = it.get("contentDetails", {}).get("videoId")
-                    if video_id:
-                        video_ids.append(video_id)
-
-                logger.debug(
-                    f"[YouTubeAPI] Page {page_count}: fetched {len(items)} video IDs "
-                    f"(total: {len(video_ids)})"
-                )
-
-                nextPageToken = items_resp.get("nextPageToken")
-                if not nextPageToken:
-                    break
-
-            return video_ids
-
-        except Exception as e:
-            logger.error(f"Failed to fetch video IDs for {playlist_id}: {e}")
-            return video_ids  # Return partial results
-
     def _parse_video_item(self, item: Dict[str, Any], rank: int) -> Optional[Dict[str, Any]]:
         """Parse a single video item from API response (defensive)."""
         try:
@@ -749,10 +819,8 @@ class YouTubeBackendAPI(YouTubeBackendBase):
     async def extract_channel_id_from_playlist(self, playlist_id):
         """NEW: Extract channel ID from playlist"""
         try:
-            response = (
-                self.youtube.playlists()
-                .list(part="snippet", id=playlist_id, maxResults=1)
-                .execute()
+            response = await self._api_get(
+                "playlists", part="snippet", id=playlist_id, maxResults=1
             )
 
             if response.get("items"):
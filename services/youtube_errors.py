@@ -31,6 +31,26 @@ class QuotaExceededException(YouTubeServiceError):
         super().__init__(f"YouTube quota exceeded for channel: {channel_id}")
 
 
+class YouTubeApiError(YouTubeServiceError):
+    """
+    Non-2xx response from the Data API via the httpx client (services/youtube_http).
+
+    Carries the HTTP status and the ``reason`` codes from the error body
+    (e.g. ``quotaExceeded``, ``channelNotFound``).
+    """
+
+    def __init__(self, status: int, reasons: list[str], message: str = ""):
+        self.status = status
+        self.reasons = reasons
+        super().__init__(f"YouTube API {status} {','.join(reasons)}: {message}".rstrip(": "))
+
+    @classmethod
+    def from_response(cls, status: int, body: dict | None, resource: str) -> "YouTubeApiError":
+        error = (body or {}).get("error") or {}
+        reasons = [e.get("reason", "") for e in error.get("errors") or [] if e.get("reason")]
+        return cls(status, reasons, f"{resource}: {error.get('message', '')}".rstrip(": "))
+
+
 def is_quota_exhausted_error(exc: Exception) -> bool:
     """
     Return True when exc is a YouTube API 403 quotaExceeded error.
@@ -38,6 +58,8 @@ def is_quota_exhausted_error(exc: Exception) -> bool:
     Checks both error_details (structured) and str(exc) (fallback) so the
     detection still works if the HttpError payload format changes.
     """
+    if isinstance(exc, YouTubeApiError):
+        return exc.status == 403 and "quotaExceeded" in exc.reasons
     try:
         from googleapiclient.errors import HttpError
     except ImportError:
@@ -0,0 +1,178 @@
+"""
+services/youtube_http.py
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+Thin httpx client for the YouTube Data API v3 endpoints the creator worker uses.
+
+googleapiclient drives every request through one shared httplib2 connection,
+which corrupts its C heap when used from more than one thread — the reason
+the creator worker serialises YouTube calls and runs one job per process.
+This client has no httplib2 underneath:
+
+  - One keep-alive ``httpx.AsyncClient`` per event loop (created lazily under
+    a lock), so concurrent tasks — and threads running their own loops —
+    share pooled connections safely.
+  - Responses are the same JSON dicts googleapiclient returns, so callers
+    swap ``_execute_async(youtube.videos().list(...))`` for
+    ``await client.videos(...)`` and keep their parsing.
+  - Every request sent is billed in ``units_used`` (and reported through
+    ``on_quota``) at the Data API's published cost, whether or not it
+    succeeded, matching how ``WorkerMetrics.youtube_credits_used`` counts.
+  - Non-2xx responses raise ``YouTubeApiError``, which
+    ``is_quota_exhausted_error`` recognises for quotaExceeded.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+import weakref
+from typing import Any, Callable, Dict, Iterable, Optional
+
+import httpx
+
+from services.channel_utils import YouTubeResolver
+from services.youtube_errors import YouTubeApiError
+
+logger = logging.getLogger(__name__)
+
+YOUTUBE_API_BASE_URL = "https://www.googleapis.com/youtube/v3"
+
+# Data API v3 quota cost per request
+# https://developers.google.com/youtube/v3/determine_quota_cost
+QUOTA_COST: Dict[str, int] = {
+    "channels": 1,
+    "playlistItems": 1,
+    "videos": 1,
+    "search": 100,
+}
+
+CHANNEL_PARTS = "id,snippet,statistics,brandingSettings,topicDetails,status,contentDetails"
+MAX_IDS_PER_REQUEST = 50
+
+
+class YouTubeHttpClient:
+    """Thread-safe, connection-pooled YouTube Data API client (no httplib2)."""
+
+    def __init__(
+        self,
+        api_key: str,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+        on_quota: Optional[Callable[[int], None]] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        if not api_key:
+            raise ValueError("YOUTUBE_API_KEY not configured")
+        self.api_key = api_key
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.on_quota = on_quota
+        self._transport = transport
+        self._lock = threading.Lock()
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.units_used = 0
+
+    # ── Plumbing ─────────────────────────────────────────────────────────────
+
+    def _client(self) -> httpx.AsyncClient:
+        """The pooled client for the running loop (AsyncClients are loop-bound)."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.get(loop)
+            if client is None or client.is_closed:
+                client = httpx.AsyncClient(
+                    base_url=YOUTUBE_API_BASE_URL,
+                    timeout=httpx.Timeout(self.timeout, connect=5.0),
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    transport=self._transport,
+                )
+                self._clients[loop] = client
+            return client
+
+    def _bill(self, resource: str) -> None:
+        units = QUOTA_COST.get(resource, 1)
+        with self._lock:
+            self.units_used += units
+        if self.on_quota:
+            self.on_quota(units)
+
+    async def get(self, resource: str, **params) -> Dict[str, Any]:
+        """
+        GET ``/{resource}`` and return the decoded JSON body.
+
+        ``None`` params are dropped. Raises ``YouTubeApiError`` on non-2xx.
+        """
+        query = {k: v for k, v in params.items() if v is not None}
+        query["key"] = self.api_key
+        client = self._client()
+        self._bill(resource)
+        resp = await client.get(f"/{resource}", params=query)
+        if resp.is_success:
+            return resp.json()
+        raise YouTubeApiError.from_response(resp.status_code, _json_or_none(resp), resource)
+
+    async def aclose(self) -> None:
+        """Close the client owned by the running loop."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            client = self._clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    # ── Endpoints ────────────────────────────────────────────────────────────
+
+    async def channels(self, **params) -> Dict[str, Any]:
+        return await self.get("channels", **params)
+
+    async def playlist_items(self, **params) -> Dict[str, Any]:
+        return await self.get("playlistItems", **params)
+
+    async def videos(self, **params) -> Dict[str, Any]:
+        return await self.get("videos", **params)
+
+    async def search(self, **params) -> Dict[str, Any]:
+        return await self.get("search", **params)
+
+    # ── Helpers mirroring YouTubeResolver ────────────────────────────────────
+
+    async def get_channel_data(self, channel_id: str) -> Optional[dict]:
+        """Normalized channels.list data for one channel, or None if not found."""
+        response = await self.channels(part=CHANNEL_PARTS, id=channel_id)
+        items = response.get("items") or []
+        if not items:
+            logger.error(f"[YouTubeHttp] Channel not found: {channel_id}")
+            return None
+        return YouTubeResolver.normalize_channel(items[0])
+
+    async def get_channels_data(self, channel_ids: Iterable[str]) -> dict[str, dict]:
+        """Normalized data for many channels, 50 IDs per request, fetched concurrently."""
+        ids = list(dict.fromkeys(channel_ids))
+        chunks = [
+            ids[start : start + MAX_IDS_PER_REQUEST]
+            for start in range(0, len(ids), MAX_IDS_PER_REQUEST)
+        ]
+        responses = await asyncio.gather(
+            *(
+                self.channels(part=CHANNEL_PARTS, id=",".join(chunk), maxResults=50)
+                for chunk in chunks
+            )
+        )
+        return {
+            item["id"]: YouTubeResolver.normalize_channel(item)
+            for response in responses
+            for item in response.get("items", [])
+            if item.get("id")
+        }
+
+
+def _json_or_none(resp: httpx.Response) -> Optional[dict]:
+    try:
+        return resp.json()
+    except ValueError:
+        return None
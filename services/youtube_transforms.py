@@ -10,12 +10,178 @@ from typing import Any, Dict, Tuple
 
 import polars as pl
 
-from services.youtube_utils import get_category_emoji
-from utils.dates import format_duration, parse_iso_duration
-from utils import format_number
+from services.youtube_utils import CATEGORY_EMOJI_DEFAULTS, CATEGORY_EMOJI_MAP
 
 logger = logging.getLogger(__name__)
 
+# ISO 8601 video duration (contentDetails.duration), e.g. "PT1H2M3S", "P1DT4M".
+# Fractional seconds are truncated, as int(isodate...total_seconds()) does.
+_ISO_DURATION_RE = r"^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)(?:\.\d+)?S)?)?$"
+
+
+# Tenths q for which f"{x:.1f}" rounds the tie x = (2q + 1) / 20 (e.g. 1.15) up
+# to q + 1: it depends on which side of the tie the nearest float lies.
+# Covers every value format_number prints below 1000B.
+_TIES_ROUNDED_UP = pl.Series(
+    [q for q in range(10_000) if f"{(2 * q + 1) / 20:.1f}" == f"{(q + 1) // 10}.{(q + 1) % 10}"],
+    dtype=pl.Int64,
+)
+_NUMBER_SUFFIXES = {0: "", 1: "K", 2: "M", 3: "B"}
+
+
+# --- Native Polars equivalents of the per-cell UI formatters ---
+# Each produces exactly what the scalar helper it replaces returns, without
+# calling back into Python for every row.
+def _iso_duration_seconds(text: pl.Expr) -> pl.Expr:
+    """Seconds in an ISO 8601 duration string (null when it is not one)."""
+    parts = text.str.extract_groups(_ISO_DURATION_RE)
+    seconds = sum(
+        parts.struct.field(str(group)).cast(pl.Int64).fill_null(0) * factor
+        for group, factor in ((1, 86_400), (2, 3_600), (3, 60), (4, 1))
+    )
+    return pl.when(text.str.contains(_ISO_DURATION_RE)).then(seconds)
+
+
+def _with_formatted_numbers(df: pl.DataFrame, columns: Dict[str, str]) -> pl.DataFrame:
+    """
+    Add ``utils.format_number`` text (1234 → "1.2K") for each ``source → target``.
+
+    Built in stages over temporary columns: Polars does not share repeated
+    sub-expressions, so one nested expression per column recomputes them.
+    """
+    temp = {
+        src: {part: f"__{part}_{src}" for part in ("abs", "pow", "div", "tenths")}
+        for src in columns
+    }
+
+    def col(src: str, part: str) -> pl.Expr:
+        return pl.col(temp[src][part])
+
+    lf = df.lazy().with_columns(
+        pl.col(src).cast(pl.Int64, strict=False).fill_null(0).abs().alias(temp[src]["abs"])
+        for src in columns
+    )
+    # 0 below 1K, then 1 / 2 / 3 for K / M / B
+    lf = lf.with_columns(
+        sum((col(src, "abs") >= 1_000**k).cast(pl.Int64) for k in (1, 2, 3)).alias(temp[src]["pow"])
+        for src in columns
+    ).with_columns(
+        pl.lit(1_000, dtype=pl.Int64).pow(col(src, "pow")).alias(temp[src]["div"])
+        for src in columns
+    )
+
+    # format_number rounds the float abs / divisor to one decimal.  Work in
+    # exact integer tenths, rounding half up; only exact decimal ties
+    # (1150 → 1.15K) depend on the float, which may sit just below the tie.
+    lf = lf.with_columns(
+        ((col(src, "abs") * 10 + col(src, "div") // 2) // col(src, "div")).alias(
+            temp[src]["tenths"]
+        )
+        for src in columns
+    )
+    lf = lf.with_columns(
+        (
+            col(src, "tenths")
+            - (
+                (col(src, "abs") * 10 % col(src, "div") * 2 == col(src, "div"))
+                & ~(col(src, "tenths") - 1).is_in(_TIES_ROUNDED_UP.implode())
+            ).cast(pl.Int64)
+        ).alias(temp[src]["tenths"])
+        for src in columns
+    )
+
+    lf = lf.with_columns(
+        pl.when(col(src, "pow") == 0)
+        .then(pl.col(src).cast(pl.Int64, strict=False).fill_null(0).cast(pl.Utf8))
+        .otherwise(
+            pl.format(
+                "{}{}.{}{}",
+                pl.when(pl.col(src).cast(pl.Int64, strict=False) < 0)
+                .then(pl.lit("-"))
+                .otherwise(pl.lit("")),
+                col(src, "tenths") // 10,
+                col(src, "tenths") % 10,
+                col(src, "pow").replace_strict(_NUMBER_SUFFIXES, return_dtype=pl.Utf8),
+            )
+        )
+        .alias(target)
+        for src, target in columns.items()
+    )
+    return lf.drop(name for parts in temp.values() for name in parts.values()).collect()
+
+
+def _zero_pad(expr: pl.Expr) -> pl.Expr:
+    return expr.cast(pl.Utf8).str.zfill(2)
+
+
+def _format_duration_expr(col: str) -> pl.Expr:
+    """``utils.dates.format_duration`` for a seconds column (253 → "04:13")."""
+    seconds = pl.col(col).cast(pl.Int64, strict=False)
+    hours = seconds // 3_600
+    minutes = _zero_pad((seconds % 3_600) // 60)
+    secs = _zero_pad(seconds % 60)
+    return (
+        pl.when(seconds.is_null() | (seconds <= 0))
+        .then(pl.lit("00:00"))
+        .when(hours > 0)
+        .then(pl.format("{}:{}:{}", _zero_pad(hours), minutes, secs))
+        .otherwise(pl.format("{}:{}", minutes, secs))
+    )
+
+
+def _format_percent_expr(col: str) -> pl.Expr:
+    """
+    ``f"{x:.2%}"`` for a ratio column (0.0345 → "3.45%", -0.0005 → "-0.05%").
+
+    ``.2%`` multiplies by 100 in floating point, then rounds the exact binary
+    value of that percentage to two places, half-to-even.  Scaling it by 100
+    again can land on a .5 tie that the exact value is not on, so the
+    product's exact rounding error (Dekker's two-product; 100 needs no split)
+    decides those ties (0.12345 → "12.35%").  The sign is formatted
+    separately, including "-0.00%".
+    """
+    x = pl.col(col).fill_null(0.0)
+    percent = x * 100
+    magnitude = percent.abs()
+    scaled = magnitude * 100
+    split = magnitude * 134_217_729.0  # 2**27 + 1
+    high = split - (split - magnitude)
+    error = (high * 100 - scaled) + (magnitude - high) * 100
+    whole = scaled.floor()
+    fraction = scaled - whole
+    round_up = (fraction > 0.5) | (
+        (fraction == 0.5) & ((error > 0) | ((error == 0) & (whole.cast(pl.Int64) % 2 == 1)))
+    )
+    hundredths = whole.cast(pl.Int64) + round_up.cast(pl.Int64)
+    sign = pl.when(percent < 0).then(pl.lit("-")).otherwise(pl.lit(""))
+    return pl.format("{}{}.{}%", sign, hundredths // 100, _zero_pad(hundredths % 100))
+
+
+def _category_emoji_expr() -> pl.Expr:
+    """``services.youtube_utils.get_category_emoji`` over CategoryId / CategoryName."""
+    by_id = (
+        pl.col("CategoryId")
+        .cast(pl.Utf8)
+        .replace_strict(CATEGORY_EMOJI_MAP, default=None, return_dtype=pl.Utf8)
+    )
+    # Name fallback: first CATEGORY_EMOJI_DEFAULTS key contained in the name
+    name = pl.col("CategoryName").cast(pl.Utf8).str.to_lowercase()
+    by_name = pl.lit(CATEGORY_EMOJI_DEFAULTS["default"])
+    for key, emoji in reversed(CATEGORY_EMOJI_DEFAULTS.items()):
+        by_name = (
+            pl.when(name.str.contains(key, literal=True)).then(pl.lit(emoji)).otherwise(by_name)
+        )
+    return pl.coalesce(by_id, by_name)
+
+
+def _with_category_emoji(df: pl.DataFrame) -> pl.DataFrame:
+    """Add ``Category Emoji``, resolved once per distinct category and joined back."""
+    keys = ["CategoryId", "CategoryName"]
+    lookup = df.select(keys).unique().with_columns(_category_emoji_expr().alias("Category Emoji"))
+    return df.drop("Category Emoji", strict=False).join(
+        lookup, on=keys, how="left", nulls_equal=True, maintain_order="left"
+    )
+
 
 # --- Normalize dataframe column names between yt-dlp and YouTube API ---
 def normalize_columns(df: pl.DataFrame) -> pl.DataFrame:
@@ -83,20 +249,14 @@ def normalize_columns(df: pl.DataFrame) -> pl.DataFrame:
             # Already numeric, just ensure it's Int64
             df = df.with_columns(duration_col.cast(pl.Int64, strict=False).alias("Duration"))
         else:
-            # Duration is string or other type - convert it
+            # Duration is string or other type - ISO 8601 strings become
+            # seconds, anything else numeric is cast, the rest is null
+            duration_text = duration_col.cast(pl.Utf8).str.strip_chars()
             df = df.with_columns(
-                pl.when(duration_col.is_null() | (duration_col.cast(pl.Utf8) == ""))
-                .then(None)
-                .otherwise(
-                    pl.col("Duration").map_elements(
-                        lambda d: (
-                            parse_iso_duration(d) if isinstance(d, str) and "PT" in d else d
-                        ),
-                        return_dtype=pl.Int64,
-                    )
-                )
-                .cast(pl.Int64, strict=False)
-                .alias("Duration")
+                pl.coalesce(
+                    _iso_duration_seconds(duration_text),
+                    duration_col.cast(pl.Int64, strict=False),
+                ).alias("Duration")
             )
 
     # Ensure numeric columns are Int64
@@ -195,14 +355,7 @@ def _enrich_dataframe(
     # ==================== CATEGORY EMOJI (NEW) ====================
     # ✅ Add visual emoji indicator for content category
     if "CategoryId" in df.columns and "CategoryName" in df.columns:
-        df = df.with_columns(
-            pl.struct(["CategoryId", "CategoryName"])
-            .map_elements(
-                lambda s: get_category_emoji(s["CategoryId"], s["CategoryName"]),
-                return_dtype=pl.Utf8,
-            )
-            .alias("Category Emoji")
-        )
+        df = _with_category_emoji(df)
     else:
         logger.debug("CategoryId/CategoryName not found, skipping emoji mapping")
         df = df.with_columns(pl.lit("📹").alias("Category Emoji"))
@@ -217,32 +370,24 @@ def _enrich_dataframe(
         )
 
     # === Formatted columns (for direct UI use) ===
+    df = _with_formatted_numbers(
+        df,
+        {
+            "Views": "Views Formatted",
+            "Likes": "Likes Formatted",
+            "Dislikes": "Dislikes Formatted",
+            "Comments": "Comments Formatted",
+        },
+    )
     df = df.with_columns(
         [
-            pl.col("Views")
-            .map_elements(format_number, return_dtype=pl.Utf8)
-            .alias("Views Formatted"),
-            pl.col("Likes")
-            .map_elements(format_number, return_dtype=pl.Utf8)
-            .alias("Likes Formatted"),
-            pl.col("Dislikes")
-            .map_elements(format_number, return_dtype=pl.Utf8)
-            .alias("Dislikes Formatted"),
-            pl.col("Comments")
-            .map_elements(format_number, return_dtype=pl.Utf8)
-            .alias("Comments Formatted"),
-            pl.col("Duration")
-            .map_elements(format_duration, return_dtype=pl.Utf8)
-            .alias("Duration Formatted"),
+            _format_duration_expr("Duration").alias("Duration Formatted"),
             # (pl.col("Controversy") * 100)
             # .round(1)
             # .cast(pl.Utf8)
             # .add("%")
             # .alias("Controversy %"),
-            pl.col("Engagement Rate Raw")
-            .fill_null(0.0)  # Handle nulls first
-            .map_elements(lambda x: f"{x:.2%}", return_dtype=pl.Utf8)
-            .alias("Engagement Rate (%)"),
+            _format_percent_expr("Engagement Rate Raw").alias("Engagement Rate (%)"),
         ]
     )
 
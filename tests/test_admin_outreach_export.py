@@ -389,5 +389,69 @@ def test_csv_export_format():
     assert parsed[1]["Email"] == "test2@example.com"
 
 
+class _CreatorPages:
+    """Fake ``creators`` table: serves ``pages`` in order, recording keyset filters."""
+
+    def __init__(self, pages):
+        self.pages = list(pages)
+        self.or_filters = []
+
+    def table(self, name):
+        assert name == "creators"
+        return self
+
+    def select(self, *_a, **_kw):
+        return self
+
+    eq = order = limit = select
+
+    def or_(self, expr):
+        self.or_filters.append(expr)
+        return self
+
+    def execute(self):
+        page = self.pages.pop(0)
+        if isinstance(page, Exception):
+            raise page
+        return type("Resp", (), {"data": page})()
+
+
+def test_admin_export_pages_by_keyset(monkeypatch):
+    import routes.admin as admin
+
+    monkeypatch.setattr(admin, "_OUTREACH_EXPORT_PAGE_SIZE", 2)
+    first = [
+        _sample_creator("1", "Channel 1", "a") | {"current_subscribers": 900},
+        _sample_creator("2", "Channel 2", "b") | {"current_subscribers": 500},
+    ]
+    second = [_sample_creator("3", "Channel 3", "c") | {"current_subscribers": None}]
+    sc = _CreatorPages([first, second])
+
+    rows = list(admin._iter_admin_outreach_rows(sc))
+
+    assert [row["Email"] for row in rows] == [
+        "a@example.com",
+        "b@example.com",
+        "c@example.com",
+    ]
+    assert sc.or_filters == [
+        "current_subscribers.lt.500,and(current_subscribers.eq.500,id.gt.2),"
+        "current_subscribers.is.null"
+    ]
+
+
+def test_admin_export_raises_when_a_later_page_fails(monkeypatch):
+    import routes.admin as admin
+
+    monkeypatch.setattr(admin, "_OUTREACH_EXPORT_PAGE_SIZE", 1)
+    sc = _CreatorPages([[_sample_creator("1", "Channel 1", "a")], RuntimeError("57014")])
+
+    rows = admin._iter_admin_outreach_rows(sc)
+
+    assert next(rows)["Email"] == "a@example.com"
+    with pytest.raises(RuntimeError):
+        next(rows)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -399,7 +399,6 @@ class TestHandleResolveAndAddJob:
 
         fake_supabase = self._mock_supabase(creators_data=[], insert_data=[{"id": "stub-id"}])
         monkeypatch.setattr(cw, "supabase_client", fake_supabase)
-        monkeypatch.setattr(cw, "mark_creator_sync_processing", lambda jid: None)
         monkeypatch.setattr(cw, "mark_creator_sync_failed", lambda jid, error=None: None)
 
         result = await cw.handle_resolve_and_add_job(
@@ -414,7 +413,6 @@ class TestHandleResolveAndAddJob:
 
         fake_supabase = self._mock_supabase(creators_data=[], insert_data=[{"id": "stub-id"}])
         monkeypatch.setattr(cw, "supabase_client", fake_supabase)
-        monkeypatch.setattr(cw, "mark_creator_sync_processing", lambda jid: None)
         monkeypatch.setattr(cw, "mark_creator_sync_failed", lambda jid, error=None: None)
 
         # Mock youtube_resolver (module-level variable used by handle_resolve_and_add_job)
@@ -457,7 +455,6 @@ class TestHandleResolveAndAddJob:
 
         fake_supabase.table = table_with_spy
         monkeypatch.setattr(cw, "supabase_client", fake_supabase)
-        monkeypatch.setattr(cw, "mark_creator_sync_processing", lambda jid: None)
         monkeypatch.setattr(cw, "mark_creator_sync_failed", lambda jid, error=None: None)
 
         result = await cw.handle_resolve_and_add_job(
@@ -474,7 +471,6 @@ class TestHandleResolveAndAddJob:
 
         fake_supabase = self._mock_supabase(creators_data=[])
         monkeypatch.setattr(cw, "supabase_client", fake_supabase)
-        monkeypatch.setattr(cw, "mark_creator_sync_processing", lambda jid: None)
 
         failed_jobs = []
         monkeypatch.setattr(
@@ -495,7 +491,6 @@ class TestHandleResolveAndAddJob:
 
         fake_supabase = self._mock_supabase(creators_data=[])
         monkeypatch.setattr(cw, "supabase_client", fake_supabase)
-        monkeypatch.setattr(cw, "mark_creator_sync_processing", lambda jid: None)
         monkeypatch.setattr(cw, "mark_creator_sync_failed", lambda jid, error=None: None)
 
         mock_resolver = AsyncMock()
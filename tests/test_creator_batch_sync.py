@@ -0,0 +1,377 @@
+"""Tests for the creator worker's batched sync mode and bulk write-back paths."""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import db as db_module
+import worker.creator_worker as cw
+from services.channel_utils import YouTubeResolver
+
+CHANNEL_A = "UC" + "a" * 22
+CHANNEL_B = "UC" + "b" * 22
+
+
+def _resp(data):
+    return SimpleNamespace(data=data)
+
+
+def _channel_data(channel_id: str, subs: int = 1000, views: int = 50000) -> dict:
+    return {
+        "channel_id": channel_id,
+        "channel_name": f"Channel {channel_id[-1]}",
+        "current_subscribers": subs,
+        "current_view_count": views,
+        "current_video_count": 10,
+        "uploads_playlist_id": "UU" + channel_id[2:],
+        "topic_categories": [],
+    }
+
+
+def _fake_supabase(creator_rows):
+    """Fake client: creators select returns ``creator_rows``; everything else is a no-op."""
+    deleted = []
+
+    def table(name):
+        chain = MagicMock()
+        chain.select.return_value.in_.return_value.execute.return_value = _resp(creator_rows)
+        chain.select.return_value.eq.return_value.execute.return_value = _resp([{"retry_count": 0}])
+
+        def delete():
+            inner = MagicMock()
+            inner.eq.side_effect = lambda col, val: deleted.append((name, val)) or inner
+            return inner
+
+        chain.delete.side_effect = delete
+        return chain
+
+    return SimpleNamespace(table=table), deleted
+
+
+@pytest.fixture
+def batch_env(monkeypatch):
+    calls = {"completed": [], "bulk": [], "failed": []}
+
+    monkeypatch.setattr(
+        cw, "mark_creator_syncs_completed", lambda ids: calls["completed"].append(ids) or True
+    )
+    monkeypatch.setattr(cw, "bulk_update_creators", lambda rows: calls["bulk"].append(rows) or True)
+    monkeypatch.setattr(
+        cw, "mark_creator_sync_failed", lambda jid, err=None: calls["failed"].append(jid)
+    )
+
+    async def fake_intel(channel_id, uploads_playlist_id=None, sample_size=50):
+        return cw._empty_recent_video_intelligence()
+
+    monkeypatch.setattr(cw, "_fetch_recent_video_intelligence", fake_intel)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_uses_one_channel_fetch_and_one_bulk_write(monkeypatch, batch_env):
+    rows = [
+        {"id": "c1", "channel_id": CHANNEL_A, "primary_category": "Gaming"},
+        {"id": "c2", "channel_id": CHANNEL_B, "primary_category": "Music"},
+    ]
+    fake, _ = _fake_supabase(rows)
+    monkeypatch.setattr(cw, "supabase_client", fake)
+
+    fetch_calls = []
+
+    async def fake_batch(channel_ids):
+        fetch_calls.append(list(channel_ids))
+        return {cid: _channel_data(cid) for cid in channel_ids}
+
+    monkeypatch.setattr(cw, "_fetch_channel_data_batch", fake_batch)
+
+    jobs = [{"id": 1, "creator_id": "c1"}, {"id": 2, "creator_id": "c2"}]
+    results = await cw.handle_sync_batch(jobs, batch_number=1)
+
+    assert results == [True, True]
+    assert fetch_calls == [[CHANNEL_A, CHANNEL_B]]
+    assert batch_env["completed"] == [[1, 2]]
+    assert len(batch_env["bulk"]) == 1
+    written = batch_env["bulk"][0]
+    assert [row["id"] for row in written] == ["c1", "c2"]
+    assert all(row["sync_status"] == "synced" for row in written)
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_purges_channel_missing_from_response(monkeypatch, batch_env):
+    rows = [
+        {"id": "c1", "channel_id": CHANNEL_A, "primary_category": "Gaming"},
+        {"id": "c2", "channel_id": CHANNEL_B, "primary_category": "Music"},
+    ]
+    fake, deleted = _fake_supabase(rows)
+    monkeypatch.setattr(cw, "supabase_client", fake)
+
+    async def fake_batch(channel_ids):
+        return {CHANNEL_A: _channel_data(CHANNEL_A)}
+
+    monkeypatch.setattr(cw, "_fetch_channel_data_batch", fake_batch)
+
+    jobs = [{"id": 1, "creator_id": "c1"}, {"id": 2, "creator_id": "c2"}]
+    results = await cw.handle_sync_batch(jobs)
+
+    assert results == [True, False]
+    assert ("creators", "c2") in deleted
+    assert batch_env["completed"] == [[1]]
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_returns_quota_error_for_every_job(monkeypatch, batch_env):
+    rows = [{"id": "c1", "channel_id": CHANNEL_A}, {"id": "c2", "channel_id": CHANNEL_B}]
+    fake, _ = _fake_supabase(rows)
+    monkeypatch.setattr(cw, "supabase_client", fake)
+
+    async def fake_batch(channel_ids):
+        raise cw.QuotaExceededException(channel_ids[0])
+
+    monkeypatch.setattr(cw, "_fetch_channel_data_batch", fake_batch)
+
+    jobs = [{"id": 1, "creator_id": "c1"}, {"id": 2, "creator_id": "c2"}]
+    results = await cw.handle_sync_batch(jobs)
+
+    assert all(isinstance(r, cw.QuotaExceededException) for r in results)
+    assert batch_env["failed"] == [1, 2]
+    assert batch_env["bulk"] == []
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_falls_back_to_row_writes(monkeypatch, batch_env):
+    rows = [{"id": "c1", "channel_id": CHANNEL_A, "primary_category": "Gaming"}]
+    fake, _ = _fake_supabase(rows)
+    monkeypatch.setattr(cw, "supabase_client", fake)
+    monkeypatch.setattr(cw, "bulk_update_creators", lambda rows: False)
+
+    async def fake_batch(channel_ids):
+        return {CHANNEL_A: _channel_data(CHANNEL_A)}
+
+    monkeypatch.setattr(cw, "_fetch_channel_data_batch", fake_batch)
+
+    written = []
+    monkeypatch.setattr(
+        cw, "_write_creator_update", lambda tag, cid, payload, full: written.append(cid)
+    )
+
+    results = await cw.handle_sync_batch([{"id": 1, "creator_id": "c1"}])
+
+    assert results == [True]
+    assert written == ["c1"]
+
+
+@pytest.mark.asyncio
+async def test_batch_sync_fails_only_the_job_whose_video_fetch_raised(monkeypatch, batch_env):
+    rows = [
+        {"id": "c1", "channel_id": CHANNEL_A, "primary_category": "Gaming"},
+        {"id": "c2", "channel_id": CHANNEL_B, "primary_category": "Music"},
+    ]
+    fake, _ = _fake_supabase(rows)
+    monkeypatch.setattr(cw, "supabase_client", fake)
+
+    async def fake_batch(channel_ids):
+        return {cid: _channel_data(cid) for cid in channel_ids}
+
+    async def fake_intel(channel_id, uploads_playlist_id=None, sample_size=50):
+        if channel_id == CHANNEL_B:
+            raise RuntimeError("playlistItems.list 500")
+        return cw._empty_recent_video_intelligence()
+
+    failures = []
+
+    def fake_failure(tag, job_id, creator_id, exc):
+        failures.append((job_id, str(exc)))
+        return False
+
+    monkeypatch.setattr(cw, "_fetch_channel_data_batch", fake_batch)
+    monkeypatch.setattr(cw, "_fetch_recent_video_intelligence", fake_intel)
+    monkeypatch.setattr(cw, "_handle_sync_failure", fake_failure)
+
+    jobs = [{"id": 1, "creator_id": "c1"}, {"id": 2, "creator_id": "c2"}]
+    results = await cw.handle_sync_batch(jobs)
+
+    assert results == [True, False]
+    assert failures == [(2, "playlistItems.list 500")]
+    assert batch_env["completed"] == [[1]]
+
+
+def test_commit_sync_writes_falls_back_per_row_when_bulk_fails(monkeypatch, batch_env):
+    def write(job_id, payload):
+        return cw.PendingSyncWrite(
+            job_id=job_id,
+            creator_id=f"c{job_id}",
+            job_tag=f"[Job {job_id}]",
+            update_payload=payload,
+            full_payload=payload,
+        )
+
+    writes = [
+        write(1, {"sync_status": "synced"}),
+        write(2, {"sync_status": "synced", "prev_snapshot_at": "2026-01-01"}),
+    ]
+
+    def bulk(rows):
+        batch_env["bulk"].append([row["id"] for row in rows])
+        return False
+
+    rewritten = []
+    monkeypatch.setattr(cw, "bulk_update_creators", bulk)
+    monkeypatch.setattr(
+        cw, "_write_creator_update", lambda tag, cid, payload, full: rewritten.append(cid)
+    )
+
+    results = cw._commit_sync_writes("[Batch]", writes)
+
+    assert batch_env["bulk"] == [["c1", "c2"]]
+    assert rewritten == ["c1", "c2"]
+    assert results == {1: True, 2: True}
+
+
+@pytest.mark.asyncio
+async def test_resolver_get_channels_data_chunks_at_50_ids(monkeypatch):
+    resolver = YouTubeResolver(api_key="test")
+    ids = [f"UC{i:022d}" for i in range(120)]
+    requested = []
+
+    class _Channels:
+        def list(self, part, id, maxResults):
+            requested.append(id.split(","))
+            return [{"id": cid} for cid in id.split(",")]
+
+    monkeypatch.setattr(
+        resolver, "_get_youtube_client", lambda: SimpleNamespace(channels=_Channels)
+    )
+
+    async def fake_execute(request):
+        return {"items": request}
+
+    monkeypatch.setattr(resolver, "_execute_async", fake_execute)
+    monkeypatch.setattr(YouTubeResolver, "normalize_channel", staticmethod(lambda item: item))
+
+    result = await resolver.get_channels_data(ids + ["not-a-channel"])
+
+    assert [len(chunk) for chunk in requested] == [50, 50, 20]
+    assert set(result) == set(ids)
+
+
+def test_bulk_update_creators_sends_partial_rows_through_update_rpc(monkeypatch):
+    calls = []
+
+    def rpc(name, params):
+        calls.append((name, params))
+        return SimpleNamespace(execute=lambda: _resp(2))
+
+    def table(name):
+        raise AssertionError("bulk_update_creators must not upsert through the table API")
+
+    monkeypatch.setattr(db_module, "supabase_client", SimpleNamespace(rpc=rpc, table=table))
+
+    # Partial rows: no channel_id / NOT NULL columns, and differing key sets
+    rows = [
+        {"id": "c1", "current_subscribers": 1},
+        {"id": "c2", "current_subscribers": 2, "prev_snapshot_at": "x"},
+    ]
+    assert db_module.bulk_update_creators(rows) is True
+
+    assert calls == [("bulk_update_creators", {"p_rows": rows})]
+
+
+def test_bulk_update_creators_reports_rpc_failure(monkeypatch):
+    def rpc(name, params):
+        raise RuntimeError("function bulk_update_creators does not exist")
+
+    monkeypatch.setattr(db_module, "supabase_client", SimpleNamespace(rpc=rpc))
+
+    assert db_module.bulk_update_creators([{"id": "c1", "sync_status": "synced"}]) is False
+
+
+def test_fetch_pending_jobs_claims_through_rpc(monkeypatch):
+    calls = []
+
+    def rpc(name, params):
+        calls.append((name, params))
+        return SimpleNamespace(execute=lambda: _resp([{"id": 1, "creator_id": "c1"}]))
+
+    monkeypatch.setattr(cw, "supabase_client", SimpleNamespace(rpc=rpc))
+
+    assert cw._fetch_pending_jobs(5) == [{"id": 1, "creator_id": "c1"}]
+    assert calls == [("claim_creator_sync_jobs", {"p_limit": 5})]
+
+
+def test_fetch_pending_jobs_falls_back_to_select_when_rpc_fails(monkeypatch):
+    def rpc(name, params):
+        raise RuntimeError("function claim_creator_sync_jobs does not exist")
+
+    chain = MagicMock()
+    query = chain.select.return_value.eq.return_value.or_.return_value
+    query.order.return_value.limit.return_value.execute.return_value = _resp([{"id": 2}, {"id": 3}])
+    # Job 3 was taken by another worker between the select and the claim
+    claim = chain.update.return_value.in_.return_value.eq.return_value
+    claim.execute.return_value = _resp([{"id": 2}])
+    monkeypatch.setattr(cw, "supabase_client", SimpleNamespace(rpc=rpc, table=lambda name: chain))
+
+    assert cw._fetch_pending_jobs(5) == [{"id": 2}]
+    assert chain.update.call_args.args[0]["status"] == "processing"
+    chain.update.return_value.in_.return_value.eq.assert_called_once_with("status", "pending")
+
+
+def test_reset_stuck_jobs_only_touches_jobs_past_their_lease(monkeypatch):
+    chain = MagicMock()
+    stuck = chain.select.return_value.eq.return_value.or_.return_value
+    stuck.execute.return_value = _resp([{"id": 9, "creator_id": "c9"}])
+    monkeypatch.setattr(cw, "supabase_client", SimpleNamespace(table=lambda name: chain))
+
+    cw._reset_stuck_processing_jobs()
+
+    lease_filter = chain.select.return_value.eq.return_value.or_.call_args.args[0]
+    assert lease_filter.startswith("started_at.is.null,started_at.lt.")
+    reset = chain.update.return_value.eq.return_value
+    reset.eq.assert_called_once_with("status", "processing")
+
+
+def _pending_write(job_id, creator_id, is_invalid=False):
+    return cw.PendingSyncWrite(
+        job_id=job_id,
+        creator_id=creator_id,
+        job_tag=f"[Job {job_id}]",
+        update_payload={"current_subscribers": 10, "sync_status": "synced"},
+        full_payload={},
+        is_invalid=is_invalid,
+        sync_error="Invalid stats" if is_invalid else None,
+    )
+
+
+def test_commit_sync_writes_settles_many_jobs_in_one_write(monkeypatch, batch_env):
+    writes = [_pending_write(1, "c1"), _pending_write(2, "c2"), _pending_write(3, "c3", True)]
+
+    assert cw._commit_sync_writes("[Batch]", writes) == {1: True, 2: True, 3: False}
+
+    assert [[row["id"] for row in rows] for rows in batch_env["bulk"]] == [["c1", "c2", "c3"]]
+    assert batch_env["completed"] == [[1, 2]]
+    assert batch_env["failed"] == [3]
+
+
+@pytest.mark.asyncio
+async def test_worker_loop_writes_a_claimed_batch_in_fewer_round_trips(monkeypatch, batch_env):
+    channels = [CHANNEL_A, CHANNEL_B, "UC" + "c" * 22]
+    rows = [{"id": f"c{i}", "channel_id": cid} for i, cid in enumerate(channels)]
+    fake, _ = _fake_supabase(rows)
+    monkeypatch.setattr(cw, "supabase_client", fake)
+    monkeypatch.setattr(cw, "stop_event", asyncio.Event())
+    monkeypatch.setattr(cw, "SYNC_BATCH_SIZE", 3)
+    monkeypatch.setattr(
+        cw, "_fetch_pending_jobs", lambda n: [{"id": i, "creator_id": f"c{i}"} for i in range(n)]
+    )
+
+    async def fake_batch(channel_ids):
+        return {cid: _channel_data(cid) for cid in channel_ids}
+
+    monkeypatch.setattr(cw, "_fetch_channel_data_batch", fake_batch)
+
+    await cw.process_creator_syncs()
+
+    # Three jobs: one creators write and one status write between them
+    assert len(batch_env["bulk"]) == 1 and len(batch_env["bulk"][0]) == 3
+    assert batch_env["completed"] == [[0, 1, 2]]
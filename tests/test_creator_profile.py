@@ -9,6 +9,8 @@ Coverage:
   5. GET /creators?page=999  — out-of-range page redirects to last valid page
 """
 
+import time
+
 import pytest
 from starlette.testclient import TestClient
 
@@ -33,7 +35,7 @@ FAKE_CREATOR = {
     "quality_grade": "A",
     "engagement_score": 3.5,
     "sync_status": "synced",
-    # Empty geo/language fields — avoids thread-pool rank queries in _get_context_ranks
+    # Empty geo/language fields — avoids the rank RPC in _get_context_ranks
     "country_code": "",
     "default_language": "",
     "primary_category": "",
@@ -341,3 +343,296 @@ class TestCreatorProfile:
 
         assert r.status_code == 200
         assert "Viral Pattern" not in r.text
+
+
+# ===========================================================================
+# 6. _load_profile_data — concurrent fan-out with partial results
+# ===========================================================================
+
+
+class TestProfileDataLoader:
+    """Unit tests for routes.creators._load_profile_data."""
+
+    def _patch_fetches(self, monkeypatch, **overrides):
+        import routes.creators as rc
+
+        fetches = {
+            "_get_context_ranks": lambda c: {
+                "country_rank": 1,
+                "language_rank": 2,
+                "category_rank": 3,
+            },
+            "get_cached_category_box_stats": lambda cat: {"total": 10},
+            "get_category_peer_benchmarks": lambda cat: {"peer_engagement_p75": 4.2},
+            "get_category_leaderboard": lambda cat, limit=5: [{"id": "x"}],
+            "is_creator_favourited": lambda uid, cid: True,
+            "_get_similar_creators": lambda c: [{"id": "y"}],
+            "get_embedding_peers": lambda cid, limit, hydrate_limit: ([{"id": "z"}], 1),
+        }
+        fetches.update(overrides)
+        for name, fn in fetches.items():
+            monkeypatch.setattr(rc, name, fn)
+        return rc
+
+    def test_loads_every_section_and_records_timings(self, monkeypatch):
+        rc = self._patch_fetches(monkeypatch)
+
+        data = rc._load_profile_data(FAKE_CREATOR, FAKE_CREATOR_UUID, user_id="u1")
+
+        assert data.context_ranks["category_rank"] == 3
+        assert data.peer_benchmarks == {"peer_engagement_p75": 4.2}
+        assert data.is_favourited is True
+        assert data.embedding_peers == ([{"id": "z"}], 1)
+        assert data.missing == []
+        assert set(data.timings_ms) == {
+            "context_ranks",
+            "category_stats",
+            "peer_benchmarks",
+            "niche_leaderboard",
+            "is_favourited",
+            "similar_creators",
+            "embedding_peers",
+        }
+
+    def test_fetches_run_concurrently(self, monkeypatch):
+        import threading
+
+        barrier = threading.Barrier(2, timeout=2)
+
+        def _wait_for_peer(*_args, **_kwargs):
+            barrier.wait()  # deadlocks (BrokenBarrierError) if run sequentially
+            return []
+
+        rc = self._patch_fetches(
+            monkeypatch,
+            get_category_leaderboard=_wait_for_peer,
+            _get_similar_creators=_wait_for_peer,
+        )
+
+        data = rc._load_profile_data(FAKE_CREATOR, FAKE_CREATOR_UUID, user_id=None)
+
+        assert "niche_leaderboard" not in data.missing
+        assert "similar_creators" not in data.missing
+
+    def test_failed_and_slow_fetches_fall_back_to_defaults(self, monkeypatch):
+        import threading
+
+        release = threading.Event()
+
+        def _boom(cat):
+            raise RuntimeError("db down")
+
+        def _slow(c):
+            release.wait(2)
+            return [{"id": "late"}]
+
+        rc = self._patch_fetches(
+            monkeypatch, get_category_peer_benchmarks=_boom, _get_similar_creators=_slow
+        )
+        monkeypatch.setattr(rc, "_PROFILE_FETCH_TIMEOUT_S", 0.2)
+
+        try:
+            data = rc._load_profile_data(FAKE_CREATOR, FAKE_CREATOR_UUID, user_id=None)
+        finally:
+            release.set()
+
+        assert sorted(data.missing) == ["peer_benchmarks", "similar_creators"]
+        assert data.peer_benchmarks == {}
+        assert data.similar_creators == []
+        assert data.niche_leaderboard == [{"id": "x"}]
+        assert data.is_favourited is False
+
+    def test_timeout_counts_from_fetch_start_not_queue_entry(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+
+        def _slowish(*_args, **_kwargs):
+            time.sleep(0.15)
+            return [{"id": "ok"}]
+
+        rc = self._patch_fetches(
+            monkeypatch, get_category_leaderboard=_slowish, _get_similar_creators=_slowish
+        )
+        pool = ThreadPoolExecutor(max_workers=1)
+        monkeypatch.setattr(rc, "_profile_pool", pool)
+        monkeypatch.setattr(rc, "_PROFILE_FETCH_TIMEOUT_S", 0.25)
+        monkeypatch.setattr(rc, "_PROFILE_QUEUE_WAIT_S", 2)
+
+        try:
+            # Serialised on one thread the fetches need ~0.3s in total, more
+            # than the per-fetch budget, but each one runs well inside it.
+            data = rc._load_profile_data(FAKE_CREATOR, FAKE_CREATOR_UUID, user_id=None)
+        finally:
+            pool.shutdown()
+
+        assert data.missing == []
+        assert data.similar_creators == [{"id": "ok"}]
+
+    def test_public_profile_response_omits_server_timing(self, client, monkeypatch):
+        rc = self._patch_fetches(monkeypatch)
+        monkeypatch.setattr(rc, "get_creator_stats", lambda creator_id: FAKE_CREATOR)
+        monkeypatch.setattr(main, "get_creator_stats", lambda creator_id: None)
+
+        r = client.get(f"/creator/{FAKE_CREATOR_UUID}")
+
+        assert r.status_code == 200
+        assert r.headers["cache-control"].startswith("public")
+        assert "server-timing" not in r.headers
+
+    def test_private_profile_page_carries_server_timing(self):
+        page = main.Titled("Creator")
+
+        result = main._with_server_timing(page, {"context_ranks": 12.34})
+
+        assert result[0] is page
+        assert (result[1].k, result[1].v) == ("Server-Timing", "context_ranks;dur=12.3")
+
+
+class TestCategoryPeerBenchmarks:
+    """db.get_category_peer_benchmarks reads one pre-aggregated MV row, cached."""
+
+    class _Query:
+        def __init__(self, client, table):
+            self.client, self.table = client, table
+
+        def select(self, *_):
+            return self
+
+        def eq(self, *_):
+            return self
+
+        def gt(self, *_):
+            return self
+
+        def limit(self, *_):
+            return self
+
+        def execute(self):
+            self.client.tables.append(self.table)
+            if self.table in self.client.fail:
+                raise RuntimeError(f"relation {self.table} does not exist")
+
+            class _Resp:
+                data = self.client.rows[self.table]
+
+            return _Resp()
+
+    class _Client:
+        def __init__(self, rows, fail=()):
+            self.rows, self.fail, self.tables = rows, set(fail), []
+
+        def table(self, name):
+            return TestCategoryPeerBenchmarks._Query(self, name)
+
+    @pytest.fixture(autouse=True)
+    def _fresh_cache(self):
+        import db
+
+        db.clear_peer_benchmarks_cache()
+        yield
+        db.clear_peer_benchmarks_cache()
+
+    def test_reads_single_view_row_and_caches_it(self, monkeypatch):
+        import db
+
+        row = {"peer_vpv_p75": 1200.0, "peer_vc_p75": 0.25, "peer_engagement_p75": 4.5}
+        client = self._Client({db.CATEGORY_PEER_BENCHMARKS_VIEW: [row]})
+        monkeypatch.setattr(db, "supabase_client", client)
+
+        assert db.get_category_peer_benchmarks("Gaming") == row
+        assert db.get_category_peer_benchmarks("Gaming") == row
+        assert client.tables == [db.CATEGORY_PEER_BENCHMARKS_VIEW]
+
+    def test_falls_back_to_row_scan_when_view_missing(self, monkeypatch):
+        import db
+
+        creators = [
+            {
+                "current_view_count": 1000 * (i + 1),
+                "current_video_count": 10,
+                "views_change_30d": 100 * i,
+                "current_subscribers": 1000,
+                "engagement_score": float(i),
+            }
+            for i in range(4)
+        ]
+        client = self._Client({db.CREATOR_TABLE: creators}, fail=[db.CATEGORY_PEER_BENCHMARKS_VIEW])
+        monkeypatch.setattr(db, "supabase_client", client)
+
+        assert db.get_category_peer_benchmarks("Gaming") == {
+            "peer_vpv_p75": 400.0,
+            "peer_vc_p75": 0.3,
+            "peer_engagement_p75": 3.0,
+        }
+        assert client.tables == [db.CATEGORY_PEER_BENCHMARKS_VIEW, db.CREATOR_TABLE]
+
+
+class TestCreatorContextRanks:
+    """db.get_creator_context_ranks resolves all three ranks with one RPC."""
+
+    class _Client:
+        def __init__(self, data=None, error=None):
+            self.data, self.error, self.calls = data, error, []
+
+        def rpc(self, name, params):
+            self.calls.append((name, params))
+            client = self
+
+            class _Call:
+                def execute(self_):
+                    if client.error:
+                        raise client.error
+
+                    class _Resp:
+                        data = client.data
+
+                    return _Resp()
+
+            return _Call()
+
+    def test_single_rpc_returns_all_ranks(self, monkeypatch):
+        import db
+
+        client = self._Client(data=[{"country_rank": 4, "language_rank": 9, "category_rank": 2}])
+        monkeypatch.setattr(db, "supabase_client", client)
+
+        ranks = db.get_creator_context_ranks(500, country="US", language="", category="Gaming")
+
+        assert ranks == {"country_rank": 4, "language_rank": None, "category_rank": 2}
+        assert client.calls == [
+            (
+                db.RPC_CREATOR_CONTEXT_RANKS,
+                {
+                    "p_subscribers": 500,
+                    "p_country": "US",
+                    "p_language": None,
+                    "p_category": "Gaming",
+                },
+            )
+        ]
+
+    def test_rpc_failure_falls_back_to_count_queries(self, monkeypatch):
+        import db
+
+        monkeypatch.setattr(db, "supabase_client", self._Client(error=RuntimeError("missing")))
+        counted = []
+        monkeypatch.setattr(db, "get_creator_rank", lambda subs, key, val: counted.append(key) or 7)
+
+        ranks = db.get_creator_context_ranks(500, country="US", language="en")
+
+        assert ranks == {"country_rank": 7, "language_rank": 7, "category_rank": None}
+        assert counted == ["country_code", "default_language"]
+
+    def test_route_helper_delegates_to_rpc(self, monkeypatch):
+        import routes.creators as rc
+
+        seen = {}
+
+        def _ranks(subs, **segments):
+            seen.update(segments, subs=subs)
+            return {"country_rank": 1, "language_rank": None, "category_rank": None}
+
+        monkeypatch.setattr(rc, "get_creator_context_ranks", _ranks)
+        creator = {**FAKE_CREATOR, "country_code": "US"}
+
+        assert rc._get_context_ranks(creator)["country_rank"] == 1
+        assert seen == {"subs": 1_000_000, "country": "US", "language": "", "category": ""}
@@ -0,0 +1,120 @@
+"""Tests for the shared get_creators result cache in db.py."""
+
+import threading
+import time
+
+import pytest
+
+import db
+from db import CreatorsResult, _CreatorsResultCache, _DegradedCreators
+
+ROWS = [{"id": "a", "channel_name": "A"}, {"id": "b", "channel_name": "B"}]
+
+
+class _TimeoutError(Exception):
+    def __str__(self):
+        return "canceling statement due to statement timeout (57014)"
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    db.clear_creators_cache()
+    yield
+    db.clear_creators_cache()
+
+
+def test_equivalent_calls_share_one_query_and_get_copies(monkeypatch):
+    calls = []
+
+    def fake_query(**kwargs):
+        calls.append(kwargs)
+        return CreatorsResult([dict(r) for r in ROWS], 2)
+
+    monkeypatch.setattr(db, "_query_creators", fake_query)
+
+    first = db.get_creators(search=" MrBeast ", country_filter="us", return_count=True)
+    first.creators[0]["_rank"] = 99
+    second = db.get_creators(search="mrbeast", country_filter="US ", return_count=True)
+
+    assert len(calls) == 1
+    assert second.total_count == 2
+    assert "_rank" not in second.creators[0]
+
+
+def test_query_runs_with_the_normalised_arguments(monkeypatch):
+    calls = []
+    monkeypatch.setattr(db, "_query_creators", lambda **kwargs: calls.append(kwargs) or [])
+
+    db.get_creators(search="   ", country_filter=" us", category_filter="Video_game  culture")
+    db.get_creators(country_filter="US", category_filter="Video game culture")
+    db.get_creators(search=" MrBeast ")
+
+    assert len(calls) == 2
+    assert calls[0]["search"] == ""
+    assert calls[0]["country_filter"] == "US"
+    assert calls[0]["category_filter"] == "Video game culture"
+    assert calls[1]["search"] == "mrbeast"
+
+
+def test_concurrent_misses_are_coalesced():
+    cache = _CreatorsResultCache()
+    release = threading.Event()
+    calls = []
+
+    def load():
+        calls.append(1)
+        release.wait(2)
+        return list(ROWS)
+
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(cache.get(("k",), load))) for _ in range(8)
+    ]
+    for t in threads:
+        t.start()
+    time.sleep(0.05)
+    release.set()
+    for t in threads:
+        t.join(2)
+
+    assert calls == [1]
+    assert len(results) == 8 and all(r == ROWS for r in results)
+
+
+def test_statement_timeout_serves_stale_result():
+    cache = _CreatorsResultCache(ttl=0)
+    assert cache.get(("k",), lambda: list(ROWS)) == ROWS
+
+    def timed_out():
+        raise _DegradedCreators([], _TimeoutError())
+
+    assert cache.get(("k",), timed_out) == ROWS
+
+
+def test_other_failures_are_returned_but_not_cached():
+    cache = _CreatorsResultCache()
+
+    def broken():
+        raise _DegradedCreators(CreatorsResult([], 0), RuntimeError("boom"))
+
+    assert cache.get(("k",), broken) == CreatorsResult([], 0)
+    assert cache.get(("k",), lambda: list(ROWS)) == ROWS
+
+
+def test_hot_key_is_refreshed_in_background_before_expiry():
+    cache = _CreatorsResultCache(ttl=60, refresh_ahead=60)
+    cache.get(("k",), lambda: [{"id": "old"}])
+
+    refreshed = threading.Event()
+
+    def reload():
+        refreshed.set()
+        return [{"id": "new"}]
+
+    # Served from cache immediately; the refresh runs behind it
+    assert cache.get(("k",), reload) == [{"id": "old"}]
+    assert refreshed.wait(2)
+    for thread in threading.enumerate():
+        if thread.name == "creators-cache-refresh":
+            thread.join(2)
+    assert cache.get(("k",), lambda: []) == [{"id": "new"}]
@@ -0,0 +1,155 @@
+"""Tests for the rendered-dashboard cache and ETag revalidation on /d/{id}."""
+
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import polars as pl
+import pytest
+from starlette.testclient import TestClient
+
+import db
+
+import main
+import services.dashboard_render_cache as rc
+
+DASHBOARD_ID = "abc123"
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    rc.clear_dashboard_render_cache()
+    yield
+    rc.clear_dashboard_render_cache()
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcard():
+    etag = rc.dashboard_etag(rc.render_cache_key(DASHBOARD_ID, None, "Views", "desc", "v1"))
+    assert rc.etag_matches(etag, etag)
+    assert rc.etag_matches(f'"other", W/{etag}', etag)
+    assert rc.etag_matches("*", etag)
+    assert not rc.etag_matches('"other"', etag)
+    assert not rc.etag_matches(None, etag)
+
+
+def test_etag_changes_with_version_and_sort():
+    base = rc.dashboard_etag(rc.render_cache_key(DASHBOARD_ID, None, "Views", "desc", "v1"))
+    assert base != rc.dashboard_etag(rc.render_cache_key(DASHBOARD_ID, None, "Views", "desc", "v2"))
+    assert base != rc.dashboard_etag(rc.render_cache_key(DASHBOARD_ID, None, "Likes", "desc", "v1"))
+
+
+def test_cache_key_folds_sort_arguments_the_table_ignores():
+    default = rc.render_cache_key(DASHBOARD_ID, None, "Views", "desc", "v1")
+    assert rc.render_cache_key(DASHBOARD_ID, None, "nonsense", "DESC", "v1") == default
+    assert rc.render_cache_key(DASHBOARD_ID, None, "Views", "sideways", "v1") == default
+    assert rc.render_cache_key(DASHBOARD_ID, None, "Likes", "asc", "v1") != default
+
+
+class _PlaylistStatsTable:
+    """One stored playlist_stats row: upsert_row writes it, the version lookup reads it."""
+
+    def __init__(self):
+        self.row = None
+
+    def select(self, *_a, **_kw):
+        return self
+
+    eq = order = limit = select
+
+    def execute(self):
+        return SimpleNamespace(data=[self.row] if self.row else [])
+
+
+def test_reanalysis_upsert_moves_version_and_etag(monkeypatch):
+    table = _PlaylistStatsTable()
+    clock = iter(datetime(2026, 3, 1, tzinfo=timezone.utc) + timedelta(hours=h) for h in range(9))
+
+    class _Clock(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return next(clock)
+
+    def fake_upsert_row(_table, row, conflict_fields=None):
+        table.row = row
+        return True
+
+    monkeypatch.setattr(db, "datetime", _Clock)
+    monkeypatch.setattr(db, "supabase_client", SimpleNamespace(table=lambda _name: table))
+    monkeypatch.setattr(db, "get_cached_playlist_stats", lambda *a, **kw: None)
+    monkeypatch.setattr(db, "upsert_row", fake_upsert_row)
+
+    stats = {
+        "playlist_url": "https://www.youtube.com/playlist?list=PLx",
+        "user_id": None,
+        "df": pl.DataFrame({"Views": [1, 2]}),
+        "summary_stats": {},
+    }
+    etags = []
+    for _ in range(2):
+        assert db.upsert_playlist_stats(dict(stats)).source == "fresh"
+        version = db.get_dashboard_version(DASHBOARD_ID)
+        etags.append(
+            rc.dashboard_etag(rc.render_cache_key(DASHBOARD_ID, None, "Views", "desc", version))
+        )
+
+    assert etags[0] != etags[1]
+
+
+def test_render_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(rc, "_RENDER_CACHE_MAX_ENTRIES", 2)
+    rc.store_rendered_dashboard(("a",), "A", "<a/>")
+    rc.store_rendered_dashboard(("b",), "B", "<b/>")
+    assert rc.get_rendered_dashboard(("a",)) is not None  # touch "a"
+    rc.store_rendered_dashboard(("c",), "C", "<c/>")
+
+    assert rc.get_rendered_dashboard(("b",)) is None
+    assert rc.get_rendered_dashboard(("a",)).title == "A"
+
+
+@pytest.fixture
+def dashboard_route(monkeypatch):
+    loads = []
+    version = {"value": "2026-01-01T00:00:00+00:00"}
+
+    def fake_load(dashboard_id, user_id=None):
+        loads.append(dashboard_id)
+        return {
+            "df": [],
+            "frame": None,
+            "playlist_url": "https://www.youtube.com/playlist?list=PLx",
+            "playlist_name": "Cached Playlist",
+            "channel_name": "Chan",
+            "channel_thumbnail": "",
+            "summary_stats": {},
+            "cached_stats": {},
+        }
+
+    monkeypatch.setattr(main, "get_dashboard_version", lambda *a, **kw: version["value"])
+    monkeypatch.setattr(main, "load_dashboard_by_id", fake_load)
+    monkeypatch.setattr(main, "render_full_dashboard", lambda **kw: main.Div("dashboard body"))
+    return loads, version
+
+
+def test_dashboard_page_renders_once_then_serves_cache_and_304(dashboard_route):
+    loads, version = dashboard_route
+    client = TestClient(main.app)
+
+    first = client.get(f"/d/{DASHBOARD_ID}")
+    assert first.status_code == 200
+    assert "dashboard body" in first.text
+    etag = first.headers["etag"]
+
+    second = client.get(f"/d/{DASHBOARD_ID}")
+    assert second.status_code == 200
+    assert "dashboard body" in second.text
+    assert loads == [DASHBOARD_ID]
+
+    not_modified = client.get(f"/d/{DASHBOARD_ID}", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert loads == [DASHBOARD_ID]
+
+    # Re-analysis bumps processed_on → new ETag and a fresh render
+    version["value"] = "2026-02-01T00:00:00+00:00"
+    fresh = client.get(f"/d/{DASHBOARD_ID}", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+    assert loads == [DASHBOARD_ID, DASHBOARD_ID]
@@ -0,0 +1,92 @@
+"""Tests for the Polars-backed dashboard table engine."""
+
+import polars as pl
+import pytest
+
+import services.dashboard_table as dt
+from utils import sort_dataframe
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLtable"
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "Rank": [1, 2, 3, 4, 5],
+            "Title": ["banana", "", "Apple", None, "cherry"],
+            "Views": [300, None, 100, 200, 100],
+            "Engagement Rate Raw": [0.1, float("nan"), 0.3, None, 0.2],
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache():
+    dt.clear_dashboard_frame_cache()
+    yield
+    dt.clear_dashboard_frame_cache()
+
+
+@pytest.mark.parametrize("descending", [False, True])
+def test_sort_frame_matches_list_sort_with_nulls_last(descending):
+    frame = _frame()
+    for column in ("Views", "Title"):
+        expected = [r["Rank"] for r in sort_dataframe(frame.to_dicts(), column, descending)]
+        got = dt.sort_frame(frame, column, descending)["Rank"].to_list()
+        assert got == expected
+
+
+def test_sort_frame_puts_nan_last():
+    ranks = dt.sort_frame(_frame(), "Engagement Rate Raw", descending=True)["Rank"].to_list()
+    assert ranks[:3] == [3, 5, 1]
+    assert set(ranks[3:]) == {2, 4}
+
+
+def test_build_table_view_paginates_sorted_frame():
+    data = {"frame": _frame(), "df": None}
+    view = dt.build_table_view(data, "Views", "DESC", page=2, page_size=2)
+
+    assert (view.valid_sort, view.valid_order) == ("Views", "desc")
+    assert (view.total_rows, view.page, view.page_count) == (5, 2, 3)
+    assert [r["Rank"] for r in view.rows] == [3, 5]
+    assert view.next_order("Views") == "asc"
+    assert view.next_order("Likes") == "desc"
+
+
+def test_build_table_view_falls_back_for_stub_payload():
+    rows = [{"Views": 1, "Rank": 1}, {"Views": 5, "Rank": 2}]
+    view = dt.build_table_view({"frame": None, "df": rows}, "Bogus", "sideways")
+
+    assert (view.valid_sort, view.valid_order) == ("Views", "desc")
+    assert [r["Rank"] for r in view.rows] == [2, 1]
+
+
+def test_load_dashboard_data_caches_decoded_frames(monkeypatch):
+    calls = []
+
+    def fake_loader(url, meter_max, user_id=None):
+        calls.append(url)
+        return {"cached": True, "frame": _frame(), "df": [], "summary_stats": {}}
+
+    monkeypatch.setattr(dt, "load_cached_or_stub", fake_loader)
+
+    first = dt.load_dashboard_data(PLAYLIST_URL)
+    second = dt.load_dashboard_data(PLAYLIST_URL)
+
+    assert first is second
+    assert calls == [PLAYLIST_URL]
+
+
+def test_load_dashboard_data_does_not_cache_stubs(monkeypatch):
+    calls = []
+
+    def fake_loader(url, meter_max, user_id=None):
+        calls.append(url)
+        return {"cached": False, "frame": None, "df": [], "summary_stats": {}}
+
+    monkeypatch.setattr(dt, "load_cached_or_stub", fake_loader)
+
+    dt.load_dashboard_data(PLAYLIST_URL)
+    dt.load_dashboard_data(PLAYLIST_URL)
+
+    assert len(calls) == 2
@@ -0,0 +1,84 @@
+"""Tests for the streaming export helpers in services/exports.py."""
+
+import asyncio
+import csv
+import gzip
+import io
+import json
+from types import SimpleNamespace
+
+import polars as pl
+
+import main
+from services.exports import (
+    gzip_chunks,
+    iter_dict_rows_csv,
+    iter_frame_csv,
+    iter_json_document,
+)
+
+FRAME = pl.DataFrame(
+    {
+        "Title": [f'Video "{i}", part {i}' for i in range(7)],
+        "Views": list(range(0, 7_000, 1_000)),
+        "Tags": [["a", "b"], [], None, ["c"], ["d", "e", "f"], ["g"], ["h"]],
+    }
+)
+
+
+def test_frame_csv_batches_match_single_write():
+    chunks = list(iter_frame_csv(FRAME, batch_rows=3))
+
+    assert len(chunks) == 1 + 3  # header, then ceil(7 / 3) batches
+    expected = FRAME.with_columns(pl.col("Tags").list.join(", ")).write_csv()
+    assert "".join(chunks) == expected
+    rows = list(csv.DictReader(io.StringIO("".join(chunks))))
+    assert rows[0]["Title"] == 'Video "0", part 0'
+    assert rows[4]["Tags"] == "d, e, f"
+
+
+def test_json_document_matches_to_dicts():
+    head = {"dashboard_id": "abc", "summary_stats": {"total_views": 21_000}}
+
+    doc = json.loads("".join(iter_json_document(head, "videos", FRAME, batch_rows=2)))
+
+    assert doc == {**head, "videos": FRAME.to_dicts()}
+    assert json.loads("".join(iter_json_document(head, "videos", FRAME.head(0)))) == {
+        **head,
+        "videos": [],
+    }
+
+
+def test_dict_rows_csv_and_gzip_round_trip():
+    rows = ({"Email": f"c{i}@example.com", "Ignored": i} for i in range(5))
+
+    chunks = list(iter_dict_rows_csv(rows, ["Email", "Name"], batch_rows=2))
+    body = gzip.decompress(b"".join(gzip_chunks(chunks))).decode()
+
+    assert len(chunks) == 3
+    assert body == "".join(chunks)
+    assert body.splitlines()[:2] == ["Email,Name", "c0@example.com,"]
+
+
+def test_dashboard_csv_export_streams_gzip(monkeypatch):
+    monkeypatch.setattr(main, "gate_plan", lambda *a, **kw: None)
+    monkeypatch.setattr(
+        main, "resolve_playlist_url_from_dashboard_id", lambda *a, **kw: "https://yt/pl"
+    )
+    monkeypatch.setattr(
+        main,
+        "load_cached_or_stub",
+        lambda *a, **kw: {"df": FRAME.to_dicts(), "frame": FRAME},
+    )
+
+    req = SimpleNamespace(headers={"accept-encoding": "gzip, deflate"})
+    sess = {"auth": {"email": "t@example.com"}, "user_id": "u1"}
+
+    r = main.export_csv("dash1", req, sess)
+
+    async def body():
+        return b"".join([chunk async for chunk in r.body_iterator])
+
+    assert r.headers["content-encoding"] == "gzip"
+    assert r.headers["content-disposition"] == 'attachment; filename="viralvibes-dash1.csv"'
+    assert gzip.decompress(asyncio.run(body())).decode() == "".join(iter_frame_csv(FRAME))
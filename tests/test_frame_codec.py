@@ -0,0 +1,87 @@
+"""Tests for columnar playlist DataFrame storage (df_arrow) and the df_json fallback."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import polars as pl
+
+import db as db_module
+from utils import decode_frame, encode_frame, load_playlist_frame
+
+PLAYLIST_URL = "https://www.youtube.com/playlist?list=PLcodec"
+
+
+def _frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "Rank": [1, 2],
+            "Title": ["a", "b"],
+            "Views": [100, 200],
+            "Tags": [["x"], []],
+            "Rating": [None, 4.5],
+        }
+    )
+
+
+def test_encode_decode_round_trip_preserves_schema():
+    df = _frame()
+    restored = decode_frame(encode_frame(df))
+    assert restored.equals(df)
+    assert restored.schema == df.schema
+
+
+def test_load_playlist_frame_prefers_arrow_over_json():
+    df = _frame()
+    row = {"df_arrow": encode_frame(df), "df_json": '[{"Title": "stale"}]'}
+    assert load_playlist_frame(row).equals(df)
+
+
+def test_load_playlist_frame_falls_back_to_legacy_json():
+    df = _frame()
+    loaded = load_playlist_frame({"df_arrow": None, "df_json": df.write_json()})
+    assert loaded["Title"].to_list() == ["a", "b"]
+    assert loaded["Tags"].to_list() == [["x"], []]
+    assert load_playlist_frame({}).is_empty()
+
+
+def _fake_client(rows):
+    def table(name):
+        chain = MagicMock()
+        chain.select.return_value = chain
+        chain.eq.return_value = chain
+        chain.is_.return_value = chain
+        chain.order.return_value = chain
+        chain.limit.return_value = chain
+        chain.execute.return_value = SimpleNamespace(data=rows)
+        return chain
+
+    return SimpleNamespace(table=table)
+
+
+def test_cached_stats_decodes_arrow_row(monkeypatch):
+    row = {"df_arrow": encode_frame(_frame()), "df_json": None, "summary_stats": "{}"}
+    monkeypatch.setattr(db_module, "supabase_client", _fake_client([row]))
+
+    cached = db_module.get_cached_playlist_stats(PLAYLIST_URL)
+
+    assert isinstance(cached["df"], pl.DataFrame)
+    assert cached["df"].height == 2
+
+
+def test_upsert_writes_arrow_and_no_json(monkeypatch):
+    written = []
+    monkeypatch.setattr(db_module, "get_cached_playlist_stats", lambda *a, **kw: None)
+    monkeypatch.setattr(
+        db_module,
+        "upsert_row",
+        lambda table, row, conflict_fields=None: written.append(row) or True,
+    )
+
+    result = db_module.upsert_playlist_stats(
+        {"playlist_url": PLAYLIST_URL, "df": _frame(), "summary_stats": {}}
+    )
+
+    assert result.source == "fresh"
+    assert written[0]["df_json"] is None
+    assert decode_frame(written[0]["df_arrow"]).equals(_frame())
+    assert result.df_arrow == written[0]["df_arrow"]
@@ -56,6 +56,7 @@ sys.modules.setdefault("views.lists", views_lists_stub)
 
 import db_lists
 import routes.lists as lists_routes
+import services.lists_snapshot as lists_snapshot
 
 
 def _req(*, query_params=None, session=None, category_slug=None):
@@ -366,3 +367,196 @@ def test_ranking_detail_more_route_happy_path(monkeypatch):
     assert out["country_code"] == "US"
     assert out["page"] == 1
     assert out["total_pages"] == 2
+
+
+def _snapshot_row(*, version=None, age_hours=1, payload=None):
+    from datetime import datetime, timedelta, timezone
+
+    return {
+        "version": lists_snapshot.LISTS_SNAPSHOT_VERSION if version is None else version,
+        "built_at": (datetime.now(timezone.utc) - timedelta(hours=age_hours)).isoformat(),
+        "payload": payload if payload is not None else {"top_rated": [{"channel_name": "A"}]},
+    }
+
+
+def _patch_snapshot_source(monkeypatch, row):
+    lists_snapshot.clear_lists_snapshot_cache()
+    calls = {"reads": 0, "builds": 0}
+
+    def _read(key):
+        calls["reads"] += 1
+        assert key == lists_snapshot.LISTS_SNAPSHOT_KEY
+        return row
+
+    def _build():
+        calls["builds"] += 1
+        return {"top_rated": [{"channel_name": "live"}]}
+
+    monkeypatch.setattr(lists_snapshot, "get_lists_snapshot", _read)
+    monkeypatch.setattr(lists_snapshot, "build_lists_tab_data", _build)
+    return calls
+
+
+def test_lists_route_renders_stored_snapshot_without_live_queries(monkeypatch):
+    calls = _patch_snapshot_source(monkeypatch, _snapshot_row())
+    monkeypatch.setattr(lists_routes, "render_lists_page", lambda **kwargs: kwargs)
+
+    out = lists_routes.lists_route(_req(query_params={"tab": "rising"}))
+    lists_routes.lists_route(_req())
+
+    assert out["active_tab"] == "rising"
+    assert out["tab_data"] == {"top_rated": [{"channel_name": "A"}]}
+    assert calls == {"reads": 1, "builds": 0}  # second view served from the local copy
+    lists_snapshot.clear_lists_snapshot_cache()
+
+
+def test_load_lists_tab_data_builds_live_on_missing_stale_or_old_version(monkeypatch):
+    for row in (
+        None,
+        _snapshot_row(age_hours=13),
+        _snapshot_row(version=lists_snapshot.LISTS_SNAPSHOT_VERSION + 1),
+    ):
+        calls = _patch_snapshot_source(monkeypatch, row)
+
+        assert lists_snapshot.load_lists_tab_data() == {"top_rated": [{"channel_name": "live"}]}
+        assert calls == {"reads": 1, "builds": 1}
+    lists_snapshot.clear_lists_snapshot_cache()
+
+
+def test_refresh_lists_snapshot_stores_versioned_payload(monkeypatch):
+    saved = {}
+    monkeypatch.setattr(lists_snapshot, "build_lists_tab_data", lambda: {"heatmap": []})
+    monkeypatch.setattr(lists_snapshot, "get_lists_snapshot", lambda key: None)
+    monkeypatch.setattr(
+        lists_snapshot,
+        "save_lists_snapshot",
+        lambda key, version, payload: saved.update(key=key, version=version, payload=payload)
+        or True,
+    )
+
+    assert lists_snapshot.refresh_lists_snapshot() is True
+    assert saved == {
+        "key": "lists_page",
+        "version": lists_snapshot.LISTS_SNAPSHOT_VERSION,
+        "payload": {"heatmap": []},
+    }
+
+
+def test_refresh_lists_snapshot_keeps_previous_when_a_section_empties(monkeypatch):
+    saved = []
+    previous = _snapshot_row(payload={"rising": [{"channel_name": "A"}], "heatmap": []})
+    monkeypatch.setattr(lists_snapshot, "get_lists_snapshot", lambda key: previous)
+    monkeypatch.setattr(
+        lists_snapshot, "save_lists_snapshot", lambda *args: saved.append(args) or True
+    )
+
+    # rising timed out (helper returned []); heatmap was already empty
+    monkeypatch.setattr(
+        lists_snapshot, "build_lists_tab_data", lambda: {"rising": [], "heatmap": []}
+    )
+    assert lists_snapshot.refresh_lists_snapshot() is False
+    assert saved == []
+
+    monkeypatch.setattr(
+        lists_snapshot,
+        "build_lists_tab_data",
+        lambda: {"rising": [{"channel_name": "B"}], "heatmap": []},
+    )
+    assert lists_snapshot.refresh_lists_snapshot() is True
+    assert len(saved) == 1
+
+
+class _HeatmapClient:
+    def __init__(self, rpc_rows=None, scan_rows=()):
+        self.rpc_rows = rpc_rows
+        self.scan_rows = list(scan_rows)
+        self.rpc_calls = []
+
+    def rpc(self, name, params):
+        self.rpc_calls.append((name, params))
+        if self.rpc_rows is None:
+            raise RuntimeError("function public.get_niche_heatmap does not exist")
+        return MagicMock(execute=lambda: SimpleNamespace(data=self.rpc_rows))
+
+    def table(self, name):
+        query = MagicMock()
+        for method in ("select", "eq", "is_", "gt", "limit"):
+            getattr(query, method).return_value = query
+        query.not_ = query
+        query.execute.return_value = SimpleNamespace(data=self.scan_rows)
+        return query
+
+
+def test_get_niche_heatmap_data_reads_rpc_once_and_filters_from_cache(monkeypatch):
+    client = _HeatmapClient(
+        rpc_rows=[
+            {
+                "category": "Music",
+                "creator_count": 40,
+                "avg_engagement": 4.26,
+                "avg_growth_pct": -1.04,
+                "premium_ratio": 0.125,
+            },
+            {
+                "category": "Food",
+                "creator_count": 2,
+                "avg_engagement": None,
+                "avg_growth_pct": None,
+                "premium_ratio": 0,
+            },
+        ]
+    )
+    monkeypatch.setattr(db_lists, "_get_supabase_client", lambda: client)
+    db_lists.clear_niche_heatmap_cache()
+
+    rows = db_lists.get_niche_heatmap_data()
+    all_rows = db_lists.get_niche_heatmap_data(min_creators=1)
+
+    assert rows == [
+        {
+            "category": "Music",
+            "creator_count": 40,
+            "avg_engagement": 4.3,
+            "avg_growth_pct": -1.0,
+            "premium_ratio": 0.12,
+        }
+    ]
+    assert [r["category"] for r in all_rows] == ["Music", "Food"]
+    assert client.rpc_calls == [("get_niche_heatmap", {"p_min_creators": 1})]
+    db_lists.clear_niche_heatmap_cache()
+
+
+def test_get_niche_heatmap_data_scans_creators_when_rpc_missing(monkeypatch):
+    client = _HeatmapClient(
+        scan_rows=[
+            {
+                "topic_categories": '["https://en.wikipedia.org/wiki/Video_game_culture"]',
+                "engagement_score": 3.0,
+                "subscribers_change_30d": 10,
+                "current_subscribers": 100,
+                "quality_grade": "A",
+            },
+            {
+                "topic_categories": ["Video_game_culture", "Music"],
+                "engagement_score": None,
+                "subscribers_change_30d": None,
+                "current_subscribers": 50,
+                "quality_grade": "C",
+            },
+        ]
+    )
+    monkeypatch.setattr(db_lists, "_get_supabase_client", lambda: client)
+    db_lists.clear_niche_heatmap_cache()
+
+    rows = db_lists.get_niche_heatmap_data(min_creators=2)
+
+    assert rows == [
+        {
+            "category": "Video game culture",
+            "creator_count": 2,
+            "avg_engagement": 3.0,
+            "avg_growth_pct": 10.0,
+            "premium_ratio": 0.5,
+        }
+    ]
+    db_lists.clear_niche_heatmap_cache()
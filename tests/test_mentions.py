@@ -7,17 +7,23 @@ All HTTP calls are stubbed — no network required.
 
 from __future__ import annotations
 
+import asyncio
+
 import httpx
 from unittest.mock import MagicMock, patch
 from urllib.parse import urlparse
 
 import pytest
 
+import services.mentions as mentions_module
 from services.mentions import (
     MentionBundle,
+    afetch_news_mentions,
+    afetch_recent_videos,
     fetch_news_mentions,
     fetch_recent_videos,
     get_mentions,
+    get_mentions_async,
     _strip_source,
     _parse_yt_date,
 )
@@ -338,3 +344,94 @@ def test_fetch_recent_videos_handles_partial_entries():
     assert no_thumb.view_count == 2000
     # When media:thumbnail is missing, thumbnail_url should be empty.
     assert no_thumb.thumbnail_url == ""
+
+
+# ── Async path ─────────────────────────────────────────────────────────────
+
+
+def _pooled(monkeypatch, handler):
+    client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    monkeypatch.setattr(mentions_module, "_get_async_client", lambda: client)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_async_fetchers_parse_both_feeds(monkeypatch):
+    def handler(request):
+        xml = _YT_RSS_XML if "youtube.com" in request.url.host else _GNEWS_RSS_XML
+        return httpx.Response(200, content=xml.encode())
+
+    _pooled(monkeypatch, handler)
+    videos = await afetch_recent_videos("UCtest123", limit=1)
+    mentions = await afetch_news_mentions("MrBeast", limit=10)
+
+    assert [v.title for v in videos] == ["Amazing Video Title"]
+    assert [m.source for m in mentions] == ["BBC News", "Forbes"]
+
+
+@pytest.mark.asyncio
+async def test_async_fetchers_return_empty_on_bad_xml_or_status(monkeypatch):
+    responses = iter([httpx.Response(404), httpx.Response(200, content=b"not xml <<<")])
+    _pooled(monkeypatch, lambda request: next(responses))
+
+    assert await afetch_recent_videos("UCgone") == []
+    assert await afetch_news_mentions("Nobody") == []
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_upstream_fetch(monkeypatch):
+    calls = []
+
+    async def fake_videos(channel_id, limit=6):
+        calls.append(channel_id)
+        await asyncio.sleep(0.01)
+        return []
+
+    async def fake_news(channel_name, limit=6):
+        return []
+
+    monkeypatch.setattr(mentions_module, "afetch_recent_videos", fake_videos)
+    monkeypatch.setattr(mentions_module, "afetch_news_mentions", fake_news)
+
+    bundles = await asyncio.gather(
+        *(get_mentions_async("UCburst_xyz", "Burst Channel") for _ in range(20))
+    )
+
+    assert calls == ["UCburst_xyz"]
+    assert all(b is bundles[0] for b in bundles)
+
+
+@pytest.mark.asyncio
+async def test_stale_bundle_is_served_while_refreshing(monkeypatch):
+    stale = MentionBundle(channel_id="UCstale_xyz", channel_name="Stale", fetched_at=0.0)
+    monkeypatch.setattr(mentions_module.time, "monotonic", lambda: mentions_module._CACHE_TTL + 1)
+    mentions_module._store(stale)
+    refreshed = asyncio.Event()
+
+    async def fake_videos(channel_id, limit=6):
+        refreshed.set()
+        return []
+
+    async def fake_news(channel_name, limit=6):
+        return []
+
+    monkeypatch.setattr(mentions_module, "afetch_recent_videos", fake_videos)
+    monkeypatch.setattr(mentions_module, "afetch_news_mentions", fake_news)
+
+    assert await get_mentions_async("UCstale_xyz", "Stale") is stale
+    await asyncio.wait_for(asyncio.gather(*mentions_module._inflight.values()), timeout=1)
+    assert refreshed.is_set()
+    assert await get_mentions_async("UCstale_xyz", "Stale") is not stale
+
+
+def test_cache_evicts_least_recently_used(monkeypatch):
+    monkeypatch.setattr(mentions_module, "_MAX_CACHE_ENTRIES", 2)
+    mentions_module.clear_mentions_cache()
+    for name in ("a", "b"):
+        mentions_module._store(MentionBundle(channel_id=name, channel_name=name))
+    assert mentions_module._cached("a", "a") is not None  # touch "a"
+    mentions_module._store(MentionBundle(channel_id="c", channel_name="c"))
+
+    assert mentions_module._cached("b", "b") is None
+    assert mentions_module._cached("a", "a") is not None
+    assert mentions_module._cached("c", "c") is not None
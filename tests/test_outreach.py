@@ -13,7 +13,7 @@ from services.outreach import (
     filter_email_ready_rows,
     render_outreach_csv,
 )
-from services.contact_extractor import extract_social_links
+from services.contact_extractor import ContactExtractorService, extract_social_links
 
 
 FAKE_USER_ID = "bbbbbbbb-bbbb-bbbb-bbbb-bbbbbbbbbbbb"
@@ -137,6 +137,53 @@ def test_contact_parser_skips_youtube_urls():
     )
 
 
+@pytest.mark.parametrize(
+    "text",
+    [
+        "IG: @chef.ana | TT: @chefana | discord.gg/kitchen",
+        "Diſcord.gg/unicode-s and İnstagram.com/dotted",
+        "plain bio without any contact details at all",
+    ],
+)
+def test_contact_parser_prefilter_matches_running_every_pattern(text):
+    from services import contact_extractor as ce
+
+    # Reference: run every handle pattern over the text, no literal prefilter
+    expected = []
+    seen = set()
+    for pattern, icon, label, url_tpl in ce._SOCIAL_PATTERNS:
+        for match in pattern.finditer(text):
+            if icon in ("globe", "linkedin"):
+                continue
+            handle = match.group(1).strip("/ .")
+            href = url_tpl.format(handle)
+            if len(handle) >= 2 and href not in seen:
+                expected.append(href)
+                seen.add(href)
+
+    links = extract_social_links(text, "")
+    assert [href for icon, _, href in links if icon not in ("globe", "mail")] == expected
+
+
+def test_build_db_update_payloads_shares_one_stamp_and_keys_rows():
+    payloads = ContactExtractorService.build_db_update_payloads(
+        [
+            {"id": "c1", "channel_id": "UC1", "description": "mail me at a@b.co"},
+            {"id": "c2", "channel_id": "UC2", "description": "nothing here"},
+            {"channel_id": "UC3", "description": "no id, skipped"},
+        ],
+        extracted_at="2026-01-01T00:00:00+00:00",
+    )
+
+    assert [p["id"] for p in payloads] == ["c1", "c2"]
+    assert payloads[0]["extracted_email"] == "a@b.co"
+    assert payloads[0]["has_contact_info"] is True
+    assert payloads[1]["has_contact_info"] is False
+    assert {p["contact_signals_extracted_at"] for p in payloads} == {"2026-01-01T00:00:00+00:00"}
+    single = ContactExtractorService.build_db_update_payload({"description": "mail me at a@b.co"})
+    assert set(payloads[0]) == set(single) | {"id"}
+
+
 def test_email_export_filters_rows_without_email():
     rows = build_outreach_rows([CREATOR_WITH_EMAIL, CREATOR_SOCIAL_ONLY])
 
@@ -0,0 +1,97 @@
+"""Tests for plan lookup caching in db.get_user_plan and services/plan_gate.py."""
+
+from types import SimpleNamespace
+
+import pytest
+
+import db
+import routes.stripe_webhooks as stripe_webhooks
+from services.plan_gate import gate_plan
+
+USER_ID = "aaaaaaaa-aaaa-aaaa-aaaa-aaaaaaaaaaaa"
+
+
+class _SubscriptionsClient:
+    """Answers the get_user_plan query chain and counts round-trips."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls = 0
+
+    def table(self, name):
+        assert name == db.SUBSCRIPTIONS_TABLE
+        return self
+
+    def select(self, *_a, **_kw):
+        return self
+
+    eq = in_ = order = limit = upsert = select
+
+    def execute(self):
+        self.calls += 1
+        return SimpleNamespace(data=list(self.rows))
+
+
+@pytest.fixture(autouse=True)
+def _clear_plan_cache():
+    db.clear_user_plan_cache()
+    yield
+    db.clear_user_plan_cache()
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = _SubscriptionsClient([{"plan": "pro", "status": "active"}])
+    monkeypatch.setattr(db, "supabase_client", client)
+    return client
+
+
+def test_get_user_plan_is_cached_until_cleared(client):
+    assert db.get_user_plan(USER_ID)["plan"] == "pro"
+    assert db.get_user_plan(USER_ID)["plan"] == "pro"
+    assert client.calls == 1
+
+    db.get_user_plan(USER_ID, fresh=True)
+    db.clear_user_plan_cache(USER_ID)
+    db.get_user_plan(USER_ID)
+    assert client.calls == 3
+
+
+def test_plan_cache_evicts_least_recently_used(client, monkeypatch):
+    monkeypatch.setattr(db, "_USER_PLAN_CACHE_MAX_ENTRIES", 2)
+
+    db.get_user_plan("user-a")
+    db.get_user_plan("user-b")
+    db.get_user_plan("user-a")  # hit: user-b is now least recently used
+    db.get_user_plan("user-c")
+
+    assert list(db._user_plan_cache) == ["user-a", "user-c"]
+    assert client.calls == 3
+
+
+def test_gates_in_one_request_share_a_lookup(client, monkeypatch):
+    monkeypatch.setattr(db, "_USER_PLAN_TTL_SECONDS", 0)
+    req = SimpleNamespace(state=SimpleNamespace())
+
+    assert gate_plan(USER_ID, required="pro", request=req) is None
+    assert gate_plan(USER_ID, required="agency", request=req) is not None
+    assert client.calls == 1
+
+
+def test_subscription_webhook_invalidates_cached_plan(client, monkeypatch):
+    monkeypatch.setattr(stripe_webhooks, "get_user_id_by_stripe_customer", lambda _c: USER_ID)
+    monkeypatch.setattr(stripe_webhooks, "get_plan_for_price", lambda _p: ("agency", "month"))
+
+    assert gate_plan(USER_ID, required="agency") is not None
+
+    client.rows = [{"plan": "agency", "status": "active"}]
+    stripe_webhooks._handle_subscription_upsert(
+        {
+            "id": "sub_1",
+            "customer": "cus_1",
+            "status": "active",
+            "items": {"data": [{"price": {"id": "price_agency"}}]},
+        }
+    )
+
+    assert gate_plan(USER_ID, required="agency") is None
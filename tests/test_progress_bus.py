@@ -0,0 +1,75 @@
+"""Tests for the in-process job progress bus and the SSE progress stream."""
+
+import asyncio
+
+import pytest
+
+import controllers.job_progress as jp
+from services.progress_bus import ProgressBus
+
+URL = "https://youtube.com/playlist?list=PLbus"
+
+
+def _snapshot(status, progress=0.0):
+    return {"job_id": 1, "status": status, "progress": progress, "retry_count": 0}
+
+
+@pytest.mark.asyncio
+async def test_watchers_share_one_db_poll_per_interval():
+    fetches = []
+
+    def fetch(key):
+        fetches.append(key)
+        return _snapshot("processing", 0.5)
+
+    bus = ProgressBus(fetch=fetch, poll_interval=0.05)
+    subs = [bus.subscribe(URL) for _ in range(50)]
+
+    snapshots = await asyncio.gather(*(sub.get(timeout=1) for sub in subs))
+
+    assert all(s["progress"] == 0.5 for s in snapshots)
+    assert fetches == [URL]
+    for sub in subs:
+        sub.close()
+    assert bus.subscriber_count(URL) == 0
+
+
+@pytest.mark.asyncio
+async def test_in_process_publish_skips_db_and_coalesces():
+    fetches = []
+    bus = ProgressBus(fetch=lambda key: fetches.append(key) or {}, poll_interval=60)
+    bus.publish(URL, _snapshot("processing", 0.1))
+
+    with bus.subscribe(URL) as sub:
+        for progress in (0.2, 0.3, 0.4):
+            bus.publish(URL, {"progress": progress})
+        latest = await sub.get(timeout=1)
+        assert latest["progress"] == 0.4
+        assert latest["status"] == "processing"
+        assert await sub.get(timeout=0.01) is None
+
+    # Snapshot was fresh, so the poller never queried the DB
+    assert fetches == []
+
+
+@pytest.mark.asyncio
+async def test_unwatched_finished_job_is_not_replayed():
+    bus = ProgressBus(fetch=lambda key: _snapshot("processing", 0.0), poll_interval=60)
+    bus.publish(URL, _snapshot("complete", 1.0))
+
+    assert bus.latest(URL) is None
+
+
+@pytest.mark.asyncio
+async def test_stream_renders_fragments_and_closes_on_completion(monkeypatch):
+    states = iter([_snapshot("processing", 0.5), _snapshot("complete", 1.0)])
+    bus = ProgressBus(fetch=lambda key: next(states), poll_interval=0.01)
+    monkeypatch.setattr(jp, "get_playlist_preview_info", lambda url: {"title": "Bus Test"})
+
+    events = [event async for event in jp.job_progress_stream(URL, bus=bus)]
+
+    assert len(events) == 3
+    assert "Bus Test" in events[0] and "hx-trigger" not in events[0]
+    assert "/d/" in events[1]
+    assert events[2].startswith("event: close")
+    assert bus.subscriber_count(URL) == 0
@@ -0,0 +1,125 @@
+"""
+Warm runner pool tests for the Render supervisor.
+
+A tiny fake ``run_one_job --serve`` child speaks the stdin/stdout protocol so
+the pool's dispatch, recycling and crash handling run against real processes.
+"""
+
+import signal
+import sys
+import textwrap
+
+import pytest
+
+# render_worker installs SIGINT/SIGTERM handlers at import; keep pytest's
+_handlers = {sig: signal.getsignal(sig) for sig in (signal.SIGINT, signal.SIGTERM)}
+import worker.render_worker as rw  # noqa: E402
+
+for _sig, _handler in _handlers.items():
+    signal.signal(_sig, _handler)
+
+FAKE_CHILD = textwrap.dedent(
+    """
+    import json, os, sys
+    prefix = sys.argv[1]
+    max_jobs = int(sys.argv[2])
+    print("warming up", flush=True)
+    print(prefix + json.dumps({"event": "ready"}), flush=True)
+    for _ in range(max_jobs):
+        line = sys.stdin.readline()
+        if not line:
+            break
+        job = json.loads(line)
+        if job["creator_id"] == "crash":
+            sys.exit(3)
+        if job["creator_id"] == "hang":
+            sys.stdin.readline()
+        print("running", job["job_id"], "in", os.getpid(), flush=True)
+        print(prefix + json.dumps({"event": "result", "job_id": job["job_id"], "ok": True}), flush=True)
+    """
+)
+
+
+def _pool(max_jobs=1, **kwargs):
+    cmd = [sys.executable, "-c", FAKE_CHILD, rw.PROTOCOL_PREFIX, str(max_jobs)]
+    return rw.WarmRunnerPool(size=1, max_jobs_per_child=max_jobs, cmd=cmd, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_single_job_children_are_prewarmed_and_recycled(caplog):
+    pool = _pool(max_jobs=1)
+    pool.start()
+    caplog.set_level("INFO", logger="render_worker")
+
+    results = [await pool.run_job(i, f"creator-{i}", i) for i in range(3)]
+    await pool.close()
+
+    assert results == [True, True, True]
+    # One child per job plus the spare still warm at shutdown
+    assert pool.spawned == 4
+    assert pool.recycled == 3
+    pids = {r.getMessage().split()[-1] for r in caplog.records if "running" in r.getMessage()}
+    assert len(pids) == 3
+
+
+@pytest.mark.asyncio
+async def test_child_is_reused_until_its_job_budget(caplog):
+    pool = _pool(max_jobs=2)
+    pool.start()
+    caplog.set_level("INFO", logger="render_worker")
+
+    results = [await pool.run_job(i, f"creator-{i}", i) for i in range(4)]
+    await pool.close()
+
+    assert results == [True] * 4
+    pids = [r.getMessage().split()[-1] for r in caplog.records if "running" in r.getMessage()]
+    assert pids[0] == pids[1] and pids[2] == pids[3] and pids[0] != pids[2]
+
+
+@pytest.mark.asyncio
+async def test_crashed_or_hung_child_fails_the_job_and_is_replaced():
+    pool = _pool(max_jobs=5, job_timeout=1)
+    pool.start()
+
+    assert await pool.run_job(1, "crash", 1) is False
+    assert await pool.run_job(2, "hang", 2) is False
+    assert await pool.run_job(3, "creator-3", 3) is True
+    await pool.close()
+
+    assert pool.spawned >= 3
+
+
+@pytest.mark.asyncio
+async def test_falls_back_to_cold_subprocess_when_child_never_ready(monkeypatch):
+    cold = []
+
+    async def fake_cold(job_id, creator_id, job_number, retry_count=0):
+        cold.append(job_id)
+        return True
+
+    monkeypatch.setattr(rw, "_run_job_subprocess", fake_cold)
+    pool = rw.WarmRunnerPool(size=1, cmd=[sys.executable, "-c", "import sys; sys.exit(1)"])
+
+    assert await pool.run_job(7, "creator-7", 1) is True
+    await pool.close()
+
+    assert cold == [7]
+
+
+@pytest.mark.asyncio
+async def test_warm_child_does_not_reset_processing_jobs(monkeypatch):
+    import worker.run_one_job as roj
+
+    init_calls = []
+
+    async def fake_init(**kwargs):
+        init_calls.append(kwargs)
+
+    monkeypatch.setattr(roj._cw, "init", fake_init)
+    monkeypatch.setattr(roj.sys.stdin, "readline", lambda: "")
+    monkeypatch.setattr(roj.sys.stdout, "write", lambda text: len(text))
+
+    await roj.serve(max_jobs=1)
+
+    # Its sibling's job is 'processing' while this child warms up
+    assert init_calls == [{"reset_stuck_jobs": False}]
@@ -5,10 +5,17 @@ connection required. The A+ lookalike path was previously untested in CI
 because generate_sitemap.py falls back to empty lists when DB creds are absent.
 """
 
+import threading
 import xml.etree.ElementTree as ET
 
 from services.rankings import iter_ranking_sitemap_paths
-from services.sitemap import STATIC_ROUTES, build_sitemap_xml, fetch_synced_creators
+from services.sitemap import (
+    STATIC_ROUTES,
+    LiveSitemap,
+    ShardedSitemap,
+    build_sitemap_xml,
+    fetch_synced_creators,
+)
 
 _NS = "http://www.sitemaps.org/schemas/sitemap/0.9"
 
@@ -165,3 +172,79 @@ class TestFetchSyncedCreators:
                 raise RuntimeError("connection refused")
 
         assert fetch_synced_creators(_BadClient()) == []
+
+
+_N_PAGES = len(STATIC_ROUTES) + len(iter_ranking_sitemap_paths())
+
+
+def _creators(n, updated="2026-01-01"):
+    return [{"id": f"id-{i}", "last_updated_at": updated} for i in range(n)]
+
+
+class TestShardedSitemap:
+    def test_small_sitemap_matches_single_urlset(self):
+        creators = _creators(5)
+        sitemap = ShardedSitemap()
+        sitemap.update(creators)
+        assert sitemap.shard_count == 1
+        assert sitemap.shard_xml(1) is None
+        assert _parse_locs(sitemap.root_xml()) == _parse_locs(build_sitemap_xml(creators))
+
+    def test_large_sitemap_splits_into_index_and_shards(self):
+        sitemap = ShardedSitemap(max_urls=_N_PAGES + 10)
+        n_creators = 2 * sitemap.max_urls
+        sitemap.update(_creators(n_creators))
+
+        root = ET.fromstring(sitemap.root_xml())
+        assert root.tag == f"{{{_NS}}}sitemapindex"
+        shard_locs = [el.text for el in root.findall(f"{{{_NS}}}sitemap/{{{_NS}}}loc")]
+        assert len(shard_locs) == sitemap.shard_count >= 3
+        assert shard_locs[0].endswith("/sitemap-1.xml")
+
+        all_locs = []
+        for number in range(1, sitemap.shard_count + 1):
+            locs = _parse_locs(sitemap.shard_xml(number))
+            assert len(locs) <= sitemap.max_urls
+            all_locs.extend(locs)
+        assert len(all_locs) == _N_PAGES + n_creators
+        assert len(set(all_locs)) == len(all_locs)
+        assert sitemap.shard_xml(sitemap.shard_count + 1) is None
+
+    def test_only_changed_shards_are_rerendered(self):
+        sitemap = ShardedSitemap(max_urls=_N_PAGES + 10)
+        creators = _creators(2 * sitemap.max_urls)
+        first = sitemap.update(creators)
+        assert first == list(range(1, sitemap.shard_count + 1))
+
+        # Same rows in a different order: nothing changed
+        assert sitemap.update(list(reversed(creators))) == []
+
+        creators[7] = {**creators[7], "last_updated_at": "2026-09-30"}
+        rebuilt = sitemap.update(creators)
+        assert len(rebuilt) == 1
+        shard = sitemap.shard_xml(rebuilt[0])
+        assert "/creator/id-7" in shard and "2026-09-30" in shard
+
+
+class TestLiveSitemap:
+    def test_first_request_builds_then_stale_refreshes_in_background(self):
+        loads = []
+        release = threading.Event()
+
+        def load():
+            loads.append(1)
+            if len(loads) > 1:
+                release.wait(5)
+            return _creators(len(loads)), []
+
+        live = LiveSitemap(load, ttl=0)
+        assert len(_parse_locs(live.root_xml())) == _N_PAGES + 1
+
+        # Expired: the previous XML is served while the refresh is blocked
+        assert len(_parse_locs(live.root_xml())) == _N_PAGES + 1
+        release.set()
+        for thread in threading.enumerate():
+            if thread.name == "sitemap-refresh":
+                thread.join(5)
+        assert len(loads) == 2
+        assert len(_parse_locs(live.sitemap.root_xml())) == _N_PAGES + 2
@@ -0,0 +1,195 @@
+"""
+Concurrent job execution tests for worker_loop.
+
+Covers the bounded semaphore, graceful drain/cancellation at shutdown and the
+shared bot-challenge gate.
+"""
+
+import asyncio
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+import worker.worker as wk
+
+
+def _jobs(n):
+    return [
+        {"id": f"job{i}", "playlist_url": f"https://youtube.com/playlist?list={i}"}
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def loop_env(monkeypatch):
+    """Fake queue with claimable jobs; records status writes."""
+    statuses = []
+    queue = {"pending": _jobs(4)}
+
+    async def fetch_pending():
+        jobs, queue["pending"] = queue["pending"], []
+        return jobs
+
+    async def fetch_failed():
+        return []
+
+    async def mark(job_id, status, meta=None):
+        statuses.append((job_id, status))
+        return True
+
+    claim = MagicMock()
+    claim.update.return_value.eq.return_value.in_.return_value.execute.return_value = (
+        SimpleNamespace(data=[{"id": "x"}])
+    )
+
+    monkeypatch.setattr(wk, "fetch_pending_jobs", fetch_pending)
+    monkeypatch.setattr(wk, "fetch_retryable_failed_jobs", fetch_failed)
+    monkeypatch.setattr(wk, "mark_job_status", mark)
+
+    def rpc(name, params):
+        raise RuntimeError(f"function {name} does not exist")
+
+    # No claim RPC deployed: the loop falls back to poll-then-claim.
+    monkeypatch.setattr(wk, "supabase_client", SimpleNamespace(rpc=rpc, table=lambda name: claim))
+    monkeypatch.setattr(wk, "POLL_INTERVAL", 1)
+    monkeypatch.setattr(wk, "IDLE_BACKOFF_MAX", 1)
+    monkeypatch.setattr(wk, "last_bot_challenge_time", None)
+    monkeypatch.setattr(wk, "consecutive_bot_challenges", 0)
+    monkeypatch.setattr(wk, "stop_event", asyncio.Event())
+    return statuses
+
+
+@pytest.mark.asyncio
+async def test_worker_loop_runs_up_to_concurrency_jobs_at_once(loop_env, monkeypatch):
+    running = 0
+    peak = 0
+
+    async def fake_handle_job(job, is_retry=False):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.05)
+        running -= 1
+
+    monkeypatch.setattr(wk, "handle_job", fake_handle_job)
+    monkeypatch.setattr(wk, "WORKER_CONCURRENCY", 2)
+    monkeypatch.setattr(wk, "MAX_RUNTIME", 1)
+
+    processed = await wk.worker_loop()
+
+    assert processed == 4
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_worker_loop_drain_cancels_and_releases_stuck_jobs(loop_env, monkeypatch):
+    async def stuck_handle_job(job, is_retry=False):
+        await asyncio.sleep(60)
+
+    monkeypatch.setattr(wk, "handle_job", stuck_handle_job)
+    monkeypatch.setattr(wk, "WORKER_CONCURRENCY", 4)
+    monkeypatch.setattr(wk, "MAX_RUNTIME", 1)
+    monkeypatch.setattr(wk, "DRAIN_TIMEOUT", 0.05)
+
+    processed = await wk.worker_loop()
+
+    assert processed == 0
+    released = sorted(job_id for job_id, status in loop_env if status == "pending")
+    assert released == ["job0", "job1", "job2", "job3"]
+
+
+@pytest.mark.asyncio
+async def test_run_job_timeout_records_retryable_failure(monkeypatch):
+    failures = []
+
+    async def slow_handle_job(job, is_retry=False):
+        await asyncio.sleep(60)
+
+    async def fake_failure(job_id, retry_count, error_message, error_trace=None):
+        failures.append((job_id, error_message))
+        return True
+
+    monkeypatch.setattr(wk, "handle_job", slow_handle_job)
+    monkeypatch.setattr(wk, "handle_job_failure", fake_failure)
+    monkeypatch.setattr(wk, "JOB_TIMEOUT", 0.01)
+
+    await wk.run_job({"id": "slow", "retry_count": 0})
+
+    assert failures and failures[0][0] == "slow"
+    assert "timed out" in failures[0][1]
+
+
+@pytest.mark.asyncio
+async def test_handle_job_releases_job_during_shared_bot_cooldown(loop_env, monkeypatch):
+    monkeypatch.setattr(wk, "MIN_REQUEST_DELAY", 0)
+    monkeypatch.setattr(wk, "MAX_REQUEST_DELAY", 0)
+    monkeypatch.setattr(wk, "last_bot_challenge_time", wk.time.time())
+    monkeypatch.setattr(wk, "consecutive_bot_challenges", 1)
+    fetch = MagicMock()
+    monkeypatch.setattr(wk, "yt_service", SimpleNamespace(get_playlist_data=fetch))
+
+    await wk.handle_job({"id": "gated", "playlist_url": "https://youtube.com/playlist?list=g"})
+
+    assert loop_env == [("gated", "pending")]
+    fetch.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_worker_loop_claims_batches_through_rpc(loop_env, monkeypatch):
+    queue = _jobs(3)
+    limits = []
+
+    def rpc(name, params):
+        assert name == "claim_playlist_jobs"
+        limits.append(params["p_limit"])
+        batch = [{"job": job, "is_retry": False} for job in queue[: params["p_limit"]]]
+        del queue[: params["p_limit"]]
+        return SimpleNamespace(execute=lambda: SimpleNamespace(data=batch))
+
+    async def unexpected_poll():
+        raise AssertionError("poll path used while the claim RPC is available")
+
+    monkeypatch.setattr(wk, "supabase_client", SimpleNamespace(rpc=rpc))
+    monkeypatch.setattr(wk, "fetch_pending_jobs", unexpected_poll)
+    handled = []
+
+    async def fake_handle_job(job, is_retry=False):
+        handled.append(job["id"])
+        await asyncio.sleep(0.02)
+
+    monkeypatch.setattr(wk, "handle_job", fake_handle_job)
+    monkeypatch.setattr(wk, "WORKER_CONCURRENCY", 2)
+    monkeypatch.setattr(wk, "MAX_RUNTIME", 1)
+
+    processed = await wk.worker_loop()
+
+    assert processed == 3
+    assert sorted(handled) == ["job0", "job1", "job2"]
+    # First claim takes both free slots in one round trip
+    assert limits[0] == 2
+    assert max(limits) <= 2
+
+
+@pytest.mark.asyncio
+async def test_claim_and_retry_writes_run_off_the_event_loop(monkeypatch):
+    loop_thread = threading.get_ident()
+    threads = []
+
+    def execute():
+        threads.append(threading.get_ident())
+        return SimpleNamespace(data=[{"job": _jobs(1)[0], "is_retry": False}])
+
+    query = MagicMock()
+    query.execute.side_effect = execute
+    for method in ("table", "rpc", "update", "eq", "in_"):
+        getattr(query, method).return_value = query
+    monkeypatch.setattr(wk, "supabase_client", query)
+
+    await wk.claim_jobs(1)
+    assert await wk.claim_job("job0")
+    await wk.increment_retry_count("job0", 1)
+
+    assert len(threads) == 3
+    assert loop_thread not in threads
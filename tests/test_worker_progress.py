@@ -5,6 +5,7 @@ Tests that the worker's progress tracking mechanism:
 1. Handles various callback argument patterns from YouTube service
 2. Correctly updates job progress in database
 3. Doesn't crash the job on callback errors
+4. Coalesces bursts of updates into few DB writes (ProgressWriter)
 """
 
 import asyncio
@@ -35,7 +36,7 @@ def fake_df():
 def patch_upsert(monkeypatch):
     """Mock upsert_playlist_stats to avoid database writes."""
 
-    async def fake_upsert(*args, **kwargs):
+    def fake_upsert(*args, **kwargs):
         return {"id": "dashboard-123"}
 
     monkeypatch.setattr("worker.worker.upsert_playlist_stats", fake_upsert)
@@ -295,3 +296,48 @@ async def test_no_progress_callback_still_completes_job(
 
     # ✅ Job should complete successfully without progress updates
     assert result.status == "complete"
+
+
+@pytest.mark.asyncio
+async def test_progress_writer_coalesces_rapid_updates(monkeypatch):
+    """
+    PERFORMANCE: Bursts of small progress callbacks collapse into few writes.
+
+    The first value is written at once, superseded values are dropped, and
+    the final value always lands on flush.
+    """
+    writes = []
+    monkeypatch.setattr(wk, "update_progress", lambda job_id, p, t: writes.append((p, t)))
+
+    writer = wk.ProgressWriter("job-1", interval=60, min_delta=0.25)
+    for processed in range(1, 101):
+        await writer.submit(processed, 200)
+    await writer.flush()
+
+    # 1/200 immediately, then only when progress moved by 25%, then the final value
+    assert writes[0] == (1, 200)
+    assert (51, 200) in writes
+    assert writes[-1] == (100, 200)
+    assert len(writes) <= 4
+
+
+@pytest.mark.asyncio
+async def test_progress_writer_writes_after_interval_and_drops_after_close(monkeypatch):
+    """Deferred values are written by the interval timer; close() drops the rest."""
+    writes = []
+    monkeypatch.setattr(wk, "update_progress", lambda job_id, p, t: writes.append(p))
+
+    writer = wk.ProgressWriter("job-2", interval=0.05, min_delta=0)
+    await writer.submit(1, 100)
+    await writer.submit(2, 100)
+    await writer.submit(3, 100)
+    assert writes == [1]
+
+    await asyncio.sleep(0.15)
+    assert writes == [1, 3]
+
+    await writer.submit(4, 100)  # interval elapsed → immediate
+    await writer.submit(5, 100)  # deferred
+    writer.close()
+    await asyncio.sleep(0.1)
+    assert writes == [1, 3, 4]
@@ -0,0 +1,118 @@
+"""Tests for the httpx-based YouTube Data API client used by the creator worker."""
+
+import asyncio
+
+import httpx
+import pytest
+
+import worker.creator_worker as cw
+from services.youtube_errors import QuotaExceededException, YouTubeApiError
+from services.youtube_errors import is_quota_exhausted_error
+from services.youtube_http import YouTubeHttpClient
+
+CHANNEL = "UC" + "a" * 22
+
+
+def _client(handler, **kwargs):
+    return YouTubeHttpClient(api_key="k", transport=httpx.MockTransport(handler), **kwargs)
+
+
+def _quota_exceeded(request):
+    return httpx.Response(
+        403,
+        json={"error": {"message": "quota", "errors": [{"reason": "quotaExceeded"}]}},
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_are_billed_at_api_cost_even_on_error():
+    billed = []
+
+    def handler(request):
+        if request.url.path.endswith("/videos"):
+            return httpx.Response(500, text="boom")
+        assert request.url.params["key"] == "k"
+        assert "pageToken" not in request.url.params
+        return httpx.Response(200, json={"items": []})
+
+    yt = _client(handler, on_quota=billed.append)
+    await yt.channels(part="id", id=CHANNEL, pageToken=None)
+    await yt.search(part="snippet", q="x")
+    with pytest.raises(YouTubeApiError) as err:
+        await yt.videos(part="statistics", id="v1")
+
+    assert err.value.status == 500
+    assert billed == [1, 100, 1]
+    assert yt.units_used == 102
+
+
+@pytest.mark.asyncio
+async def test_quota_error_is_recognised_by_worker(monkeypatch):
+    yt = _client(_quota_exceeded)
+    monkeypatch.setattr(cw, "youtube_http", yt)
+    monkeypatch.setattr(cw, "youtube_resolver", object())
+
+    with pytest.raises(YouTubeApiError) as err:
+        await yt.playlist_items(part="contentDetails", playlistId="UU1")
+    assert is_quota_exhausted_error(err.value)
+
+    with pytest.raises(QuotaExceededException):
+        await cw._fetch_channel_data(CHANNEL)
+
+
+@pytest.mark.asyncio
+async def test_calls_run_concurrently_on_one_pooled_client():
+    in_flight = 0
+    peak = 0
+
+    async def handler(request):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"items": [{"id": request.url.params["id"]}]})
+
+    yt = _client(handler)
+    results = await asyncio.gather(*(yt.videos(part="id", id=str(i)) for i in range(10)))
+    await yt.aclose()
+
+    assert [r["items"][0]["id"] for r in results] == [str(i) for i in range(10)]
+    assert peak > 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_recent_upload_uses_http_client(monkeypatch):
+    def handler(request):
+        if request.url.path.endswith("/playlistItems"):
+            assert request.url.params["playlistId"] == "UU" + CHANNEL[2:]
+            return httpx.Response(
+                200,
+                json={
+                    "items": [
+                        {
+                            "contentDetails": {"videoId": "vid1"},
+                            "snippet": {"title": "Latest", "publishedAt": "2026-01-01T00:00:00Z"},
+                        }
+                    ]
+                },
+            )
+        return httpx.Response(
+            200,
+            json={
+                "items": [
+                    {"statistics": {"viewCount": "42"}, "contentDetails": {"duration": "PT45S"}}
+                ]
+            },
+        )
+
+    yt = _client(handler)
+    monkeypatch.setattr(cw, "youtube_http", yt)
+    monkeypatch.setattr(cw, "youtube_resolver", object())
+
+    upload = await cw._fetch_recent_upload(CHANNEL)
+
+    assert upload["video_id"] == "vid1"
+    assert upload["view_count"] == 42
+    assert upload["is_short"] is True
+    assert yt.units_used == 2
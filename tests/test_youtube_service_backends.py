@@ -1,10 +1,13 @@
+import asyncio
 import os
 from unittest.mock import patch
 
+import httpx
 import polars as pl
 import pytest
 from dotenv import load_dotenv
 
+import services.youtube_backend_api as api_module
 from services.youtube_service import YoutubePlaylistService
 
 # Load environment variables at module level
@@ -69,3 +72,207 @@ async def test_playlist_service_runs(backend):
     assert isinstance(channel_name, str)
     assert isinstance(channel_thumb, str)
     assert isinstance(stats, dict)
+
+
+# ---------------------------------------------------------------------------
+# Async Data API transport (httpx, no network)
+# ---------------------------------------------------------------------------
+
+
+def _api_backend(monkeypatch, handler):
+    monkeypatch.setenv("YOUTUBE_API_KEY", "test-key")
+    monkeypatch.setattr(api_module, "build", lambda *a, **kw: object())
+    backend = api_module.YouTubeBackendAPI()
+    backend._http_client = httpx.AsyncClient(
+        base_url=backend.YOUTUBE_API_BASE_URL, transport=httpx.MockTransport(handler)
+    )
+    return backend
+
+
+def _video_item(video_id):
+    return {
+        "id": video_id,
+        "snippet": {"title": f"Video {video_id}", "channelTitle": "Chan", "channelId": "UC1"},
+        "statistics": {"viewCount": "10", "likeCount": "2", "commentCount": "1"},
+        "contentDetails": {"duration": "PT1M"},
+    }
+
+
+def _playlist_handler(video_ids, videos_handler):
+    """Serve ``video_ids`` as 50-item playlistItems pages; delegate videos.list."""
+
+    async def handler(request: httpx.Request):
+        if request.url.path.endswith("/playlistItems"):
+            start = int(request.url.params.get("pageToken") or 0)
+            end = start + int(request.url.params["maxResults"])
+            body = {"items": [{"contentDetails": {"videoId": v}} for v in video_ids[start:end]]}
+            if end < len(video_ids):
+                body["nextPageToken"] = str(end)
+            return httpx.Response(200, json=body)
+        response = videos_handler(request)
+        return await response if asyncio.iscoroutine(response) else response
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_api_backend_fetches_detail_batches_concurrently(monkeypatch):
+    in_flight = 0
+    peak = 0
+
+    async def videos(request: httpx.Request):
+        nonlocal in_flight, peak
+        assert request.url.path.endswith("/videos")
+        assert request.url.params["key"] == "test-key"
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        ids = request.url.params["id"].split(",")
+        return httpx.Response(200, json={"items": [_video_item(v) for v in ids]})
+
+    video_ids = [f"v{i:03d}" for i in range(220)]
+    backend = _api_backend(monkeypatch, _playlist_handler(video_ids, videos))
+    monkeypatch.setattr(backend, "VIDEO_DETAIL_CONCURRENCY", 3)
+    progress = []
+
+    async def progress_cb(done, total, meta):
+        progress.append((done, total))
+
+    _, videos_out, _ = await backend._fetch_videos_pipelined("PL1", None, 220, progress_cb)
+    await backend.close()
+
+    assert [v["id"] for v in videos_out] == video_ids
+    assert [v["Rank"] for v in videos_out] == list(range(1, 221))
+    assert 1 < peak <= 3
+    assert len(progress) == 5
+    assert progress[-1] == (220, 220)
+
+
+@pytest.mark.asyncio
+async def test_api_backend_skips_failed_detail_batch(monkeypatch):
+    def videos(request: httpx.Request):
+        ids = request.url.params["id"].split(",")
+        if "v000" in ids:
+            return httpx.Response(403, json={"error": {"message": "quotaExceeded"}})
+        return httpx.Response(200, json={"items": [_video_item(v) for v in ids]})
+
+    video_ids = [f"v{i:03d}" for i in range(60)]
+    backend = _api_backend(monkeypatch, _playlist_handler(video_ids, videos))
+    _, videos_out, _ = await backend._fetch_videos_pipelined("PL1", None, 60, None)
+
+    assert [v["id"] for v in videos_out] == video_ids[50:]
+    assert videos_out[0]["Rank"] == 51
+
+
+@pytest.mark.asyncio
+async def test_api_backend_paginates_playlist_items(monkeypatch):
+    pages = {
+        None: {"items": [{"contentDetails": {"videoId": "a"}}], "nextPageToken": "p2"},
+        "p2": {"items": [{"contentDetails": {"videoId": "b"}}]},
+    }
+
+    def handler(request: httpx.Request):
+        if request.url.path.endswith("/videos"):
+            ids = request.url.params["id"].split(",")
+            return httpx.Response(200, json={"items": [_video_item(v) for v in ids]})
+        return httpx.Response(200, json=pages[request.url.params.get("pageToken")])
+
+    backend = _api_backend(monkeypatch, handler)
+    ids, _, df = await backend._fetch_videos_pipelined("PL1", None, 2, None)
+    assert ids == ["a", "b"]
+    assert df["id"].to_list() == ["a", "b"]
+
+    await backend.close()
+    assert backend._http_client is None
+
+
+@pytest.mark.asyncio
+async def test_api_backend_pipeline_survives_failing_batches(monkeypatch):
+    def videos(request: httpx.Request):
+        ids = request.url.params["id"].split(",")
+        return httpx.Response(200, json={"items": [_video_item(v) for v in ids]})
+
+    # More pages than the queue and consumers can hold, every batch failing.
+    video_ids = [f"v{i:04d}" for i in range(50 * 12)]
+    backend = _api_backend(monkeypatch, _playlist_handler(video_ids, videos))
+    monkeypatch.setattr(backend, "VIDEO_DETAIL_CONCURRENCY", 2)
+
+    def broken_frame(rows):
+        raise ValueError("bad schema")
+
+    monkeypatch.setattr(backend, "_create_dataframe_from_videos", broken_frame)
+
+    ids, _, df = await asyncio.wait_for(
+        backend._fetch_videos_pipelined("PL1", None, len(video_ids), None), timeout=5
+    )
+
+    assert ids == video_ids
+    assert df.height == 0
+
+
+def _pipeline_handler(page_count, log):
+    """Serve ``page_count`` pages of 50 playlist items plus matching videos.list batches."""
+
+    async def handler(request: httpx.Request):
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        log.append(endpoint)
+        await asyncio.sleep(0.005)
+        params = request.url.params
+        if endpoint == "playlists":
+            item = {
+                "snippet": {"title": "PL", "channelTitle": "Chan", "channelId": "UC1"},
+                "contentDetails": {"itemCount": page_count * 50},
+                "status": {"privacyStatus": "public"},
+            }
+            return httpx.Response(200, json={"items": [item]})
+        if endpoint == "playlistItems":
+            page = int(params.get("pageToken") or 0)
+            body = {
+                "items": [
+                    {"contentDetails": {"videoId": f"v{page * 50 + i:04d}"}}
+                    for i in range(int(params["maxResults"]))
+                ]
+            }
+            if page + 1 < page_count:
+                body["nextPageToken"] = str(page + 1)
+            return httpx.Response(200, json=body)
+        ids = params["id"].split(",")
+        return httpx.Response(200, json={"items": [_video_item(v) for v in ids]})
+
+    return handler
+
+
+@pytest.mark.asyncio
+async def test_api_backend_pipelines_details_while_paging(monkeypatch):
+    log = []
+    backend = _api_backend(monkeypatch, _pipeline_handler(4, log))
+    progress = []
+
+    async def progress_cb(done, total, meta):
+        progress.append((done, total))
+
+    ids, videos, df = await backend._fetch_videos_pipelined("PL1", None, 200, progress_cb)
+
+    assert len(ids) == 200
+    assert df["id"].to_list() == ids
+    assert df["Rank"].to_list() == list(range(1, 201))
+    # First detail batch is requested before the last playlist page
+    assert log.index("videos") < len(log) - 1 - log[::-1].index("playlistItems")
+    assert [total for _, total in progress] == [200] * 4
+    assert progress[-1] == (200, 200)
+
+
+@pytest.mark.asyncio
+async def test_api_backend_get_playlist_data_respects_max_expanded(monkeypatch):
+    log = []
+    backend = _api_backend(monkeypatch, _pipeline_handler(3, log))
+
+    df, name, channel, _, stats = await backend.get_playlist_data(
+        "https://www.youtube.com/playlist?list=PL1", max_expanded=70, progress_callback=None
+    )
+
+    assert (name, channel) == ("PL", "Chan")
+    assert df.height == 70
+    assert stats["analyzed_videos"] == 70
+    assert log.count("playlistItems") == 2
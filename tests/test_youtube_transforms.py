@@ -0,0 +1,71 @@
+"""Tests for the native Polars playlist transforms in services/youtube_transforms.py."""
+
+import polars as pl
+
+from services.youtube_transforms import (
+    _enrich_dataframe,
+    _format_percent_expr,
+    normalize_columns,
+)
+from services.youtube_utils import get_category_emoji
+from utils import format_number
+from utils.dates import format_duration
+
+# Includes exact decimal ties, where format_number's float rounding decides
+# (1150 → "1.1K", 1250 → "1.2K", 1350 → "1.4K").
+COUNTS = [0, 7, 999, 1_000, 1_049, 1_050, 1_150, 1_250, 1_350, 999_950, 1_150_000, 2_250_000_000]
+
+
+def _playlist(**overrides) -> pl.DataFrame:
+    n = len(COUNTS)
+    data = {
+        "videoId": [f"v{i}" for i in range(n)],
+        "viewCount": COUNTS,
+        "likeCount": COUNTS[::-1],
+        "dislikeCount": [0] * n,
+        "commentCount": [c // 7 for c in COUNTS],
+        "duration": ["PT0S", "PT59S", "PT1M", "PT4M13S", "PT1H", "PT1H2M3S"] * (n // 6),
+        "publishedAt": ["2024-05-01T12:00:00Z"] * n,
+        "CategoryId": ["10", "15", None, "999", "", "17"] * (n // 6),
+        "CategoryName": ["x", None, "Music videos", "Gaming", None, "Sports"] * (n // 6),
+    }
+    data.update(overrides)
+    return pl.DataFrame(data)
+
+
+def test_formatted_columns_match_scalar_helpers():
+    df, stats = _enrich_dataframe(normalize_columns(_playlist()))
+
+    for col in ("Views", "Likes", "Comments"):
+        assert df[f"{col} Formatted"].to_list() == [format_number(v) for v in df[col]]
+    assert df["Duration Formatted"].to_list() == [format_duration(s) for s in df["Duration"]]
+    assert df["Engagement Rate (%)"].to_list() == [f"{r:.2%}" for r in df["Engagement Rate Raw"]]
+    assert df["Category Emoji"].to_list() == [
+        get_category_emoji(i, n) for i, n in zip(df["CategoryId"], df["CategoryName"])
+    ]
+    assert df["id"].to_list() == [f"v{i}" for i in range(len(COUNTS))]  # row order kept
+    assert stats["total_views"] == sum(COUNTS)
+
+
+def test_format_number_handles_negative_and_null_counts():
+    df = _playlist(viewCount=[-1_150, None] + COUNTS[2:])
+    df, _ = _enrich_dataframe(normalize_columns(df))
+
+    assert df["Views Formatted"].to_list()[:2] == ["-1.1K", "0"]
+
+
+def test_normalize_columns_parses_iso_and_numeric_durations():
+    df = normalize_columns(
+        pl.DataFrame({"duration": ["PT1H30M", "PT4M13.5S", "P1DT1S", "253", "", None, "n/a"]})
+    )
+
+    assert df["Duration"].to_list() == [5_400, 253, 86_401, 253, None, None, None]
+
+
+def test_format_percent_matches_python_on_ties_and_negatives():
+    rates = [0.12345, 0.22335, 0.00005, 0.00015, -0.0005, -0.00004, -0.12345, 1.0, 0.0, None]
+    df = pl.DataFrame({"r": rates}, schema={"r": pl.Float64})
+
+    formatted = df.select(_format_percent_expr("r").alias("f"))["f"].to_list()
+
+    assert formatted == [f"{(r or 0.0):.2%}" for r in rates]
@@ -57,6 +57,11 @@ from .dataframe import (
     has_column,
     sort_dataframe,
 )
+from .frame_codec import (
+    decode_frame,
+    encode_frame,
+    load_playlist_frame,
+)
 
 # Analytics
 from .analytics import (
@@ -119,6 +124,9 @@ __all__ = [
     "get_unique_count",
     "has_column",
     "sort_dataframe",
+    "decode_frame",
+    "encode_frame",
+    "load_playlist_frame",
     # Analytics
     "calculate_creator_stats",
     "calculate_engagement_rate",
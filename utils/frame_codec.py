@@ -0,0 +1,52 @@
+"""
+Compact columnar storage for cached playlist DataFrames.
+
+playlist_stats rows historically carried the whole frame as ``df_json``
+(row-oriented JSON from ``DataFrame.write_json``). New rows store it in
+``df_arrow`` instead: Arrow IPC with zstd compression, base64-encoded so it
+fits a PostgREST text column. Typically 5-10x smaller than the JSON and
+decoded straight into Polars without a Python-object round trip.
+"""
+
+import base64
+import io
+import json
+from typing import Any, Mapping
+
+import polars as pl
+
+FRAME_CODEC_COMPRESSION = "zstd"
+
+
+def encode_frame(df: pl.DataFrame) -> str:
+    """Serialize a DataFrame to base64 Arrow IPC (zstd)."""
+    buf = io.BytesIO()
+    df.write_ipc(buf, compression=FRAME_CODEC_COMPRESSION)
+    return base64.b64encode(buf.getvalue()).decode("ascii")
+
+
+def decode_frame(blob: str) -> pl.DataFrame:
+    """Inverse of :func:`encode_frame`."""
+    return pl.read_ipc(io.BytesIO(base64.b64decode(blob)))
+
+
+def frame_from_json(df_json: str) -> pl.DataFrame:
+    """Load a legacy ``df_json`` payload (list of row dicts) as a DataFrame."""
+    rows = json.loads(df_json) if df_json else []
+    if not rows:
+        return pl.DataFrame()
+    return pl.DataFrame(rows, infer_schema_length=None)
+
+
+def load_playlist_frame(row: Mapping[str, Any]) -> pl.DataFrame:
+    """
+    Load the cached DataFrame from a playlist_stats row.
+
+    Prefers the columnar ``df_arrow`` payload and falls back to ``df_json``
+    for rows written before it existed. Returns an empty frame when the row
+    has neither.
+    """
+    blob = row.get("df_arrow")
+    if blob:
+        return decode_frame(blob)
+    return frame_from_json(row.get("df_json"))
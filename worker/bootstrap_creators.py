@@ -29,6 +29,7 @@ from db import (
     refresh_total_categories,
     setup_logging,
 )
+from services.lists_snapshot import refresh_lists_snapshot
 
 # Reuse the two queuing functions directly from creator_worker to avoid
 # duplicating logic. They depend only on supabase_client and queue_creator_sync,
@@ -95,6 +96,11 @@ def _parse_args() -> argparse.Namespace:
         action="store_true",
         help="Skip total_categories recount (Pass 6). Slow (~4s); safe to skip on frequent runs.",
     )
+    parser.add_argument(
+        "--no-lists-snapshot",
+        action="store_true",
+        help="Skip rebuilding the /lists page snapshot (Pass 7)",
+    )
     return parser.parse_args()
 
 
@@ -180,6 +186,21 @@ def main() -> None:
     else:
         logger.info("── Pass 6: total_categories skipped (--no-categories)")
 
+    # ── 7. Rebuild the /lists page snapshot ───────────────────────────────────
+    # Runs last so the payload reflects the stats refreshed above.  Non-fatal:
+    # /lists falls back to live queries while the stored snapshot is stale.
+    if not args.no_lists_snapshot:
+        logger.info("── Pass 7: rebuilding /lists snapshot")
+        try:
+            if refresh_lists_snapshot():
+                logger.info("   Stored")
+            else:
+                logger.warning("   ⚠️  Snapshot not stored (see error above)")
+        except Exception as e:
+            logger.warning(f"   ⚠️  Pass 7 failed (non-fatal): {e}")
+    else:
+        logger.info("── Pass 7: /lists snapshot skipped (--no-lists-snapshot)")
+
     logger.info(f"✅ Bootstrap complete — {total_queued} total creators queued")
 
 
@@ -49,10 +49,11 @@ from constants import (
     CREATOR_WORKER_RETRY_BASE,
 )
 from db import (
+    bulk_update_creators,
     init_supabase,
     mark_creator_sync_completed,
     mark_creator_sync_failed,
-    mark_creator_sync_processing,
+    mark_creator_syncs_completed,
     queue_creator_sync,
     queue_creator_sync_bulk,
     queue_invalid_creators_for_retry,
@@ -62,6 +63,7 @@ from db import (
 from utils import normalize_category_name
 from services.channel_utils import ChannelIDValidator, YouTubeResolver, get_video_category_name
 from services.youtube_errors import is_quota_exhausted_error, QuotaExceededException
+from services.youtube_http import YouTubeHttpClient
 from services.schema_detector import schema_detector
 from services.youtube_config import get_creator_worker_api_key
 from services.contact_extractor import ContactExtractorService
@@ -82,10 +84,24 @@ POLL_INTERVAL = int(os.getenv("CREATOR_WORKER_POLL_INTERVAL", str(CREATOR_WORKER
 # Each job gets a completely fresh Python process and clean httplib2 state
 BATCH_SIZE = 1  # Changed from 15 - prevents memory corruption in httplib2 C library
 EXIT_AFTER_JOB = True  # Exit after processing 1 job for complete memory isolation
+# Batch sync mode: when > 1, claim up to this many sync_stats jobs per run and
+# resolve them through handle_sync_batch (one channels.list call per 50 IDs,
+# one bulk DB write).  Default 1 keeps the single-job path.
+SYNC_BATCH_SIZE = max(1, int(os.getenv("CREATOR_WORKER_SYNC_BATCH_SIZE", "1")))
+# Route channels/playlistItems/videos calls through the httpx client
+# (services/youtube_http) instead of the httplib2-backed googleapiclient.
+# It is safe under concurrency; set to false to fall back to YouTubeResolver.
+YOUTUBE_HTTP_CLIENT = os.getenv("CREATOR_WORKER_YOUTUBE_HTTP", "true").lower() == "true"
+# Max recent-video fetches in flight during a batch sync
+SYNC_BATCH_VIDEO_CONCURRENCY = max(1, int(os.getenv("CREATOR_WORKER_BATCH_VIDEO_CONCURRENCY", "4")))
 MAX_RUNTIME = int(os.getenv("CREATOR_WORKER_MAX_RUNTIME", "3600"))
 MAX_RETRY_ATTEMPTS = CREATOR_WORKER_MAX_RETRIES
 RETRY_BACKOFF_BASE = CREATOR_WORKER_RETRY_BASE
 SYNC_TIMEOUT = int(os.getenv("CREATOR_WORKER_SYNC_TIMEOUT", "30"))  # Timeout per sync
+# A 'processing' job older than this is treated as orphaned by a dead worker
+# and re-queued on startup. Must exceed the longest handler timeout (batch
+# syncs allow SYNC_TIMEOUT + 30 + 20s per job).
+PROCESSING_LEASE_SECONDS = int(os.getenv("CREATOR_WORKER_PROCESSING_LEASE_SECONDS", "1800"))
 EMPTY_QUEUE_BACKOFF_BASE = int(
     os.getenv("CREATOR_WORKER_EMPTY_BACKOFF_BASE", "30")
 )  # Start at 30s when queue is empty
@@ -109,7 +125,8 @@ if _raw_youtube_daily_quota <= 0:
 else:
     YOUTUBE_DAILY_QUOTA = _raw_youtube_daily_quota
 
-YOUTUBE_CREDITS_PER_CHANNEL_FETCH = 1  # channels.list costs 1 unit
+YOUTUBE_CREDITS_PER_CHANNEL_FETCH = 1  # channels.list costs 1 unit (for up to 50 IDs)
+YOUTUBE_MAX_IDS_PER_CHANNELS_LIST = 50  # channels.list id= accepts at most 50 IDs
 YOUTUBE_CREDITS_PER_CATEGORY_FETCH = 2  # playlistItems.list (1) + videos.list (1)
 YOUTUBE_CREDITS_PER_RECENT_VIDEO_FETCH = 2  # playlistItems.list + videos.list for uploads
 RECENT_VIDEO_SAMPLE_SIZE = 50
@@ -200,6 +217,7 @@ class WorkerMetrics:
 
 # --- Services ---
 youtube_resolver: Optional[YouTubeResolver] = None
+youtube_http: Optional[YouTubeHttpClient] = None
 channel_validator = ChannelIDValidator()
 # Note: Thread-safety is now handled internally by YouTubeResolver._execute_async
 
@@ -449,6 +467,45 @@ def _queue_creators_for_extended_refresh(days_since_last_sync: int = 7) -> int:
 # =============================================================================
 
 
+def _claim_pending_jobs(batch_size: int) -> Optional[List[Dict]]:
+    """Claim up to ``batch_size`` due jobs via RPC; None when the RPC is unavailable."""
+    try:
+        resp = supabase_client.rpc("claim_creator_sync_jobs", {"p_limit": batch_size}).execute()
+        return resp.data or []
+    except Exception:
+        logger.warning(
+            "  claim_creator_sync_jobs RPC failed; falling back to plain select", exc_info=True
+        )
+        return None
+
+
+def _claim_selected_jobs(jobs: List[Dict]) -> List[Dict]:
+    """
+    Mark polled jobs processing, keeping only those still pending.
+
+    Fallback for when the claim RPC is unavailable: a conditional update
+    instead of SKIP LOCKED, so a job another worker took in between drops out.
+    """
+    try:
+        resp = (
+            supabase_client.table(CREATOR_SYNC_JOBS_TABLE)
+            .update(
+                {
+                    "status": JobStatus.PROCESSING.value,
+                    "started_at": datetime.now(timezone.utc).isoformat(),
+                }
+            )
+            .in_("id", [job["id"] for job in jobs])
+            .eq("status", JobStatus.PENDING.value)
+            .execute()
+        )
+    except Exception as e:
+        logger.error(f"  ❌ Failed to claim polled jobs: {e}")
+        return []
+    claimed = {row["id"] for row in resp.data or []}
+    return [job for job in jobs if job["id"] in claimed]
+
+
 def _fetch_pending_jobs(batch_size: int) -> List[Dict]:
     """
     Fetch pending jobs that are ready to be processed.
@@ -464,10 +521,24 @@ def _fetch_pending_jobs(batch_size: int) -> List[Dict]:
     for fresh jobs (which it does, since retry_at is only set on failure).
 
     Actually the simplest correct fix: add .or_() to handle both cases.
+
+    Jobs are claimed atomically through the ``claim_creator_sync_jobs`` RPC
+    (``FOR UPDATE SKIP LOCKED``), so concurrent workers never pick the same
+    rows. Without the RPC this falls back to the plain select below plus a
+    conditional claim. Either way the returned jobs are already 'processing'
+    with ``started_at`` set; handlers do not mark them again.
     """
     if not supabase_client:
         return []
 
+    claimed = _claim_pending_jobs(batch_size)
+    if claimed is not None:
+        if claimed:
+            logger.info(f"  Claimed pending jobs: {len(claimed)}")
+        else:
+            logger.debug("  No pending jobs ready for processing right now")
+        return claimed
+
     now_iso = datetime.now(timezone.utc).isoformat()
 
     try:
@@ -489,6 +560,8 @@ def _fetch_pending_jobs(batch_size: int) -> List[Dict]:
         )
 
         all_jobs = resp.data or []
+        if all_jobs:
+            all_jobs = _claim_selected_jobs(all_jobs)
 
         if all_jobs:
             logger.info(f"  Pending jobs ready: {len(all_jobs)}")
@@ -507,6 +580,20 @@ def _fetch_pending_jobs(batch_size: int) -> List[Dict]:
 # =============================================================================
 
 
+async def _youtube_get(resource: str, **params) -> dict:
+    """
+    One Data API list call (``channels``, ``playlistItems``, ``videos``, ``search``).
+
+    Uses the httpx client when configured — safe to run concurrently — and
+    otherwise the resolver's googleapiclient client, serialised by its lock.
+    Quota is billed by the caller, as before.
+    """
+    if youtube_http:
+        return await youtube_http.get(resource, **params)
+    youtube = youtube_resolver._get_youtube_client()
+    return await youtube_resolver._execute_async(getattr(youtube, resource)().list(**params))
+
+
 async def _fetch_channel_data(channel_id: str) -> Dict:
     if not youtube_resolver:
         raise RuntimeError("YouTube resolver not initialized")
@@ -518,10 +605,10 @@ async def _fetch_channel_data(channel_id: str) -> Dict:
     logger.debug(f"  Calling YouTube API for channel {channel_id}...")
 
     try:
-        # Get normalized data from YouTubeResolver
-        # Note: Thread-safety is handled internally by YouTubeResolver._execute_async
+        # Get normalized data (httpx client, or YouTubeResolver's locked client)
+        source = youtube_http or youtube_resolver
         channel_data = await asyncio.wait_for(
-            youtube_resolver.get_channel_data(channel_id), timeout=SYNC_TIMEOUT
+            source.get_channel_data(channel_id), timeout=SYNC_TIMEOUT
         )
 
         if channel_data is None:
@@ -560,6 +647,51 @@ async def _fetch_channel_data(channel_id: str) -> Dict:
         raise
 
 
+async def _fetch_channel_data_batch(channel_ids: List[str]) -> Dict[str, Dict]:
+    """
+    Fetch normalized channel data for many channels in as few calls as possible.
+
+    Issues one channels.list request per 50 IDs (1 quota unit each) instead of
+    one request per channel.  Channels missing from the result were either
+    rejected by the offline format check or not returned by YouTube — the
+    caller decides which by re-validating the ID.
+
+    Returns:
+        Mapping of channel_id → normalized channel data.
+    """
+    if not youtube_resolver:
+        raise RuntimeError("YouTube resolver not initialized")
+
+    valid_ids = [cid for cid in dict.fromkeys(channel_ids) if channel_validator.is_valid(cid)]
+    if not valid_ids:
+        return {}
+
+    calls = -(-len(valid_ids) // YOUTUBE_MAX_IDS_PER_CHANNELS_LIST)
+    logger.debug(f"  Calling YouTube API for {len(valid_ids)} channels ({calls} request(s))...")
+
+    try:
+        source = youtube_http or youtube_resolver
+        channels = await asyncio.wait_for(source.get_channels_data(valid_ids), timeout=SYNC_TIMEOUT)
+        logger.info(
+            f"  YouTube API batch response: {len(channels)}/{len(valid_ids)} channels returned"
+        )
+        return channels
+
+    except asyncio.TimeoutError:
+        metrics.timeout_errors += 1
+        raise Exception(f"YouTube API timeout after {SYNC_TIMEOUT}s for {len(valid_ids)} channels")
+    except Exception as e:
+        if is_quota_exhausted_error(e):
+            logger.error("  YouTube quota exceeded during batch fetch — scheduling retries")
+            raise QuotaExceededException(",".join(valid_ids[:3])) from e
+        metrics.api_errors += 1
+        logger.error(f"  YouTube API batch error: {e}")
+        raise
+    finally:
+        # Each channels.list call is billed whether or not it succeeded
+        metrics.youtube_credits_used += calls * YOUTUBE_CREDITS_PER_CHANNEL_FETCH
+
+
 def _empty_engagement() -> dict:
     """Return a fresh empty engagement payload to prevent shared-mutation bugs."""
     return {
@@ -784,17 +916,17 @@ async def _fetch_recent_video_intelligence(
         if not playlist_id:
             return _empty_recent_video_intelligence()
 
-        youtube_resolver._reset_client()
-        youtube = youtube_resolver._get_youtube_client()
+        if not youtube_http:
+            # Fresh httplib2 connection (see YouTubeResolver._reset_client)
+            youtube_resolver._reset_client()
 
         try:
             playlist_response = await asyncio.wait_for(
-                youtube_resolver._execute_async(
-                    youtube.playlistItems().list(
-                        part="contentDetails",
-                        playlistId=playlist_id,
-                        maxResults=capped_sample,
-                    )
+                _youtube_get(
+                    "playlistItems",
+                    part="contentDetails",
+                    playlistId=playlist_id,
+                    maxResults=capped_sample,
                 ),
                 timeout=10,
             )
@@ -814,11 +946,10 @@ async def _fetch_recent_video_intelligence(
 
         try:
             videos_response = await asyncio.wait_for(
-                youtube_resolver._execute_async(
-                    youtube.videos().list(
-                        part="statistics,snippet,contentDetails",
-                        id=",".join(video_ids),
-                    )
+                _youtube_get(
+                    "videos",
+                    part="statistics,snippet,contentDetails",
+                    id=",".join(video_ids),
                 ),
                 timeout=10,
             )
@@ -866,8 +997,6 @@ async def _fetch_recent_performance_stats(channel_id: str) -> dict:
         if not youtube_resolver:
             return _empty_engagement()
 
-        # Thread-safety is handled internally by YouTubeResolver._execute_async
-        youtube = youtube_resolver._get_youtube_client()
         # Convert channel ID to uploads playlist ID: UC... → UU...
         uploads_playlist_id = "UU" + channel_id[2:]
 
@@ -876,17 +1005,11 @@ async def _fetch_recent_performance_stats(channel_id: str) -> dict:
         # Fetch last 10 videos — contentDetails includes videoPublishedAt
         try:
             playlist_response = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: (
-                        youtube.playlistItems()
-                        .list(
-                            part="contentDetails",
-                            playlistId=uploads_playlist_id,
-                            maxResults=10,
-                        )
-                        .execute()
-                    ),
+                _youtube_get(
+                    "playlistItems",
+                    part="contentDetails",
+                    playlistId=uploads_playlist_id,
+                    maxResults=10,
                 ),
                 timeout=5,  # Short timeout for optional data
             )
@@ -913,12 +1036,7 @@ async def _fetch_recent_performance_stats(channel_id: str) -> dict:
         # Fetch video stats
         try:
             stats_response = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: (
-                        youtube.videos().list(part="statistics", id=",".join(video_ids)).execute()
-                    ),
-                ),
+                _youtube_get("videos", part="statistics", id=",".join(video_ids)),
                 timeout=5,
             )
         except Exception as e:
@@ -1001,21 +1119,16 @@ async def _fetch_recent_upload(channel_id: str) -> dict | None:
         if not youtube_resolver:
             return None
 
-        youtube = youtube_resolver._get_youtube_client()
         uploads_playlist_id = "UU" + channel_id[2:]
 
         # 1 quota unit — get the most recent item
         try:
             pl_resp = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: youtube.playlistItems()
-                    .list(
-                        part="contentDetails,snippet",
-                        playlistId=uploads_playlist_id,
-                        maxResults=1,
-                    )
-                    .execute(),
+                _youtube_get(
+                    "playlistItems",
+                    part="contentDetails,snippet",
+                    playlistId=uploads_playlist_id,
+                    maxResults=1,
                 ),
                 timeout=5,
             )
@@ -1041,12 +1154,7 @@ async def _fetch_recent_upload(channel_id: str) -> dict | None:
         # 1 quota unit — get statistics + duration
         try:
             vid_resp = await asyncio.wait_for(
-                asyncio.get_event_loop().run_in_executor(
-                    None,
-                    lambda: youtube.videos()
-                    .list(part="statistics,contentDetails", id=video_id)
-                    .execute(),
-                ),
+                _youtube_get("videos", part="statistics,contentDetails", id=video_id),
                 timeout=5,
             )
         except Exception as e:
@@ -1311,9 +1419,6 @@ async def handle_resolve_and_add_job(
     if not supabase_client:
         raise RuntimeError("Supabase client not initialized")
 
-    # STAGE 1: Mark as processing
-    mark_creator_sync_processing(job_id)
-
     try:
         # STAGE 2: Determine channel_id
         if input_query.startswith("UC"):
@@ -1415,6 +1520,569 @@ async def handle_resolve_and_add_job(
 # Job handler
 # =============================================================================
 
+# Columns read from the creators row before a sync (previous stats feed the
+# 30-day delta calculation).  Shared by the single-job and batch paths.
+_CREATOR_SYNC_FIELDS = (
+    "channel_id,channel_name,primary_category,"
+    "current_subscribers,current_view_count,current_video_count,"
+    "prev_subscribers,prev_view_count,prev_video_count,prev_snapshot_at"
+)
+
+
+def _build_sync_update(
+    job_tag: str,
+    creator: dict,
+    channel_data: dict,
+    video_intel: dict,
+) -> tuple[dict, dict, bool, Optional[str]]:
+    """
+    Turn fresh YouTube data into the creators-table update for one creator.
+
+    Pure with respect to the DB — no reads or writes happen here, so the same
+    logic serves both ``handle_sync_job`` and ``handle_sync_batch``.
+
+    Args:
+        job_tag:      Log prefix for this job.
+        creator:      Existing creators row (``_CREATOR_SYNC_FIELDS``).
+        channel_data: Normalized channels.list payload from YouTubeResolver.
+        video_intel:  Result of ``_fetch_recent_video_intelligence``.
+
+    Returns:
+        (update_payload, full_payload, is_invalid, sync_error) where
+        update_payload is full_payload filtered to the detected schema.
+    """
+    channel_id = creator.get("channel_id")
+
+    # Track previous values for 30-day delta calculation
+    prev_subs = creator.get("prev_subscribers") or creator.get("current_subscribers") or 0
+    prev_views = creator.get("prev_view_count") or creator.get("current_view_count") or 0
+    prev_videos = creator.get("prev_video_count") or creator.get("current_video_count") or 0
+    prev_snapshot_at = creator.get("prev_snapshot_at")
+    current_subs = creator.get("current_subscribers") or 0
+    current_views = creator.get("current_view_count") or 0
+    current_videos = creator.get("current_video_count") or 0
+
+    # Category costs 2 extra quota units — only fetch when primary_category
+    # is NULL (never been set). To force a re-fetch, NULL the column in DB.
+    should_fetch_categories = _needs_category_fetch(creator.get("primary_category"))
+    engagement = video_intel["engagement_score"]
+    if should_fetch_categories:
+        cat_data = {
+            "primary_category": video_intel.get("primary_category"),
+            "primary_category_id": video_intel.get("primary_category_id"),
+            "category_distribution": video_intel.get("category_distribution") or {},
+        }
+    else:
+        cat_data = {
+            "primary_category": creator.get("primary_category"),
+            "primary_category_id": None,
+            "category_distribution": None,  # None = leave existing DB value as-is
+        }
+        logger.debug(f"{job_tag} Category already set — skipping fetch")
+    quality = _compute_quality_grade(engagement, channel_data["current_subscribers"])
+
+    subs = channel_data["current_subscribers"]
+    views = channel_data["current_view_count"]
+    videos = channel_data["current_video_count"]
+
+    # Format topic categories from Wikipedia URLs to readable names
+    # This converts URLs like "https://en.wikipedia.org/wiki/Music" to "Music"
+    # and stores cleaned names in the database for better filtering/aggregation
+    topic_categories = _format_categories(channel_data.get("topic_categories", []))
+
+    primary_category = cat_data.get("primary_category")
+    primary_category_id = cat_data.get("primary_category_id")
+    category_distribution = cat_data.get("category_distribution", {})
+
+    # Fallback: if video-level category fetch failed, try to map topic categories
+    # to official YouTube categories. Topic categories like "Music", "Gaming", "Education"
+    # map to official YouTube categoryIds (10, 20, 27, etc.).
+    # This ensures primary_category is populated even when the video-level fetch
+    # times out or fails, providing a sensible category for stats aggregation.
+    if not primary_category and topic_categories:
+        primary_category = _map_topic_to_official_category(topic_categories)
+        if primary_category:
+            logger.debug(
+                f"{job_tag} Video-level category unavailable; "
+                f"mapped topic categories to official category: {primary_category}"
+            )
+
+    logger.info(
+        f"{job_tag} Stats: subs={subs:,}, views={views:,}, videos={videos:,}, "
+        f"engagement={engagement:.2f}%, quality={quality}, "
+        f"avg_views_10={video_intel['avg_views_10']}, "
+        f"cadence={video_intel['avg_days_between_uploads']}d, "
+        f"outliers={video_intel['outlier_count']}"
+    )
+    if primary_category and category_distribution:
+        dist_str = ", ".join(
+            f"{name}: {count}"
+            for name, count in sorted(
+                category_distribution.items(), key=lambda x: x[1], reverse=True
+            )
+        )
+        logger.info(
+            f"{job_tag} Category: primary='{primary_category}' "
+            f"(id={primary_category_id}) | "
+            f"distribution ({len(category_distribution)} buckets): {dist_str}"
+        )
+    else:
+        logger.debug(f"{job_tag} No video category data available for {channel_id}")
+    if topic_categories:
+        logger.debug(
+            f"{job_tag} Topic categories ({len(topic_categories)}): " + ", ".join(topic_categories)
+        )
+
+    # Validate stats quality
+    is_invalid = False
+    sync_status = "synced"
+    sync_error = None
+
+    if subs == 0 and views == 0:
+        is_invalid = True
+        sync_status = "invalid"
+        sync_error = "Zero subs + zero views — likely invalid/deleted channel"
+        logger.warning(
+            f"{job_tag} ⚠️  Invalid stats: {channel_id} has 0 subs AND 0 views. "
+            "Flagging for retry. (Could be deleted channel or bad channel_id)"
+        )
+    elif subs == 0 and views > 0:
+        is_invalid = True
+        sync_status = "invalid"
+        sync_error = "Zero subscribers but has views — suspicious, will retry"
+        logger.warning(
+            f"{job_tag} ⚠️  Suspicious stats: {channel_id} has 0 subs but {views:,} views"
+        )
+
+    # Calculate 30-day changes
+    # Determine if we should take a new snapshot (every ~30 days)
+    now = datetime.now(timezone.utc)
+    should_update_snapshot = False
+    has_valid_baseline = False  # Track if we have enough data for meaningful deltas
+
+    if prev_snapshot_at:
+        try:
+            # Parse the timestamp (handle both with and without timezone)
+            if isinstance(prev_snapshot_at, str):
+                # Try parsing with timezone first, then without
+                try:
+                    prev_dt = datetime.fromisoformat(prev_snapshot_at.replace("Z", "+00:00"))
+                except ValueError:
+                    prev_dt = datetime.fromisoformat(prev_snapshot_at).replace(tzinfo=timezone.utc)
+            else:
+                prev_dt = (
+                    prev_snapshot_at.replace(tzinfo=timezone.utc)
+                    if prev_snapshot_at.tzinfo is None
+                    else prev_snapshot_at
+                )
+
+            days_since_snapshot = (now - prev_dt).days
+            should_update_snapshot = days_since_snapshot >= 30
+            # Only show growth if baseline is at least 7 days old (enough for meaningful change)
+            has_valid_baseline = days_since_snapshot >= 7
+            logger.debug(
+                f"{job_tag} Days since last snapshot: {days_since_snapshot} "
+                f"(threshold: 30, valid_baseline: {has_valid_baseline})"
+            )
+        except Exception as e:
+            logger.warning(f"{job_tag} Could not parse prev_snapshot_at: {e}, forcing snapshot")
+            should_update_snapshot = True
+            has_valid_baseline = False
+    else:
+        # First sync ever - initialize snapshot
+        should_update_snapshot = True
+        has_valid_baseline = False
+        logger.debug(f"{job_tag} No previous snapshot - initializing (growth tracking starts now)")
+
+    # Calculate changes based on snapshot values (only if we have valid baseline)
+    if has_valid_baseline:
+        subs_change_30d = subs - prev_subs
+        views_change_30d = views - prev_views
+        videos_change_30d = videos - prev_videos
+        logger.info(
+            f"{job_tag} 30-day changes: subs={subs_change_30d:+,}, "
+            f"views={views_change_30d:+,}, videos={videos_change_30d:+}"
+        )
+    else:
+        # Not enough data yet - use NULL to indicate "tracking in progress"
+        subs_change_30d = None
+        views_change_30d = None
+        videos_change_30d = None
+        logger.info(
+            f"{job_tag} Growth tracking initializing - changes will be available "
+            f"after baseline matures (7+ days)"
+        )
+
+    # Build full update payload
+    full_payload = {
+        "current_subscribers": subs,
+        "current_view_count": views,
+        "current_video_count": videos,
+        "subscribers_change_30d": subs_change_30d,
+        "views_change_30d": views_change_30d,
+        "videos_change_30d": videos_change_30d,
+        "channel_name": channel_data.get("channel_name"),
+        "channel_url": channel_data.get("channel_url"),
+        "channel_description": channel_data.get("channel_description"),
+        "custom_url": channel_data.get("custom_url"),
+        "custom_url_available": channel_data.get("custom_url_available", False),
+        "uploads_playlist_id": channel_data.get("uploads_playlist_id"),
+        "channel_thumbnail_url": channel_data.get("channel_thumbnail_url"),
+        "channel_thumbnail_default": channel_data.get("channel_thumbnail_default"),
+        "banner_image_url": channel_data.get("banner_image_url"),
+        "published_at": channel_data.get("published_at"),
+        "country_code": channel_data.get("country_code"),
+        "default_language": channel_data.get("default_language"),
+        "keywords": channel_data.get("keywords"),
+        "featured_channels_count": channel_data.get("featured_channels_count", 0),
+        "featured_channels_urls": channel_data.get("featured_channels_urls"),
+        "topic_categories": topic_categories,  # Store cleaned category names
+        "primary_category": primary_category,
+    }
+
+    # Update snapshot if enough time has passed
+    if should_update_snapshot:
+        full_payload["prev_subscribers"] = current_subs
+        full_payload["prev_view_count"] = current_views
+        full_payload["prev_video_count"] = current_videos
+        full_payload["prev_snapshot_at"] = now.isoformat()
+        logger.debug(f"{job_tag} Updating snapshot baseline")
+
+    # Only write category fields when freshly fetched — avoids overwriting
+    # the histogram on every routine stats sync.
+    if should_fetch_categories and category_distribution is not None:
+        full_payload["primary_category_id"] = primary_category_id
+        full_payload["category_distribution"] = category_distribution or None
+
+    # Derive monthly_uploads from total video count + channel age.
+    # YouTube API does not expose an upload rate directly.
+    # Falls back to channel_data value if already computed (future-proof).
+    channel_age_days = channel_data.get("channel_age_days")
+    _monthly_uploads_api = channel_data.get("monthly_uploads")
+    if _monthly_uploads_api is not None:
+        computed_monthly_uploads = _monthly_uploads_api
+    elif channel_age_days and channel_age_days > 0 and videos > 0:
+        months_active = max(channel_age_days / 30.0, 1.0)
+        computed_monthly_uploads = round(videos / months_active, 2)
+    else:
+        computed_monthly_uploads = None
+
+    full_payload.update(
+        {
+            "official": channel_data.get("official", False),
+            "channel_age_days": channel_age_days,
+            "monthly_uploads": computed_monthly_uploads,
+            "hidden_subscriber_count": channel_data.get("hidden_subscriber_count", False),
+            # ── Filterable derived fields ──────────────────────────────
+            # quality_grade and engagement_score were previously computed
+            # but never written to the DB, making the grade and activity
+            # filters return zero results for every value. Fixed here.
+            "quality_grade": quality,
+            "engagement_score": round(engagement, 4),
+            # ── Recent upload (latest video snapshot) ─────────────────
+            "recent_upload": video_intel["recent_upload"],
+            # ── Tier 1 recent performance ─────────────────────────────
+            "avg_views_10": video_intel["avg_views_10"],
+            "avg_likes_10": video_intel["avg_likes_10"],
+            "avg_comments_10": video_intel["avg_comments_10"],
+            "avg_days_between_uploads": video_intel["avg_days_between_uploads"],
+            # ── Outlier discovery (viral pattern identification) ──────
+            "recent_views_median": video_intel["recent_views_median"],
+            "recent_video_sample_size": video_intel["recent_video_sample_size"],
+            "outlier_count": video_intel["outlier_count"],
+            "outlier_videos": video_intel["outlier_videos"],
+            # ── Tier 1 brand safety (from channels.list status part) ───
+            "is_made_for_kids": channel_data.get("is_made_for_kids", False),
+            "has_long_upload_status": channel_data.get("has_long_upload_status", False),
+            # ──────────────────────────────────────────────────────────
+            "sync_status": sync_status,
+            "sync_error_message": sync_error,
+            "last_updated_at": datetime.now(timezone.utc).isoformat(),
+            "last_synced_at": datetime.now(timezone.utc).isoformat(),
+        }
+    )
+
+    # Extract and persist contact signals
+    # Extract email, website, Instagram, X, TikTok, LinkedIn from channel_description/keywords
+    # This enables fast filtering for outreach exports without regex on request path
+    try:
+        contact_payload = ContactExtractorService.build_db_update_payload(full_payload)
+        full_payload.update(contact_payload)
+        logger.debug(
+            f"{job_tag} Contact signals extracted: "
+            f"email={bool(contact_payload.get('extracted_email'))}, "
+            f"has_contact={contact_payload.get('has_contact_info')}"
+        )
+    except Exception as e:
+        logger.warning(f"{job_tag} Contact extraction failed (non-critical): {e}")
+        # Continue without contact info - not a blocker
+
+    # Filter to available schema columns
+    update_payload, missing_fields = schema_detector.filter_payload(full_payload)
+
+    if missing_fields:
+        schema_detector.log_schema_mismatch(missing_fields, table_name=CREATOR_TABLE)
+        logger.info(
+            f"{job_tag} Schema filter: writing {len(update_payload)} fields, "
+            f"skipping {len(missing_fields)} unavailable columns: {missing_fields}"
+        )
+
+    return update_payload, full_payload, is_invalid, sync_error
+
+
+def _write_creator_update(
+    job_tag: str,
+    creator_id: str,
+    update_payload: dict,
+    full_payload: dict,
+) -> None:
+    """
+    Write one creator's sync payload, degrading to core fields on failure.
+
+    Raises:
+        Exception: When both the full and the minimal fallback update fail.
+    """
+    try:
+        result = (
+            supabase_client.table(CREATOR_TABLE)
+            .update(update_payload)
+            .eq("id", creator_id)
+            .execute()
+        )
+
+        if not result.data:
+            logger.warning(
+                f"{job_tag} ⚠️  DB update returned no rows. "
+                "Check that creator_id exists and RLS allows updates."
+            )
+        else:
+            logger.info(f"{job_tag} ✅ DB updated ({len(update_payload)} fields written)")
+
+    except Exception as update_error:
+        # FALLBACK: Try with minimal core fields
+        metrics.db_errors += 1
+        logger.warning(f"{job_tag} ⚠️  Full update failed: {update_error}")
+        logger.info(f"{job_tag} Attempting fallback with minimal core fields...")
+
+        minimal_payload = {
+            "current_subscribers": full_payload.get("current_subscribers"),
+            "current_view_count": full_payload.get("current_view_count"),
+            "current_video_count": full_payload.get("current_video_count"),
+            "channel_name": full_payload.get("channel_name"),
+            "country_code": full_payload.get("country_code"),
+            "sync_status": "synced_partial",
+            "sync_error_message": "Schema mismatch — synced with basic fields only",
+            "last_updated_at": datetime.now(timezone.utc).isoformat(),
+        }
+
+        try:
+            supabase_client.table(CREATOR_TABLE).update(minimal_payload).eq(
+                "id", creator_id
+            ).execute()
+            logger.info(f"{job_tag} ✅ Fallback write succeeded (core stats only)")
+        except Exception as fallback_error:
+            logger.error(f"{job_tag} ❌ Both full and fallback updates failed:")
+            logger.error(f"   Full error:     {update_error}")
+            logger.error(f"   Fallback error: {fallback_error}")
+            raise Exception("DB update completely failed after fallback")
+
+
+def _handle_sync_failure(job_tag: str, job_id: int, creator_id: str, e: Exception) -> bool:
+    """
+    Apply the failure policy for a sync job that raised ``e``.
+
+    - QuotaExceededException: mark the job failed for retry and re-raise.
+    - ChannelNotFoundException: purge the creator and job permanently.
+    - Anything else: schedule an exponential-backoff retry.
+
+    Returns:
+        False (the job did not succeed).
+    """
+    metrics.syncs_failed += 1
+
+    # ── Quota exhausted: transient — stop processing, do NOT purge ─────────
+    # The daily quota resets at midnight Pacific. Mark the job failed so it
+    # re-enters the queue tomorrow; do not touch the creator row.
+    # Re-raise to let kaggle_worker.py handle key rotation.
+    if isinstance(e, QuotaExceededException):
+        logger.error(
+            f"{job_tag} ⏸️  YouTube quota exhausted — marking job {job_id} failed "
+            "for retry. Creator record preserved."
+        )
+        try:
+            mark_creator_sync_failed(job_id, "YouTube quota exceeded — will retry")
+        except Exception as mark_err:
+            logger.warning(f"{job_tag} Could not mark job failed: {mark_err}")
+        raise e
+
+    # ── Permanent failure: channel does not exist on YouTube ──────────────
+    # Do NOT retry — the channel is gone. Hard-delete from creators table
+    # to prevent wasting quota on future syncs.
+    if isinstance(e, ChannelNotFoundException):
+        logger.warning(
+            f"{job_tag} 🗑️  Channel not found on YouTube — purging creator "
+            f"({creator_id}) and sync job ({job_id}) permanently. No retry."
+        )
+        try:
+            # Hard-delete the creator row — channel confirmed gone from YouTube.
+            supabase_client.table(CREATOR_TABLE).delete().eq("id", creator_id).execute()
+
+            # Delete the job row to prevent it from re-entering the queue.
+            # Don't use mark_creator_sync_failed — it expects the job to exist
+            # and has retry logic. Just delete it.
+            supabase_client.table(CREATOR_SYNC_JOBS_TABLE).delete().eq("id", job_id).execute()
+
+            logger.info(
+                f"{job_tag} ✅ Purge complete — creator {creator_id} "
+                f"({e.channel_id}) and job {job_id} removed from DB."
+            )
+        except Exception as purge_error:
+            logger.error(
+                f"{job_tag} ❌ Purge failed for creator {creator_id}: {purge_error}. "
+                "Attempting to mark job permanently failed."
+            )
+            # Try to mark job as permanently failed, but don't crash if job is gone
+            try:
+                supabase_client.table(CREATOR_SYNC_JOBS_TABLE).delete().eq("id", job_id).execute()
+                logger.info(f"{job_tag} Job {job_id} deleted after purge failure")
+            except Exception as job_delete_error:
+                logger.warning(
+                    f"{job_tag} Could not delete job {job_id}: {job_delete_error}. "
+                    "Job may have been cascade-deleted or doesn't exist."
+                )
+
+        return False
+
+    # ── Transient failure: schedule exponential backoff retry ─────────────
+    try:
+        retry_response = (
+            supabase_client.table(CREATOR_SYNC_JOBS_TABLE)
+            .select("retry_count")
+            .eq("id", job_id)
+            .execute()
+        )
+
+        if retry_response.data:
+            current_retries = retry_response.data[0].get("retry_count", 0) or 0
+
+            if current_retries < MAX_RETRY_ATTEMPTS:
+                backoff = RETRY_BACKOFF_BASE * (2**current_retries)
+                retry_at = datetime.now(timezone.utc) + timedelta(seconds=backoff)
+                logger.info(
+                    f"{job_tag} Scheduling retry "
+                    f"{current_retries + 1}/{MAX_RETRY_ATTEMPTS} "
+                    f"in {backoff}s (at {retry_at.isoformat()})"
+                )
+                supabase_client.table(CREATOR_SYNC_JOBS_TABLE).update(
+                    {
+                        "status": JobStatus.PENDING.value,
+                        "retry_count": current_retries + 1,
+                        "retry_at": retry_at.isoformat(),
+                        "error_message": str(e),
+                    }
+                ).eq("id", job_id).execute()
+                metrics.syncs_retried += 1
+            else:
+                logger.error(
+                    f"{job_tag} Max retries ({MAX_RETRY_ATTEMPTS}) exhausted "
+                    "— marking as permanently failed"
+                )
+                mark_creator_sync_failed(job_id, str(e))
+
+    except Exception as retry_e:
+        logger.error(f"{job_tag} Failed to update retry status: {retry_e}")
+        mark_creator_sync_failed(job_id, f"Sync failed + retry update failed: {e}")
+
+    return False
+
+
+# =============================================================================
+# Sync result write-back (bulk)
+# =============================================================================
+
+
+@dataclass
+class PendingSyncWrite:
+    """A built creator update waiting to be written, plus its job's outcome."""
+
+    job_id: int
+    creator_id: str
+    job_tag: str
+    update_payload: dict
+    full_payload: dict
+    is_invalid: bool = False
+    sync_error: Optional[str] = None
+
+    def row(self) -> dict:
+        return {"id": self.creator_id} | self.update_payload
+
+
+def _commit_sync_writes(batch_tag: str, writes: List[PendingSyncWrite]) -> Dict[int, bool]:
+    """
+    Write creator updates with one ``bulk_update_creators`` call, then settle
+    their jobs.
+
+    The bulk write is all-or-nothing, so when it fails every row falls back
+    to its own write (with the minimal-field fallback). Completions go out as
+    one update; invalid-stats jobs are marked failed individually.
+
+    Returns:
+        job_id → True (completed) / False (failed) for every write.
+    """
+    results: Dict[int, bool] = {}
+    written: List[PendingSyncWrite] = []
+
+    if bulk_update_creators([write.row() for write in writes]):
+        logger.info(f"{batch_tag} ✅ Bulk DB update wrote {len(writes)} creator(s)")
+        written.extend(writes)
+    else:
+        metrics.db_errors += 1
+        logger.warning(
+            f"{batch_tag} ⚠️  Bulk update of {len(writes)} row(s) failed — "
+            "writing them individually"
+        )
+        for write in writes:
+            try:
+                _write_creator_update(
+                    write.job_tag, write.creator_id, write.update_payload, write.full_payload
+                )
+            except Exception as e:
+                results[write.job_id] = _handle_sync_failure(
+                    write.job_tag, write.job_id, write.creator_id, e
+                )
+                continue
+            written.append(write)
+
+    completed_ids: List[int] = []
+    for write in written:
+        if write.is_invalid:
+            logger.warning(
+                f"{write.job_tag} Marking job as FAILED (invalid stats) — "
+                "will retry with exponential backoff"
+            )
+            mark_creator_sync_failed(write.job_id, write.sync_error or "Invalid stats")
+            metrics.syncs_failed += 1
+            results[write.job_id] = False
+        else:
+            completed_ids.append(write.job_id)
+
+    if completed_ids:
+        if mark_creator_syncs_completed(completed_ids):
+            metrics.syncs_processed += len(completed_ids)
+            for job_id in completed_ids:
+                results[job_id] = True
+        else:
+            logger.error(
+                f"{batch_tag} ❌ mark_creator_syncs_completed returned False — "
+                f"{len(completed_ids)} job(s) will stay in 'processing' and be re-queued "
+                "on next startup."
+            )
+            metrics.syncs_failed += len(completed_ids)
+            for job_id in completed_ids:
+                results[job_id] = False
+
+    return results
+
 
 async def handle_sync_job(
     job_id: int,
@@ -1453,11 +2121,7 @@ async def handle_sync_job(
         # STAGE 1: Fetch creator metadata (including previous stats for delta calculation)
         creator_response = (
             supabase_client.table(CREATOR_TABLE)
-            .select(
-                "channel_id,channel_name,primary_category,"
-                "current_subscribers,current_view_count,current_video_count,"
-                "prev_subscribers,prev_view_count,prev_video_count,prev_snapshot_at"
-            )
+            .select(_CREATOR_SYNC_FIELDS)
             .eq("id", creator_id)
             .execute()
         )
@@ -1469,24 +2133,11 @@ async def handle_sync_job(
         channel_id = creator.get("channel_id")
         channel_name = creator.get("channel_name", "unknown")
 
-        # Track previous values for 30-day delta calculation
-        prev_subs = creator.get("prev_subscribers") or creator.get("current_subscribers") or 0
-        prev_views = creator.get("prev_view_count") or creator.get("current_view_count") or 0
-        prev_videos = creator.get("prev_video_count") or creator.get("current_video_count") or 0
-        prev_snapshot_at = creator.get("prev_snapshot_at")
-        current_subs = creator.get("current_subscribers") or 0
-        current_views = creator.get("current_view_count") or 0
-        current_videos = creator.get("current_video_count") or 0
-
         if not channel_id:
             raise ValueError(f"Creator {creator_id} has no channel_id set")
 
         logger.info(f"{job_tag} Creator: {channel_name} ({channel_id})")
 
-        # STAGE 2: Mark as processing
-        mark_creator_sync_processing(job_id)
-        logger.debug(f"{job_tag} Marked as processing")
-
         # STAGE 3: Fetch channel data
         logger.info(f"{job_tag} Fetching data from YouTube API...")
         try:
@@ -1497,335 +2148,26 @@ async def handle_sync_job(
             raise Exception(f"YouTube API timeout after {SYNC_TIMEOUT}s")
 
         # STAGE 3.5: Recent video intelligence (all optional)
-        # Category costs 2 extra quota units — only fetch when primary_category
-        # is NULL (never been set). To force a re-fetch, NULL the column in DB.
         # The recent-video sample costs 2 quota units and derives engagement,
         # latest upload, category distribution, and outlier discovery together.
         #
-        # IMPORTANT: keep YouTube calls sequential (not via asyncio.gather) because
-        # they share the same httplib2-backed YouTube client via run_in_executor.
-        # httplib2's C internals are not thread-safe — concurrent executor threads
-        # corrupt its heap, producing segfaults and "free(): corrupted unsorted chunks"
-        # crashes. Sequential calls are safe; the per-job latency increase is
-        # acceptable because EXIT_AFTER_JOB ensures only one job runs per process.
-        # If EXIT_AFTER_JOB is ever disabled, consider a per-call YouTube client
-        # instance to restore safe concurrency.
-        should_fetch_categories = _needs_category_fetch(creator.get("primary_category"))
+        # With YOUTUBE_HTTP_CLIENT these calls go through the pooled httpx client
+        # and may run concurrently across jobs. On the googleapiclient fallback
+        # they are serialised by YouTubeResolver's lock: httplib2's C internals
+        # are not thread-safe, and concurrent executor threads corrupt its heap
+        # ("free(): corrupted unsorted chunks").
         video_intel = await _fetch_recent_video_intelligence(
             channel_id,
             uploads_playlist_id=channel_data.get("uploads_playlist_id"),
         )
-        engagement = video_intel["engagement_score"]
-        if should_fetch_categories:
-            cat_data = {
-                "primary_category": video_intel.get("primary_category"),
-                "primary_category_id": video_intel.get("primary_category_id"),
-                "category_distribution": video_intel.get("category_distribution") or {},
-            }
-        else:
-            cat_data = {
-                "primary_category": creator.get("primary_category"),
-                "primary_category_id": None,
-                "category_distribution": None,  # None = leave existing DB value as-is
-            }
-            logger.debug(f"{job_tag} Category already set — skipping fetch")
-        quality = _compute_quality_grade(engagement, channel_data["current_subscribers"])
-
-        subs = channel_data["current_subscribers"]
-        views = channel_data["current_view_count"]
-        videos = channel_data["current_video_count"]
-
-        # Format topic categories from Wikipedia URLs to readable names
-        # This converts URLs like "https://en.wikipedia.org/wiki/Music" to "Music"
-        # and stores cleaned names in the database for better filtering/aggregation
-        topic_categories = _format_categories(channel_data.get("topic_categories", []))
-
-        primary_category = cat_data.get("primary_category")
-        primary_category_id = cat_data.get("primary_category_id")
-        category_distribution = cat_data.get("category_distribution", {})
-
-        # Fallback: if video-level category fetch failed, try to map topic categories
-        # to official YouTube categories. Topic categories like "Music", "Gaming", "Education"
-        # map to official YouTube categoryIds (10, 20, 27, etc.).
-        # This ensures primary_category is populated even when the video-level fetch
-        # times out or fails, providing a sensible category for stats aggregation.
-        if not primary_category and topic_categories:
-            primary_category = _map_topic_to_official_category(topic_categories)
-            if primary_category:
-                logger.debug(
-                    f"{job_tag} Video-level category unavailable; "
-                    f"mapped topic categories to official category: {primary_category}"
-                )
-
-        logger.info(
-            f"{job_tag} Stats: subs={subs:,}, views={views:,}, videos={videos:,}, "
-            f"engagement={engagement:.2f}%, quality={quality}, "
-            f"avg_views_10={video_intel['avg_views_10']}, "
-            f"cadence={video_intel['avg_days_between_uploads']}d, "
-            f"outliers={video_intel['outlier_count']}"
-        )
-        if primary_category and category_distribution:
-            dist_str = ", ".join(
-                f"{name}: {count}"
-                for name, count in sorted(
-                    category_distribution.items(), key=lambda x: x[1], reverse=True
-                )
-            )
-            logger.info(
-                f"{job_tag} Category: primary='{primary_category}' "
-                f"(id={primary_category_id}) | "
-                f"distribution ({len(category_distribution)} buckets): {dist_str}"
-            )
-        else:
-            logger.debug(f"{job_tag} No video category data available for {channel_id}")
-        if topic_categories:
-            logger.debug(
-                f"{job_tag} Topic categories ({len(topic_categories)}): "
-                + ", ".join(topic_categories)
-            )
-
-        # STAGE 3.5: Validate stats quality
-        is_invalid = False
-        sync_status = "synced"
-        sync_error = None
-
-        if subs == 0 and views == 0:
-            is_invalid = True
-            sync_status = "invalid"
-            sync_error = "Zero subs + zero views — likely invalid/deleted channel"
-            logger.warning(
-                f"{job_tag} ⚠️  Invalid stats: {channel_id} has 0 subs AND 0 views. "
-                "Flagging for retry. (Could be deleted channel or bad channel_id)"
-            )
-        elif subs == 0 and views > 0:
-            is_invalid = True
-            sync_status = "invalid"
-            sync_error = "Zero subscribers but has views — suspicious, will retry"
-            logger.warning(
-                f"{job_tag} ⚠️  Suspicious stats: {channel_id} has 0 subs but {views:,} views"
-            )
-
-        # STAGE 3.75: Calculate 30-day changes
-        # Determine if we should take a new snapshot (every ~30 days)
-        now = datetime.now(timezone.utc)
-        should_update_snapshot = False
-        has_valid_baseline = False  # Track if we have enough data for meaningful deltas
-
-        if prev_snapshot_at:
-            try:
-                # Parse the timestamp (handle both with and without timezone)
-                if isinstance(prev_snapshot_at, str):
-                    # Try parsing with timezone first, then without
-                    try:
-                        prev_dt = datetime.fromisoformat(prev_snapshot_at.replace("Z", "+00:00"))
-                    except ValueError:
-                        prev_dt = datetime.fromisoformat(prev_snapshot_at).replace(
-                            tzinfo=timezone.utc
-                        )
-                else:
-                    prev_dt = (
-                        prev_snapshot_at.replace(tzinfo=timezone.utc)
-                        if prev_snapshot_at.tzinfo is None
-                        else prev_snapshot_at
-                    )
-
-                days_since_snapshot = (now - prev_dt).days
-                should_update_snapshot = days_since_snapshot >= 30
-                # Only show growth if baseline is at least 7 days old (enough for meaningful change)
-                has_valid_baseline = days_since_snapshot >= 7
-                logger.debug(
-                    f"{job_tag} Days since last snapshot: {days_since_snapshot} "
-                    f"(threshold: 30, valid_baseline: {has_valid_baseline})"
-                )
-            except Exception as e:
-                logger.warning(f"{job_tag} Could not parse prev_snapshot_at: {e}, forcing snapshot")
-                should_update_snapshot = True
-                has_valid_baseline = False
-        else:
-            # First sync ever - initialize snapshot
-            should_update_snapshot = True
-            has_valid_baseline = False
-            logger.debug(
-                f"{job_tag} No previous snapshot - initializing (growth tracking starts now)"
-            )
-
-        # Calculate changes based on snapshot values (only if we have valid baseline)
-        if has_valid_baseline:
-            subs_change_30d = subs - prev_subs
-            views_change_30d = views - prev_views
-            videos_change_30d = videos - prev_videos
-            logger.info(
-                f"{job_tag} 30-day changes: subs={subs_change_30d:+,}, "
-                f"views={views_change_30d:+,}, videos={videos_change_30d:+}"
-            )
-        else:
-            # Not enough data yet - use NULL to indicate "tracking in progress"
-            subs_change_30d = None
-            views_change_30d = None
-            videos_change_30d = None
-            logger.info(
-                f"{job_tag} Growth tracking initializing - changes will be available "
-                f"after baseline matures (7+ days)"
-            )
 
         # STAGE 4: Build full update payload
-        full_payload = {
-            "current_subscribers": subs,
-            "current_view_count": views,
-            "current_video_count": videos,
-            "subscribers_change_30d": subs_change_30d,
-            "views_change_30d": views_change_30d,
-            "videos_change_30d": videos_change_30d,
-            "channel_name": channel_data.get("channel_name"),
-            "channel_url": channel_data.get("channel_url"),
-            "channel_description": channel_data.get("channel_description"),
-            "custom_url": channel_data.get("custom_url"),
-            "custom_url_available": channel_data.get("custom_url_available", False),
-            "uploads_playlist_id": channel_data.get("uploads_playlist_id"),
-            "channel_thumbnail_url": channel_data.get("channel_thumbnail_url"),
-            "channel_thumbnail_default": channel_data.get("channel_thumbnail_default"),
-            "banner_image_url": channel_data.get("banner_image_url"),
-            "published_at": channel_data.get("published_at"),
-            "country_code": channel_data.get("country_code"),
-            "default_language": channel_data.get("default_language"),
-            "keywords": channel_data.get("keywords"),
-            "featured_channels_count": channel_data.get("featured_channels_count", 0),
-            "featured_channels_urls": channel_data.get("featured_channels_urls"),
-            "topic_categories": topic_categories,  # Store cleaned category names
-            "primary_category": primary_category,
-        }
-
-        # Update snapshot if enough time has passed
-        if should_update_snapshot:
-            full_payload["prev_subscribers"] = current_subs
-            full_payload["prev_view_count"] = current_views
-            full_payload["prev_video_count"] = current_videos
-            full_payload["prev_snapshot_at"] = now.isoformat()
-            logger.debug(f"{job_tag} Updating snapshot baseline")
-
-        # Only write category fields when freshly fetched — avoids overwriting
-        # the histogram on every routine stats sync.
-        if should_fetch_categories and category_distribution is not None:
-            full_payload["primary_category_id"] = primary_category_id
-            full_payload["category_distribution"] = category_distribution or None
-
-        # Derive monthly_uploads from total video count + channel age.
-        # YouTube API does not expose an upload rate directly.
-        # Falls back to channel_data value if already computed (future-proof).
-        channel_age_days = channel_data.get("channel_age_days")
-        _monthly_uploads_api = channel_data.get("monthly_uploads")
-        if _monthly_uploads_api is not None:
-            computed_monthly_uploads = _monthly_uploads_api
-        elif channel_age_days and channel_age_days > 0 and videos > 0:
-            months_active = max(channel_age_days / 30.0, 1.0)
-            computed_monthly_uploads = round(videos / months_active, 2)
-        else:
-            computed_monthly_uploads = None
-
-        full_payload.update(
-            {
-                "official": channel_data.get("official", False),
-                "channel_age_days": channel_age_days,
-                "monthly_uploads": computed_monthly_uploads,
-                "hidden_subscriber_count": channel_data.get("hidden_subscriber_count", False),
-                # ── Filterable derived fields ──────────────────────────────
-                # quality_grade and engagement_score were previously computed
-                # but never written to the DB, making the grade and activity
-                # filters return zero results for every value. Fixed here.
-                "quality_grade": quality,
-                "engagement_score": round(engagement, 4),
-                # ── Recent upload (latest video snapshot) ─────────────────
-                "recent_upload": video_intel["recent_upload"],
-                # ── Tier 1 recent performance ─────────────────────────────
-                "avg_views_10": video_intel["avg_views_10"],
-                "avg_likes_10": video_intel["avg_likes_10"],
-                "avg_comments_10": video_intel["avg_comments_10"],
-                "avg_days_between_uploads": video_intel["avg_days_between_uploads"],
-                # ── Outlier discovery (viral pattern identification) ──────
-                "recent_views_median": video_intel["recent_views_median"],
-                "recent_video_sample_size": video_intel["recent_video_sample_size"],
-                "outlier_count": video_intel["outlier_count"],
-                "outlier_videos": video_intel["outlier_videos"],
-                # ── Tier 1 brand safety (from channels.list status part) ───
-                "is_made_for_kids": channel_data.get("is_made_for_kids", False),
-                "has_long_upload_status": channel_data.get("has_long_upload_status", False),
-                # ──────────────────────────────────────────────────────────
-                "sync_status": sync_status,
-                "sync_error_message": sync_error,
-                "last_updated_at": datetime.now(timezone.utc).isoformat(),
-                "last_synced_at": datetime.now(timezone.utc).isoformat(),
-            }
+        update_payload, full_payload, is_invalid, sync_error = _build_sync_update(
+            job_tag, creator, channel_data, video_intel
         )
 
-        # STAGE 4.5: Extract and persist contact signals
-        # Extract email, website, Instagram, X, TikTok, LinkedIn from channel_description/keywords
-        # This enables fast filtering for outreach exports without regex on request path
-        try:
-            contact_payload = ContactExtractorService.build_db_update_payload(full_payload)
-            full_payload.update(contact_payload)
-            logger.debug(
-                f"{job_tag} Contact signals extracted: "
-                f"email={bool(contact_payload.get('extracted_email'))}, "
-                f"has_contact={contact_payload.get('has_contact_info')}"
-            )
-        except Exception as e:
-            logger.warning(f"{job_tag} Contact extraction failed (non-critical): {e}")
-            # Continue without contact info - not a blocker
-
-        # Filter to available schema columns
-        update_payload, missing_fields = schema_detector.filter_payload(full_payload)
-
-        if missing_fields:
-            schema_detector.log_schema_mismatch(missing_fields, table_name=CREATOR_TABLE)
-            logger.info(
-                f"{job_tag} Schema filter: writing {len(update_payload)} fields, "
-                f"skipping {len(missing_fields)} unavailable columns: {missing_fields}"
-            )
-
         # STAGE 4: Write to DB
-        try:
-            result = (
-                supabase_client.table(CREATOR_TABLE)
-                .update(update_payload)
-                .eq("id", creator_id)
-                .execute()
-            )
-
-            if not result.data:
-                logger.warning(
-                    f"{job_tag} ⚠️  DB update returned no rows. "
-                    "Check that creator_id exists and RLS allows updates."
-                )
-            else:
-                logger.info(f"{job_tag} ✅ DB updated ({len(update_payload)} fields written)")
-
-        except Exception as update_error:
-            # FALLBACK: Try with minimal core fields
-            metrics.db_errors += 1
-            logger.warning(f"{job_tag} ⚠️  Full update failed: {update_error}")
-            logger.info(f"{job_tag} Attempting fallback with minimal core fields...")
-
-            minimal_payload = {
-                "current_subscribers": subs,
-                "current_view_count": views,
-                "current_video_count": videos,
-                "channel_name": full_payload.get("channel_name"),
-                "country_code": full_payload.get("country_code"),
-                "sync_status": "synced_partial",
-                "sync_error_message": "Schema mismatch — synced with basic fields only",
-                "last_updated_at": datetime.now(timezone.utc).isoformat(),
-            }
-
-            try:
-                supabase_client.table(CREATOR_TABLE).update(minimal_payload).eq(
-                    "id", creator_id
-                ).execute()
-                logger.info(f"{job_tag} ✅ Fallback write succeeded (core stats only)")
-            except Exception as fallback_error:
-                logger.error(f"{job_tag} ❌ Both full and fallback updates failed:")
-                logger.error(f"   Full error:     {update_error}")
-                logger.error(f"   Fallback error: {fallback_error}")
-                raise Exception("DB update completely failed after fallback")
+        _write_creator_update(job_tag, creator_id, update_payload, full_payload)
 
         # STAGE 5: Mark job done
         if is_invalid:
@@ -1851,106 +2193,154 @@ async def handle_sync_job(
 
     except Exception as e:
         logger.exception(f"{job_tag} ❌ Sync FAILED: {e}")
+        return _handle_sync_failure(job_tag, job_id, creator_id, e)
 
-        metrics.syncs_failed += 1
 
-        # ── Quota exhausted: transient — stop processing, do NOT purge ─────────
-        # The daily quota resets at midnight Pacific. Mark the job failed so it
-        # re-enters the queue tomorrow; do not touch the creator row.
-        # Re-raise to let kaggle_worker.py handle key rotation.
-        if isinstance(e, QuotaExceededException):
-            logger.error(
-                f"{job_tag} ⏸️  YouTube quota exhausted — marking job {job_id} failed "
-                "for retry. Creator record preserved."
-            )
-            try:
-                mark_creator_sync_failed(job_id, "YouTube quota exceeded — will retry")
-            except Exception as mark_err:
-                logger.warning(f"{job_tag} Could not mark job failed: {mark_err}")
-            raise
+async def handle_sync_batch(jobs: List[Dict], batch_number: int = 0) -> List[bool | Exception]:
+    """
+    Sync many creators with one channels.list call and one bulk DB write.
 
-        # ── Permanent failure: channel does not exist on YouTube ──────────────
-        # Do NOT retry — the channel is gone. Hard-delete from creators table
-        # to prevent wasting quota on future syncs.
-        if isinstance(e, ChannelNotFoundException):
-            logger.warning(
-                f"{job_tag} 🗑️  Channel not found on YouTube — purging creator "
-                f"({creator_id}) and sync job ({job_id}) permanently. No retry."
-            )
-            try:
-                # Hard-delete the creator row — channel confirmed gone from YouTube.
-                supabase_client.table(CREATOR_TABLE).delete().eq("id", creator_id).execute()
+    Used when SYNC_BATCH_SIZE > 1.  Compared with running ``handle_sync_job``
+    per creator this collapses:
+      - N creators-row selects        → 1 select (``id IN (...)``)
+      - N channels.list calls         → ceil(N / 50) calls (1 quota unit each)
+      - N creators-row updates        → 1 bulk upsert per payload shape
+      - N mark-completed updates      → 1 update
 
-                # Delete the job row to prevent it from re-entering the queue.
-                # Don't use mark_creator_sync_failed — it expects the job to exist
-                # and has retry logic. Just delete it.
-                supabase_client.table(CREATOR_SYNC_JOBS_TABLE).delete().eq("id", job_id).execute()
+    Recent-video fetches still cost 2 units per creator and are fanned out
+    under ``SYNC_BATCH_VIDEO_CONCURRENCY``.  Per-job failures use the same
+    policy as ``handle_sync_job`` (purge / retry / quota) via
+    ``_handle_sync_failure``.
 
-                logger.info(
-                    f"{job_tag} ✅ Purge complete — creator {creator_id} "
-                    f"({e.channel_id}) and job {job_id} removed from DB."
-                )
-            except Exception as purge_error:
-                logger.error(
-                    f"{job_tag} ❌ Purge failed for creator {creator_id}: {purge_error}. "
-                    "Attempting to mark job permanently failed."
-                )
-                # Try to mark job as permanently failed, but don't crash if job is gone
-                try:
-                    supabase_client.table(CREATOR_SYNC_JOBS_TABLE).delete().eq(
-                        "id", job_id
-                    ).execute()
-                    logger.info(f"{job_tag} Job {job_id} deleted after purge failure")
-                except Exception as job_delete_error:
-                    logger.warning(
-                        f"{job_tag} Could not delete job {job_id}: {job_delete_error}. "
-                        "Job may have been cascade-deleted or doesn't exist."
-                    )
+    Args:
+        jobs:         Pending ``sync_stats`` job rows (id, creator_id, retry_count).
+        batch_number: For logging.
 
-            return False
+    Returns:
+        One entry per job, in input order: True / False, or the
+        QuotaExceededException that stopped the batch.
+    """
+    batch_tag = f"[Batch {batch_number}]"
+    if not supabase_client:
+        raise RuntimeError("Supabase client not initialized")
+
+    results: Dict[int, bool | Exception] = {}
+    tags = {job["id"]: f"[Job {batch_number}.{i}:{job['id']}]" for i, job in enumerate(jobs, 1)}
+    quota_error: Optional[QuotaExceededException] = None
 
-        # ── Transient failure: schedule exponential backoff retry ─────────────
-        # Handle retries
+    def _fail(job: Dict, exc: Exception) -> None:
+        nonlocal quota_error
         try:
-            retry_response = (
-                supabase_client.table(CREATOR_SYNC_JOBS_TABLE)
-                .select("retry_count")
-                .eq("id", job_id)
-                .execute()
+            results[job["id"]] = _handle_sync_failure(
+                tags[job["id"]], job["id"], job["creator_id"], exc
             )
+        except QuotaExceededException as quota_exc:
+            quota_error = quota_exc
+            results[job["id"]] = quota_exc
+
+    logger.info(f"{batch_tag} ─── Starting batch sync | jobs={len(jobs)}")
+
+    # STAGE 1: Fetch all creator rows in one query
+    creator_ids = [job["creator_id"] for job in jobs]
+    creator_response = (
+        supabase_client.table(CREATOR_TABLE)
+        .select(f"id,{_CREATOR_SYNC_FIELDS}")
+        .in_("id", creator_ids)
+        .execute()
+    )
+    creators_by_id = {row["id"]: row for row in (creator_response.data or [])}
+
+    runnable: List[Dict] = []
+    for job in jobs:
+        creator = creators_by_id.get(job["creator_id"])
+        if not creator:
+            _fail(job, ValueError(f"Creator not found in DB: {job['creator_id']}"))
+        elif not creator.get("channel_id"):
+            _fail(job, ValueError(f"Creator {job['creator_id']} has no channel_id set"))
+        else:
+            runnable.append(job)
 
-            if retry_response.data:
-                current_retries = retry_response.data[0].get("retry_count", 0) or 0
+    if not runnable:
+        return [results[job["id"]] for job in jobs]
 
-                if current_retries < MAX_RETRY_ATTEMPTS:
-                    backoff = RETRY_BACKOFF_BASE * (2**current_retries)
-                    retry_at = datetime.now(timezone.utc) + timedelta(seconds=backoff)
-                    logger.info(
-                        f"{job_tag} Scheduling retry "
-                        f"{current_retries + 1}/{MAX_RETRY_ATTEMPTS} "
-                        f"in {backoff}s (at {retry_at.isoformat()})"
-                    )
-                    supabase_client.table(CREATOR_SYNC_JOBS_TABLE).update(
-                        {
-                            "status": JobStatus.PENDING.value,
-                            "retry_count": current_retries + 1,
-                            "retry_at": retry_at.isoformat(),
-                            "error_message": str(e),
-                        }
-                    ).eq("id", job_id).execute()
-                    metrics.syncs_retried += 1
-                else:
-                    logger.error(
-                        f"{job_tag} Max retries ({MAX_RETRY_ATTEMPTS}) exhausted "
-                        "— marking as permanently failed"
-                    )
-                    mark_creator_sync_failed(job_id, str(e))
+    # STAGE 3: Resolve every channel in as few channels.list calls as possible
+    channel_ids = [creators_by_id[job["creator_id"]]["channel_id"] for job in runnable]
+    logger.info(f"{batch_tag} Fetching {len(channel_ids)} channel(s) from YouTube API...")
+    try:
+        channels = await _fetch_channel_data_batch(channel_ids)
+    except Exception as e:
+        logger.exception(f"{batch_tag} ❌ Batch channels.list FAILED: {e}")
+        for job in runnable:
+            _fail(job, e)
+        return [results[job["id"]] for job in jobs]
+
+    fetched: List[Dict] = []
+    for job in runnable:
+        channel_id = creators_by_id[job["creator_id"]]["channel_id"]
+        if channel_id in channels:
+            fetched.append(job)
+        elif channel_validator.is_valid(channel_id):
+            # A valid ID omitted from a successful channels.list response is the
+            # same signal as a single-ID lookup returning no items.
+            _fail(job, ChannelNotFoundException(channel_id))
+        else:
+            _fail(job, ValueError(f"Invalid channel ID format: {channel_id}"))
 
-        except Exception as retry_e:
-            logger.error(f"{job_tag} Failed to update retry status: {retry_e}")
-            mark_creator_sync_failed(job_id, f"Sync failed + retry update failed: {e}")
+    # STAGE 3.5: Fan out recent-video intelligence.  With the httpx client the
+    # semaphore bounds real parallelism; on the googleapiclient fallback
+    # YouTubeResolver serialises the calls and it only bounds in-flight work.
+    semaphore = asyncio.Semaphore(SYNC_BATCH_VIDEO_CONCURRENCY)
 
-        return False
+    async def _intel(job: Dict) -> dict:
+        channel_id = creators_by_id[job["creator_id"]]["channel_id"]
+        async with semaphore:
+            return await _fetch_recent_video_intelligence(
+                channel_id,
+                uploads_playlist_id=channels[channel_id].get("uploads_playlist_id"),
+            )
+
+    # One creator's failure (e.g. a deleted uploads playlist) must not sink
+    # the batch: each exception is settled through that job's failure policy.
+    intel = await asyncio.gather(*(_intel(job) for job in fetched), return_exceptions=True)
+
+    # STAGE 4: Build payloads
+    pending_writes: List[PendingSyncWrite] = []
+    for job, video_intel in zip(fetched, intel):
+        if isinstance(video_intel, BaseException):
+            if not isinstance(video_intel, Exception):
+                raise video_intel
+            logger.error(f"{tags[job['id']]} ❌ Recent-video fetch FAILED: {video_intel}")
+            _fail(job, video_intel)
+            continue
+        creator = creators_by_id[job["creator_id"]]
+        try:
+            update_payload, full_payload, is_invalid, sync_error = _build_sync_update(
+                tags[job["id"]], creator, channels[creator["channel_id"]], video_intel
+            )
+        except Exception as e:
+            logger.exception(f"{tags[job['id']]} ❌ Sync FAILED: {e}")
+            _fail(job, e)
+            continue
+        pending_writes.append(
+            PendingSyncWrite(
+                job_id=job["id"],
+                creator_id=job["creator_id"],
+                job_tag=tags[job["id"]],
+                update_payload=update_payload,
+                full_payload=full_payload,
+                is_invalid=is_invalid,
+                sync_error=sync_error,
+            )
+        )
+
+    # STAGE 4-5: One bulk write (per-row fallback), then completions in one update
+    results.update(_commit_sync_writes(batch_tag, pending_writes))
+
+    succeeded = sum(1 for r in results.values() if r is True)
+    logger.info(f"{batch_tag} ✅ Batch sync done: {succeeded}/{len(jobs)} succeeded")
+    if quota_error:
+        logger.error(f"{batch_tag} ⏸️  YouTube quota exhausted during batch sync")
+    return [results[job["id"]] for job in jobs]
 
 
 # =============================================================================
@@ -1962,13 +2352,14 @@ def _reset_stuck_processing_jobs() -> None:
     """
     Reset jobs left in 'processing' status by a previously crashed worker.
 
-    A segfault or SIGABRT after mark_creator_sync_processing() but before
+    A segfault or SIGABRT after the job is claimed but before
     mark_creator_sync_completed/failed() leaves the job permanently invisible
     to _fetch_pending_jobs (which only polls status='pending').
 
-    Safe to run on every startup: a fresh process cannot legitimately have
-    a job in 'processing' since EXIT_AFTER_JOB=True means the previous process
-    has already exited before this one starts.
+    Other live workers hold claimed jobs in 'processing' too, so only jobs
+    whose ``started_at`` is older than PROCESSING_LEASE_SECONDS (or missing)
+    are treated as orphaned. No live worker keeps a job that long: every
+    handler runs under a timeout well inside the lease.
 
     Handles the unique constraint idx_creator_sync_jobs_pending_unique:
     When a pending job already exists for the same creator, deletes the
@@ -1977,11 +2368,15 @@ def _reset_stuck_processing_jobs() -> None:
     """
     if not supabase_client:
         return
+    lease_cutoff = (
+        datetime.now(timezone.utc) - timedelta(seconds=PROCESSING_LEASE_SECONDS)
+    ).isoformat()
     try:
         stuck = (
             supabase_client.table(CREATOR_SYNC_JOBS_TABLE)
             .select("id, creator_id")
             .eq("status", JobStatus.PROCESSING.value)
+            .or_(f"started_at.is.null,started_at.lt.{lease_cutoff}")
             .execute()
         )
         if not stuck.data:
@@ -2000,7 +2395,7 @@ def _reset_stuck_processing_jobs() -> None:
                 try:
                     supabase_client.table(CREATOR_SYNC_JOBS_TABLE).update(
                         {"status": JobStatus.PENDING.value, "retry_at": None}
-                    ).eq("id", job_id).execute()
+                    ).eq("id", job_id).eq("status", JobStatus.PROCESSING.value).execute()
                     reset_count += 1
                 except Exception as update_e:
                     # If unique constraint violation, another pending job was created
@@ -2032,8 +2427,17 @@ def _reset_stuck_processing_jobs() -> None:
         logger.error(f"  ❌ Could not reset stuck processing jobs: {e}")
 
 
-async def init():
-    global youtube_resolver, supabase_client
+async def init(reset_stuck_jobs: bool = True):
+    """
+    Initialise Supabase and the YouTube clients for this process.
+
+    Args:
+        reset_stuck_jobs: Recover orphaned 'processing' jobs on startup.
+            Runner children spawned by render_worker pass False: they start
+            while a sibling is mid-job, and the supervisor already ran the
+            reset once before starting any child.
+    """
+    global youtube_resolver, youtube_http, supabase_client
 
     logger.info("Initializing worker services...")
 
@@ -2070,6 +2474,9 @@ async def init():
         api_key = get_creator_worker_api_key()
         youtube_resolver = YouTubeResolver(api_key=api_key)
         logger.info("✅ YouTube resolver initialized")
+        if YOUTUBE_HTTP_CLIENT:
+            youtube_http = YouTubeHttpClient(api_key=api_key)
+            logger.info("✅ YouTube httpx client initialized")
     except Exception as e:
         logger.error(f"❌ YouTube API key initialization failed: {e}")
         raise SystemExit(1)
@@ -2078,11 +2485,12 @@ async def init():
     logger.info("✅ Worker initialization complete")
 
     # Reset orphaned 'processing' jobs left behind by crashed processes.
-    # Each worker process marks a job 'processing' before fetching from YouTube.
+    # Claimed jobs are 'processing' before anything is fetched from YouTube.
     # A segfault/SIGABRT after that point leaves the job permanently stuck because
-    # _fetch_pending_jobs only polls status='pending'. Reset them on every startup
-    # so they re-enter the queue and are retried by the next iteration.
-    _reset_stuck_processing_jobs()
+    # _fetch_pending_jobs only polls status='pending'. Jobs past their lease are
+    # reset on startup so they re-enter the queue and are retried.
+    if reset_stuck_jobs:
+        _reset_stuck_processing_jobs()
 
     # Run DB diagnosis on first startup only.
     # When the bash loop restarts the process 500 times, running 4 HTTP
@@ -2112,6 +2520,7 @@ async def process_creator_syncs():
     logger.info(
         f"Starting worker loop | "
         f"poll_interval={POLL_INTERVAL}s, batch_size={BATCH_SIZE}, "
+        f"sync_batch_size={SYNC_BATCH_SIZE}, "
         f"max_runtime={MAX_RUNTIME}s, max_retries={MAX_RETRY_ATTEMPTS}, "
         f"empty_backoff_max={EMPTY_QUEUE_BACKOFF_MAX}s"
     )
@@ -2197,7 +2606,7 @@ async def process_creator_syncs():
 
         try:
             # ── Fetch pending jobs (respects retry_at) ────────────────────────
-            jobs = _fetch_pending_jobs(BATCH_SIZE)
+            jobs = _fetch_pending_jobs(max(BATCH_SIZE, SYNC_BATCH_SIZE))
 
             if not jobs:
                 empty_poll_count += 1
@@ -2231,11 +2640,34 @@ async def process_creator_syncs():
                 )
                 empty_poll_count = 0
 
-            logger.info(f"Processing {len(jobs)} pending job(s) sequentially...")
+            # ── Batch mode: sync_stats jobs share channels.list + bulk write ──
+            results = []
+            if SYNC_BATCH_SIZE > 1:
+                sync_jobs = [
+                    j for j in jobs if j.get("job_type", "sync_stats") != "resolve_and_add"
+                ]
+                jobs = [j for j in jobs if j.get("job_type", "sync_stats") == "resolve_and_add"]
+                if sync_jobs:
+                    logger.info(f"Processing {len(sync_jobs)} sync job(s) as one batch...")
+                    try:
+                        results.extend(
+                            await asyncio.wait_for(
+                                handle_sync_batch(sync_jobs, batch_number=1),
+                                # Extra buffer for DB ops plus per-creator video fetches
+                                timeout=SYNC_TIMEOUT + 30 + 20 * len(sync_jobs),
+                            )
+                        )
+                    except asyncio.CancelledError:
+                        raise
+                    except Exception as e:
+                        logger.exception("Batch sync raised exception")
+                        results.extend([e] * len(sync_jobs))
+
+            if jobs:
+                logger.info(f"Processing {len(jobs)} pending job(s) sequentially...")
 
             # Process jobs one at a time to avoid httplib2 thread-safety issues
             # Even with internal locking, concurrent tasks can corrupt httplib2 state
-            results = []
             for i, job in enumerate(jobs, 1):
                 try:
                     job_type = job.get("job_type", "sync_stats")
@@ -2267,7 +2699,7 @@ async def process_creator_syncs():
 
             successes = sum(1 for r in results if r is True)
             failures = sum(1 for r in results if r is False or isinstance(r, Exception))
-            logger.info(f"Batch done: {successes}/{len(jobs)} succeeded, {failures} failed")
+            logger.info(f"Batch done: {successes}/{len(results)} succeeded, {failures} failed")
 
             # Exit after processing job(s) for complete memory isolation
             if EXIT_AFTER_JOB:
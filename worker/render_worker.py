@@ -11,8 +11,8 @@ This file is the long-running "supervisor" process. It:
 
   2. Polls Supabase for pending jobs.
 
-  3. For each job, spawns worker/run_one_job.py as a *subprocess* and waits
-     for it to finish before fetching the next job.
+  3. For each job, hands it to a worker/run_one_job.py *subprocess* and
+     waits for it to finish before fetching the next job.
 
 WHY SUBPROCESS PER JOB
 ───────────────────────
@@ -26,6 +26,19 @@ The RESOLVER_RESET_INTERVAL trick in kaggle_worker.py works only because
 Kaggle links a different httplib2 build. On Render's Debian container the
 corruption is deterministic on job 1.
 
+WARM POOL
+─────────
+A cold subprocess pays interpreter start, secrets loading, Supabase client
+init and YouTube discovery before it can touch its job — seconds per job.
+The pool is opt-in (RENDER_WARM_POOL_SIZE defaults to 0, the cold per-job
+subprocess). With RENDER_WARM_POOL_SIZE > 0 the supervisor keeps that many
+children started in ``--serve`` mode: fully initialised and blocked on stdin. A job is
+written to a ready child's stdin and its result read back from stdout, and a
+replacement starts warming while the job runs. Each child is recycled after
+RENDER_WARM_CHILD_MAX_JOBS jobs (default 1, i.e. still one heap per job),
+on crash, or on timeout (killed). If no warm child can be started the job
+falls back to the cold per-job subprocess.
+
 DEPLOYMENT
 ──────────
   worker/render_worker.py   ← this file (supervisor)
@@ -38,6 +51,7 @@ render.yaml startCommand:
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
 import os
 import signal
@@ -60,6 +74,7 @@ logger.info("render_worker (supervisor) starting — secrets loaded via: %s", _e
 
 # ── Worker internals (for queue polling and maintenance only) ─────────────────
 import worker.creator_worker as _cw
+from worker.run_one_job import PROTOCOL_PREFIX
 
 # ── Config ────────────────────────────────────────────────────────────────────
 
@@ -78,6 +93,15 @@ EMPTY_WARN_THRESHOLD: int = int(os.getenv("RENDER_EMPTY_WARN_THRESHOLD", "10"))
 # Subprocess timeout per job: sync timeout + generous buffer for DB ops.
 JOB_SUBPROCESS_TIMEOUT: int = _cw.SYNC_TIMEOUT + 60
 
+# Pre-initialised runner children kept waiting for work (0 = cold spawn per job).
+WARM_POOL_SIZE: int = int(os.getenv("RENDER_WARM_POOL_SIZE", "0"))
+
+# Jobs a warm child runs before it is recycled (1 = fresh heap per job).
+WARM_CHILD_MAX_JOBS: int = max(1, int(os.getenv("RENDER_WARM_CHILD_MAX_JOBS", "1")))
+
+# How long a warm child may take to initialise before it is discarded.
+WARM_CHILD_START_TIMEOUT: int = int(os.getenv("RENDER_WARM_CHILD_START_TIMEOUT", "120"))
+
 # ── Graceful shutdown ─────────────────────────────────────────────────────────
 
 _shutdown = asyncio.Event()
@@ -119,6 +143,18 @@ def _start_health_server(port: int) -> None:
 # ── Job subprocess runner ─────────────────────────────────────────────────────
 
 
+def _subprocess_env() -> dict:
+    """
+    Inherit everything from the supervisor, then explicitly override
+    CREATOR_WORKER_SKIP_DIAGNOSIS so the subprocess never re-runs the startup
+    diagnosis or bootstrap that the supervisor already handled. This saves
+    ~8s of overhead (3s RPC timeout + 1s bootstrap + 4s schema/init) per job.
+    """
+    env = os.environ.copy()
+    env["CREATOR_WORKER_SKIP_DIAGNOSIS"] = "true"
+    return env
+
+
 async def _run_job_subprocess(
     job_id: int, creator_id: str, job_number: int, retry_count: int = 0
 ) -> bool:
@@ -141,20 +177,12 @@ async def _run_job_subprocess(
         str(retry_count),
     ]
 
-    # Build subprocess env: inherit everything from the supervisor, then
-    # explicitly override CREATOR_WORKER_SKIP_DIAGNOSIS so the subprocess
-    # never re-runs the startup diagnosis or bootstrap that the supervisor
-    # already handled. This saves ~8s of overhead (3s RPC timeout + 1s
-    # bootstrap + 4s schema/init) per job.
-    subprocess_env = os.environ.copy()
-    subprocess_env["CREATOR_WORKER_SKIP_DIAGNOSIS"] = "true"
-
     try:
         proc = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
             stderr=asyncio.subprocess.STDOUT,  # merge stderr → stdout
-            env=subprocess_env,
+            env=_subprocess_env(),
         )
 
         try:
@@ -192,6 +220,232 @@ async def _run_job_subprocess(
         return False
 
 
+# ── Warm runner pool ──────────────────────────────────────────────────────────
+
+
+class _WarmChild:
+    """One ``run_one_job --serve`` process and the reader draining its stdout."""
+
+    def __init__(self, proc: asyncio.subprocess.Process):
+        self.proc = proc
+        self.jobs_run = 0
+        self._messages: asyncio.Queue = asyncio.Queue()
+        self._reader = asyncio.create_task(self._read_output())
+
+    @property
+    def pid(self) -> int:
+        return self.proc.pid
+
+    @property
+    def alive(self) -> bool:
+        return self.proc.returncode is None and not self._reader.done()
+
+    async def _read_output(self) -> None:
+        """Forward log lines as they arrive; queue protocol messages (None on EOF)."""
+        try:
+            async for raw in self.proc.stdout:
+                line = raw.decode(errors="replace").rstrip()
+                if line.startswith(PROTOCOL_PREFIX):
+                    try:
+                        self._messages.put_nowait(json.loads(line[len(PROTOCOL_PREFIX) :]))
+                    except ValueError:
+                        logger.warning("[warm:%d] bad protocol line: %s", self.pid, line)
+                elif line.strip():
+                    logger.info("[subprocess] %s", line)
+        finally:
+            self._messages.put_nowait(None)
+
+    async def _next_message(self, event: str, timeout: float) -> dict | None:
+        """Next protocol message of type ``event``; None on EOF or timeout."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            try:
+                msg = await asyncio.wait_for(
+                    self._messages.get(), timeout=max(0.0, deadline - loop.time())
+                )
+            except asyncio.TimeoutError:
+                return None
+            if msg is None or msg.get("event") == event:
+                return msg
+
+    async def wait_ready(self, timeout: float) -> bool:
+        return await self._next_message("ready", timeout) is not None
+
+    async def run(self, job: dict, timeout: float) -> bool | None:
+        """
+        Hand ``job`` to the child over stdin and wait for its result.
+
+        Returns the child's ok flag, or None if it died or timed out
+        (the child is killed in that case).
+        """
+        self.jobs_run += 1
+        try:
+            self.proc.stdin.write((json.dumps(job) + "\n").encode())
+            await self.proc.stdin.drain()
+        except (BrokenPipeError, ConnectionResetError):
+            return None
+        msg = await self._next_message("result", timeout)
+        if msg is None:
+            await self.kill()
+            return None
+        return bool(msg.get("ok"))
+
+    async def retire(self, timeout: float = 10) -> int | None:
+        """Close stdin and let the child exit on its own; kill it if it lingers."""
+        if self.proc.stdin and not self.proc.stdin.is_closing():
+            self.proc.stdin.close()
+        try:
+            await asyncio.wait_for(self.proc.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            await self.kill()
+        await self._reader
+        return self.proc.returncode
+
+    async def kill(self) -> None:
+        if self.proc.returncode is None:
+            self.proc.kill()
+        await self.proc.wait()
+
+
+class WarmRunnerPool:
+    """
+    Keeps ``size`` pre-initialised ``run_one_job --serve`` children ready.
+
+    Jobs are run one child at a time; taking a child immediately starts its
+    replacement so warm-up overlaps with the running job. Children are
+    recycled after ``max_jobs_per_child`` jobs, on crash, and on timeout.
+    """
+
+    def __init__(
+        self,
+        size: int = WARM_POOL_SIZE,
+        max_jobs_per_child: int = WARM_CHILD_MAX_JOBS,
+        job_timeout: float = JOB_SUBPROCESS_TIMEOUT,
+        start_timeout: float = WARM_CHILD_START_TIMEOUT,
+        cmd: list[str] | None = None,
+    ):
+        self.size = max(1, size)
+        self.max_jobs_per_child = max(1, max_jobs_per_child)
+        self.job_timeout = job_timeout
+        self.start_timeout = start_timeout
+        self.cmd = cmd or [
+            sys.executable,
+            "-m",
+            "worker.run_one_job",
+            "--serve",
+            "--max-jobs",
+            str(self.max_jobs_per_child),
+        ]
+        self._idle: list[_WarmChild] = []
+        self._starting: list[asyncio.Task] = []
+        self.spawned = 0
+        self.recycled = 0
+
+    # ── Child lifecycle ──────────────────────────────────────────────────────
+
+    async def _spawn(self) -> _WarmChild | None:
+        try:
+            proc = await asyncio.create_subprocess_exec(
+                *self.cmd,
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,  # merge stderr → stdout
+                env=_subprocess_env(),
+            )
+        except Exception:
+            logger.exception("❌ Failed to spawn warm runner")
+            return None
+        self.spawned += 1
+        child = _WarmChild(proc)
+        if await child.wait_ready(self.start_timeout):
+            logger.info("🔥 Warm runner pid=%d ready", child.pid)
+            return child
+        logger.warning("Warm runner pid=%d never became ready — discarding", child.pid)
+        await child.kill()
+        return None
+
+    def _fill(self) -> None:
+        """Start warming children until ``size`` are ready or on their way."""
+        self._starting = [t for t in self._starting if not t.done() or t.result() is not None]
+        while len(self._idle) + len(self._starting) < self.size:
+            self._starting.append(asyncio.create_task(self._spawn()))
+
+    async def _acquire(self) -> _WarmChild | None:
+        while self._idle:
+            child = self._idle.pop(0)
+            if child.alive:
+                return child
+            await child.retire()
+        if not self._starting:
+            self._fill()
+        return await self._starting.pop(0)
+
+    async def _release(self, child: _WarmChild) -> None:
+        if child.alive and child.jobs_run < self.max_jobs_per_child:
+            self._idle.append(child)
+            return
+        code = await child.retire()
+        self.recycled += 1
+        logger.debug(
+            "Recycled warm runner pid=%d after %d job(s) (exit %s)", child.pid, child.jobs_run, code
+        )
+
+    def start(self) -> None:
+        """Begin warming the pool (returns immediately)."""
+        self._fill()
+
+    # ── Dispatch ─────────────────────────────────────────────────────────────
+
+    async def run_job(
+        self, job_id: int, creator_id: str, job_number: int, retry_count: int = 0
+    ) -> bool:
+        """
+        Run one job on a warm child. Falls back to a cold subprocess if no
+        warm child could be started.
+        """
+        child = await self._acquire()
+        if child is None or child.jobs_run + 1 >= self.max_jobs_per_child:
+            # This child retires after the job — warm its successor meanwhile
+            self._fill()
+        if child is None:
+            logger.warning("No warm runner available — running job #%d cold", job_number)
+            return await _run_job_subprocess(job_id, creator_id, job_number, retry_count)
+
+        job = {
+            "job_id": job_id,
+            "creator_id": str(creator_id),
+            "job_number": job_number,
+            "retry_count": retry_count,
+        }
+        ok = await child.run(job, timeout=self.job_timeout)
+        await self._release(child)
+
+        if ok is None:
+            logger.warning(
+                "❌ Job #%d (id=%s) warm runner pid=%d died or timed out (exit %s)",
+                job_number,
+                job_id,
+                child.pid,
+                child.proc.returncode,
+            )
+            return False
+        icon = "✅" if ok else "❌"
+        logger.info(
+            "%s Job #%d (id=%s) finished on warm runner pid=%d", icon, job_number, job_id, child.pid
+        )
+        return ok
+
+    async def close(self) -> None:
+        """Stop every idle and warming child."""
+        starting, self._starting = self._starting, []
+        for child in await asyncio.gather(*starting, return_exceptions=True):
+            if isinstance(child, _WarmChild):
+                self._idle.append(child)
+        idle, self._idle = self._idle, []
+        await asyncio.gather(*(child.retire() for child in idle), return_exceptions=True)
+
+
 # ── Supervisor loop ───────────────────────────────────────────────────────────
 
 
@@ -200,7 +454,10 @@ async def _supervisor_loop() -> None:
     Poll for jobs and dispatch each one to an isolated subprocess.
     Never exits unless _shutdown is set.
     """
-    await _cw.init()  # sets up Supabase client
+    # Sets up the Supabase client and recovers jobs orphaned by a previous
+    # deploy. This is the only stuck-job reset: it runs before any runner
+    # child exists, and the children skip it (run_one_job).
+    await _cw.init()
 
     jobs_processed: int = 0
     empty_polls: int = 0
@@ -212,6 +469,11 @@ async def _supervisor_loop() -> None:
     # delays the first job by however long those synchronous calls take.)
     last_periodic_check: float = time.time()
 
+    pool = WarmRunnerPool() if WARM_POOL_SIZE > 0 else None
+    if pool:
+        pool.start()
+    run_job = pool.run_job if pool else _run_job_subprocess
+
     while not _shutdown.is_set():
 
         # ── 1. Time-gated periodic maintenance ───────────────────────────────
@@ -254,24 +516,30 @@ async def _supervisor_loop() -> None:
 
         # ── 3. Run job in isolated subprocess ─────────────────────────────────
         logger.info(
-            "→ Dispatching job #%d (id=%s, creator=%s) to subprocess",
+            "→ Dispatching job #%d (id=%s, creator=%s) to %s",
             jobs_processed,
             job["id"],
             job["creator_id"],
+            "warm runner" if pool else "subprocess",
         )
-        await _run_job_subprocess(
+        await run_job(
             job_id=job["id"],
             creator_id=job["creator_id"],
             job_number=jobs_processed,
             retry_count=int(job.get("retry_count") or 0),
         )
 
+    if pool:
+        await pool.close()
+
     # ── Shutdown summary ──────────────────────────────────────────────────────
     elapsed = time.time() - start_time
     logger.info("=" * 60)
     logger.info("render_worker supervisor shutting down")
     logger.info("  Uptime              : %.0fs (%.1f min)", elapsed, elapsed / 60)
     logger.info("  Jobs dispatched     : %d", jobs_processed)
+    if pool:
+        logger.info("  Warm runners spawned: %d", pool.spawned)
     logger.info("=" * 60)
 
 
@@ -285,6 +553,8 @@ async def main() -> None:
     logger.info("   IDLE_POLL_INTERVAL      : %ds", IDLE_POLL_INTERVAL)
     logger.info("   PERIODIC_CHECK_INTERVAL : %ds", PERIODIC_CHECK_INTERVAL)
     logger.info("   JOB_SUBPROCESS_TIMEOUT  : %ds", JOB_SUBPROCESS_TIMEOUT)
+    logger.info("   WARM_POOL_SIZE          : %d", WARM_POOL_SIZE)
+    logger.info("   WARM_CHILD_MAX_JOBS     : %d", WARM_CHILD_MAX_JOBS)
     logger.info("=" * 60)
 
     # Health-check server in a background daemon thread
@@ -8,6 +8,19 @@ Python so that render_worker.py (the supervisor) never has to exit.
 
 Usage (internal — called by render_worker.py only):
     python -m worker.run_one_job --job-id <id> --creator-id <uuid> --job-number <n> [--retry-count <n>]
+    python -m worker.run_one_job --serve [--max-jobs <k>]
+
+Warm mode (--serve):
+    The child initialises (secrets, Supabase, YouTube resolver) *before* it
+    is given any work, announces itself on stdout, then reads one JSON job per
+    line from stdin and answers each with a JSON result line. It exits after
+    --max-jobs jobs (default 1 — same per-job heap isolation as above), on
+    stdin EOF, or after an unhandled exception. Protocol lines carry
+    PROTOCOL_PREFIX so the supervisor can tell them apart from log output:
+
+        stdin : {"job_id": 1, "creator_id": "…", "job_number": 3, "retry_count": 0}
+        stdout: @@run_one_job {"event": "ready"}
+        stdout: @@run_one_job {"event": "result", "job_id": 1, "ok": true}
 
 Exit codes:
     0  — job completed, timed out, or was marked failed/retried in DB
@@ -20,6 +33,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import json
 import logging
 import sys
 
@@ -36,22 +50,15 @@ logger = logging.getLogger("run_one_job")
 # ── Worker internals ──────────────────────────────────────────────────────────
 import worker.creator_worker as _cw
 
+# Marks supervisor protocol lines on stdout (everything else is log output)
+PROTOCOL_PREFIX = "@@run_one_job "
 
-# ── Entry point ───────────────────────────────────────────────────────────────
 
+# ── Job execution ─────────────────────────────────────────────────────────────
 
-async def main(job_id: int, creator_id: str, job_number: int, retry_count: int = 0) -> None:
-    logger.info(
-        "run_one_job starting | job_id=%s creator_id=%s job_number=%d retry_count=%d",
-        job_id,
-        creator_id,
-        job_number,
-        retry_count,
-    )
-
-    # Initialise Supabase + YouTubeResolver for this process
-    await _cw.init()
 
+async def _run_job(job_id: int, creator_id: str, job_number: int, retry_count: int = 0) -> None:
+    """Run one sync job in this (already initialised) process."""
     try:
         result = await asyncio.wait_for(
             # retry_count is tracked in DB; supervisor re-fetches on retry
@@ -87,23 +94,91 @@ async def main(job_id: int, creator_id: str, job_number: int, retry_count: int =
     )
 
 
+def _emit(event: str, **fields) -> None:
+    """Write one protocol line for the supervisor."""
+    sys.stdout.write(PROTOCOL_PREFIX + json.dumps({"event": event, **fields}) + "\n")
+    sys.stdout.flush()
+
+
+# ── Entry points ──────────────────────────────────────────────────────────────
+
+
+async def main(job_id: int, creator_id: str, job_number: int, retry_count: int = 0) -> None:
+    logger.info(
+        "run_one_job starting | job_id=%s creator_id=%s job_number=%d retry_count=%d",
+        job_id,
+        creator_id,
+        job_number,
+        retry_count,
+    )
+
+    # Initialise Supabase + YouTubeResolver for this process. The stuck-job
+    # reset is the supervisor's: run here it would re-queue jobs in flight.
+    await _cw.init(reset_stuck_jobs=False)
+    await _run_job(job_id, creator_id, job_number, retry_count)
+
+
+async def serve(max_jobs: int = 1) -> None:
+    """Warm mode: initialise first, then run up to ``max_jobs`` jobs sent on stdin."""
+    # A warm child starts while the previous child's job is still running, so
+    # it must not reset 'processing' jobs (see creator_worker.init).
+    await _cw.init(reset_stuck_jobs=False)
+    logger.info("run_one_job warm and waiting | max_jobs=%d", max_jobs)
+    _emit("ready")
+
+    for _ in range(max_jobs):
+        line = await asyncio.to_thread(sys.stdin.readline)
+        if not line:
+            logger.info("run_one_job: supervisor closed the pipe — exiting")
+            return
+        job = json.loads(line)
+        logger.info(
+            "run_one_job assigned | job_id=%s creator_id=%s job_number=%d retry_count=%d",
+            job["job_id"],
+            job["creator_id"],
+            job["job_number"],
+            job.get("retry_count", 0),
+        )
+        try:
+            await _run_job(
+                job_id=job["job_id"],
+                creator_id=job["creator_id"],
+                job_number=job["job_number"],
+                retry_count=int(job.get("retry_count") or 0),
+            )
+        except Exception:
+            # Same contract as exit code 1: report, then let the child die
+            _emit("result", job_id=job["job_id"], ok=False)
+            raise
+        _emit("result", job_id=job["job_id"], ok=True)
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Process a single creator sync job")
-    parser.add_argument("--job-id", required=True, type=int)
-    parser.add_argument("--creator-id", required=True)
-    parser.add_argument("--job-number", required=True, type=int)
+    parser.add_argument("--serve", action="store_true", help="warm mode: read jobs from stdin")
+    parser.add_argument("--max-jobs", type=int, default=1)
+    parser.add_argument("--job-id", type=int)
+    parser.add_argument("--creator-id")
+    parser.add_argument("--job-number", type=int)
     parser.add_argument("--retry-count", type=int, default=0)
     args = parser.parse_args()
+    if not args.serve and (
+        args.job_id is None or args.creator_id is None or args.job_number is None
+    ):
+        parser.error("--job-id, --creator-id and --job-number are required without --serve")
 
     try:
-        asyncio.run(
-            main(
-                job_id=args.job_id,
-                creator_id=args.creator_id,
-                job_number=args.job_number,
-                retry_count=args.retry_count,
+        if args.serve:
+            asyncio.run(serve(max_jobs=max(1, args.max_jobs)))
+        else:
+            asyncio.run(
+                main(
+                    job_id=args.job_id,
+                    creator_id=args.creator_id,
+                    job_number=args.job_number,
+                    retry_count=args.retry_count,
+                )
             )
-        )
         sys.exit(0)
     except Exception:
         logger.exception("run_one_job failed with unhandled exception")
@@ -36,6 +36,7 @@ from db import (
     supabase_client,
     upsert_playlist_stats,
 )
+from services.progress_bus import progress_bus
 from services.youtube_service import (
     YouTubeBotChallengeError,
     YoutubePlaylistService,
@@ -63,6 +64,22 @@ MIN_REQUEST_DELAY = float(os.getenv("MIN_REQUEST_DELAY", "1.0"))  # Reduced dela
 MAX_REQUEST_DELAY = float(os.getenv("MAX_REQUEST_DELAY", "3.0"))
 BOT_CHALLENGE_BACKOFF = int(os.getenv("BOT_CHALLENGE_BACKOFF", "180"))  # 3 min
 
+# --- Concurrency ---
+# Jobs are mostly network waits (pre-delay, YouTube fetches, DB writes), so up to
+# WORKER_CONCURRENCY claimed jobs run as concurrent tasks on the event loop.
+WORKER_CONCURRENCY = max(1, int(os.getenv("WORKER_CONCURRENCY", "1")))
+# Seconds in-flight jobs get to finish after MAX_RUNTIME / shutdown before being cancelled
+DRAIN_TIMEOUT = int(os.getenv("WORKER_DRAIN_TIMEOUT", "300"))
+# Per-job wall-clock limit in seconds (0 disables)
+JOB_TIMEOUT = int(os.getenv("WORKER_JOB_TIMEOUT", "0"))
+
+# --- Progress writes ---
+# playlist_jobs.progress is written at most once per PROGRESS_WRITE_INTERVAL seconds
+# unless progress moved by PROGRESS_WRITE_MIN_DELTA (fraction); the final value
+# always lands.
+PROGRESS_WRITE_INTERVAL = float(os.getenv("WORKER_PROGRESS_WRITE_INTERVAL", "2.0"))
+PROGRESS_WRITE_MIN_DELTA = float(os.getenv("WORKER_PROGRESS_WRITE_MIN_DELTA", "0.1"))
+
 # --- Retry configuration ---
 RETRY_BACKOFF_BASE = int(os.getenv("RETRY_BACKOFF_BASE", "300"))  # 5 minutes
 FAILED_JOB_RETRY_AGE = int(os.getenv("FAILED_JOB_RETRY_AGE", "3600"))  # 1 hour
@@ -112,8 +129,8 @@ async def init():
 async def fetch_pending_jobs():
     """Return list of pending job rows from playlist_jobs table."""
     try:
-        resp = (
-            supabase_client.table(PLAYLIST_JOBS_TABLE)
+        resp = await asyncio.to_thread(
+            lambda: supabase_client.table(PLAYLIST_JOBS_TABLE)
             .select("*")
             .eq("status", "pending")
             .order("created_at", desc=False)
@@ -142,8 +159,8 @@ async def fetch_retryable_failed_jobs():
             datetime.now(timezone.utc) - timedelta(seconds=FAILED_JOB_RETRY_AGE)
         ).isoformat()
 
-        resp = (
-            supabase_client.table(PLAYLIST_JOBS_TABLE)
+        resp = await asyncio.to_thread(
+            lambda: supabase_client.table(PLAYLIST_JOBS_TABLE)
             .select("*")
             .eq("status", "failed")
             .lt("retry_count", MAX_RETRY_ATTEMPTS)
@@ -161,8 +178,73 @@ async def fetch_retryable_failed_jobs():
         return []
 
 
+async def claim_jobs(limit: int) -> Optional[list[tuple[Dict[str, Any], bool]]]:
+    """
+    Atomically claim up to ``limit`` jobs via the ``claim_playlist_jobs`` RPC.
+
+    The RPC picks pending jobs first, then retryable failed jobs, using
+    ``FOR UPDATE SKIP LOCKED`` and marks them processing in the same statement,
+    so concurrent workers get disjoint batches in one round trip.
+
+    Returns ``[(job, is_retry), ...]``, or None when the RPC is unavailable
+    and the caller should fall back to poll-then-claim.
+    """
+    if limit <= 0:
+        return []
+
+    cutoff_time = (datetime.now(timezone.utc) - timedelta(seconds=FAILED_JOB_RETRY_AGE)).isoformat()
+    try:
+        # supabase-py is synchronous; claims run while other jobs are in flight.
+        resp = await asyncio.to_thread(
+            lambda: supabase_client.rpc(
+                "claim_playlist_jobs",
+                {
+                    "p_limit": limit,
+                    "p_max_retries": MAX_RETRY_ATTEMPTS,
+                    "p_retry_cutoff": cutoff_time,
+                    "p_retry_limit": max(1, BATCH_SIZE // 2),
+                },
+            ).execute()
+        )
+    except Exception:
+        logger.warning(
+            "claim_playlist_jobs RPC failed; falling back to poll-then-claim", exc_info=True
+        )
+        return None
+
+    claimed = [(row["job"], bool(row.get("is_retry"))) for row in resp.data or []]
+    if claimed:
+        logger.info(f"Claimed {len(claimed)} job(s)")
+    return claimed
+
+
+async def claim_job(job_id: str) -> bool:
+    """Claim a single polled job; False when another worker got it first."""
+    try:
+        claim_response = await asyncio.to_thread(
+            lambda: supabase_client.table(PLAYLIST_JOBS_TABLE)
+            .update(
+                {
+                    "status": "processing",
+                    "started_at": utc_now_iso(),
+                }
+            )
+            .eq("id", job_id)
+            .in_("status", ["pending", "failed"])  # Allow claiming failed jobs
+            .execute()
+        )
+    except Exception as e:
+        logger.error(f"[Job {job_id}] Failed to claim job: {e}")
+        return False
+
+    if not claim_response.data:
+        logger.debug(f"[Job {job_id}] Claim failed, another worker took it. Skipping.")
+        return False
+    return True
+
+
 async def mark_job_status(job_id: str, status: str, meta: Optional[Dict[str, Any]] = None) -> bool:
-    """Update a job's status with optional metadata."""
+    """Update a job's status with optional metadata (off the event loop)."""
     if not supabase_client:
         logger.error(f"Cannot mark job {job_id} as {status}: Supabase client not initialized")
         return False
@@ -172,8 +254,12 @@ async def mark_job_status(job_id: str, status: str, meta: Optional[Dict[str, Any
         if meta:
             payload.update(meta)
 
-        response = (
-            supabase_client.table(PLAYLIST_JOBS_TABLE).update(payload).eq("id", job_id).execute()
+        # supabase-py is synchronous; concurrent jobs share this event loop.
+        response = await asyncio.to_thread(
+            lambda: supabase_client.table(PLAYLIST_JOBS_TABLE)
+            .update(payload)
+            .eq("id", job_id)
+            .execute()
         )
 
         success = bool(response.data)
@@ -201,9 +287,12 @@ async def increment_retry_count(job_id: str, current_count: int = 0):
     """Increment the retry count for a job."""
     try:
         new_count = current_count + 1
-        supabase_client.table(PLAYLIST_JOBS_TABLE).update({"retry_count": new_count}).eq(
-            "id", job_id
-        ).execute()
+        await asyncio.to_thread(
+            lambda: supabase_client.table(PLAYLIST_JOBS_TABLE)
+            .update({"retry_count": new_count})
+            .eq("id", job_id)
+            .execute()
+        )
         logger.info(f"[Job {job_id}] Retry count incremented to {new_count}")
     except Exception as e:
         logger.warning(f"Failed to update retry count for {job_id}: {e}")
@@ -221,6 +310,117 @@ def update_progress(job_id: str, processed: int, total: int):
         logger.warning(f"Failed to update progress for {job_id}: {e}")
 
 
+class ProgressWriter:
+    """
+    Coalescing, rate-limited ``update_progress`` for one job.
+
+    - The first value is written immediately; later ones at most once per
+      ``interval`` seconds, or sooner once progress moves by ``min_delta``.
+    - Only the latest value is kept: while a write is in flight or waiting
+      for the interval, newer values replace older ones, so superseded
+      writes never reach the executor.
+    - A complete value (processed >= total) is written without delay, and
+      ``flush()`` always lands the last value.
+    """
+
+    def __init__(
+        self,
+        job_id: str,
+        interval: Optional[float] = None,
+        min_delta: Optional[float] = None,
+    ):
+        self.job_id = job_id
+        self.interval = PROGRESS_WRITE_INTERVAL if interval is None else interval
+        self.min_delta = PROGRESS_WRITE_MIN_DELTA if min_delta is None else min_delta
+        self.writes = 0
+        self._pending: Optional[tuple[int, int]] = None
+        self._last_written_at: Optional[float] = None
+        self._last_fraction = 0.0
+        self._in_flight: Optional[asyncio.Future] = None
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._closed = False
+
+    def submit(self, processed: int, total: int) -> asyncio.Future:
+        """Record the latest progress; returns the write it triggered (or a done future)."""
+        loop = asyncio.get_running_loop()
+        if self._closed:
+            return self._done(loop)
+        self._pending = (processed, total)
+        return self._write_if_due(loop) or self._done(loop)
+
+    async def flush(self) -> None:
+        """Write the latest value now (after any in-flight write)."""
+        self._cancel_timer()
+        if self._in_flight is not None:
+            await asyncio.gather(self._in_flight, return_exceptions=True)
+        if self._pending is not None:
+            await asyncio.gather(self._start_write(asyncio.get_running_loop()))
+
+    def close(self) -> None:
+        """Drop anything not yet written; later submits are ignored."""
+        self._closed = True
+        self._pending = None
+        self._cancel_timer()
+
+    @staticmethod
+    def _done(loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        fut = loop.create_future()
+        fut.set_result(None)
+        return fut
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _fraction(self) -> float:
+        processed, total = self._pending
+        return processed / total if total > 0 else 0.0
+
+    def _write_if_due(self, loop: asyncio.AbstractEventLoop) -> Optional[asyncio.Future]:
+        if self._pending is None or self._in_flight is not None:
+            return None  # the in-flight write's callback picks the latest value up
+
+        processed, total = self._pending
+        now = time.monotonic()
+        wait = (
+            0.0 if self._last_written_at is None else self.interval - (now - self._last_written_at)
+        )
+        complete = total > 0 and processed >= total
+        moved = self._fraction() - self._last_fraction >= self.min_delta > 0
+        if wait <= 0 or complete or moved:
+            self._cancel_timer()
+            return self._start_write(loop)
+
+        if self._timer is None:
+            self._timer = loop.call_later(wait, self._on_timer, loop)
+        return None
+
+    def _on_timer(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._timer = None
+        if not self._closed:
+            self._write_if_due(loop)
+
+    def _start_write(self, loop: asyncio.AbstractEventLoop) -> asyncio.Future:
+        processed, total = self._pending
+        self._last_fraction = self._fraction()
+        self._pending = None
+        self._last_written_at = time.monotonic()
+        self.writes += 1
+        fut = loop.run_in_executor(None, update_progress, self.job_id, processed, total)
+        self._in_flight = fut
+        fut.add_done_callback(lambda f: self._on_write_done(loop, f))
+        return fut
+
+    def _on_write_done(self, loop: asyncio.AbstractEventLoop, fut: asyncio.Future) -> None:
+        if self._in_flight is fut:
+            self._in_flight = None
+        if not fut.cancelled() and fut.exception() is not None:
+            logger.warning(f"[Job {self.job_id}] Progress write failed: {fut.exception()}")
+        if not self._closed:
+            self._write_if_due(loop)
+
+
 async def check_bot_challenge_cooldown():
     """
     Check if we're in a bot challenge cooldown period.
@@ -303,6 +503,7 @@ def _result_to_mapping(result) -> Dict[str, Any]:
             "source": getattr(result, "source", None),
             "df": getattr(result, "df", None),
             "df_json": getattr(result, "df_json", None),
+            "df_arrow": getattr(result, "df_arrow", None),
             "summary_stats": getattr(result, "summary_stats", None),
             "summary_stats_json": getattr(result, "summary_stats_json", None),
             "error": getattr(result, "error", None),
@@ -382,11 +583,17 @@ async def handle_job(job: Dict[str, Any], is_retry: bool = False):
     logger.debug(f"[Job {job_id}] Waiting {delay:.2f}s before processing")
     await asyncio.sleep(delay)
 
+    # Shared bot-challenge gate: a sibling task may have tripped the cooldown
+    # while this job was waiting. Hand the job back instead of hitting YouTube.
+    if await check_bot_challenge_cooldown():
+        logger.warning(f"[Job {job_id}] Bot challenge cooldown active, releasing job")
+        await mark_job_status(job_id, "pending", {"started_at": None})
+        return
+
+    # claim_jobs / claim_job already set status=processing and started_at.
     start_time = time.time()
-    _set_stage("mark-processing")
-    started_ok = await mark_job_status(job_id, "processing", {"started_at": utc_now_iso()})
-    logger.info(f"[Job {job_id}] mark_job_status(processing) returned: {started_ok}")
 
+    progress_writer = ProgressWriter(job_id)
     try:
         _set_stage("fetch-playlist-data")
         # Fetch playlist data
@@ -435,9 +642,14 @@ async def handle_job(job: Dict[str, Any], is_retry: bool = False):
                     logger.warning(f"Invalid progress values: processed={processed}, total={total}")
                     processed, total = 0, 0
 
-                # Schedule the sync update_progress in the default executor
-                loop = asyncio.get_running_loop()
-                return loop.run_in_executor(None, update_progress, job_id, processed, total)
+                # In-process SSE watchers see this immediately; others via the DB poll
+                progress_bus.publish(
+                    playlist_url,
+                    {"status": "processing", "progress": processed / total if total > 0 else 0.0},
+                )
+
+                # Coalesced, rate-limited DB write (see ProgressWriter)
+                return progress_writer.submit(processed, total)
 
             except Exception as e:
                 logger.exception(f"[Job {job_id}] Progress callback failed: {e}")
@@ -456,6 +668,8 @@ async def handle_job(job: Dict[str, Any], is_retry: bool = False):
         ) = await yt_service.get_playlist_data(
             playlist_url, progress_callback=_progress_cb
         )  # ← Async (100+ concurrent HTTP calls)
+        # Land the last progress value before any status write can follow it
+        await progress_writer.flush()
         _set_stage("fetched-playlist-data")
 
         logger.info(
@@ -548,18 +762,24 @@ async def handle_job(job: Dict[str, Any], is_retry: bool = False):
 
         _set_stage("upsert-to-db")
 
-        result = upsert_playlist_stats(stats_to_cache)  # ← Sync (single DB write)
+        # Sync single DB write (plus serialisation): run it off the event loop
+        result = await asyncio.to_thread(upsert_playlist_stats, stats_to_cache)
         result_map = _result_to_mapping(result)
         logger.info(
             f"[Job {job_id}] Upsert result: source={result_map.get('source')}, "
             f"error={result_map.get('error')}, "
+            f"df_arrow present={bool(result_map.get('df_arrow'))}, "
             f"df_json present={bool(result_map.get('df_json'))}, "
             f"summary_stats_json present={bool(result_map.get('summary_stats_json'))}"
         )
         _set_stage("upsert-done")
 
         # Detailed validation: ensure DB confirms presence of serialized payloads
-        df_present = bool(result_map.get("df")) or bool(result_map.get("df_json"))
+        df_present = (
+            bool(result_map.get("df"))
+            or bool(result_map.get("df_arrow"))
+            or bool(result_map.get("df_json"))
+        )
         summary_present = bool(result_map.get("summary_stats")) or bool(
             result_map.get("summary_stats_json")
         )
@@ -786,10 +1006,69 @@ async def handle_job(job: Dict[str, Any], is_retry: bool = False):
             )
 
     finally:
+        # Never let a deferred progress write land after the final status
+        progress_writer.close()
         elapsed = time.time() - start_time
         logger.info(f"[Job {job_id}] Completed in {elapsed:.2f}s")
 
 
+async def run_job(job: Dict[str, Any], is_retry: bool = False) -> None:
+    """
+    Run ``handle_job`` as a cancellable unit.
+
+    - JOB_TIMEOUT exceeded → cancelled and recorded as a retryable failure.
+    - Cancelled from outside (shutdown drain) → the job is handed back to
+      ``pending`` so the next worker picks it up without burning a retry.
+    """
+    job_id = job.get("id")
+    try:
+        if JOB_TIMEOUT > 0:
+            await asyncio.wait_for(handle_job(job, is_retry=is_retry), timeout=JOB_TIMEOUT)
+        else:
+            await handle_job(job, is_retry=is_retry)
+    except asyncio.TimeoutError:
+        logger.error(f"[Job {job_id}] Exceeded {JOB_TIMEOUT}s timeout, cancelled")
+        await handle_job_failure(
+            job_id, job.get("retry_count", 0), f"Job timed out after {JOB_TIMEOUT}s"
+        )
+    except asyncio.CancelledError:
+        logger.warning(f"[Job {job_id}] Cancelled during shutdown, releasing back to pending")
+        await mark_job_status(job_id, "pending", {"started_at": None})
+        raise
+    except Exception as e:
+        # handle_job records its own failures; this only guards the task boundary
+        logger.exception(f"[Job {job_id}] Unhandled error escaped handle_job: {e}")
+
+
+async def drain_jobs(in_flight: set, timeout: float) -> None:
+    """Wait up to ``timeout`` seconds for in-flight jobs, then cancel the rest."""
+    if not in_flight:
+        return
+    logger.info("Draining %s in-flight job(s) (timeout=%ss)", len(in_flight), timeout)
+    _, pending = await asyncio.wait(set(in_flight), timeout=max(timeout, 0))
+    if pending:
+        logger.warning("Cancelling %s job(s) still running after drain timeout", len(pending))
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+async def acquire_slots(slots: asyncio.Semaphore, limit: int, timeout: float) -> int:
+    """
+    Wait up to ``timeout`` seconds for one slot, then take up to ``limit`` in
+    total without blocking. Returns the number of slots held (0 on timeout).
+    """
+    try:
+        await asyncio.wait_for(slots.acquire(), timeout=max(timeout, 0))
+    except asyncio.TimeoutError:
+        return 0
+    held = 1
+    while held < limit and not slots.locked():
+        await slots.acquire()
+        held += 1
+    return held
+
+
 _raw_idle_backoff_max = int(os.getenv("WORKER_IDLE_BACKOFF_MAX", "120"))
 if _raw_idle_backoff_max < 1:
     logger.warning(
@@ -808,12 +1087,42 @@ async def worker_loop():
     # Start at whichever is smaller so the initial sleep never exceeds the cap
     idle_sleep = min(POLL_INTERVAL, IDLE_BACKOFF_MAX)
 
+    # Bounded concurrent job execution: a slot is taken before claiming a job and
+    # released when its task finishes, so at most WORKER_CONCURRENCY jobs are claimed.
+    slots = asyncio.Semaphore(WORKER_CONCURRENCY)
+    in_flight: set[asyncio.Task] = set()
+
+    def _on_job_done(task: asyncio.Task, is_retry: bool) -> None:
+        nonlocal jobs_processed, retries_processed
+        in_flight.discard(task)
+        slots.release()
+        if task.cancelled():
+            return
+        if is_retry:
+            retries_processed += 1
+        else:
+            jobs_processed += 1
+
+    async def start_job(job: Dict[str, Any], is_retry: bool) -> bool:
+        """Run a claimed job (holding a slot) as a task; False once it is time to stop."""
+        job_id = job["id"]
+        if time.time() - start_time >= MAX_RUNTIME or stop_event.is_set():
+            slots.release()
+            await mark_job_status(job_id, "pending", {"started_at": None})
+            logger.info("Max runtime reached while processing jobs, stopping")
+            return False
+        task = asyncio.create_task(run_job(job, is_retry=is_retry), name=f"job-{job_id}")
+        in_flight.add(task)
+        task.add_done_callback(lambda t: _on_job_done(t, is_retry))
+        return True
+
     logger.info(
         "Worker starting main loop (poll_interval=%ss, max_runtime=%sm, batch_size=%s, "
-        "request_delay=%s-%ss, bot_backoff=%ss, max_retries=%s, retry_age=%ss)",
+        "concurrency=%s, request_delay=%s-%ss, bot_backoff=%ss, max_retries=%s, retry_age=%ss)",
         POLL_INTERVAL,
         MAX_RUNTIME // 60,
         BATCH_SIZE,
+        WORKER_CONCURRENCY,
         MIN_REQUEST_DELAY,
         MAX_REQUEST_DELAY,
         BOT_CHALLENGE_BACKOFF,
@@ -831,6 +1140,9 @@ async def worker_loop():
                 retries_processed,
             )
             break
+        if stop_event.is_set():
+            logger.info("Stop requested. Leaving main loop.")
+            break
 
         remaining_time = MAX_RUNTIME - elapsed_time
         if int(elapsed_time) % 300 == 0 and elapsed_time > 0:
@@ -851,18 +1163,57 @@ async def worker_loop():
                     await asyncio.sleep(cooldown_sleep)
                 continue
 
-            # Both fetches are scheduled together; supabase-py execute() is sync so they
-            # still run sequentially, but gather keeps the structure symmetric for when
-            # an async client is adopted later.
-            pending_jobs, failed_jobs = await asyncio.gather(
-                fetch_pending_jobs(),
-                fetch_retryable_failed_jobs(),
-            )
+            # Take every free slot (at least one) and claim that many jobs in one
+            # atomic round trip; slots left over are handed straight back.
+            held = await acquire_slots(slots, BATCH_SIZE, min(POLL_INTERVAL, remaining_time))
+            if not held:
+                # Every slot is busy; re-check runtime/stop before waiting again
+                continue
+            claimed = await claim_jobs(held)
+            for _ in range(held - len(claimed or [])):
+                slots.release()
+
+            if claimed is not None:
+                found_jobs = bool(claimed)
+                for index, (job, is_retry) in enumerate(claimed):
+                    if not await start_job(job, is_retry):
+                        # Hand back the claimed-but-unstarted remainder
+                        for leftover, _ in claimed[index + 1 :]:
+                            slots.release()
+                            await mark_job_status(leftover["id"], "pending", {"started_at": None})
+                        break
+            else:
+                # Claim RPC unavailable: poll, then claim row by row
+                pending_jobs, failed_jobs = await asyncio.gather(
+                    fetch_pending_jobs(),
+                    fetch_retryable_failed_jobs(),
+                )
+                found_jobs = bool(pending_jobs or failed_jobs)
+
+                # Combine jobs: prioritize pending over retries
+                for job in pending_jobs + failed_jobs:
+                    job_id = job.get("id")
+                    if not job_id:
+                        continue
+
+                    # Wait for a free slot before claiming, so we never hold more
+                    # claimed-but-not-running jobs than we can execute
+                    await slots.acquire()
+
+                    # Check bot challenge cooldown before each job
+                    if await check_bot_challenge_cooldown():
+                        slots.release()
+                        logger.info("Bot challenge cooldown triggered, pausing job processing")
+                        break
+
+                    if not await claim_job(job_id):
+                        slots.release()
+                        continue
 
-            # Combine jobs: prioritize pending over retries
-            all_jobs = pending_jobs + failed_jobs
+                    if not await start_job(job, job in failed_jobs):
+                        break
 
-            if not all_jobs:
+            if not found_jobs:
                 sleep_time = min(idle_sleep, remaining_time)
                 if sleep_time <= 0:
                     logger.info("No time remaining, exiting worker loop")
@@ -876,55 +1227,6 @@ async def worker_loop():
             # Jobs found — reset idle backoff
             idle_sleep = POLL_INTERVAL
 
-            for job in all_jobs:
-                job_id = job.get("id")
-                if not job_id:
-                    continue
-
-                # Check bot challenge cooldown before each job
-                if await check_bot_challenge_cooldown():
-                    logger.info("Bot challenge cooldown triggered, pausing job processing")
-                    break
-
-                # Claim job atomically
-                try:
-                    claim_response = (
-                        supabase_client.table(PLAYLIST_JOBS_TABLE)
-                        .update(
-                            {
-                                "status": "processing",
-                                "started_at": utc_now_iso(),
-                            }
-                        )
-                        .eq("id", job_id)
-                        .in_("status", ["pending", "failed"])  # Allow claiming failed jobs
-                        .execute()
-                    )
-
-                    if not claim_response.data:
-                        logger.debug(
-                            f"[Job {job_id}] Claim failed, another worker took it. Skipping."
-                        )
-                        continue
-
-                except Exception as e:
-                    logger.error(f"[Job {job_id}] Failed to claim job: {e}")
-                    continue
-
-                # Check time before processing
-                if time.time() - start_time >= MAX_RUNTIME:
-                    logger.info("Max runtime reached while processing jobs, stopping")
-                    break
-
-                # Process job (with retry flag)
-                is_retry = job in failed_jobs
-                await handle_job(job, is_retry=is_retry)
-
-                if is_retry:
-                    retries_processed += 1
-                else:
-                    jobs_processed += 1
-
             # Small delay between polling cycles
             await asyncio.sleep(min(0.5, remaining_time))
 
@@ -937,6 +1239,15 @@ async def worker_loop():
                 logger.info("No time remaining for error retry sleep, exiting")
                 break
 
+    # Graceful drain: let in-flight jobs finish, cancel (and release) stragglers
+    await drain_jobs(in_flight, DRAIN_TIMEOUT)
+
+    # The API backend's keep-alive client is bound to this event loop
+    try:
+        await yt_service.close()
+    except Exception:
+        logger.warning("Failed to close YouTube service client", exc_info=True)
+
     logger.info(
         "Worker loop completed. New jobs: %s, Retries: %s, Total: %s",
         jobs_processed,